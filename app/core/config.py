@@ -1,3 +1,4 @@
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 
 
@@ -9,9 +10,146 @@ class Settings(BaseSettings):
     # vLLM 서버 설정
     VLLM_SERVER_URL: str = "http://tc-server-gpu:8000"
     VLLM_SERVER_ENDPOINT: str = "/v1/chat/completions"
+    VLLM_SERVER_COMPLETIONS_ENDPOINT: str = "/v1/completions"  # 다중 프롬프트 배치 요청용
     VLLM_SERVER_MODEL: str = "Qwen/Qwen2.5-14B-Instruct-AWQ"
     VLLM_SERVER_TIMEOUT: int = 60
-    VLLM_SERVER_MAX_RETRIES: int = 1
-    VLLM_SERVER_RETRY_DELAY: int = 2
-    
-settings = Settings()
\ No newline at end of file
+    VLLM_SERVER_MAX_RETRIES: int = 1  # 요청당 최대 시도 횟수 (최초 시도 포함)
+    VLLM_SERVER_RETRY_DELAY: int = 2  # 지수 백오프 기본 대기 시간(초)
+
+    # 적응형 호출 타임아웃 (단계별 지연 시간 모델: 소요 시간 ≈ a + b x 입력 토큰 + c x 출력 토큰)
+    VLLM_ADAPTIVE_TIMEOUT: bool = True  # 모델이 적합되기 전에는 VLLM_SERVER_TIMEOUT 사용
+    VLLM_ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = 20  # 모델 적합에 필요한 최소 관측치 수
+    VLLM_ADAPTIVE_TIMEOUT_PERCENTILE: float = 99.0  # 실측/예측 비율 백분위
+    VLLM_ADAPTIVE_TIMEOUT_SAFETY_FACTOR: float = 1.5
+    VLLM_ADAPTIVE_TIMEOUT_MIN: float = 5.0  # 타임아웃 하한(초)
+    VLLM_ADAPTIVE_TIMEOUT_MAX: float = 180.0  # 타임아웃 상한(초)
+
+    # vLLM 재시도 정책 설정
+    VLLM_RETRY_MAX_DELAY: float = 30.0  # 재시도 1회 최대 대기 시간(초), Retry-After가 더 길면 재시도 포기
+    VLLM_RETRY_MAX_TOTAL_DELAY: float = 60.0  # 요청별 누적 재시도 대기 시간 상한(초)
+    VLLM_RETRY_BUDGET_RATIO: float = 0.1  # 전역 재시도 예산: 전체 요청 대비 재시도 비율 상한
+    VLLM_RETRY_BUDGET_MIN_RESERVE: int = 10  # 트래픽이 적을 때도 허용할 최소 재시도 횟수
+
+    # vLLM 레플리카 라우팅 설정
+    VLLM_SERVER_URLS: List[str] = []  # 비어 있으면 VLLM_SERVER_URL 하나만 사용
+    VLLM_ROUTING_MODE: str = "single"  # "single" | "prefix_affinity"
+    VLLM_ROUTING_LOAD_FACTOR: float = 1.25  # 레플리카당 허용 부하 = 평균 부하 x 배수
+    VLLM_ROUTING_VIRTUAL_NODES: int = 100  # 해시 링에 배치할 레플리카당 가상 노드 수
+    LLM_PREFIX_CACHE_PRIMING: bool = False  # 서버 시작 시 템플릿별 prefix cache 사전 적재
+
+    # vLLM 서버 텔레메트리(Prometheus /metrics) 기반 요청 보류 설정
+    VLLM_METRICS_ENABLED: bool = False  # 서버 시작 시 메트릭 수집기 실행
+    VLLM_METRICS_ENDPOINT: str = "/metrics"
+    VLLM_METRICS_POLL_INTERVAL: float = 1.0  # 수집 주기 (초)
+    VLLM_METRICS_MAX_WAITING: int = 8  # 서버 대기열 요청 수가 이 값을 넘으면 새 청크 요청 보류
+    VLLM_METRICS_MAX_KV_USAGE: float = 0.9  # KV cache 사용률(0~1)이 이 값을 넘으면 새 청크 요청 보류
+    VLLM_METRICS_STALE_AFTER: float = 10.0  # 이 시간(초)보다 오래된 메트릭은 무시
+    VLLM_METRICS_MAX_HOLD: float = 30.0  # 요청 1건의 최대 보류 시간 (초)
+
+    # 단계별 모델/서버 설정 (비어 있으면 VLLM_SERVER_MODEL, VLLM_SERVER_URLS/VLLM_SERVER_URL 사용)
+    # 모델이 TOKENIZER_MODEL과 다르면 해당 단계는 1단계 배치 모드/토큰 ID 전송을 사용하지 않음
+    LLM_EXTRACTION_MODEL: str = ""  # 1단계(추출) 모델 (예: 더 작고 빠른 모델)
+    LLM_EXTRACTION_SERVER_URLS: List[str] = []
+    LLM_EXTRACTION_TEMPERATURE: float = 0.7
+    LLM_EXTRACTION_MAX_OUTPUT_TOKENS: int = 4096
+    LLM_ENRICHMENT_MODEL: str = ""  # 2단계(상세화) 모델
+    LLM_ENRICHMENT_SERVER_URLS: List[str] = []
+    LLM_ENRICHMENT_TEMPERATURE: float = 0.7
+    LLM_ENRICHMENT_MAX_OUTPUT_TOKENS: int = 4096
+
+    # 작은 모델 → 큰 모델 cascade 설정 (작은 모델 출력이 JSON/형식/커버리지 검증에 실패하면 단계 모델로 재요청)
+    LLM_CASCADE_ENABLED: bool = False
+    LLM_CASCADE_SMALL_MODEL: str = "Qwen/Qwen2.5-3B-Instruct-AWQ"
+    LLM_CASCADE_SMALL_SERVER_URLS: List[str] = []  # 비어 있으면 단계 서버 사용
+    LLM_CASCADE_MIN_WORDS_PER_1K_TOKENS: float = 20.0  # 청크 1,000토큰당 최소 추출 단어 수
+    LLM_CASCADE_MIN_PHRASES_PER_1K_TOKENS: float = 0.0  # 청크 1,000토큰당 최소 추출 숙어 수 (숙어는 없을 수도 있음)
+    LLM_CASCADE_MIN_ENRICHMENT_COVERAGE: float = 0.9  # 상세화 결과에 포함되어야 하는 입력 항목 비율
+
+    # 요청별 출력 토큰 예산(max_tokens) 설정
+    LLM_MAX_OUTPUT_TOKENS: int = 4096  # 요청별 max_tokens 상한
+    LLM_MIN_OUTPUT_TOKENS: int = 256  # 요청별 max_tokens 하한
+    LLM_OUTPUT_OVERHEAD_TOKENS: int = 64  # JSON 외곽 구조("videoId", "result" 등)에 필요한 토큰
+    LLM_WORD_EXTRACTION_OUTPUT_RATIO: float = 1.2  # 청크 입력 토큰 1개당 예상 출력 토큰 (단어 추출)
+    LLM_PHRASE_EXTRACTION_OUTPUT_RATIO: float = 0.3  # 청크 입력 토큰 1개당 예상 출력 토큰 (숙어 추출)
+    LLM_WORD_ENRICHMENT_TOKENS_PER_ITEM: int = 48  # 단어 1개당 예상 출력 토큰 (동의어 + 예문)
+    LLM_PHRASE_ENRICHMENT_TOKENS_PER_ITEM: int = 32  # 숙어 1개당 예상 출력 토큰 (예문)
+
+    # 2단계 상세화 샤딩 (항목을 출력 토큰 예산 기준 shard로 나누어 병렬 요청)
+    LLM_ENRICHMENT_SHARDING: bool = True
+    LLM_ENRICHMENT_SHARD_OUTPUT_TOKENS: int = 1536  # shard 1개의 목표 출력 토큰 수 (shard 크기 = 이 값 / 항목당 토큰)
+
+    # 영상 간 공유 lexicon 캐시 ((원형, 품사, 프롬프트 버전) -> 상세화 결과, SQLite 파일)
+    LLM_LEXICON_ENABLED: bool = False
+    LLM_LEXICON_PATH: str = "data/lexicon.sqlite3"
+    LLM_LEXICON_MAX_ENTRIES: int = 50000  # 초과 시 가장 오래 사용되지 않은 항목부터 제거
+
+    # 잘린 상세화 응답 이어받기 (finish_reason == "length"이면 완성된 항목을 살리고 누락 항목만 후속 요청)
+    LLM_CONTINUATION_ENABLED: bool = True
+    LLM_CONTINUATION_MAX_ROUNDS: int = 2  # 응답 1건당 최대 후속 요청 수
+
+    # 1단계 배치 요청 설정 (/v1/completions에 여러 프롬프트를 한 번에 전송)
+    LLM_STAGE1_BATCH_MODE: bool = False
+    LLM_STAGE1_BATCH_SIZE: int = 16  # 요청 1건에 담을 최대 프롬프트(청크) 수
+
+    # 1단계 청크 선택 (어휘 커버리지 기준 탐욕 선택, 비디오 ID seed로 결정적)
+    LLM_CHUNK_SELECTION_MAX_CHUNKS: int = 10  # 1단계에 보낼 최대 청크 수
+    LLM_CHUNK_SELECTION_MAX_TOKENS: int = 0  # 선택한 청크의 최대 토큰 합 (0이면 제한 없음)
+
+    # 원형 기준 단어 병합 (상세화 전에 "running", "ran", "runs" 같은 변화형 항목을 원형 "run"으로 합침)
+    LLM_LEMMA_MERGE_ENABLED: bool = True
+
+    # 로컬 단어 순위 (번들 빈도 순위표로 흔한 단어를 걸러 상위 단어만 2단계 상세화로 보냄)
+    LLM_WORD_RANKING_ENABLED: bool = False
+    LLM_WORD_RANKING_TOP_K: int = 60  # 상세화할 최대 단어 수 (0이면 개수 제한 없음, 파이프라인 모드에서는 도착 순서대로 K개까지)
+    LLM_WORD_RANKING_MIN_SCORE: float = 0.3  # 최소 희소도 점수 (0 ~ 1, 0.3이면 순위표 상위 30% 단어 제외)
+    LLM_WORD_RANKING_CORPUS_IDF: bool = False  # 지난 영상들의 문서 빈도로 점수 보정
+    LLM_WORD_RANKING_CORPUS_PATH: str = "data/word_corpus.json"  # 코퍼스 문서 빈도 저장 경로 (빈 값이면 메모리에만 보관)
+
+    # 1단계 어휘 포화 조기 종료 (wave 단위로 청크를 보내고 새 항목 발견 비율이 기준 미만이면 중단)
+    LLM_SATURATION_EARLY_EXIT: bool = False
+    LLM_SATURATION_WAVE_SIZE: int = 4  # wave 1회에 보낼 청크 수
+    LLM_SATURATION_MIN_DISCOVERY_RATE: float = 0.1  # wave의 추출 항목 중 새 항목 비율이 이보다 낮으면 중단
+
+    # 숙어 사전 인덱스 (번들 숙어 목록의 Aho-Corasick 매칭으로 숙어 맵을 로컬에서 먼저 채움, 통합 추출 모드에는 미적용)
+    LLM_PHRASE_INDEX_ENABLED: bool = False
+    LLM_PHRASE_INDEX_FAST_MODE: bool = False  # 매칭된 숙어가 충분한 청크는 숙어 LLM 호출 생략
+    LLM_PHRASE_INDEX_MIN_HITS: int = 3  # 빠른 모드에서 LLM 호출을 생략할 청크의 최소 매칭 숙어 수
+
+    # 1단계 로컬 후보 추출 모드 (단어 후보/품사는 로컬 규칙으로 만들고 LLM에는 문맥상 뜻만 요청, 통합 추출 모드에는 미적용)
+    LLM_STAGE1_LOCAL_CANDIDATES: bool = False
+    LLM_WORD_MEANING_TOKENS_PER_ITEM: int = 16  # 후보 단어 1개당 예상 출력 토큰 수 (뜻 목록만 출력)
+    LLM_LEXICAL_DICTIONARY_PATH: str = ""  # 접미사 규칙 원형을 확인할 추가 원형 사전 (1줄 1단어, 빈 값이면 번들 순위표/변화표만 사용)
+
+    # 1단계 통합 추출 모드 (청크당 요청 1건으로 단어와 숙어를 함께 추출, 청크 prefill과 요청 수를 절반으로)
+    LLM_STAGE1_FUSED_MODE: bool = False
+
+    # 1단계 → 2단계 파이프라인 모드 (청크 추출 결과가 도착하는 대로 새 항목을 배치로 상세화)
+    LLM_PIPELINE_MODE: bool = False
+    LLM_PIPELINE_ENRICHMENT_BATCH_SIZE: int = 20  # 상세화 요청 1건에 담을 항목 수
+
+    # KV cache 토큰 예산 (서버별 동시 요청들의 프롬프트 토큰 + max_tokens 합계 상한, 0이면 제한 없음)
+    LLM_KV_TOKEN_BUDGET: int = 65536  # 서버별 기본 예산
+    LLM_KV_TOKEN_BUDGETS: Dict[str, int] = {}  # 서버 URL별 예산 (서버마다 KV cache 크기가 다를 때, 예: {"http://gpu-small:8000": 32768})
+
+    # 오프라인 JSONL 배치 모드 설정 (대량 백필용, app/services/llm/offline_batch.py)
+    LLM_OFFLINE_BATCH_RUNNER: str = "local"  # "vllm" (vLLM run_batch) | "local" (vLLM 서버로 전송하는 대체 실행기)
+    LLM_OFFLINE_BATCH_DIR: str = "batch"  # 요청/결과 JSONL 파일 저장 디렉토리
+    LLM_OFFLINE_LOCAL_CONCURRENCY: int = 64  # 대체 실행기의 최대 동시 요청 수
+
+    # 비동기 단어장 생성 작업 설정 (POST는 작업 ID를 바로 반환하고 워커가 영구 큐에서 꺼내 처리)
+    JOB_QUEUE_BACKEND: str = "sqlite"  # "sqlite" (JOB_QUEUE_PATH) 또는 "filesystem" (JOB_QUEUE_DIR)
+    JOB_QUEUE_PATH: str = "data/jobs.sqlite3"
+    JOB_QUEUE_DIR: str = "data/jobs"
+    JOB_IN_PROCESS_WORKERS: bool = True  # API 프로세스 안에서 워커 풀 실행 (독립 워커 python -m app.worker 사용 시 False)
+    JOB_WORKER_CONCURRENCY: int = 2  # 동시에 처리할 최대 작업 수
+    JOB_WORKER_POLL_INTERVAL: float = 1.0  # 큐가 비어 있을 때 다시 확인하는 주기 (초)
+    JOB_WEBHOOK_TIMEOUT: float = 10.0  # 완료 webhook 요청 타임아웃 (초)
+    JOB_WEBHOOK_ALLOWED_HOSTS: List[str] = []  # webhook 허용 호스트 (비어 있으면 공인 IP로 연결되는 호스트만 허용)
+    JOB_LEASE_SECONDS: float = 60.0  # 워커가 꺼낸 작업의 lease 유지 시간 (만료되면 죽은 워커로 보고 다시 큐에 넣음)
+    JOB_HEARTBEAT_INTERVAL: float = 15.0  # lease 갱신 주기 (초, JOB_LEASE_SECONDS보다 충분히 짧게)
+    JOB_MAX_ATTEMPTS: int = 3  # lease 만료로 다시 넣는 최대 시도 횟수 (초과 시 실패 처리)
+
+    # 클라이언트 측 토큰화 설정 (chat template 적용/토큰화 후 토큰 ID를 /v1/completions로 전송)
+    LLM_SEND_TOKEN_IDS: bool = False
+
+settings = Settings()
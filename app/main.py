@@ -1,19 +1,38 @@
 """
 FastAPI 애플리케이션 메인 파일
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.routes import video
+from app.routes import video, llm
+from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.middleware import setup_middleware
+from app.services.llm.background import llm_background_tasks
+from app.services.jobs.runner import get_job_worker_pool
 
 # 로깅 설정 초기화 (가장 먼저 실행)
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 실행되는 작업"""
+    # prefix cache 적재, vLLM 서버 부하 수집 (독립 워커와 공유)
+    async with llm_background_tasks():
+        if settings.JOB_IN_PROCESS_WORKERS:
+            # 단어장 생성 작업 워커 풀 시작 (재시작 전에 중단된 작업은 다시 큐에 넣음)
+            get_job_worker_pool().start()
+        yield
+        if settings.JOB_IN_PROCESS_WORKERS:
+            await get_job_worker_pool().stop()
+
+
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
     title="YouTube Vocabulary Generator",
     description="YouTube 동영상에서 단어장을 생성하는 API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # 미들웨어 등록 (라우터 등록 전에 해야 함)
@@ -36,4 +55,5 @@ def health_check():
 
 
 # 라우터 포함
-app.include_router(video.router)
\ No newline at end of file
+app.include_router(video.router)
+app.include_router(llm.router)
\ No newline at end of file
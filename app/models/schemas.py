@@ -1,6 +1,6 @@
 from pydantic import BaseModel, field_validator
 from urllib.parse import urlparse
-from typing import List
+from typing import List, Dict, Any
 
 
 class VideoUrlRequests(BaseModel):
@@ -148,4 +148,77 @@ class VocabularyResponse(BaseModel):
                 "message": None
             }
         }
-    
\ No newline at end of file
+    
+
+
+class VocabularyJobRequest(BaseModel):
+    """단어장 생성 작업 요청 스키마"""
+    webhook_url: str | None = None  # 작업이 끝나면 결과를 POST할 URL (선택)
+    
+    @field_validator('webhook_url')
+    @classmethod
+    def validate_webhook_url(cls, v):
+        """webhook URL이 http/https 형식인지 검증"""
+        if v is None or not v.strip():
+            return None
+        parsed = urlparse(v.strip())
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise ValueError(
+                "webhook URL은 http 또는 https 형식이어야 합니다. "
+                "(예: https://example.com/webhook)"
+            )
+        return v.strip()
+
+
+class VocabularyJobResponse(BaseModel):
+    """단어장 생성 작업 응답 스키마"""
+    job_id: str
+    video_id: str
+    status: str  # queued | running | completed | failed
+    stage: str | None = None  # 진행 중인(또는 실패한) 단계
+    progress: Dict[str, str]  # 단계별 상태 (pending | running | completed)
+    result: VocabularyResponse | None = None  # 완료 시 단어장
+    error: str | None = None  # 실패 시 메시지
+    created_at: float
+    updated_at: float
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f2b9c1e8a7d4e6f9b0c1d2e3f4a5b6c",
+                "video_id": "dQw4w9WgXcQ",
+                "status": "running",
+                "stage": "enrichment",
+                "progress": {
+                    "transcript": "completed",
+                    "extraction": "completed",
+                    "enrichment": "running",
+                    "merge": "pending"
+                },
+                "result": None,
+                "error": None,
+                "created_at": 1760000000.0,
+                "updated_at": 1760000012.5
+            }
+        }
+
+
+class LexiconEntry(BaseModel):
+    """lexicon 캐시 항목 스키마 (노드 간 내보내기/가져오기 형식)"""
+    lemma: str  # 단어 원형 또는 숙어
+    pos: str = ""  # 품사 (숙어는 빈 문자열)
+    prompt_version: str  # 상세화 프롬프트 버전 (예: "Word Enrichment:v11")
+    data: Dict[str, Any]  # 상세화 결과 (예: {"동의어": [...], "예문": "..."})
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "lemma": "decision",
+                "pos": "n",
+                "prompt_version": "Word Enrichment:v11",
+                "data": {
+                    "동의어": ["choice", "resolution"],
+                    "예문": "She made a quick decision."
+                }
+            }
+        }
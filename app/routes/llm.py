@@ -0,0 +1,199 @@
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, status
+from app.core.config import settings
+from app.services.llm.router import get_all_replica_stats
+from app.services.llm.retry import get_retry_budget
+from app.services.llm.prefix_cache import get_priming_stats
+from app.services.llm.admission import get_kv_budget_stats
+from app.services.llm.telemetry import get_backend_telemetry
+from app.services.llm.cascade import get_cascade_tracker
+from app.services.llm.latency import get_latency_model_params
+from app.services.llm.lexicon import get_lexicon
+from app.services.llm.saturation import get_saturation_tracker
+from app.models.schemas import LexiconEntry
+from app.services.llm.stages import (
+    get_stage_config,
+    get_stage_latency_tracker,
+    STAGE_EXTRACTION,
+    STAGE_ENRICHMENT
+)
+
+router = APIRouter(prefix="/api/llm", tags=["llm"])
+
+
+def _require_lexicon_enabled() -> None:
+    """lexicon 캐시가 꺼져 있으면 캐시 파일을 만들지 않도록 404를 반환합니다."""
+    if not settings.LLM_LEXICON_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="lexicon 캐시가 비활성화되어 있습니다. (LLM_LEXICON_ENABLED=True로 설정해주세요)"
+        )
+
+
+@router.get("/replicas")
+def get_list_replica_stats():
+    """vLLM 레플리카별 라우팅 통계를 반환합니다.
+    
+    Returns:
+        dict: 라우팅 모드와 레플리카별 통계
+            - in_flight: 진행 중인 요청 수
+            - requests / spillovers: 누적 요청 수 / bounded-load로 넘겨받은 요청 수
+            - prefix_cache_hit_rate: cached_tokens / prompt_tokens (usage 정보가 없으면 None)
+    """
+    return {
+        "mode": settings.VLLM_ROUTING_MODE,
+        "replicas": get_all_replica_stats()
+    }
+
+
+@router.get("/retries")
+def get_detail_retry_budget():
+    """전역 재시도 예산 현황을 반환합니다.
+    
+    Returns:
+        dict: 누적 요청/재시도 수, 예산 부족으로 거절된 재시도 수, 재시도 비율
+    """
+    return get_retry_budget().get_stats()
+
+
+@router.get("/prefix-cache")
+def get_list_prefix_cache_priming():
+    """템플릿별 prefix cache 사전 적재 결과를 반환합니다.
+    
+    Returns:
+        dict: 템플릿(라우팅 키)별 prefix 토큰 수, cache miss/hit 지연 시간, 요청당 절약되는 prefill 시간
+    """
+    return {
+        "enabled": settings.LLM_PREFIX_CACHE_PRIMING,
+        "templates": get_priming_stats()
+    }
+
+
+@router.get("/admission")
+def get_detail_kv_budget():
+    """서버별 KV cache 토큰 예산 기반 요청 수락 현황을 반환합니다.
+    
+    Returns:
+        dict: 서버 URL별 예산(capacity), 사용 중인 토큰(in_use), 대기 중인 요청 수(waiting),
+            최대 사용량(peak_in_use), 누적 수락/대기 요청 수와 평균 대기 시간
+    """
+    return get_kv_budget_stats()
+
+
+@router.get("/telemetry")
+def get_detail_backend_telemetry():
+    """vLLM 서버 텔레메트리와 요청 보류 현황을 반환합니다.
+    
+    Returns:
+        dict: 서버별 실행/대기 요청 수, KV cache 사용률, 평균 TTFT(ms)와 요청 보류 통계
+    """
+    return {
+        "enabled": settings.VLLM_METRICS_ENABLED,
+        **get_backend_telemetry().get_stats()
+    }
+
+
+@router.get("/stages")
+def get_list_stage_stats():
+    """단계별 모델/서버 설정과 호출 지연 시간을 반환합니다.
+    
+    Returns:
+        dict: 단계별 설정(model, server_urls, temperature, max_output_tokens)과
+            호출 지연 시간 통계(calls, avg_ms, p50_ms, p95_ms, max_ms)
+    """
+    latency = get_stage_latency_tracker().get_stats()
+    return {
+        stage: {
+            "config": get_stage_config(stage),
+            "latency": latency.get(stage)
+        }
+        for stage in (STAGE_EXTRACTION, STAGE_ENRICHMENT)
+    }
+
+
+@router.get("/cascade")
+def get_detail_cascade_stats():
+    """작은 모델 → 큰 모델 cascade의 단계별 에스컬레이션 현황을 반환합니다.
+    
+    Returns:
+        dict: 단계(프로세스)별 요청 수, 에스컬레이션 수/비율과 사유,
+            작은/큰 모델 평균 호출 시간, 모든 요청을 큰 모델로 보냈을 때 대비 추정 절약 시간(ms)
+    """
+    return {
+        "enabled": settings.LLM_CASCADE_ENABLED,
+        "small_model": settings.LLM_CASCADE_SMALL_MODEL,
+        "stages": get_cascade_tracker().get_stats()
+    }
+
+
+@router.get("/latency-model")
+def get_detail_latency_model():
+    """단계별 지연 시간 모델의 적합 파라미터를 반환합니다.
+    
+    Returns:
+        dict: 단계별 절편(초), 입력/출력 토큰당 소요 시간(초), 실측/예측 비율 p99, 관측치 및 타임아웃 수
+    """
+    return {
+        "enabled": settings.VLLM_ADAPTIVE_TIMEOUT,
+        "stages": get_latency_model_params()
+    }
+
+
+@router.get("/saturation")
+def get_detail_saturation():
+    """1단계 어휘 포화 조기 종료 통계를 반환합니다.
+    
+    Returns:
+        dict: 활성화 여부, 조기 종료 수, 처리/건너뛴 청크 수, 평균 추정 커버리지
+    """
+    return {
+        "enabled": settings.LLM_SATURATION_EARLY_EXIT,
+        **get_saturation_tracker().get_stats()
+    }
+
+
+@router.get("/lexicon")
+def get_detail_lexicon():
+    """영상 간 공유 lexicon 캐시 통계를 반환합니다.
+    
+    Returns:
+        dict: 활성화 여부, 항목 수, 조회 적중률, 저장/제거 수
+    """
+    if not settings.LLM_LEXICON_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **get_lexicon().get_stats()}
+
+
+@router.get("/lexicon/export", response_model=List[LexiconEntry])
+def get_list_lexicon_entries(prompt_version: Optional[str] = None):
+    """lexicon 캐시 항목을 내보냅니다 (다른 노드에서 /lexicon/import로 가져오기).
+    
+    Args:
+        prompt_version: 특정 프롬프트 버전만 내보낼 때 지정 (예: "Word Enrichment:v11")
+    
+    Returns:
+        List[LexiconEntry]: lexicon 항목 리스트
+        
+    Raises:
+        HTTPException: lexicon 캐시가 비활성화된 경우 404 Not Found
+    """
+    _require_lexicon_enabled()
+    return get_lexicon().export_entries(prompt_version)
+
+
+@router.post("/lexicon/import")
+def post_import_lexicon_entries(entries: List[LexiconEntry]):
+    """다른 노드에서 내보낸 lexicon 항목을 가져옵니다 (같은 키는 덮어씀).
+    
+    Args:
+        entries: lexicon 항목 리스트
+    
+    Returns:
+        dict: 가져온 항목 수
+        
+    Raises:
+        HTTPException: lexicon 캐시가 비활성화된 경우 404 Not Found
+    """
+    _require_lexicon_enabled()
+    imported = get_lexicon().import_entries(entry.model_dump() for entry in entries)
+    return {"imported": imported}
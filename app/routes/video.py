@@ -1,21 +1,90 @@
 from fastapi import APIRouter, HTTPException, status
 from pydantic import ValidationError
+from typing import Dict, Optional, Any
 from app.models.schemas import (
     VideoUrlRequests, 
     VideoUrlResponse, 
     TranscriptResponse,
     VocabularyResponse,
+    VocabularyJobRequest,
+    VocabularyJobResponse,
     WordEntry,
     PhraseEntry
 )
 from app.services.validator import extract_video_id
 from app.services.transcript import get_transcript
 from app.services.llm.processor import process_vocabulary
+from app.services.jobs.backends import get_job_queue
+from app.services.jobs.runner import get_job_worker_pool
+from app.services.jobs.webhook import validate_webhook_url
+from app.core.config import settings
 from app.core.logging import get_error_logger
 
 router = APIRouter(prefix="/api/video", tags=["video"])
 ERROR_LOGGER = get_error_logger()
 
+def _build_vocabulary_response(result: Dict[str, Any], video_id: str) -> VocabularyResponse:
+    """process_vocabulary 결과 딕셔너리를 VocabularyResponse로 변환합니다.
+    
+    Args:
+        result: 단어장 딕셔너리 (videoId, words, phrases)
+        video_id: YouTube 영상 ID
+        
+    Returns:
+        VocabularyResponse: 단어장 정보 (변환에 실패한 항목은 건너뜀)
+    """
+    # processor.py는 camelCase를 사용하지만, 스키마는 snake_case를 사용
+    words = []
+    for word_data in result.get("words", []):
+        try:
+            words.append(WordEntry(**word_data))
+        except ValidationError as e:
+            # Pydantic ValidationError만 명시적으로 처리
+            # 개별 단어 변환 실패 시 로그만 남기고 건너뛰기
+            ERROR_LOGGER.warning(
+                f"Skipping word entry due to validation error - "
+                f"Video ID: '{video_id}' - Word: {word_data.get('word', 'unknown')} - Error: {str(e)}"
+            )
+            continue
+    
+    phrases = []
+    for phrase_data in result.get("phrases", []):
+        try:
+            phrases.append(PhraseEntry(**phrase_data))
+        except ValidationError as e:
+            # Pydantic ValidationError만 명시적으로 처리
+            # 개별 숙어 변환 실패 시 로그만 남기고 건너뛰기
+            ERROR_LOGGER.warning(
+                f"Skipping phrase entry due to validation error - "
+                f"Video ID: '{video_id}' - Phrase: {phrase_data.get('phrase', 'unknown')} - Error: {str(e)}"
+            )
+            continue
+    
+    return VocabularyResponse(
+        video_id=result.get("videoId", video_id),
+        words=words,
+        phrases=phrases,
+        status="success",
+        message=None
+    )
+
+
+def _build_job_response(job: Dict[str, Any]) -> VocabularyJobResponse:
+    """작업 딕셔너리를 VocabularyJobResponse로 변환합니다."""
+    result = job.get("result")
+    return VocabularyJobResponse(
+        job_id=job["jobId"],
+        video_id=job["videoId"],
+        status=job["status"],
+        stage=job.get("stage"),
+        progress=job["progress"],
+        result=_build_vocabulary_response(result, job["videoId"]) if result else None,
+        error=job.get("error"),
+        created_at=job["createdAt"],
+        updated_at=job["updatedAt"]
+    )
+
+
 @router.post("/", response_model=VideoUrlResponse)
 def post_process_video_url(request: VideoUrlRequests):
     """YouTube URL을 받아서 Video ID를 반환합니다.
@@ -120,42 +189,8 @@ async def post_generate_vocabulary(video_id: str):
         # 3. LLM 처리 (비동기)
         result = await process_vocabulary(chunk_texts, video_id)
         
-        # 4. 딕셔너리를 Pydantic 모델로 변환
-        # processor.py는 camelCase를 사용하지만, 스키마는 snake_case를 사용
-        words = []
-        for word_data in result.get("words", []):
-            try:
-                words.append(WordEntry(**word_data))
-            except ValidationError as e:
-                # Pydantic ValidationError만 명시적으로 처리
-                # 개별 단어 변환 실패 시 로그만 남기고 건너뛰기
-                ERROR_LOGGER.warning(
-                    f"Skipping word entry due to validation error - "
-                    f"Video ID: '{video_id}' - Word: {word_data.get('word', 'unknown')} - Error: {str(e)}"
-                )
-                continue
-        
-        phrases = []
-        for phrase_data in result.get("phrases", []):
-            try:
-                phrases.append(PhraseEntry(**phrase_data))
-            except ValidationError as e:
-                # Pydantic ValidationError만 명시적으로 처리
-                # 개별 숙어 변환 실패 시 로그만 남기고 건너뛰기
-                ERROR_LOGGER.warning(
-                    f"Skipping phrase entry due to validation error - "
-                    f"Video ID: '{video_id}' - Phrase: {phrase_data.get('phrase', 'unknown')} - Error: {str(e)}"
-                )
-                continue
-        
-        # 5. 응답 반환
-        return VocabularyResponse(
-            video_id=result.get("videoId", video_id),
-            words=words,
-            phrases=phrases,
-            status="success",
-            message=None
-        )
+        # 4. 딕셔너리를 Pydantic 모델로 변환 후 응답 반환
+        return _build_vocabulary_response(result, video_id)
         
     except ValueError as e:
         # 자막 추출 실패 또는 LLM 처리 실패 등 (사용자 입력 오류 또는 처리 오류)
@@ -184,3 +219,61 @@ async def post_generate_vocabulary(video_id: str):
         )
 
 
+@router.post(
+    "/{video_id}/vocabulary/jobs",
+    response_model=VocabularyJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def post_create_vocabulary_job(video_id: str, request: Optional[VocabularyJobRequest] = None):
+    """단어장 생성 작업을 큐에 넣고 작업 ID를 바로 반환합니다.
+    
+    워커가 작업을 처리하는 동안 GET /api/video/vocabulary/jobs/{job_id}로
+    단계별 진행 상황과 결과를 조회할 수 있습니다.
+    
+    Args:
+        video_id: YouTube 영상 ID
+        request: VocabularyJobRequest 스키마 (webhook URL, 선택)
+        
+    Returns:
+        VocabularyJobResponse: 생성된 작업 정보 (status: "queued")
+        
+    Raises:
+        HTTPException: 허용되지 않은 webhook 대상(허용 목록 밖, 내부 주소)인 경우 400 Bad Request
+    """
+    webhook_url = request.webhook_url if request else None
+    if webhook_url:
+        try:
+            validate_webhook_url(webhook_url)
+        except ValueError as e:
+            ERROR_LOGGER.error(f"Rejected Webhook URL for Video ID: '{video_id}' - Error: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="허용되지 않은 webhook URL입니다. 공개된 주소의 URL을 사용해주세요."
+            )
+    job = get_job_queue().enqueue(video_id, webhook_url=webhook_url)
+    if settings.JOB_IN_PROCESS_WORKERS:
+        # 대기 중인 워커를 깨워 바로 처리
+        get_job_worker_pool().notify()
+    return _build_job_response(job)
+
+
+@router.get("/vocabulary/jobs/{job_id}", response_model=VocabularyJobResponse)
+def get_detail_vocabulary_job(job_id: str):
+    """단어장 생성 작업의 상태, 단계별 진행 상황, 결과를 조회합니다.
+    
+    Args:
+        job_id: 작업 ID
+        
+    Returns:
+        VocabularyJobResponse: 작업 정보 (완료 시 단어장 포함)
+        
+    Raises:
+        HTTPException: 작업이 없으면 404 Not Found
+    """
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다. 작업 ID를 확인해주세요."
+        )
+    return _build_job_response(job)
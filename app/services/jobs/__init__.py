@@ -0,0 +1,6 @@
+"""
+비동기 작업 모듈
+
+단어장 생성 요청을 작업(job)으로 영구 큐에 넣고, 워커가 꺼내 처리합니다.
+API는 작업 ID를 바로 반환하고, 클라이언트는 작업 조회로 단계별 진행 상황과 결과를 확인합니다.
+"""
@@ -0,0 +1,44 @@
+"""
+작업 큐 백엔드 선택 모듈
+
+settings.JOB_QUEUE_BACKEND에 따라 프로세스 전역 작업 큐를 만듭니다.
+API 노드와 독립 워커(python -m app.worker)가 같은 설정(같은 파일/디렉터리)을 사용해야 합니다.
+"""
+from typing import Optional
+from app.core.config import settings
+from app.services.jobs.queue import JobQueue
+from app.services.jobs.sqlite_queue import SqliteJobQueue
+from app.services.jobs.filesystem_queue import FileSystemJobQueue
+
+JOB_QUEUE_BACKEND_SQLITE = "sqlite"
+JOB_QUEUE_BACKEND_FILESYSTEM = "filesystem"
+
+_JOB_QUEUE: Optional[JobQueue] = None
+
+
+def create_job_queue(backend: str) -> JobQueue:
+    """
+    설정된 경로와 lease 설정으로 작업 큐 백엔드를 만듭니다.
+    
+    Args:
+        backend: "sqlite" (JOB_QUEUE_PATH) 또는 "filesystem" (JOB_QUEUE_DIR)
+        
+    Returns:
+        작업 큐
+        
+    Raises:
+        ValueError: 지원하지 않는 백엔드 이름인 경우
+    """
+    if backend == JOB_QUEUE_BACKEND_SQLITE:
+        return SqliteJobQueue(settings.JOB_QUEUE_PATH, settings.JOB_LEASE_SECONDS, settings.JOB_MAX_ATTEMPTS)
+    if backend == JOB_QUEUE_BACKEND_FILESYSTEM:
+        return FileSystemJobQueue(settings.JOB_QUEUE_DIR, settings.JOB_LEASE_SECONDS, settings.JOB_MAX_ATTEMPTS)
+    raise ValueError(f"Unsupported job queue backend: '{backend}'")
+
+
+def get_job_queue() -> JobQueue:
+    """프로세스 전역 작업 큐를 반환합니다 (처음 사용할 때 JOB_QUEUE_BACKEND로 생성)."""
+    global _JOB_QUEUE
+    if _JOB_QUEUE is None:
+        _JOB_QUEUE = create_job_queue(settings.JOB_QUEUE_BACKEND)
+    return _JOB_QUEUE
@@ -0,0 +1,240 @@
+"""
+파일시스템 작업 큐 백엔드
+
+SQLite 없이 디렉터리 하나로 작업 큐를 구성합니다 (같은 호스트의 여러 프로세스가 공유).
+
+디렉터리 구조:
+    {root}/jobs/{job_id}.json          작업 딕셔너리 (임시 파일 작성 후 os.replace로 원자적 교체)
+    {root}/queued/{생성시각}-{job_id}   대기 순서 표시 파일 (이름순 = 먼저 들어온 순서)
+    {root}/running/{job_id}            lease 만료 확인 대상 표시 파일
+    {root}/.lock                       프로세스 간 배타 잠금 (fcntl.flock)
+
+상태를 바꾸는 작업은 모두 .lock을 잡은 상태에서 수행하므로 여러 워커가 같은 작업을 꺼내지 않습니다.
+조회(get)는 잠금 없이 작업 파일만 읽습니다 (os.replace 덕분에 쓰는 중인 파일을 읽지 않음).
+"""
+import fcntl
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Any
+from app.services.jobs.queue import (
+    JobQueue,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUSES,
+    JOB_ERROR_ABANDONED,
+    get_stage_progress,
+)
+
+
+class FileSystemJobQueue(JobQueue):
+    """디렉터리 기반 영구 작업 큐 (단일 호스트용)"""
+
+    def __init__(self, root: str, lease_seconds: float = 60.0, max_attempts: int = 3):
+        self.root = Path(root)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._jobs_dir = self.root / "jobs"
+        self._queued_dir = self.root / "queued"
+        self._running_dir = self.root / "running"
+        for directory in (self._jobs_dir, self._queued_dir, self._running_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.root / ".lock"
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """스레드 잠금과 프로세스 간 파일 잠금을 함께 잡습니다."""
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _job_path(self, job_id: str) -> Path:
+        return self._jobs_dir / f"{job_id}.json"
+
+    def _write(self, job: Dict[str, Any]) -> None:
+        """작업 파일을 원자적으로 교체합니다."""
+        path = self._job_path(job["jobId"])
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _enqueue_marker(self, job: Dict[str, Any]) -> None:
+        """대기 순서 표시 파일을 만듭니다 (생성 시각 기준 정렬)."""
+        (self._queued_dir / f"{int(job['createdAt'] * 1_000_000):020d}-{job['jobId']}").touch()
+
+    @staticmethod
+    def _reset_to_queued(job: Dict[str, Any]) -> None:
+        job.update({
+            "status": JOB_STATUS_QUEUED,
+            "stage": None,
+            "progress": get_stage_progress(None),
+            "leaseOwner": None,
+            "leaseExpiresAt": None
+        })
+
+    def _update(self, job_id: str, changes: Dict[str, Any], worker_id: Optional[str]) -> bool:
+        """작업 1건을 갱신합니다 (worker_id가 주어지면 lease를 가진 경우에만, 잠금 안에서 호출)."""
+        job = self.get(job_id)
+        if job is None:
+            return False
+        if worker_id is not None and (job["status"] != JOB_STATUS_RUNNING or job["leaseOwner"] != worker_id):
+            return False
+        job.update(changes)
+        job["updatedAt"] = time.time()
+        self._write(job)
+        if job["status"] != JOB_STATUS_RUNNING:
+            (self._running_dir / job_id).unlink(missing_ok=True)
+        return True
+
+    def enqueue(self, video_id: str, webhook_url: Optional[str] = None) -> Dict[str, Any]:
+        """작업을 큐에 넣습니다."""
+        now = time.time()
+        job = {
+            "jobId": uuid.uuid4().hex,
+            "videoId": video_id,
+            "status": JOB_STATUS_QUEUED,
+            "stage": None,
+            "progress": get_stage_progress(None),
+            "result": None,
+            "error": None,
+            "webhookUrl": webhook_url,
+            "attempts": 0,
+            "leaseOwner": None,
+            "leaseExpiresAt": None,
+            "createdAt": now,
+            "updatedAt": now
+        }
+        with self._locked():
+            self._write(job)
+            self._enqueue_marker(job)
+        return job
+
+    def _requeue_expired_locked(self, now: float) -> int:
+        """lease가 만료된 작업을 다시 넣거나 실패 처리합니다 (잠금 안에서 호출)."""
+        count = 0
+        for marker in self._running_dir.iterdir():
+            job = self.get(marker.name)
+            if job is None or job["status"] != JOB_STATUS_RUNNING:
+                marker.unlink(missing_ok=True)
+                continue
+            if job["leaseExpiresAt"] is None or job["leaseExpiresAt"] >= now:
+                continue
+            if job["attempts"] >= self.max_attempts:
+                job.update({
+                    "status": JOB_STATUS_FAILED,
+                    "error": JOB_ERROR_ABANDONED,
+                    "leaseOwner": None,
+                    "leaseExpiresAt": None
+                })
+            else:
+                self._reset_to_queued(job)
+            job["updatedAt"] = now
+            self._write(job)
+            if job["status"] == JOB_STATUS_QUEUED:
+                self._enqueue_marker(job)
+            marker.unlink(missing_ok=True)
+            count += 1
+        return count
+
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """만료된 lease를 정리한 뒤 가장 오래된 queued 작업 1건을 running으로 바꿔 반환합니다."""
+        with self._locked():
+            now = time.time()
+            self._requeue_expired_locked(now)
+            for marker in sorted(self._queued_dir.iterdir()):
+                marker.unlink(missing_ok=True)
+                job = self.get(marker.name.split("-", 1)[1])
+                if job is None or job["status"] != JOB_STATUS_QUEUED:
+                    continue
+                job.update({
+                    "status": JOB_STATUS_RUNNING,
+                    "attempts": job["attempts"] + 1,
+                    "leaseOwner": worker_id,
+                    "leaseExpiresAt": now + self.lease_seconds,
+                    "updatedAt": now
+                })
+                self._write(job)
+                (self._running_dir / job["jobId"]).touch()
+                return job
+        return None
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """작업의 lease를 연장합니다."""
+        with self._locked():
+            return self._update(job_id, {"leaseExpiresAt": time.time() + self.lease_seconds}, worker_id)
+
+    def update_stage(self, job_id: str, stage: str, worker_id: Optional[str] = None) -> bool:
+        """작업의 현재 단계와 단계별 진행 상황을 기록합니다."""
+        with self._locked():
+            return self._update(job_id, {"stage": stage, "progress": get_stage_progress(stage)}, worker_id)
+
+    def complete(self, job_id: str, result: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """작업을 완료 처리하고 결과를 저장합니다."""
+        changes = {
+            "status": JOB_STATUS_COMPLETED,
+            "stage": None,
+            "progress": get_stage_progress(None, finished=True),
+            "result": result,
+            "leaseOwner": None,
+            "leaseExpiresAt": None
+        }
+        with self._locked():
+            return self._update(job_id, changes, worker_id)
+
+    def fail(self, job_id: str, error: str, worker_id: Optional[str] = None) -> bool:
+        """작업을 실패 처리합니다 (실패한 단계는 stage에 남김)."""
+        changes = {"status": JOB_STATUS_FAILED, "error": error, "leaseOwner": None, "leaseExpiresAt": None}
+        with self._locked():
+            return self._update(job_id, changes, worker_id)
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """중단한 작업을 바로 다시 큐에 넣습니다 (시도 횟수는 되돌림)."""
+        with self._locked():
+            job = self.get(job_id)
+            if job is None or job["status"] != JOB_STATUS_RUNNING or job["leaseOwner"] != worker_id:
+                return False
+            self._reset_to_queued(job)
+            job["attempts"] = max(job["attempts"] - 1, 0)
+            job["updatedAt"] = time.time()
+            self._write(job)
+            self._enqueue_marker(job)
+            (self._running_dir / job_id).unlink(missing_ok=True)
+        return True
+
+    def requeue_expired(self) -> int:
+        """lease가 만료된 running 작업을 다시 큐에 넣습니다."""
+        with self._locked():
+            return self._requeue_expired_locked(time.time())
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업을 조회합니다 (없으면 None)."""
+        # 작업 ID는 uuid4 hex이므로 경로 구분자 등이 섞인 ID는 파일을 찾지 않음
+        if not job_id.isalnum():
+            return None
+        try:
+            with open(self._job_path(job_id), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def get_stats(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환합니다 (작업 파일 전체를 읽음)."""
+        counts = {status: 0 for status in JOB_STATUSES}
+        for path in self._jobs_dir.glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    counts[json.load(f)["status"]] += 1
+            except (FileNotFoundError, ValueError, KeyError):
+                continue
+        return counts
@@ -0,0 +1,152 @@
+"""
+단어장 생성 작업 큐 모듈
+
+작업 큐 백엔드의 공통 인터페이스(JobQueue)와 작업 상태/단계 상수를 정의합니다.
+단일 호스트용 구현으로 SQLite(sqlite_queue.py)와 파일시스템(filesystem_queue.py) 백엔드가 있으며,
+settings.JOB_QUEUE_BACKEND로 선택합니다 (backends.get_job_queue).
+
+- 상태: queued → running → completed | failed
+- 진행 상황: 단계별 상태 {"transcript": "completed", "extraction": "running", ...}
+- 꺼내기(claim): 가장 오래된 queued 작업 1건을 원자적으로 running으로 바꾸고 워커에게 lease를 부여
+- lease: 워커는 heartbeat로 lease를 갱신하며, 만료된 lease의 작업(죽은 워커의 작업)은 다시 queued가 됨
+"""
+import socket
+import os
+import uuid
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Any
+from app.services.llm.processor import STAGE_MERGE
+from app.services.llm.stages import STAGE_EXTRACTION, STAGE_ENRICHMENT
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUSES = (JOB_STATUS_QUEUED, JOB_STATUS_RUNNING, JOB_STATUS_COMPLETED, JOB_STATUS_FAILED)
+
+STAGE_TRANSCRIPT = "transcript"
+# 작업의 단계 순서 (자막 추출 → 1단계 추출 → 2단계 상세화 → 3단계 병합)
+JOB_STAGES = (STAGE_TRANSCRIPT, STAGE_EXTRACTION, STAGE_ENRICHMENT, STAGE_MERGE)
+
+STAGE_STATUS_PENDING = "pending"
+STAGE_STATUS_RUNNING = "running"
+STAGE_STATUS_COMPLETED = "completed"
+
+# lease 만료가 JOB_MAX_ATTEMPTS번 반복된 작업에 기록하는 사용자용 메시지
+JOB_ERROR_ABANDONED = "작업 처리가 반복해서 중단되었습니다. 잠시 후 다시 요청해주세요."
+
+
+def get_stage_progress(current_stage: Optional[str], finished: bool = False) -> Dict[str, str]:
+    """
+    현재 단계 기준 단계별 진행 상황을 만듭니다.
+    
+    Args:
+        current_stage: 진행 중인 단계 (JOB_STAGES 중 하나, 시작 전이면 None)
+        finished: 모든 단계가 끝났으면 True
+    
+    Returns:
+        {단계: "pending" | "running" | "completed"} 딕셔너리
+    """
+    if finished:
+        return {stage: STAGE_STATUS_COMPLETED for stage in JOB_STAGES}
+    if current_stage not in JOB_STAGES:
+        return {stage: STAGE_STATUS_PENDING for stage in JOB_STAGES}
+    current_index = JOB_STAGES.index(current_stage)
+    return {
+        stage: (
+            STAGE_STATUS_COMPLETED if index < current_index
+            else STAGE_STATUS_RUNNING if index == current_index
+            else STAGE_STATUS_PENDING
+        )
+        for index, stage in enumerate(JOB_STAGES)
+    }
+
+
+def new_worker_id() -> str:
+    """lease 소유자로 사용할 워커 ID를 만듭니다 (호스트:PID:임의값)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobQueue(ABC):
+    """
+    작업 큐 백엔드 인터페이스
+    
+    작업은 camelCase 딕셔너리(jobId, videoId, status, stage, progress, result, error,
+    webhookUrl, attempts, leaseOwner, leaseExpiresAt, createdAt, updatedAt)로 주고받습니다.
+    lease 유지 시간(lease_seconds)과 작업당 최대 시도 횟수(max_attempts)는 백엔드 생성 시 정합니다.
+    worker_id를 받는 쓰기 메서드는 해당 워커가 lease를 가지고 있을 때만 반영되고,
+    lease를 잃은(만료 후 다른 워커가 가져간) 워커의 기록은 무시됩니다.
+    백엔드는 모든 메서드를 구현해야 합니다 (빠진 메서드가 있으면 생성 시 TypeError).
+    """
+
+    @abstractmethod
+    def enqueue(self, video_id: str, webhook_url: Optional[str] = None) -> Dict[str, Any]:
+        """
+        작업을 큐에 넣습니다.
+        
+        Args:
+            video_id: 비디오 ID
+            webhook_url: 작업이 끝나면 결과를 POST할 URL (선택)
+        
+        Returns:
+            생성된 작업 딕셔너리 (status: "queued")
+        """
+
+    @abstractmethod
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        lease가 만료된 작업을 먼저 다시 큐에 넣은 뒤, 가장 오래된 queued 작업 1건을 running으로 바꿔 반환합니다.
+        
+        Args:
+            worker_id: lease 소유자 (new_worker_id)
+        
+        Returns:
+            꺼낸 작업 딕셔너리 (없으면 None)
+        """
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        작업의 lease를 지금부터 lease_seconds만큼 연장합니다.
+        
+        Args:
+            job_id: 작업 ID
+            worker_id: lease 소유자
+        
+        Returns:
+            연장 성공 여부 (lease를 잃었으면 False)
+        """
+
+    @abstractmethod
+    def update_stage(self, job_id: str, stage: str, worker_id: Optional[str] = None) -> bool:
+        """작업의 현재 단계와 단계별 진행 상황을 기록합니다 (반영 여부 반환)."""
+
+    @abstractmethod
+    def complete(self, job_id: str, result: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """작업을 완료 처리하고 결과를 저장합니다 (반영 여부 반환)."""
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str, worker_id: Optional[str] = None) -> bool:
+        """작업을 실패 처리합니다 (실패한 단계는 stage에 남김, 반영 여부 반환)."""
+
+    @abstractmethod
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """워커 종료로 중단한 작업을 lease 만료를 기다리지 않고 바로 다시 큐에 넣습니다 (반영 여부 반환)."""
+
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """
+        lease가 만료된 running 작업(죽은 워커의 작업)을 다시 queued로 돌립니다.
+        이미 max_attempts번 시도한 작업은 다시 넣지 않고 실패 처리합니다.
+        
+        Returns:
+            다시 큐에 넣거나 실패 처리한 작업 수
+        """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업을 조회합니다 (없으면 None)."""
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환합니다."""
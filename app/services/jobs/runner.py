@@ -0,0 +1,219 @@
+"""
+단어장 생성 작업 실행 모듈
+
+크기가 제한된 워커 풀(settings.JOB_WORKER_CONCURRENCY)이 작업 큐에서 작업을 꺼내
+자막 추출 → 단어장 생성(process_vocabulary)을 실행하고, 단계별 진행 상황과 결과를 큐에 기록합니다.
+워커 풀은 API 프로세스 안(JOB_IN_PROCESS_WORKERS) 또는 독립 워커 프로세스(python -m app.worker)에서 실행됩니다.
+
+- 작업 실행 중에는 JOB_HEARTBEAT_INTERVAL마다 lease를 갱신하고, lease를 잃으면 작업을 중단합니다.
+- 워커가 종료되면 진행 중인 작업을 바로 다시 큐에 넣습니다 (비정상 종료 시에는 lease 만료 후 다시 들어감).
+- 작업에 webhook URL이 있으면 완료/실패 후 작업 내용을 POST합니다 (jobs.webhook, 전송 실패는 로그만 남김).
+- 큐 백엔드 호출(SQLite/파일 잠금)은 이벤트 루프를 막지 않도록 asyncio.to_thread로 실행합니다.
+- 큐 오류 등 예상하지 못한 예외가 나도 워커는 로그를 남기고 poll_interval만큼 쉰 뒤 계속 동작합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional, Any
+from app.core.config import settings
+from app.core.logging import get_access_logger, get_error_logger
+from app.services.transcript import get_transcript
+from app.services.llm.processor import process_vocabulary
+from app.services.jobs.queue import JobQueue, STAGE_TRANSCRIPT, new_worker_id
+from app.services.jobs.backends import get_job_queue
+from app.services.jobs.webhook import send_job_webhook
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+# 작업 실패 시 사용자에게 보여줄 메시지 (실제 에러는 로그에 기록)
+JOB_ERROR_INVALID_INPUT = "단어장 생성 중 오류가 발생했습니다. 입력값을 확인하거나 잠시 후 다시 시도해주세요."
+JOB_ERROR_INTERNAL = "일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+
+async def _keep_lease(queue: JobQueue, job_id: str, worker_id: str, work: asyncio.Task) -> None:
+    """작업이 끝날 때까지 lease를 갱신하고, lease를 잃으면 작업을 취소합니다."""
+    while not work.done():
+        await asyncio.sleep(settings.JOB_HEARTBEAT_INTERVAL)
+        if work.done():
+            return
+        try:
+            renewed = await asyncio.to_thread(queue.heartbeat, job_id, worker_id)
+        except Exception as e:
+            # 일시적인 큐 오류는 다음 주기에 다시 갱신 (lease가 남아 있는 동안은 작업 유지)
+            ERROR_LOGGER.error(
+                f"Job Heartbeat Failed - Job ID: '{job_id}' - Worker: '{worker_id}' - Error: {str(e)}",
+                exc_info=True
+            )
+            continue
+        if not renewed and not work.done():
+            ERROR_LOGGER.warning(f"Job Lease Lost - Job ID: '{job_id}' - Worker: '{worker_id}'")
+            work.cancel()
+            return
+
+
+async def _execute_vocabulary_job(queue: JobQueue, job: Dict[str, Any]) -> Dict[str, Any]:
+    """자막을 추출하고 단어장을 생성합니다 (단계가 시작될 때마다 진행 상황 기록)."""
+    job_id = job["jobId"]
+    video_id = job["videoId"]
+    worker_id = job["leaseOwner"]
+    last_record: Optional[asyncio.Task] = None
+    
+    async def record_stage(stage: str, previous: Optional[asyncio.Task]) -> None:
+        """이전 단계 기록이 끝난 뒤 스레드에서 진행 상황 기록 (기록 실패는 로그만 남김)"""
+        if previous is not None:
+            await previous
+        try:
+            await asyncio.to_thread(queue.update_stage, job_id, stage, worker_id)
+        except Exception as e:
+            ERROR_LOGGER.error(
+                f"Job Stage Update Failed - Job ID: '{job_id}' - Stage: {stage} - Error: {str(e)}",
+                exc_info=True
+            )
+    
+    def on_stage(stage: str) -> None:
+        """단계가 시작될 때마다 진행 상황 기록 (동기 콜백이므로 기록은 순서대로 백그라운드에서 실행)"""
+        nonlocal last_record
+        last_record = asyncio.create_task(record_stage(stage, last_record))
+    
+    try:
+        # 자막 추출은 동기 함수이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        on_stage(STAGE_TRANSCRIPT)
+        transcript_list = await asyncio.to_thread(get_transcript, video_id)
+        chunk_texts = [chunk.get("text", "") for chunk in transcript_list]
+        if not chunk_texts:
+            raise ValueError(f"Empty transcript chunks for Video ID: '{video_id}'")
+        
+        return await process_vocabulary(chunk_texts, video_id, on_stage=on_stage)
+    finally:
+        # 완료/실패 기록보다 단계 기록이 늦게 반영되지 않도록 남은 기록을 기다림
+        if last_record is not None:
+            await asyncio.shield(last_record)
+
+
+async def run_vocabulary_job(queue: JobQueue, job: Dict[str, Any]) -> None:
+    """
+    꺼낸 작업 1건을 실행하고 결과(또는 실패)를 큐에 기록한 뒤 webhook을 보냅니다.
+    
+    lease를 가진 동안에만 결과를 기록하며, 워커 종료로 취소되면 작업을 다시 큐에 넣습니다.
+    
+    Args:
+        queue: 작업 큐
+        job: claim_next로 꺼낸 작업 딕셔너리 (leaseOwner 포함)
+    """
+    job_id = job["jobId"]
+    video_id = job["videoId"]
+    worker_id = job["leaseOwner"]
+    ACCESS_LOGGER.info(f"Start Vocabulary Job - Job ID: '{job_id}' - Video ID: '{video_id}' - Worker: '{worker_id}'")
+    
+    work = asyncio.create_task(_execute_vocabulary_job(queue, job))
+    heartbeat = asyncio.create_task(_keep_lease(queue, job_id, worker_id, work))
+    try:
+        result = await asyncio.shield(work)
+        recorded = await asyncio.to_thread(queue.complete, job_id, result, worker_id)
+        ACCESS_LOGGER.info(f"End Vocabulary Job - Job ID: '{job_id}' - Video ID: '{video_id}'")
+        
+    except asyncio.CancelledError:
+        if work.cancelled() and heartbeat.done() and not heartbeat.cancelled():
+            # lease를 잃어 작업만 취소된 경우 (다른 워커가 이어서 처리하므로 기록하지 않음)
+            return
+        # 워커 종료로 취소된 경우 lease 만료를 기다리지 않고 바로 다시 큐에 넣음
+        work.cancel()
+        await asyncio.to_thread(queue.release, job_id, worker_id)
+        ACCESS_LOGGER.info(f"Released Vocabulary Job - Job ID: '{job_id}' - Worker: '{worker_id}'")
+        raise
+    except Exception as e:
+        ERROR_LOGGER.error(
+            f"Vocabulary Job Failed - Job ID: '{job_id}' - Video ID: '{video_id}' - Error: {str(e)}",
+            exc_info=True
+        )
+        recorded = await asyncio.to_thread(
+            queue.fail, job_id, JOB_ERROR_INVALID_INPUT if isinstance(e, ValueError) else JOB_ERROR_INTERNAL, worker_id
+        )
+    finally:
+        heartbeat.cancel()
+    
+    if not recorded:
+        # lease 만료 후 다른 워커가 가져간 작업의 결과는 버림
+        ERROR_LOGGER.warning(f"Discarded Job Result Without Lease - Job ID: '{job_id}' - Worker: '{worker_id}'")
+        return
+    await send_job_webhook(await asyncio.to_thread(queue.get, job_id))
+
+
+class JobWorkerPool:
+    """작업 큐를 처리하는 크기 제한 워커 풀 (API 프로세스 안 또는 독립 워커 프로세스에서 실행)"""
+
+    def __init__(self, queue: JobQueue, concurrency: int, poll_interval: float, worker_id: Optional[str] = None):
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or new_worker_id()
+        self._wakeup = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """죽은 워커의 작업을 다시 큐에 넣고 워커를 시작합니다."""
+        requeued = self.queue.requeue_expired()
+        if requeued:
+            ACCESS_LOGGER.info(f"Requeued Expired Jobs: {requeued}")
+        self._loop = asyncio.get_running_loop()
+        self._tasks = [asyncio.create_task(self._run_worker()) for _ in range(self.concurrency)]
+        ACCESS_LOGGER.info(f"Job Worker Pool Started - Worker: '{self.worker_id}' - Concurrency: {self.concurrency}")
+
+    def notify(self) -> None:
+        """
+        새 작업이 들어왔음을 알려 대기 중인 워커를 깨웁니다.
+        
+        동기 라우트(스레드풀)에서도 호출되므로 asyncio.Event는 워커 풀의 이벤트 루프에서 설정합니다.
+        """
+        if self._loop is None or self._loop.is_closed():
+            # 워커 풀이 시작되지 않았으면 깨울 워커가 없음
+            return
+        self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def stop(self) -> None:
+        """워커를 취소하고 종료를 기다립니다 (진행 중인 작업은 다시 큐에 들어감)."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _claim_next(self) -> Optional[Dict[str, Any]]:
+        """스레드에서 다음 작업을 꺼냅니다 (꺼내는 도중 워커가 취소되면 꺼낸 작업을 바로 큐에 되돌림)."""
+        claim = asyncio.ensure_future(asyncio.to_thread(self.queue.claim_next, self.worker_id))
+        try:
+            return await asyncio.shield(claim)
+        except asyncio.CancelledError:
+            job = await claim
+            if job is not None:
+                await asyncio.to_thread(self.queue.release, job["jobId"], self.worker_id)
+            raise
+
+    async def _run_worker(self) -> None:
+        """작업을 꺼내 실행하고, 큐가 비어 있으면 알림 또는 poll_interval까지 대기"""
+        while True:
+            try:
+                job = await self._claim_next()
+                if job is None:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await run_vocabulary_job(self.queue, job)
+            except Exception as e:
+                # 큐 오류 등으로 워커가 조용히 죽지 않도록 로그를 남기고 잠시 쉰 뒤 계속 (취소는 그대로 전파)
+                ERROR_LOGGER.error(f"Job Worker Error - Worker: '{self.worker_id}' - Error: {str(e)}", exc_info=True)
+                await asyncio.sleep(self.poll_interval)
+
+
+_JOB_WORKER_POOL: Optional[JobWorkerPool] = None
+
+
+def get_job_worker_pool() -> JobWorkerPool:
+    """프로세스 전역 워커 풀을 반환합니다."""
+    global _JOB_WORKER_POOL
+    if _JOB_WORKER_POOL is None:
+        _JOB_WORKER_POOL = JobWorkerPool(
+            get_job_queue(), settings.JOB_WORKER_CONCURRENCY, settings.JOB_WORKER_POLL_INTERVAL
+        )
+    return _JOB_WORKER_POOL
@@ -0,0 +1,209 @@
+"""
+SQLite 작업 큐 백엔드
+
+작업을 SQLite 파일(WAL 모드)에 저장하여 서버나 워커가 재시작되어도 대기/진행 중인 작업을 잃지 않습니다.
+WAL 모드에서는 워커가 작업 상태를 쓰는 동안에도 API의 작업 조회(읽기)가 막히지 않으며,
+같은 호스트의 여러 프로세스(API 노드, python -m app.worker)가 같은 파일을 공유할 수 있습니다.
+꺼내기(claim)는 BEGIN IMMEDIATE 트랜잭션 안에서 수행하여 워커 간 중복 처리를 막습니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Any
+from app.services.jobs.queue import (
+    JobQueue,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_STATUSES,
+    JOB_ERROR_ABANDONED,
+    get_stage_progress,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    progress TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    webhook_url TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+# worker_id가 주어졌을 때 lease 소유자 확인 조건
+_OWNER_CONDITION = " AND status = ? AND lease_owner = ?"
+
+
+class SqliteJobQueue(JobQueue):
+    """SQLite(WAL) 기반 영구 작업 큐"""
+
+    def __init__(self, path: str, lease_seconds: float = 60.0, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # 트랜잭션을 직접 관리 (claim의 BEGIN IMMEDIATE), 다른 프로세스가 쓰는 중이면 잠시 대기
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10.0)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        """DB 행을 작업 딕셔너리로 변환합니다."""
+        return {
+            "jobId": row["job_id"],
+            "videoId": row["video_id"],
+            "status": row["status"],
+            "stage": row["stage"],
+            "progress": json.loads(row["progress"]),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "webhookUrl": row["webhook_url"],
+            "attempts": row["attempts"],
+            "leaseOwner": row["lease_owner"],
+            "leaseExpiresAt": row["lease_expires_at"],
+            "createdAt": row["created_at"],
+            "updatedAt": row["updated_at"]
+        }
+
+    def _update(self, job_id: str, assignments: str, params: tuple, worker_id: Optional[str]) -> bool:
+        """작업 1건을 갱신합니다 (worker_id가 주어지면 lease를 가진 경우에만)."""
+        sql = f"UPDATE jobs SET {assignments}, updated_at = ? WHERE job_id = ?"
+        params = params + (time.time(), job_id)
+        if worker_id is not None:
+            sql += _OWNER_CONDITION
+            params += (JOB_STATUS_RUNNING, worker_id)
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+        return cursor.rowcount > 0
+
+    def enqueue(self, video_id: str, webhook_url: Optional[str] = None) -> Dict[str, Any]:
+        """작업을 큐에 넣습니다."""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, video_id, status, progress, webhook_url, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, video_id, JOB_STATUS_QUEUED, json.dumps(get_stage_progress(None)), webhook_url, now, now)
+            )
+        return self.get(job_id)
+
+    def _requeue_expired_locked(self, now: float) -> int:
+        """lease가 만료된 작업을 다시 넣거나 실패 처리합니다 (트랜잭션 안에서 호출)."""
+        failed = self._conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+            "WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+            (JOB_STATUS_FAILED, JOB_ERROR_ABANDONED, now, JOB_STATUS_RUNNING, now, self.max_attempts)
+        ).rowcount
+        requeued = self._conn.execute(
+            "UPDATE jobs SET status = ?, stage = NULL, progress = ?, lease_owner = NULL, lease_expires_at = NULL, "
+            "updated_at = ? WHERE status = ? AND lease_expires_at < ?",
+            (JOB_STATUS_QUEUED, json.dumps(get_stage_progress(None)), now, JOB_STATUS_RUNNING, now)
+        ).rowcount
+        return failed + requeued
+
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """만료된 lease를 정리한 뒤 가장 오래된 queued 작업 1건을 running으로 바꿔 반환합니다."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                self._requeue_expired_locked(now)
+                row = self._conn.execute(
+                    "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                    (JOB_STATUS_QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, lease_owner = ?, "
+                        "lease_expires_at = ?, updated_at = ? WHERE job_id = ?",
+                        (JOB_STATUS_RUNNING, worker_id, now + self.lease_seconds, now, row["job_id"])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row["job_id"]) if row is not None else None
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """작업의 lease를 연장합니다."""
+        return self._update(job_id, "lease_expires_at = ?", (time.time() + self.lease_seconds,), worker_id)
+
+    def update_stage(self, job_id: str, stage: str, worker_id: Optional[str] = None) -> bool:
+        """작업의 현재 단계와 단계별 진행 상황을 기록합니다."""
+        return self._update(
+            job_id, "stage = ?, progress = ?", (stage, json.dumps(get_stage_progress(stage))), worker_id
+        )
+
+    def complete(self, job_id: str, result: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """작업을 완료 처리하고 결과를 저장합니다."""
+        return self._update(
+            job_id,
+            "status = ?, stage = NULL, progress = ?, result = ?, lease_owner = NULL, lease_expires_at = NULL",
+            (
+                JOB_STATUS_COMPLETED,
+                json.dumps(get_stage_progress(None, finished=True)),
+                json.dumps(result, ensure_ascii=False)
+            ),
+            worker_id
+        )
+
+    def fail(self, job_id: str, error: str, worker_id: Optional[str] = None) -> bool:
+        """작업을 실패 처리합니다 (실패한 단계는 stage에 남김)."""
+        return self._update(
+            job_id, "status = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL",
+            (JOB_STATUS_FAILED, error), worker_id
+        )
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """중단한 작업을 바로 다시 큐에 넣습니다 (시도 횟수는 되돌림)."""
+        return self._update(
+            job_id,
+            "status = ?, stage = NULL, progress = ?, attempts = MAX(attempts - 1, 0), "
+            "lease_owner = NULL, lease_expires_at = NULL",
+            (JOB_STATUS_QUEUED, json.dumps(get_stage_progress(None))),
+            worker_id
+        )
+
+    def requeue_expired(self) -> int:
+        """lease가 만료된 running 작업을 다시 큐에 넣습니다."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                count = self._requeue_expired_locked(time.time())
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return count
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업을 조회합니다 (없으면 None)."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row is not None else None
+
+    def get_stats(self) -> Dict[str, int]:
+        """상태별 작업 수를 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        counts = {row["status"]: row["count"] for row in rows}
+        return {status: counts.get(status, 0) for status in JOB_STATUSES}
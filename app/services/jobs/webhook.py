@@ -0,0 +1,88 @@
+"""
+작업 완료 webhook 모듈
+
+작업이 끝나면(완료/실패) 요청 시 받은 webhook URL로 작업 내용을 POST합니다.
+webhook URL은 외부 사용자가 정하므로 서버 내부망을 호출하는 데(SSRF) 쓰이지 않도록 대상을 제한합니다.
+- JOB_WEBHOOK_ALLOWED_HOSTS가 있으면 목록에 있는 호스트만 허용
+- 목록이 없으면 DNS 조회 결과가 사설/루프백/링크 로컬/예약 주소인 호스트를 거부
+- 리다이렉트는 따라가지 않음 (허용된 호스트가 내부 주소로 보내는 것을 막기 위해)
+- 작업 등록 시와 전송 직전에 모두 검사 (등록 후 DNS 응답이 바뀌는 경우 대비)
+"""
+import asyncio
+import ipaddress
+import socket
+import httpx
+from typing import Dict, Any
+from urllib.parse import urlparse
+from app.core.config import settings
+from app.core.logging import get_access_logger, get_error_logger
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+# webhook으로 보내지 않는 내부 필드
+_WEBHOOK_EXCLUDED_KEYS = ("webhookUrl", "leaseOwner", "leaseExpiresAt")
+
+
+def _is_public_address(address: str) -> bool:
+    """인터넷에서 접근 가능한 주소인지 확인합니다 (IPv4-mapped IPv6는 IPv4로 판단)."""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def validate_webhook_url(url: str) -> None:
+    """
+    webhook URL이 허용된 대상인지 검사합니다 (DNS 조회를 하므로 이벤트 루프에서는 스레드로 실행).
+
+    Args:
+        url: webhook URL
+
+    Raises:
+        ValueError: http/https가 아니거나, 허용 목록에 없거나, 내부 주소로 연결되는 경우
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    if parsed.scheme not in ("http", "https") or not host:
+        raise ValueError(f"Invalid webhook URL: '{url}'")
+    if settings.JOB_WEBHOOK_ALLOWED_HOSTS:
+        if host not in {allowed.lower() for allowed in settings.JOB_WEBHOOK_ALLOWED_HOSTS}:
+            raise ValueError(f"Webhook host not allowed: '{host}'")
+        return
+    try:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)}
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Webhook host could not be resolved: '{host}' - {str(e)}")
+    blocked = sorted(address for address in addresses if not _is_public_address(address))
+    if blocked:
+        raise ValueError(f"Webhook host resolves to a non-public address: '{host}' -> {blocked}")
+
+
+async def send_job_webhook(job: Dict[str, Any]) -> bool:
+    """
+    작업 완료/실패 알림을 webhook URL로 POST합니다.
+
+    Args:
+        job: 작업 딕셔너리 (webhookUrl이 없으면 전송하지 않음)
+
+    Returns:
+        전송 성공 여부 (webhook URL이 없거나 허용되지 않은 대상이면 False)
+    """
+    webhook_url = job.get("webhookUrl")
+    if not webhook_url:
+        return False
+    payload = {key: value for key, value in job.items() if key not in _WEBHOOK_EXCLUDED_KEYS}
+    try:
+        await asyncio.to_thread(validate_webhook_url, webhook_url)
+        async with httpx.AsyncClient(timeout=settings.JOB_WEBHOOK_TIMEOUT, follow_redirects=False) as client:
+            response = await client.post(webhook_url, json=payload)
+            response.raise_for_status()
+    except Exception as e:
+        ERROR_LOGGER.error(
+            f"Job Webhook Failed - Job ID: '{job['jobId']}' - URL: '{webhook_url}' - Error: {str(e)}"
+        )
+        return False
+    ACCESS_LOGGER.info(f"Job Webhook Sent - Job ID: '{job['jobId']}' - Status: {job['status']}")
+    return True
@@ -0,0 +1,155 @@
+"""
+KV cache 토큰 예산 기반 요청 수락(admission control) 모듈
+
+vLLM은 요청마다 프롬프트 토큰 + max_tokens만큼 KV cache 블록을 사용합니다.
+동시 요청 "개수" 대신 "예상 토큰 수"를 가중치로 하는 세마포어로, 워커 전체에서 서버 1대로 동시에 보내는
+요청들의 KV cache 사용량 합계가 그 서버의 예산을 넘지 않도록 합니다.
+예산은 서버(URL)별로 따로 관리하므로, 단계별로 다른 서버를 쓸 때 한 서버의 대기열이
+다른(여유 있는) 서버로 가는 요청을 막지 않습니다.
+서버별 예산은 settings.LLM_KV_TOKEN_BUDGETS에서, 없으면 settings.LLM_KV_TOKEN_BUDGET에서 가져옵니다.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Any
+from app.core.config import settings
+from app.core.logging import get_access_logger, get_error_logger
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+
+class TokenBudgetSemaphore:
+    """
+    토큰 수를 가중치로 사용하는 FIFO 세마포어
+
+    - 먼저 기다리기 시작한 요청부터 수락합니다 (큰 요청이 작은 요청들에 밀려 굶지 않도록).
+    - 예산보다 큰 요청은 예산 크기로 취급하여, 다른 요청이 모두 끝나면 단독으로 수락합니다.
+    - capacity가 0 이하이면 제한 없이 바로 수락합니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_use = 0
+        self._waiters: deque = deque()
+        self.peak_in_use = 0
+        self.admitted = 0
+        self.queued = 0
+        self.total_wait_seconds = 0.0
+
+    def _clamp(self, weight: int) -> int:
+        """요청 가중치를 [1, capacity] 범위로 제한합니다."""
+        return max(1, min(self.capacity, weight))
+
+    def _admit(self, weight: int) -> None:
+        self.in_use += weight
+        self.admitted += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _wake_waiters(self) -> None:
+        """대기열 앞쪽부터 예산 안에 들어오는 요청을 깨웁니다."""
+        while self._waiters:
+            weight, future = self._waiters[0]
+            if future.done():
+                # 취소된 대기자
+                self._waiters.popleft()
+                continue
+            if self.in_use + weight > self.capacity:
+                break
+            self._waiters.popleft()
+            self._admit(weight)
+            future.set_result(True)
+
+    async def acquire(self, weight: int) -> int:
+        """
+        weight만큼의 예산을 확보할 때까지 기다립니다.
+        
+        Args:
+            weight: 요청의 예상 KV cache 토큰 수 (프롬프트 토큰 + max_tokens)
+            
+        Returns:
+            실제로 확보한 가중치 (release()에 그대로 전달)
+        """
+        if self.capacity <= 0:
+            self.admitted += 1
+            return 0
+        
+        weight = self._clamp(weight)
+        if not self._waiters and self.in_use + weight <= self.capacity:
+            self._admit(weight)
+            return weight
+        
+        self.queued += 1
+        started_at = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((weight, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 수락 직후 취소된 경우 확보한 예산 반환
+                self.release(weight)
+            else:
+                self._wake_waiters()
+            raise
+        self.total_wait_seconds += time.perf_counter() - started_at
+        return weight
+
+    def release(self, weight: int) -> None:
+        """확보했던 예산을 반환하고 대기 중인 요청을 깨웁니다."""
+        if self.capacity <= 0:
+            return
+        self.in_use = max(0, self.in_use - weight)
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def reserve(self, weight: int):
+        """
+        요청 1건 동안 예산을 확보하는 컨텍스트 매니저
+        
+        사용 예시:
+            async with semaphore.reserve(prompt_tokens + max_tokens):
+                response = await client.post(...)
+        """
+        acquired = await self.acquire(weight)
+        try:
+            yield acquired
+        finally:
+            self.release(acquired)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 예산 사용량과 누적 대기 통계를 반환합니다."""
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "waiting": sum(1 for _, future in self._waiters if not future.done()),
+            "peak_in_use": self.peak_in_use,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "avg_wait_ms": round(self.total_wait_seconds / self.queued * 1000, 2) if self.queued else None
+        }
+
+
+_KV_BUDGETS: Dict[str, TokenBudgetSemaphore] = {}
+
+
+def get_kv_budget(server_url: str) -> TokenBudgetSemaphore:
+    """
+    서버별 프로세스 전역 KV cache 토큰 예산을 반환합니다 (같은 서버로 보내는 모든 VLLMClient가 공유).
+    
+    Args:
+        server_url: vLLM 서버 URL (레플리카 라우팅 결과)
+        
+    Returns:
+        해당 서버의 토큰 예산 세마포어
+    """
+    if server_url not in _KV_BUDGETS:
+        capacity = settings.LLM_KV_TOKEN_BUDGETS.get(server_url, settings.LLM_KV_TOKEN_BUDGET)
+        _KV_BUDGETS[server_url] = TokenBudgetSemaphore(capacity=capacity)
+    return _KV_BUDGETS[server_url]
+
+
+def get_kv_budget_stats() -> Dict[str, Dict[str, Any]]:
+    """요청을 보낸 적이 있는 서버별 예산 사용량과 누적 대기 통계를 반환합니다."""
+    return {server_url: budget.get_stats() for server_url, budget in _KV_BUDGETS.items()}
@@ -0,0 +1,39 @@
+"""
+LLM 백그라운드 작업 모듈
+
+vLLM을 호출하는 프로세스(API 서버, 독립 워커)가 시작할 때 함께 실행해야 하는 작업을 관리합니다.
+- prefix cache 사전 적재 (LLM_PREFIX_CACHE_PRIMING)
+- vLLM 서버 부하(/metrics) 주기적 수집 (VLLM_METRICS_ENABLED): 수집하지 않으면 과부하 보류가 동작하지 않음
+
+사용 예시:
+    async with llm_background_tasks():
+        ...  # 요청 처리 / 작업 처리
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+from app.core.config import settings
+from app.services.llm.prefix_cache import prime_prefix_cache
+from app.services.llm.telemetry import get_backend_telemetry
+
+
+@asynccontextmanager
+async def llm_background_tasks() -> AsyncIterator[List[asyncio.Task]]:
+    """
+    설정에 따라 백그라운드 작업을 시작하고, 블록을 벗어나면 취소합니다.
+
+    Yields:
+        시작한 작업 목록 (가비지 컬렉션으로 취소되지 않도록 블록 안에서 참조 유지)
+    """
+    tasks = []
+    if settings.LLM_PREFIX_CACHE_PRIMING:
+        # 시작을 지연시키지 않도록 백그라운드에서 prefix cache 적재
+        tasks.append(asyncio.create_task(prime_prefix_cache()))
+    if settings.VLLM_METRICS_ENABLED:
+        tasks.append(asyncio.create_task(get_backend_telemetry().run()))
+    try:
+        yield tasks
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
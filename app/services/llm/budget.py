@@ -0,0 +1,70 @@
+"""
+출력 토큰 예산 모듈
+
+vLLM은 요청의 max_tokens를 기준으로 KV cache 블록을 예약하므로, 작은 청크에도 4096을 주면
+배치에 함께 올라갈 수 있는 요청 수가 줄어듭니다. 입력 크기(청크 토큰 수, 상세화할 항목 수)와
+설정된 비율로 요청별 출력 토큰 예산을 추정합니다.
+
+생성 종료는 stop sequence 없이 max_tokens 예산에 맡깁니다. 모델이 들여쓰기 없이 줄바꿈한 JSON을
+내보내면 "\n}" 같은 stop sequence가 안쪽 객체의 닫는 괄호에서 생성을 끊어(finish_reason == "stop")
+이어받기로도 복구할 수 없는 불완전한 JSON이 되기 때문입니다.
+"""
+import math
+from app.core.config import settings
+
+# 영어 자막 기준 평균 문자 수 / 토큰 (토크나이저 없이 빠르게 추정할 때 사용)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_token_count(text: str) -> int:
+    """
+    텍스트의 토큰 수를 문자 수 기반으로 추정합니다.
+
+    Args:
+        text: 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _clamp_output_tokens(tokens: float, max_output_tokens: int = None) -> int:
+    """출력 토큰 예산을 설정된 하한/상한 범위로 제한합니다 (상한이 없으면 LLM_MAX_OUTPUT_TOKENS)."""
+    upper = max_output_tokens or settings.LLM_MAX_OUTPUT_TOKENS
+    budget = math.ceil(tokens) + settings.LLM_OUTPUT_OVERHEAD_TOKENS
+    return max(min(settings.LLM_MIN_OUTPUT_TOKENS, upper), min(upper, budget))
+
+
+def estimate_extraction_max_tokens(chunk_text: str, output_ratio: float, max_output_tokens: int = None) -> int:
+    """
+    1단계(추출) 요청의 max_tokens를 청크 크기로부터 추정합니다.
+
+    Args:
+        chunk_text: 자막 청크 텍스트
+        output_ratio: 입력 토큰 1개당 예상 출력 토큰 수
+            (예: settings.LLM_WORD_EXTRACTION_OUTPUT_RATIO)
+        max_output_tokens: 단계별 max_tokens 상한 (없으면 LLM_MAX_OUTPUT_TOKENS)
+
+    Returns:
+        요청에 사용할 max_tokens
+    """
+    return _clamp_output_tokens(estimate_token_count(chunk_text) * output_ratio, max_output_tokens)
+
+
+def estimate_enrichment_max_tokens(item_count: int, tokens_per_item: int, max_output_tokens: int = None) -> int:
+    """
+    2단계(상세화) 요청의 max_tokens를 상세화할 항목 수로부터 추정합니다.
+
+    Args:
+        item_count: 상세화할 단어/숙어 수
+        tokens_per_item: 항목 1개당 예상 출력 토큰 수
+            (예: settings.LLM_WORD_ENRICHMENT_TOKENS_PER_ITEM)
+        max_output_tokens: 단계별 max_tokens 상한 (없으면 LLM_MAX_OUTPUT_TOKENS)
+
+    Returns:
+        요청에 사용할 max_tokens
+    """
+    return _clamp_output_tokens(item_count * tokens_per_item, max_output_tokens)
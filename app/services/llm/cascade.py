@@ -0,0 +1,136 @@
+"""
+작은 모델 → 큰 모델 cascade 모듈
+
+cascade 모드(settings.LLM_CASCADE_ENABLED)에서는 요청을 먼저 작은 모델로 보내고,
+출력이 JSON/형식 검증이나 커버리지 휴리스틱(예: 청크 토큰 대비 추출 단어 수)을 통과하지 못한 경우에만
+단계 모델(큰 모델)로 다시 요청합니다. 단계별 에스컬레이션 비율과 추정 절약 시간을 기록합니다.
+"""
+from typing import Dict, Optional, Any
+from app.services.llm.budget import estimate_token_count
+
+# 에스컬레이션 사유
+ESCALATION_INVALID_OUTPUT = "invalid_output"  # JSON 파싱/응답 형식 검증 실패
+ESCALATION_LOW_COVERAGE = "low_coverage"  # 커버리지 휴리스틱 미달
+ESCALATION_ERROR = "error"  # 작은 모델 호출 실패 (타임아웃, 서버 오류 등)
+
+
+def meets_extraction_coverage(
+    result: Dict[str, Any], chunk_text: str, min_items_per_1k_tokens: float, item_count: int = None
+) -> bool:
+    """
+    1단계 추출 결과가 청크 크기에 비해 충분한 항목을 담고 있는지 확인합니다.
+    
+    Args:
+        result: 청크 추출 결과 딕셔너리
+        chunk_text: 자막 청크 텍스트
+        min_items_per_1k_tokens: 청크 1,000토큰당 최소 항목 수 (0이면 항상 통과)
+        item_count: 추출 항목 수 (없으면 len(result), 통합 추출처럼 결과가 중첩된 경우 사용)
+        
+    Returns:
+        기준 충족 여부
+    """
+    if min_items_per_1k_tokens <= 0:
+        return True
+    chunk_tokens = estimate_token_count(chunk_text)
+    if chunk_tokens == 0:
+        return True
+    if item_count is None:
+        item_count = len(result)
+    return item_count * 1000 / chunk_tokens >= min_items_per_1k_tokens
+
+
+def meets_enrichment_coverage(
+    result: Dict[str, Any], input_items: Dict[str, Any], min_coverage: float
+) -> bool:
+    """
+    2단계 상세화 결과가 입력 항목을 충분히 포함하는지 확인합니다.
+    
+    Args:
+        result: 상세화 결과 딕셔너리
+        input_items: 상세화를 요청한 항목 딕셔너리
+        min_coverage: 결과에 포함되어야 하는 입력 항목 비율 (0 ~ 1)
+        
+    Returns:
+        기준 충족 여부
+    """
+    if not input_items:
+        return True
+    covered = sum(1 for item in input_items if item in result)
+    return covered / len(input_items) >= min_coverage
+
+
+class CascadeTracker:
+    """단계(프로세스)별 cascade 결과 기록기"""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(
+        self,
+        stage: str,
+        escalation_reason: Optional[str],
+        small_seconds: float,
+        large_seconds: Optional[float] = None
+    ) -> None:
+        """
+        cascade 요청 1건의 결과를 기록합니다.
+        
+        Args:
+            stage: 단계(프로세스) 이름 (예: "Word Extraction")
+            escalation_reason: 에스컬레이션 사유 (작은 모델로 끝났으면 None)
+            small_seconds: 작은 모델 호출에 걸린 시간(초)
+            large_seconds: 큰 모델 호출에 걸린 시간(초, 에스컬레이션한 경우)
+        """
+        stats = self._stats.setdefault(stage, {
+            "requests": 0,
+            "escalations": 0,
+            "reasons": {},
+            "small_seconds": 0.0,
+            "large_seconds": 0.0,
+            "large_calls": 0
+        })
+        stats["requests"] += 1
+        stats["small_seconds"] += small_seconds
+        if escalation_reason:
+            stats["escalations"] += 1
+            stats["reasons"][escalation_reason] = stats["reasons"].get(escalation_reason, 0) + 1
+        if large_seconds is not None:
+            stats["large_seconds"] += large_seconds
+            stats["large_calls"] += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        단계별 에스컬레이션 비율과 추정 절약 시간을 반환합니다.
+        
+        추정 절약 시간 = (모든 요청을 큰 모델로 보냈을 때의 시간) - (실제 작은 모델 + 큰 모델 시간)
+        큰 모델 호출 시간은 에스컬레이션된 요청의 평균으로 추정하므로, 에스컬레이션이 없으면 None입니다.
+        """
+        report = {}
+        for stage, stats in self._stats.items():
+            requests = stats["requests"]
+            avg_large = stats["large_seconds"] / stats["large_calls"] if stats["large_calls"] else None
+            saved_ms = None
+            if avg_large is not None:
+                actual = stats["small_seconds"] + stats["large_seconds"]
+                saved_ms = round((requests * avg_large - actual) * 1000, 2)
+            report[stage] = {
+                "requests": requests,
+                "escalations": stats["escalations"],
+                "escalation_rate": round(stats["escalations"] / requests, 4) if requests else None,
+                "reasons": dict(stats["reasons"]),
+                "avg_small_ms": round(stats["small_seconds"] / requests * 1000, 2) if requests else None,
+                "avg_large_ms": round(avg_large * 1000, 2) if avg_large is not None else None,
+                "estimated_saved_ms": saved_ms
+            }
+        return report
+
+
+_CASCADE_TRACKER: Optional[CascadeTracker] = None
+
+
+def get_cascade_tracker() -> CascadeTracker:
+    """프로세스 전역 cascade 기록기를 반환합니다."""
+    global _CASCADE_TRACKER
+    if _CASCADE_TRACKER is None:
+        _CASCADE_TRACKER = CascadeTracker()
+    return _CASCADE_TRACKER
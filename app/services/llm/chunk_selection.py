@@ -0,0 +1,100 @@
+"""
+1단계 청크 선택 모듈
+
+긴 영상은 1단계에 모든 청크를 보내지 않고 일부만 선택합니다. 무작위 선택(random.sample) 대신
+청크를 로컬에서 가볍게 점수화해 어휘 커버리지가 가장 커지는 조합을 탐욕적으로 고릅니다.
+
+- 단어 가중치: 영상 내 문서 빈도 기반 IDF (모든 청크에 나오는 "the", "and"는 0에 가깝고 드문 단어일수록 큼)
+- 청크 점수: 아직 선택된 청크에 없는 단어 유형(type)들의 가중치 합 (새 어휘 커버리지)
+- 예산: 최대 청크 수와 (선택적) 최대 토큰 수
+- 동점 처리: 비디오 ID로 만든 seed의 난수 우선순위 → 같은 영상은 항상 같은 청크를 선택 (캐시 친화적)
+"""
+import hashlib
+import math
+import random
+import re
+from typing import Dict, List, Any
+from app.services.llm.budget import estimate_token_count
+
+# 영어 단어 토큰 (축약형 포함)
+_WORD_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+
+def _get_word_types(chunk_text: str) -> set:
+    """청크의 단어 유형(type) 집합 (소문자, 한 글자 단어 제외)"""
+    return {word for word in _WORD_PATTERN.findall(chunk_text.lower()) if len(word) > 1}
+
+
+def _get_seed(video_id: str) -> int:
+    """비디오 ID에서 프로세스와 무관하게 같은 seed를 만듭니다 (내장 hash()는 실행마다 달라짐)."""
+    return int.from_bytes(hashlib.sha256(video_id.encode("utf-8")).digest()[:8], "big")
+
+
+def select_chunks_by_coverage(
+    chunk_texts: List[str],
+    video_id: str,
+    max_chunks: int,
+    max_tokens: int = 0
+) -> Dict[str, Any]:
+    """
+    어휘 커버리지가 최대가 되도록 청크를 탐욕적으로 선택합니다.
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID (동점 처리 seed)
+        max_chunks: 선택할 최대 청크 수
+        max_tokens: 선택한 청크의 최대 토큰 합 (0이면 제한 없음)
+        
+    Returns:
+        {
+            "chunks": 선택된 청크 텍스트 리스트 (원래 순서 유지),
+            "indices": 선택된 청크 인덱스 리스트,
+            "coverage": 전체 어휘 가중치 중 선택된 청크가 포함하는 비율 (0 ~ 1)
+        }
+    """
+    chunk_types = [_get_word_types(chunk_text) for chunk_text in chunk_texts]
+    chunk_tokens = [estimate_token_count(chunk_text) for chunk_text in chunk_texts]
+    
+    # 영상 내 문서 빈도 기반 가중치 (드문 단어일수록 큼)
+    document_frequency: Dict[str, int] = {}
+    for types in chunk_types:
+        for word in types:
+            document_frequency[word] = document_frequency.get(word, 0) + 1
+    total_chunks = len(chunk_texts)
+    weights = {
+        word: math.log((1 + total_chunks) / (1 + frequency)) + 1e-3
+        for word, frequency in document_frequency.items()
+    }
+    total_weight = sum(weights.values())
+    
+    # 동점 처리용 난수 우선순위 (비디오 ID seed)
+    rng = random.Random(_get_seed(video_id))
+    priorities = [rng.random() for _ in chunk_texts]
+    
+    covered = set()
+    selected = []
+    used_tokens = 0
+    remaining = set(range(total_chunks))
+    while remaining and len(selected) < max_chunks:
+        candidates = [
+            idx for idx in remaining
+            if not max_tokens or used_tokens + chunk_tokens[idx] <= max_tokens
+        ]
+        if not candidates:
+            break
+        best = max(
+            candidates,
+            key=lambda idx: (sum(weights[word] for word in chunk_types[idx] - covered), priorities[idx])
+        )
+        selected.append(best)
+        remaining.discard(best)
+        covered |= chunk_types[best]
+        used_tokens += chunk_tokens[best]
+    
+    selected.sort()
+    covered_weight = sum(weights[word] for word in covered)
+    return {
+        "chunks": [chunk_texts[idx] for idx in selected],
+        "indices": selected,
+        "coverage": round(covered_weight / total_weight, 4) if total_weight else 1.0
+    }
@@ -1,23 +1,42 @@
 import json          # JSON 파싱용
 import asyncio
+import time
 import httpx         # HTTP 클라이언트
 from typing import Dict, List, Optional, Any  # 타입 힌팅
 from app.core.config import settings  # 설정 가져오기
 from app.core.logging import get_access_logger, get_error_logger  # 로깅
 from app.core.error_utils import log_error_with_location
+from app.services.llm.router import get_replica_router
+from app.services.llm.retry import get_retry_policy
+from app.services.llm.admission import get_kv_budget
+from app.services.llm.budget import estimate_token_count
+from app.services.llm.stages import get_stage_config, get_stage_latency_tracker, MODEL_TIER_LARGE
+from app.services.llm.latency import get_latency_model
+from app.services.llm.tokenization import render_chat_prompt
 
 ACCESS_LOGGER = get_access_logger()
 ERROR_LOGGER = get_error_logger()
 
 class VLLMClient:
-    """vLLM 서버와 통신하는 클라이언트 (컨텍스트 매니저)"""
-    def __init__(self):
-        self.base_url = settings.VLLM_SERVER_URL
+    """vLLM 서버와 통신하는 클라이언트 (컨텍스트 매니저)
+    
+    stage를 지정하면 해당 단계의 모델/서버 설정(app/services/llm/stages.py)을 사용하고,
+    tier=MODEL_TIER_SMALL이면 cascade 모드의 작은 모델로 보냅니다.
+    """
+    def __init__(self, stage: Optional[str] = None, tier: str = MODEL_TIER_LARGE):
+        stage_config = get_stage_config(stage, tier)
+        # 지연 시간은 단계별로, 작은 모델은 "extraction:small"처럼 따로 기록
+        self.stage = stage_config["stage"] if tier == MODEL_TIER_LARGE else f"{stage_config['stage']}:{tier}"
+        self.base_url = stage_config["server_urls"][0]
         self.endpoint = settings.VLLM_SERVER_ENDPOINT
-        self.model = settings.VLLM_SERVER_MODEL
+        self.completions_endpoint = settings.VLLM_SERVER_COMPLETIONS_ENDPOINT
+        self.model = stage_config["model"]
         self.timeout = settings.VLLM_SERVER_TIMEOUT
         self.max_retries = settings.VLLM_SERVER_MAX_RETRIES
-        self.retry_delay = settings.VLLM_SERVER_RETRY_DELAY
+        self.retry_policy = get_retry_policy()
+        self.router = get_replica_router(stage_config["server_urls"])
+        self.latency_tracker = get_stage_latency_tracker()
+        self.latency_model = get_latency_model(self.stage)
         self.client: Optional[httpx.AsyncClient] = None
     
     async def __aenter__(self):
@@ -34,15 +53,27 @@ class VLLMClient:
         
         
     async def chat_completion(
-        self, messages: List[Dict[str, Any]], temperature: float = 0.7, max_tokens: int = 4096
+        self,
+        messages: List[Dict[str, Any]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        route_key: Optional[str] = None,
+        stop: Optional[List[str]] = None,
+        prompt_token_ids: Optional[List[int]] = None
     ) -> Dict[str, Any]:
         """
         OpenAI 호환 chat comlpetion API 호출
         
+        prompt_token_ids가 주어지면 서버 측 chat template 적용/토큰화를 건너뛰도록
+        /v1/completions에 토큰 ID를 그대로 보내고, 응답을 chat completion 형식으로 변환합니다.
+        
         Args:
             messages: 대화 메시지 리스트 (예: [{"role": "user", "content": "..."}])
             temperature: 생성 온도 (0.0 ~ 2.0)
             max_tokens: 최대 토큰 수 
+            route_key: 레플리카 라우팅 키 (예: "Word Extraction:v11", prefix_affinity 모드에서 사용)
+            stop: 생성 중단 문자열 리스트 (stop 문자열은 응답에 포함됨)
+            prompt_token_ids: messages에 chat template을 적용해 토큰화한 결과 (tokenize_chat_prompt)
             
         Returns:
             API 응답 딕셔너리
@@ -52,36 +83,227 @@ class VLLMClient:
             ValueError: JSON 파싱 실패 시
             Exception: 예상치 못한 오류 발생 시
         """
-        url = f"{self.base_url}{self.endpoint}"
+        if prompt_token_ids is not None:
+            payload = {
+                "model": self.model,
+                "prompt": prompt_token_ids,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            }
+            endpoint = self.completions_endpoint
+        else:
+            payload = {
+                "model": self.model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            }
+            endpoint = self.endpoint
+        if stop:
+            payload["stop"] = stop
+            # vLLM 확장 파라미터: stop 문자열(예: 닫는 괄호)을 응답에 남겨 유효한 JSON 유지
+            payload["include_stop_str_in_output"] = True
+        
+        response = await self._post_with_retry(endpoint, payload, route_key)
+        if prompt_token_ids is None:
+            return response
+        
+        choices = response.get("choices", [])
+        chat_response = self._to_chat_response(choices[0] if choices else None)
+        chat_response["usage"] = response.get("usage")
+        return chat_response
+    
+    
+    async def completion_batch(
+        self,
+        messages_list: List[List[Dict[str, Any]]],
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        route_key: Optional[str] = None,
+        stop: Optional[List[str]] = None,
+        prompt_token_ids_list: Optional[List[List[int]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 대화를 chat template으로 렌더링하여 /v1/completions 요청 1건으로 전송합니다.
+        
+        vLLM은 prompt 리스트를 한 번에 스케줄링하므로 요청별 HTTP/스케줄링 오버헤드가 줄어듭니다.
+        응답의 choices는 index(= 프롬프트 순서)로 다시 나누어, 프롬프트마다
+        chat completion 응답과 같은 구조로 반환합니다 (extract_content_from_response 그대로 사용 가능).
+        
+        Args:
+            messages_list: 프롬프트별 대화 메시지 리스트
+            temperature: 생성 온도 (0.0 ~ 2.0)
+            max_tokens: 프롬프트별 최대 토큰 수 (배치 내 공통)
+            route_key: 레플리카 라우팅 키
+            stop: 생성 중단 문자열 리스트 (stop 문자열은 응답에 포함됨)
+            prompt_token_ids_list: 프롬프트별 토큰 ID (주어지면 렌더링 대신 토큰 ID를 그대로 전송)
+            
+        Returns:
+            프롬프트 순서대로 정렬된 chat completion 형식 응답 리스트
+            (응답에 해당 index의 choice가 없으면 choices가 빈 응답)
+        """
+        if not messages_list:
+            return []
         
         payload = {
             "model": self.model,
-            "messages": messages,
+            "prompt": (
+                prompt_token_ids_list if prompt_token_ids_list is not None
+                else [render_chat_prompt(messages) for messages in messages_list]
+            ),
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
+        if stop:
+            payload["stop"] = stop
+            payload["include_stop_str_in_output"] = True
+        
+        response = await self._post_with_retry(self.completions_endpoint, payload, route_key)
+        
+        # choices를 프롬프트 index 기준으로 역다중화
+        choices_by_index = {
+            choice.get("index"): choice for choice in response.get("choices", [])
+        }
+        return [
+            self._to_chat_response(choices_by_index.get(idx))
+            for idx in range(len(messages_list))
+        ]
+    
+    
+    @staticmethod
+    def _to_chat_response(choice: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """/v1/completions의 choice 1개를 chat completion 응답 구조로 변환합니다 (없으면 빈 choices)."""
+        if choice is None:
+            return {"choices": []}
+        return {
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": choice.get("text", "")},
+                "finish_reason": choice.get("finish_reason")
+            }]
+        }
+    
+    
+    @staticmethod
+    def _estimate_prompt_tokens(payload: Dict[str, Any]) -> tuple:
+        """
+        요청의 (전체 프롬프트 토큰 수, 프롬프트 개수)를 추정합니다.
         
+        토큰 ID로 보낸 프롬프트는 정확한 길이를, 문자열 프롬프트는 문자 수 기반 추정치를 사용합니다.
+        """
+        if "messages" in payload:
+            prompts = ["".join(str(message.get("content", "")) for message in payload["messages"])]
+        else:
+            prompts = payload.get("prompt", [])
+            # 단일 프롬프트(문자열 또는 토큰 ID 리스트)는 배치 1건으로 취급
+            if isinstance(prompts, str) or (prompts and isinstance(prompts[0], int)):
+                prompts = [prompts]
+        
+        prompt_tokens = sum(
+            len(prompt) if isinstance(prompt, list) else estimate_token_count(prompt)
+            for prompt in prompts
+        )
+        return prompt_tokens, len(prompts)
+    
+    
+    def _get_timeout(self, prompt_tokens: int, expected_output_tokens: int, prompt_count: int = 1) -> float:
+        """
+        단계별 지연 시간 모델로 호출 타임아웃을 계산합니다.
+        
+        모델은 단일 프롬프트 호출로만 적합하므로, 비활성화 시와 배치 호출(prompt_count > 1)에는 고정 타임아웃을 사용합니다.
+        """
+        if not settings.VLLM_ADAPTIVE_TIMEOUT or prompt_count > 1:
+            return self.timeout
+        return self.latency_model.timeout_for(
+            prompt_tokens,
+            expected_output_tokens,
+            default_timeout=self.timeout,
+            percentile=settings.VLLM_ADAPTIVE_TIMEOUT_PERCENTILE,
+            safety_factor=settings.VLLM_ADAPTIVE_TIMEOUT_SAFETY_FACTOR,
+            min_timeout=settings.VLLM_ADAPTIVE_TIMEOUT_MIN,
+            max_timeout=settings.VLLM_ADAPTIVE_TIMEOUT_MAX
+        )
+    
+    
+    def _observe_latency(
+        self, usage: Optional[Dict[str, Any]], estimated_prompt_tokens: int, prompt_count: int, elapsed: float
+    ) -> None:
+        """
+        응답 usage의 실제 토큰 수와 소요 시간으로 지연 시간 모델을 갱신합니다.
+        
+        usage가 없거나 배치 호출이면 건너뜁니다. 배치 호출은 프롬프트들이 함께 디코딩되어
+        소요 시간이 합산 토큰 수에 비례하지 않으므로, 단일 호출 회귀식에 넣으면 계수가 왜곡됩니다.
+        """
+        if prompt_count > 1 or not usage or usage.get("completion_tokens") is None:
+            return
+        self.latency_model.observe(
+            usage.get("prompt_tokens") or estimated_prompt_tokens,
+            usage["completion_tokens"],
+            elapsed
+        )
+    
+    
+    async def _post_with_retry(
+        self, endpoint: str, payload: Dict[str, Any], route_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        재시도 정책에 따라 vLLM 서버에 POST 요청을 보냅니다.
+        
+        각 시도는 레플리카를 고른 뒤 그 서버의 KV cache 토큰 예산(프롬프트 토큰 + max_tokens)을 확보하고,
+        응답을 받으면 반환합니다 (재시도 대기 중에는 예산을 점유하지 않음).
+        타임아웃은 단계별 지연 시간 모델이 예상 출력 크기(max_tokens)로 계산하며,
+        성공한 호출의 usage(prompt_tokens, completion_tokens)와 소요 시간으로 모델을 갱신합니다
+        (배치 호출은 고정 타임아웃을 쓰고 모델을 갱신하지 않음).
+        
+        Args:
+            endpoint: API 엔드포인트 (예: "/v1/chat/completions")
+            payload: 요청 본문
+            route_key: 레플리카 라우팅 키
+            
+        Returns:
+            API 응답 딕셔너리
+        """
         if not self.client:
             raise RuntimeError("VLLMClient는 컨텍스트 매니저로 사용해야 합니다. 'async with VLLMClient() as client:' 형식을 사용하세요.")
         
-        for attempt in range(1, self.max_retries + 1):
+        prompt_tokens, prompt_count = self._estimate_prompt_tokens(payload)
+        expected_output_tokens = payload.get("max_tokens", 0) * prompt_count
+        kv_tokens = prompt_tokens + expected_output_tokens
+        timeout = self._get_timeout(prompt_tokens, expected_output_tokens, prompt_count)
+        retry_state = self.retry_policy.start()
+        while True:
+            attempt = retry_state["attempt"]
             try:
-                ACCESS_LOGGER.info(f"Try vLLM API Call - Attempt: {attempt}/{self.max_retries}")
-                response = await self.client.post(
-                    url, json=payload, timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                ACCESS_LOGGER.info(f"Receive Success Response from vLLM API")
-                return result
+                with self.router.route(route_key) as base_url:
+                    async with get_kv_budget(base_url).reserve(kv_tokens):
+                        url = f"{base_url}{endpoint}"
+                        ACCESS_LOGGER.info(
+                            f"Try vLLM API Call - Attempt: {attempt}/{self.max_retries} - "
+                            f"Stage: {self.stage} - Replica: {base_url} - KV Tokens: {kv_tokens} - "
+                            f"Timeout: {timeout}s"
+                        )
+                        started_at = time.perf_counter()
+                        response = await self.client.post(
+                            url, json=payload, timeout=timeout
+                        )
+                        response.raise_for_status()
+                        
+                        result = response.json()
+                        elapsed = time.perf_counter() - started_at
+                        self.latency_tracker.record(self.stage, elapsed, self.model)
+                        self._observe_latency(result.get("usage"), prompt_tokens, prompt_count, elapsed)
+                        self.router.record_usage(base_url, result.get("usage"))
+                        ACCESS_LOGGER.info(f"Receive Success Response from vLLM API")
+                        return result
                 
             except httpx.HTTPError as e:
                 ERROR_LOGGER.error(f"vLLM API Call Failed - Attempt: {attempt}/{self.max_retries} - {str(e)}")
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * attempt)
-                else:
+                if isinstance(e, httpx.TimeoutException):
+                    self.latency_model.record_timeout()
+                delay = self.retry_policy.next_delay(e, retry_state)
+                if delay is None:
                     raise
+                await asyncio.sleep(delay)
             except json.JSONDecodeError as e:
                 ERROR_LOGGER.error(f"vLLM API Response Parse Failed: {str(e)} - {response.text}")
                 raise ValueError(f"vLLM API 응답 파싱에 실패 했습니다.")
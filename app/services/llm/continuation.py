@@ -0,0 +1,66 @@
+"""
+잘린 응답 이어받기(continuation) 모듈
+
+상세화 응답이 max_tokens에 도달하면(finish_reason == "length") JSON이 중간에 끊깁니다.
+전체를 버리고 다시 요청하는 대신, 끊기기 전까지 완성된 "result" 항목만 복구하고
+아직 받지 못한 항목만 후속 요청으로 보내기 위한 보조 함수를 제공합니다.
+"""
+import json
+import re
+from typing import Dict, Any
+
+# max_tokens 도달로 생성이 중단된 응답의 finish_reason
+FINISH_REASON_LENGTH = "length"
+
+# {"result": { ... 시작 위치
+_RESULT_OBJECT_PATTERN = re.compile(r'"result"\s*:\s*\{')
+
+# 항목 사이의 공백과 쉼표
+_ENTRY_SEPARATOR_PATTERN = re.compile(r"[\s,]*")
+_WHITESPACE_PATTERN = re.compile(r"\s*")
+
+
+def get_finish_reason(response: Dict[str, Any]) -> str:
+    """chat 응답의 첫 번째 choice의 finish_reason을 반환합니다 (없으면 빈 문자열)."""
+    choices = response.get("choices") or []
+    if not choices:
+        return ""
+    return choices[0].get("finish_reason") or ""
+
+
+def recover_complete_entries(content: str) -> Dict[str, Any]:
+    """
+    잘린 JSON 응답에서 완성된 "result" 항목만 복구합니다.
+    
+    {"result": {"key": value, ...} 형식을 앞에서부터 읽어, 값이 끝까지 닫힌 항목만 반환합니다.
+    완전한 JSON이 주어지면 "result"의 모든 항목을 반환합니다.
+    
+    Args:
+        content: LLM 응답 텍스트 (코드 블록 제거 후)
+        
+    Returns:
+        복구된 항목 딕셔너리. "result" 객체를 찾지 못하면 빈 딕셔너리
+    """
+    match = _RESULT_OBJECT_PATTERN.search(content)
+    if not match:
+        return {}
+    
+    decoder = json.JSONDecoder()
+    entries = {}
+    position = match.end()
+    while True:
+        position = _ENTRY_SEPARATOR_PATTERN.match(content, position).end()
+        if position >= len(content) or content[position] == "}":
+            break
+        try:
+            key, position = decoder.raw_decode(content, position)
+            position = _WHITESPACE_PATTERN.match(content, position).end()
+            if not isinstance(key, str) or content[position:position + 1] != ":":
+                break
+            position = _WHITESPACE_PATTERN.match(content, position + 1).end()
+            value, position = decoder.raw_decode(content, position)
+        except json.JSONDecodeError:
+            # 값이 닫히기 전에 잘린 마지막 항목
+            break
+        entries[key] = value
+    return entries
@@ -4,8 +4,14 @@
 LLM을 사용하여 1단계에서 추출한 단어에 대해 동의어와 예문을 생성합니다.
 """
 from typing import Dict, Any
+from app.core.config import settings
 from app.services.llm.utils import enrich_with_retry
-from app.services.llm.prompts import get_word_enrichment_prompt_v1, get_word_enrichment_prompt_v7
+from app.services.llm.prompts import (
+    get_word_enrichment_prompt_v1,
+    get_word_enrichment_prompt_v7,
+    WORD_ENRICHMENT_PROMPT_VERSION,
+    WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION
+)
 
 
 async def enrich_words(
@@ -44,15 +50,16 @@ async def enrich_words(
         ValueError: JSON 파싱 실패 또는 응답 형식 오류 시
         Exception: LLM API 호출 실패 시
     """
-    # 재시도 로직: v1 → v7 (최대 2번 시도)
+    # 재시도 로직: v11(v1 재작성) → v12(v7 재작성) (최대 2번 시도)
     prompt_versions = [
-        ("v1", get_word_enrichment_prompt_v1),
-        ("v7", get_word_enrichment_prompt_v7),
+        (WORD_ENRICHMENT_PROMPT_VERSION, get_word_enrichment_prompt_v1),
+        (WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION, get_word_enrichment_prompt_v7),
     ]
     
     return await enrich_with_retry(
         extraction_result=word_extraction_result,
         video_id=video_id,
         process_name="Word Enrichment",
-        prompt_versions=prompt_versions
+        prompt_versions=prompt_versions,
+        tokens_per_item=settings.LLM_WORD_ENRICHMENT_TOKENS_PER_ITEM
     )
@@ -3,9 +3,11 @@
 
 LLM을 사용하여 자막 청크에서 숙어(idiom, phrasal verb, collocation)를 추출하고 한국어 뜻을 생성합니다.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable
 from app.services.llm.utils import extract_from_chunks
-from app.services.llm.prompts import get_phrase_extraction_prompt
+from app.services.llm.prompts import get_phrase_extraction_prompt, PHRASE_EXTRACTION_PROMPT_VERSION
+from app.services.llm.phrase_index import get_phrase_index
+from app.core.config import settings
 from app.core.logging import get_access_logger
 
 ACCESS_LOGGER = get_access_logger()
@@ -45,9 +47,70 @@ def _merge_phrase_results(combined_result: Dict[str, Any], chunk_result: Dict[st
                     combined_result[phrase_lower].append(meaning_value)
 
 
+async def _extract_phrases_with_index(
+    chunk_texts: List[str],
+    video_id: str,
+    on_chunk_result: Callable[[Dict[str, Any]], None] = None
+) -> Dict[str, Any]:
+    """
+    숙어 사전 인덱스의 로컬 매칭 결과로 숙어 맵을 먼저 채우고, LLM 추출 결과를 합칩니다.
+    
+    빠른 모드(settings.LLM_PHRASE_INDEX_FAST_MODE)에서는 매칭된 숙어가 LLM_PHRASE_INDEX_MIN_HITS개
+    이상인 청크는 LLM 호출을 건너뜁니다. 같은 숙어는 LLM의 문맥상 뜻을 우선합니다.
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        on_chunk_result: 청크 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        
+    Returns:
+        extract_phrases_from_chunks와 같은 형식의 결과
+    """
+    phrase_index = get_phrase_index()
+    matches_by_chunk = [phrase_index.find(chunk_text) for chunk_text in chunk_texts]
+    
+    llm_chunk_texts = chunk_texts
+    if settings.LLM_PHRASE_INDEX_FAST_MODE:
+        llm_chunk_texts = [
+            chunk_text for chunk_text, matches in zip(chunk_texts, matches_by_chunk)
+            if len(matches) < settings.LLM_PHRASE_INDEX_MIN_HITS
+        ]
+    
+    seeded_result = {}
+    for matches in matches_by_chunk:
+        if matches and on_chunk_result:
+            on_chunk_result(matches)
+        _merge_phrase_results(seeded_result, matches)
+    
+    ACCESS_LOGGER.info(
+        f"Phrase Index for Video ID: '{video_id}' - "
+        f"Matched Phrases: {len(seeded_result)}, "
+        f"LLM Chunks: {len(llm_chunk_texts)}/{len(chunk_texts)}"
+    )
+    
+    if not llm_chunk_texts:
+        return {"videoId": video_id, "result": seeded_result}
+    
+    llm_result = await extract_from_chunks(
+        chunk_texts=llm_chunk_texts,
+        video_id=video_id,
+        process_name="Phrase Extraction",
+        get_prompt_func=get_phrase_extraction_prompt,
+        prompt_version=PHRASE_EXTRACTION_PROMPT_VERSION,
+        output_token_ratio=settings.LLM_PHRASE_EXTRACTION_OUTPUT_RATIO,
+        min_items_per_1k_tokens=settings.LLM_CASCADE_MIN_PHRASES_PER_1K_TOKENS,
+        merge_results_func=_merge_phrase_results,
+        on_chunk_result=on_chunk_result
+    )
+    for phrase, meaning in seeded_result.items():
+        llm_result["result"].setdefault(phrase, meaning)
+    return llm_result
+
+
 async def extract_phrases_from_chunks(
     chunk_texts: List[str], 
-    video_id: str
+    video_id: str,
+    on_chunk_result: Callable[[Dict[str, Any]], None] = None
 ) -> Dict[str, Any]:
     """
     1단계: 청크 텍스트 리스트에서 숙어를 추출하고 한국어 뜻을 생성합니다.
@@ -55,6 +118,7 @@ async def extract_phrases_from_chunks(
     Args:
         chunk_texts: 자막 청크 텍스트 리스트
         video_id: 비디오 ID
+        on_chunk_result: 청크 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
         
     Returns:
         딕셔너리 형태의 결과:
@@ -71,10 +135,18 @@ async def extract_phrases_from_chunks(
         ValueError: JSON 파싱 실패 또는 응답 형식 오류 시
         Exception: LLM API 호출 실패 시
     """
+    if settings.LLM_PHRASE_INDEX_ENABLED:
+        # 숙어 사전 인덱스로 로컬 매칭 결과를 먼저 만들고 LLM 결과와 합침
+        return await _extract_phrases_with_index(chunk_texts, video_id, on_chunk_result)
+    
     return await extract_from_chunks(
         chunk_texts=chunk_texts,
         video_id=video_id,
         process_name="Phrase Extraction",
         get_prompt_func=get_phrase_extraction_prompt,
-        merge_results_func=_merge_phrase_results
+        prompt_version=PHRASE_EXTRACTION_PROMPT_VERSION,
+        output_token_ratio=settings.LLM_PHRASE_EXTRACTION_OUTPUT_RATIO,
+        min_items_per_1k_tokens=settings.LLM_CASCADE_MIN_PHRASES_PER_1K_TOKENS,
+        merge_results_func=_merge_phrase_results,
+        on_chunk_result=on_chunk_result
     )
@@ -0,0 +1,96 @@
+"""
+단어 + 숙어 통합 추출 모듈
+
+1단계 통합 추출 모드(settings.LLM_STAGE1_FUSED_MODE)에서 청크마다 프롬프트 1건으로 단어와 숙어를 함께 추출합니다.
+청크 prefill과 요청 수가 분리 모드(extract_words + extract_phrases)의 절반이 되며,
+청크 결과는 분리 모드와 같은 병합 함수로 합쳐 같은 형식의 결과 2개를 반환합니다.
+"""
+from typing import Dict, List, Any, Tuple, Callable
+from app.services.llm.utils import extract_from_chunks
+from app.services.llm.extract_words import _merge_word_results
+from app.services.llm.extract_phrases import _merge_phrase_results
+from app.services.llm.prompts import get_fused_extraction_prompt, FUSED_EXTRACTION_PROMPT_VERSION
+from app.core.config import settings
+from app.core.logging import get_access_logger
+
+ACCESS_LOGGER = get_access_logger()
+
+
+def _merge_fused_results(combined_result: Dict[str, Any], chunk_result: Dict[str, Any]) -> None:
+    """
+    통합 추출 결과를 단어/숙어별 병합 함수로 병합합니다.
+    
+    Args:
+        combined_result: 누적된 결과 딕셔너리 {"words": {...}, "phrases": {...}} (in-place 수정)
+        chunk_result: 현재 청크의 결과 딕셔너리 {"words": {...}, "phrases": {...}}
+    """
+    words = chunk_result.get("words")
+    phrases = chunk_result.get("phrases")
+    _merge_word_results(combined_result.setdefault("words", {}), words if isinstance(words, dict) else {})
+    _merge_phrase_results(combined_result.setdefault("phrases", {}), phrases if isinstance(phrases, dict) else {})
+
+
+def _count_fused_items(result: Dict[str, Any]) -> int:
+    """통합 추출 결과의 단어 수 + 숙어 수"""
+    return sum(
+        len(section) for section in (result.get("words"), result.get("phrases"))
+        if isinstance(section, dict)
+    )
+
+
+async def extract_vocabulary_from_chunks(
+    chunk_texts: List[str],
+    video_id: str,
+    on_word_result: Callable[[Dict[str, Any]], None] = None,
+    on_phrase_result: Callable[[Dict[str, Any]], None] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    1단계(통합 모드): 청크 텍스트 리스트에서 단어와 숙어를 요청 1건으로 함께 추출합니다.
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        on_word_result: 청크의 단어 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        on_phrase_result: 청크의 숙어 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        
+    Returns:
+        (단어 추출 결과, 숙어 추출 결과) 튜플.
+        각각 extract_words_from_chunks, extract_phrases_from_chunks의 반환 형식과 같습니다.
+        
+    Raises:
+        ValueError: JSON 파싱 실패 또는 응답 형식 오류 시
+        Exception: LLM API 호출 실패 시
+    """
+    def _on_chunk_result(chunk_result: Dict[str, Any]) -> None:
+        """청크 결과를 단어/숙어 콜백으로 나누어 전달"""
+        for callback, section in ((on_word_result, "words"), (on_phrase_result, "phrases")):
+            if callback and isinstance(chunk_result.get(section), dict):
+                callback(chunk_result[section])
+    
+    fused_result = await extract_from_chunks(
+        chunk_texts=chunk_texts,
+        video_id=video_id,
+        process_name="Fused Extraction",
+        get_prompt_func=get_fused_extraction_prompt,
+        prompt_version=FUSED_EXTRACTION_PROMPT_VERSION,
+        output_token_ratio=(
+            settings.LLM_WORD_EXTRACTION_OUTPUT_RATIO + settings.LLM_PHRASE_EXTRACTION_OUTPUT_RATIO
+        ),
+        min_items_per_1k_tokens=(
+            settings.LLM_CASCADE_MIN_WORDS_PER_1K_TOKENS + settings.LLM_CASCADE_MIN_PHRASES_PER_1K_TOKENS
+        ),
+        merge_results_func=_merge_fused_results,
+        count_items_func=_count_fused_items,
+        on_chunk_result=_on_chunk_result if on_word_result or on_phrase_result else None
+    )
+    
+    combined_result = fused_result["result"]
+    word_extraction_result = {
+        "videoId": video_id,
+        "result": combined_result.get("words", {})
+    }
+    phrase_extraction_result = {
+        "videoId": video_id,
+        "result": combined_result.get("phrases", {})
+    }
+    return word_extraction_result, phrase_extraction_result
@@ -3,9 +3,18 @@
 
 LLM을 사용하여 자막 청크에서 단어를 추출하고 한국어 뜻을 생성합니다.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Tuple
 from app.services.llm.utils import extract_from_chunks
-from app.services.llm.prompts import get_word_extraction_prompt
+from app.services.llm.prompts import (
+    get_word_extraction_prompt,
+    get_word_meaning_prompt,
+    WORD_EXTRACTION_PROMPT_VERSION,
+    WORD_MEANING_PROMPT_VERSION
+)
+from app.services.llm.lexical import extract_candidates, lemmatize
+from app.services.llm.budget import estimate_enrichment_max_tokens
+from app.services.llm.stages import get_stage_config, STAGE_EXTRACTION
+from app.core.config import settings
 from app.core.logging import get_access_logger
 
 ACCESS_LOGGER = get_access_logger()
@@ -58,9 +67,124 @@ def _merge_word_results(combined_result: Dict[str, Any], chunk_result: Dict[str,
                 combined_result[word_lower]["뜻"].append(meanings)
 
 
+def fold_word_inflections(words_dict: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """
+    변화형 단어("running", "ran", "runs")를 원형("run") 항목으로 합칩니다.
+    
+    원형은 1단계 품사에 맞는 변화만 되돌리고(lexical.lemmatize), 합친 항목의 뜻은
+    _merge_word_results와 같은 규칙(중복 제거, 나중 품사 우선)으로 합칩니다.
+    불규칙 변화형 표(resources/lemma_table.txt)에 없는 단어는 접미사 규칙의 원형이 같은 결과의
+    다른 항목이거나 알려진 단어일 때만 합칩니다 (LLM이 이미 원형으로 준 "physics", "species",
+    "embed" 같은 단어를 "physic", "specy", "emb"로 바꾸지 않기 위해).
+    
+    Args:
+        words_dict: 단어 추출 결과 딕셔너리 ({"단어": {"품사": ..., "뜻": [...]}})
+        
+    Returns:
+        (원형 기준으로 합친 딕셔너리, 원형으로 합쳐진 변화형 항목 수) 튜플
+    """
+    folded = {}
+    folded_count = 0
+    entry_words = {word.lower().strip() for word in words_dict}
+    for word, word_data in words_dict.items():
+        pos = word_data.get("품사", "") if isinstance(word_data, dict) else ""
+        lemma = lemmatize(word.lower().strip(), pos, known_words=entry_words)
+        if lemma != word.lower().strip():
+            folded_count += 1
+        _merge_word_results(folded, {lemma: word_data})
+    return folded, folded_count
+
+
+def fold_inflected_words(word_extraction_result: Dict[str, Any], video_id: str) -> Dict[str, Any]:
+    """
+    1단계 단어 추출 결과의 변화형 항목을 원형으로 합치고, 합친 항목 수를 로깅합니다.
+    
+    Args:
+        word_extraction_result: 1단계 단어 추출 결과 ({"videoId": ..., "result": {...}})
+        video_id: 비디오 ID
+        
+    Returns:
+        원형 기준으로 합친 단어 추출 결과 (같은 형식)
+    """
+    words_dict = word_extraction_result.get("result", {})
+    folded, folded_count = fold_word_inflections(words_dict)
+    ACCESS_LOGGER.info(
+        f"Lemma Merge for Video ID: '{video_id}' - "
+        f"Entries: {len(words_dict)} -> {len(folded)}, Folded: {folded_count}"
+    )
+    return {**word_extraction_result, "result": folded}
+
+
+async def _extract_word_meanings_from_chunks(
+    chunk_texts: List[str],
+    video_id: str,
+    on_chunk_result: Callable[[Dict[str, Any]], None] = None
+) -> Dict[str, Any]:
+    """
+    로컬 후보 추출 모드: 청크의 후보 단어를 로컬에서 만들고 LLM에는 문맥상 뜻만 요청합니다.
+    
+    LLM 응답({"단어": ["뜻1", ...]})은 후보 목록에 있는 단어만 남기고 로컬 추정 품사를 붙여
+    1단계 단어 결과 형식({"단어": {"품사": ..., "뜻": [...]}})으로 변환합니다.
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        on_chunk_result: 청크 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        
+    Returns:
+        extract_words_from_chunks와 같은 형식의 결과
+    """
+    candidates_by_chunk = {chunk_text: extract_candidates(chunk_text) for chunk_text in chunk_texts}
+    candidate_pos = {}
+    for candidates in candidates_by_chunk.values():
+        for word, pos in candidates.items():
+            candidate_pos.setdefault(word, pos)
+    
+    # 후보가 없는 청크는 요청하지 않음
+    chunk_texts = [chunk_text for chunk_text in chunk_texts if candidates_by_chunk[chunk_text]]
+    ACCESS_LOGGER.info(
+        f"Local Word Candidates for Video ID: '{video_id}' - "
+        f"Candidates: {len(candidate_pos)}, Chunks: {len(chunk_texts)}"
+    )
+    if not chunk_texts:
+        return {"videoId": video_id, "result": {}}
+    
+    def _normalize_meanings(result: Dict[str, Any]) -> Dict[str, Any]:
+        """후보 단어의 뜻 목록에 로컬 추정 품사를 붙임 (후보에 없는 단어는 제외)"""
+        normalized = {}
+        for word, meanings in result.items():
+            word_lower = word.lower().strip()
+            if word_lower not in candidate_pos:
+                continue
+            if isinstance(meanings, dict):
+                meanings = meanings.get("뜻", [])
+            if isinstance(meanings, str):
+                meanings = [meanings]
+            normalized[word_lower] = {"품사": candidate_pos[word_lower], "뜻": meanings}
+        return normalized
+    
+    max_output_tokens = get_stage_config(STAGE_EXTRACTION)["max_output_tokens"]
+    return await extract_from_chunks(
+        chunk_texts=chunk_texts,
+        video_id=video_id,
+        process_name="Word Meaning",
+        get_prompt_func=lambda chunk_text, video_id: get_word_meaning_prompt(
+            chunk_text, candidates_by_chunk[chunk_text], video_id
+        ),
+        prompt_version=WORD_MEANING_PROMPT_VERSION,
+        merge_results_func=_merge_word_results,
+        on_chunk_result=on_chunk_result,
+        normalize_result_func=_normalize_meanings,
+        max_tokens_func=lambda chunk_text: estimate_enrichment_max_tokens(
+            len(candidates_by_chunk[chunk_text]), settings.LLM_WORD_MEANING_TOKENS_PER_ITEM, max_output_tokens
+        )
+    )
+
+
 async def extract_words_from_chunks(
     chunk_texts: List[str], 
-    video_id: str
+    video_id: str,
+    on_chunk_result: Callable[[Dict[str, Any]], None] = None
 ) -> Dict[str, Any]:
     """
     1단계: 청크 텍스트 리스트에서 단어를 추출하고 한국어 뜻을 생성합니다.
@@ -68,6 +192,7 @@ async def extract_words_from_chunks(
     Args:
         chunk_texts: 자막 청크 텍스트 리스트
         video_id: 비디오 ID
+        on_chunk_result: 청크 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
         
     Returns:
         딕셔너리 형태의 결과:
@@ -90,10 +215,18 @@ async def extract_words_from_chunks(
         ValueError: JSON 파싱 실패 또는 응답 형식 오류 시
         Exception: LLM API 호출 실패 시
     """
+    if settings.LLM_STAGE1_LOCAL_CANDIDATES:
+        # 로컬 후보 추출 모드: 후보 단어는 로컬에서, 뜻만 LLM에서
+        return await _extract_word_meanings_from_chunks(chunk_texts, video_id, on_chunk_result)
+    
     return await extract_from_chunks(
         chunk_texts=chunk_texts,
         video_id=video_id,
         process_name="Word Extraction",
         get_prompt_func=get_word_extraction_prompt,
-        merge_results_func=_merge_word_results
+        prompt_version=WORD_EXTRACTION_PROMPT_VERSION,
+        output_token_ratio=settings.LLM_WORD_EXTRACTION_OUTPUT_RATIO,
+        min_items_per_1k_tokens=settings.LLM_CASCADE_MIN_WORDS_PER_1K_TOKENS,
+        merge_results_func=_merge_word_results,
+        on_chunk_result=on_chunk_result
     )
@@ -0,0 +1,169 @@
+"""
+vLLM 호출 지연 시간 모델 및 적응형 타임아웃 모듈
+
+단계별로 관측한 (입력 토큰 수, 출력 토큰 수, 소요 시간)에 선형 모델
+    소요 시간 ≈ a + b x 입력 토큰 + c x 출력 토큰
+을 최소제곱으로 맞추고, 호출마다 예상 출력 크기(max_tokens)로 예측한 시간에
+실측/예측 비율의 높은 백분위(예: p99)와 안전 계수를 곱해 타임아웃을 정합니다.
+
+작은 숙어 청크는 짧은 타임아웃으로 빨리 실패시켜 슬롯을 돌려주고,
+항목이 많은 상세화 요청은 고정 타임아웃(VLLM_SERVER_TIMEOUT)에 걸려 불필요하게 재시도되지 않도록 합니다.
+관측치가 min_samples보다 적으면 고정 타임아웃을 사용합니다.
+"""
+from collections import deque
+from typing import Dict, List, Optional, Any
+from app.core.config import settings
+
+# 최근 관측치 보관 개수 (서버 부하/모델 변경에 따라 모델이 따라가도록 오래된 관측치는 버림)
+LATENCY_MODEL_WINDOW_SIZE = 500
+
+# 정규방정식이 특이 행렬이 되지 않도록 더하는 작은 정칙화 값
+_RIDGE = 1e-6
+
+
+def _solve_3x3(matrix: List[List[float]], vector: List[float]) -> Optional[List[float]]:
+    """3x3 선형 방정식을 가우스 소거법(부분 피벗)으로 풉니다. 해가 없으면 None."""
+    rows = [list(matrix[i]) + [vector[i]] for i in range(3)]
+    for col in range(3):
+        pivot = max(range(col, 3), key=lambda row: abs(rows[row][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for row in range(3):
+            if row != col:
+                factor = rows[row][col] / rows[col][col]
+                rows[row] = [value - factor * pivot_value for value, pivot_value in zip(rows[row], rows[col])]
+    return [rows[i][3] / rows[i][i] for i in range(3)]
+
+
+class LatencyModel:
+    """단계 하나의 선형 지연 시간 모델 (최근 window_size개 관측치 기준)"""
+
+    def __init__(self, window_size: int = LATENCY_MODEL_WINDOW_SIZE, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window_size)
+        self._coefficients: Optional[List[float]] = None
+        self._dirty = False
+        self.observations = 0
+        self.timeouts = 0
+
+    def observe(self, input_tokens: int, output_tokens: int, seconds: float) -> None:
+        """성공한 호출 1건의 토큰 수와 소요 시간을 기록합니다."""
+        self._samples.append((float(input_tokens), float(output_tokens), float(seconds)))
+        self.observations += 1
+        self._dirty = True
+
+    def record_timeout(self) -> None:
+        """타임아웃된 호출 수를 기록합니다 (소요 시간을 알 수 없으므로 모델에는 반영하지 않음)."""
+        self.timeouts += 1
+
+    def _fit(self) -> Optional[List[float]]:
+        """관측치로 (a, b, c)를 최소제곱 추정합니다. 관측치가 부족하면 None."""
+        if not self._dirty:
+            return self._coefficients
+        self._dirty = False
+        if len(self._samples) < self.min_samples:
+            self._coefficients = None
+            return None
+        
+        # 정규방정식 (X^T X) w = X^T y, X = [1, 입력 토큰, 출력 토큰]
+        xtx = [[0.0] * 3 for _ in range(3)]
+        xty = [0.0] * 3
+        for input_tokens, output_tokens, seconds in self._samples:
+            features = (1.0, input_tokens, output_tokens)
+            for i in range(3):
+                xty[i] += features[i] * seconds
+                for j in range(3):
+                    xtx[i][j] += features[i] * features[j]
+        for i in range(3):
+            xtx[i][i] += _RIDGE
+        self._coefficients = _solve_3x3(xtx, xty)
+        return self._coefficients
+
+    def predict(self, input_tokens: int, output_tokens: int) -> Optional[float]:
+        """예상 소요 시간(초)을 반환합니다. 모델이 아직 없으면 None."""
+        coefficients = self._fit()
+        if coefficients is None:
+            return None
+        a, b, c = coefficients
+        # 음수 기울기(노이즈)로 예측이 0 이하가 되지 않도록 하한 적용
+        return max(1e-3, a + b * input_tokens + c * output_tokens)
+
+    def residual_ratio(self, percentile: float) -> Optional[float]:
+        """관측치의 실측/예측 비율 중 percentile 백분위 값 (예측이 얼마나 빗나가는지)."""
+        if self._fit() is None:
+            return None
+        ratios = sorted(
+            seconds / self.predict(input_tokens, output_tokens)
+            for input_tokens, output_tokens, seconds in self._samples
+        )
+        index = max(0, min(len(ratios) - 1, round(percentile / 100 * len(ratios)) - 1))
+        return max(1.0, ratios[index])
+
+    def timeout_for(
+        self,
+        input_tokens: int,
+        expected_output_tokens: int,
+        default_timeout: float,
+        percentile: float,
+        safety_factor: float,
+        min_timeout: float,
+        max_timeout: float
+    ) -> float:
+        """
+        호출 1건의 타임아웃(초)을 계산합니다.
+        
+        Args:
+            input_tokens: 프롬프트 토큰 수
+            expected_output_tokens: 예상 출력 토큰 수 (요청의 max_tokens)
+            default_timeout: 모델이 없을 때 사용할 고정 타임아웃
+            percentile: 실측/예측 비율 백분위 (예: 99)
+            safety_factor: 안전 계수
+            min_timeout / max_timeout: 타임아웃 하한/상한
+            
+        Returns:
+            타임아웃(초)
+        """
+        predicted = self.predict(input_tokens, expected_output_tokens)
+        if predicted is None:
+            return default_timeout
+        timeout = predicted * self.residual_ratio(percentile) * safety_factor
+        return round(max(min_timeout, min(max_timeout, timeout)), 2)
+
+    def get_params(self) -> Dict[str, Any]:
+        """적합된 모델 파라미터와 관측 통계를 반환합니다."""
+        coefficients = self._fit()
+        params = {
+            "fitted": coefficients is not None,
+            "samples": len(self._samples),
+            "observations": self.observations,
+            "timeouts": self.timeouts,
+            "intercept_seconds": None,
+            "seconds_per_input_token": None,
+            "seconds_per_output_token": None,
+            "p99_residual_ratio": None
+        }
+        if coefficients is not None:
+            a, b, c = coefficients
+            params.update({
+                "intercept_seconds": round(a, 4),
+                "seconds_per_input_token": round(b, 8),
+                "seconds_per_output_token": round(c, 6),
+                "p99_residual_ratio": round(self.residual_ratio(99), 3)
+            })
+        return params
+
+
+_LATENCY_MODELS: Dict[str, LatencyModel] = {}
+
+
+def get_latency_model(stage: str) -> LatencyModel:
+    """단계별 전역 지연 시간 모델을 반환합니다 (모든 VLLMClient가 공유)."""
+    if stage not in _LATENCY_MODELS:
+        _LATENCY_MODELS[stage] = LatencyModel(min_samples=settings.VLLM_ADAPTIVE_TIMEOUT_MIN_SAMPLES)
+    return _LATENCY_MODELS[stage]
+
+
+def get_latency_model_params() -> Dict[str, Dict[str, Any]]:
+    """단계별 지연 시간 모델 파라미터를 반환합니다."""
+    return {stage: model.get_params() for stage, model in _LATENCY_MODELS.items()}
@@ -0,0 +1,232 @@
+"""
+로컬 어휘 분석 모듈
+
+1단계 단어 추출 프롬프트는 2000토큰 청크의 모든 단어를 JSON으로 다시 출력하게 하므로 출력 토큰이 큽니다.
+로컬 후보 추출 모드(settings.LLM_STAGE1_LOCAL_CANDIDATES)에서는 이 모듈이 청크에서 후보 단어(원형)와
+품사를 결정적으로 만들고, LLM에는 주어진 후보의 문맥상 뜻만 요청합니다.
+
+- 토큰화: 영문자 정규식 (축약형 "'s", "'re", "n't" 등은 제거)
+- 원형 복원: 불규칙 변화표(resources/lemma_table.txt) → 접미사 규칙 (-ies, -es, -s, -ing, -ed),
+  품사를 알면 품사에 맞는 규칙만 적용. 규칙으로 만든 원형은 알려진 단어(번들 빈도 순위표, 변화표의 원형,
+  LLM_LEXICAL_DICTIONARY_PATH 사전)일 때만 사용하고, 아니면 텍스트에 나온 형태를 그대로 둠
+  (physics → "physic", buses → "buse"처럼 없는 단어를 만들지 않기 위해)
+- 품사 추정: 앞 단어(관사/to/정도 부사)와 접미사 규칙
+- 제외: 기능어(관사, 전치사, 접속사, 대명사, 조동사, 감탄사), 2글자 이하 단어, 문장 중간에서만 대문자로 쓰인 고유명사
+"""
+import re
+from pathlib import Path
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Tuple
+from app.core.config import settings
+from app.core.logging import get_error_logger
+from app.services.llm.word_ranking import get_word_ranker
+
+ERROR_LOGGER = get_error_logger()
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?|[.!?]")
+_SENTENCE_END = {".", "!", "?"}
+_NEGATION_STEMS = {"ca": "can", "wo": "will", "sha": "shall"}
+
+_STOPWORDS = frozenset("""
+a an the this that these those some any each every no
+i me my mine myself you your yours yourself yourselves he him his himself she her hers herself
+it its itself we us our ours ourselves they them their theirs themselves
+who whom whose which what whatever whoever
+and or but nor so yet if then than because although though while whereas unless until since as
+of in on at by for with about against between into through during before after above below to from
+up down out off over under again further once here there when where why how
+all both either neither few more most other such only own same too very just also not
+am is are was were be been being have has had having do does did doing done
+will would shall should can could may might must ought
+oh uh um ah hey hi hello yeah yes okay ok wow hmm gonna wanna gotta
+""".split())
+
+# 불규칙 변화형 → (원형, 품사) 표
+LEMMA_TABLE_PATH = Path(__file__).parent / "resources" / "lemma_table.txt"
+
+
+def _load_lemma_table(path: Path = LEMMA_TABLE_PATH) -> Dict[str, Tuple[str, str]]:
+    """변화형 표 파일(1줄에 "변화형 원형 품사", '#'으로 시작하는 줄은 주석)을 읽습니다."""
+    table = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                form, lemma, pos = line.split()
+                table[form] = (lemma, pos)
+    return table
+
+
+_IRREGULAR_LEMMAS = _load_lemma_table()
+_IRREGULAR_VALUES = frozenset(lemma for lemma, _ in _IRREGULAR_LEMMAS.values())
+
+# -s를 복수 어미로 보지 않는 끝 (단수 명사: class, status, analysis, physics)
+_NON_PLURAL_ENDINGS = ("ss", "us", "is", "ics")
+
+# 접미사 → 품사 (앞에서부터 먼저 일치하는 규칙 사용)
+_POS_SUFFIXES: Tuple[Tuple[str, str], ...] = (
+    ("tion", "n"), ("sion", "n"), ("ment", "n"), ("ness", "n"), ("ity", "n"), ("ism", "n"),
+    ("ship", "n"), ("hood", "n"), ("ance", "n"), ("ence", "n"), ("ist", "n"),
+    ("ous", "adj"), ("ful", "adj"), ("ive", "adj"), ("able", "adj"), ("ible", "adj"),
+    ("less", "adj"), ("ical", "adj"), ("ic", "adj"), ("al", "adj"),
+    ("ize", "v"), ("ise", "v"), ("ify", "v"), ("ate", "v"), ("en", "v"),
+)
+# -ly로 끝나지만 부사가 아닌 흔한 단어
+_NON_ADVERB_LY = frozenset("family only early daily likely friendly lovely supply reply apply ugly silly holy".split())
+_NOUN_CONTEXT = frozenset("a an the my your his her its our their this that these those".split())
+_ADJ_CONTEXT = frozenset("very so too really quite pretty more most".split())
+_VERB_CONTEXT = frozenset("to will would can could should must might may".split())
+
+
+_DICTIONARY_WORDS: Optional[FrozenSet[str]] = None
+
+
+def get_dictionary_words() -> FrozenSet[str]:
+    """추가 원형 사전(settings.LLM_LEXICAL_DICTIONARY_PATH)의 단어 집합을 반환합니다 (처음 사용할 때 1회 로드)."""
+    global _DICTIONARY_WORDS
+    if _DICTIONARY_WORDS is None:
+        words = set()
+        if settings.LLM_LEXICAL_DICTIONARY_PATH:
+            try:
+                with open(settings.LLM_LEXICAL_DICTIONARY_PATH, encoding="utf-8") as f:
+                    words = {line.strip().lower() for line in f if line.strip() and not line.startswith("#")}
+            except OSError as e:
+                ERROR_LOGGER.warning(
+                    f"Lexical Dictionary Load Failed - Path: '{settings.LLM_LEXICAL_DICTIONARY_PATH}' - Error: {str(e)}"
+                )
+        _DICTIONARY_WORDS = frozenset(words)
+    return _DICTIONARY_WORDS
+
+
+def _is_known_word(word: str) -> bool:
+    """번들 빈도 순위표, 불규칙 변화표의 원형, 추가 원형 사전 중 하나에 있는 단어인지 확인합니다."""
+    return (
+        get_word_ranker().frequency_table.rank(word) is not None
+        or word in _IRREGULAR_VALUES
+        or word in get_dictionary_words()
+    )
+
+
+def _suffix_candidates(word: str, pos: str) -> List[str]:
+    """접미사 규칙으로 원형 후보를 만듭니다 (앞에 있을수록 우선, 실제 단어인지는 확인하지 않음)."""
+    candidates = []
+    if pos in ("", "n", "v"):
+        if word.endswith("ies"):
+            candidates += [word[:-3] + "y", word[:-1]]  # studies -> study, movies -> movie
+        elif word.endswith("es"):
+            candidates += [word[:-2], word[:-1]]  # boxes -> box, goes -> go, makes -> make
+        elif word.endswith("s") and not word.endswith(_NON_PLURAL_ENDINGS):
+            candidates.append(word[:-1])
+    if pos in ("", "v"):
+        if word.endswith("ied"):
+            candidates += [word[:-3] + "y", word[:-1]]  # studied -> study, died -> die
+        for suffix in ("ing", "ed"):
+            if not word.endswith(suffix):
+                continue
+            stem = word[:-len(suffix)]
+            candidates.append(stem)
+            if len(stem) >= 3 and stem[-1] == stem[-2] and stem[-1] not in "lsz":
+                candidates.append(stem[:-1])  # running -> run, stopped -> stop
+            if suffix == "ing" or not stem.endswith("e") or len(stem) >= 3:
+                candidates.append(stem + "e")  # making -> make, agreed -> agree (seed -> "see"는 제외)
+    return candidates
+
+
+def lemmatize(word: str, pos: str = "", known_words: Optional[AbstractSet[str]] = None) -> str:
+    """
+    단어의 원형을 규칙 기반으로 복원합니다.
+    
+    품사가 주어지면 품사에 맞는 변화만 되돌립니다 (예: 명사 "left"는 유지, 동사 "left"는 "leave").
+    -ing/-ed는 동사, -s는 명사/동사일 때만 떼고, 형용사/부사는 변화형 표만 사용합니다.
+    접미사 규칙의 원형 후보는 알려진 단어일 때만 사용합니다 (기능어 제외, 예: "shed"는 "she"가 아님).
+    
+    Args:
+        word: 소문자 단어
+        pos: 품사 ("n", "v", "adj", "adv", 모르면 빈 문자열)
+        known_words: 규칙 원형으로 추가로 받아들일 단어 집합 (예: 같은 추출 결과의 다른 항목)
+        
+    Returns:
+        원형 (변화형 표에 없고 규칙 후보 중 알려진 단어가 없으면 입력 그대로)
+    """
+    if word in _IRREGULAR_LEMMAS:
+        lemma, lemma_pos = _IRREGULAR_LEMMAS[word]
+        return lemma if not pos or pos == lemma_pos else word
+    if len(word) <= 3 or _is_known_word(word) or pos in ("adj", "adv"):
+        return word
+    for candidate in _suffix_candidates(word, pos):
+        if len(candidate) < 2 or candidate in _STOPWORDS:
+            continue
+        if (known_words is not None and candidate in known_words) or _is_known_word(candidate):
+            return candidate
+    return word
+
+
+def guess_pos(lemma: str, token: str, previous_token: str = "") -> str:
+    """
+    품사를 추정합니다 ("n", "v", "adj", "adv" 중 하나).
+    
+    Args:
+        lemma: 원형
+        token: 텍스트에 나온 형태 (소문자)
+        previous_token: 바로 앞 토큰 (소문자, 없으면 빈 문자열)
+        
+    Returns:
+        추정 품사
+    """
+    if lemma.endswith("ly") and len(lemma) > 4 and lemma not in _NON_ADVERB_LY:
+        return "adv"
+    if previous_token in _VERB_CONTEXT:
+        return "v"
+    if previous_token in _NOUN_CONTEXT:
+        return "n"
+    if previous_token in _ADJ_CONTEXT and not lemma.endswith("ly"):
+        return "adj"
+    if token != lemma and token.endswith(("ing", "ed")):
+        return "v"
+    for suffix, pos in _POS_SUFFIXES:
+        if lemma.endswith(suffix) and len(lemma) > len(suffix) + 2:
+            return pos
+    return "n"
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 단어/문장부호 토큰으로 나눕니다 (축약형 꼬리는 제거, 대소문자 유지)."""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(text):
+        if token.lower().endswith("n't"):
+            token = _NEGATION_STEMS.get(token[:-3].lower(), token[:-3])  # isn't -> is, can't -> can
+        tokens.append(token.split("'")[0])
+    return tokens
+
+
+def extract_candidates(chunk_text: str) -> Dict[str, str]:
+    """
+    청크에서 단어 후보(원형)와 추정 품사를 추출합니다.
+    
+    Args:
+        chunk_text: 자막 청크 텍스트
+        
+    Returns:
+        {원형: 품사} 딕셔너리 (처음 등장한 순서, 같은 원형은 첫 등장의 품사 사용)
+    """
+    tokens = tokenize(chunk_text)
+    
+    # 소문자로는 한 번도 쓰이지 않고 문장 중간에서 대문자로 쓰인 단어는 고유명사로 보고 제외
+    lowercase_seen = {token for token in tokens if token.islower()}
+    proper_nouns = {
+        token.lower() for previous, token in zip(["."] + tokens, tokens)
+        if token[0].isupper() and previous not in _SENTENCE_END and token.lower() not in lowercase_seen
+    }
+    
+    candidates = {}
+    previous = "."
+    for token in tokens:
+        lower = token.lower()
+        if token in _SENTENCE_END:
+            previous = token
+            continue
+        if len(lower) > 2 and lower not in _STOPWORDS and lower not in proper_nouns:
+            # 관사/소유격 뒤의 단어는 명사 규칙만 적용 (예: "the building", "the left")
+            lemma = lemmatize(lower, "n" if previous.lower() in _NOUN_CONTEXT else "")
+            if lemma not in _STOPWORDS and lemma not in candidates:
+                candidates[lemma] = guess_pos(lemma, lower, previous.lower())
+        previous = token
+    return candidates
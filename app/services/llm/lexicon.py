@@ -0,0 +1,195 @@
+"""
+영상 간 공유 어휘(lexicon) 캐시 모듈
+
+"decision", "technology"처럼 자주 나오는 단어의 동의어/예문은 영상마다 다시 생성할 필요가 없습니다.
+2단계 상세화 결과를 (원형, 품사, 프롬프트 버전) 키로 SQLite 파일에 저장해 두고,
+상세화 프롬프트를 만들기 전에 조회하여 캐시에 없는 항목만 LLM에 요청합니다.
+
+- 키: (lemma, pos, prompt_version). prompt_version은 "Word Enrichment:v11"처럼 프로세스 이름을 포함하므로
+  단어/숙어가 섞이지 않고, 프롬프트가 바뀌면 자연스럽게 새 키가 됩니다.
+- 제거: 항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+- 내보내기/가져오기: 노드 간 공유를 위해 항목 리스트(JSON 호환) 형식으로 주고받습니다.
+- 연결 1개를 이벤트 루프(상세화)와 스레드풀(내보내기/가져오기 라우트)에서 함께 쓰므로,
+  조회/저장 트랜잭션이 섞이지 않도록 잠금을 잡고 실행합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+from app.core.config import settings
+from app.core.logging import get_access_logger
+
+ACCESS_LOGGER = get_access_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lexicon (
+    lemma TEXT NOT NULL,
+    pos TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (lemma, pos, prompt_version)
+)
+"""
+
+
+class LexiconCache:
+    """SQLite 기반 상세화 결과 캐시 (프로세스 내 조회 적중률 집계 포함)"""
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max(1, max_entries)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_lexicon_last_used ON lexicon (last_used_at)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+
+    def get_many(
+        self, keys: Iterable[Tuple[str, str]], prompt_versions: List[str]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        (원형, 품사) 키 목록을 조회합니다. 프롬프트 버전은 주어진 순서대로 먼저 찾은 값을 사용합니다.
+        
+        Args:
+            keys: (lemma, pos) 키 목록
+            prompt_versions: 허용할 프롬프트 버전 목록 (예: ["Word Enrichment:v11", "Word Enrichment:v12"])
+            
+        Returns:
+            적중한 키 -> 상세화 데이터 딕셔너리
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        now = time.time()
+        with self._lock:
+            for lemma, pos in keys:
+                for prompt_version in prompt_versions:
+                    row = self._conn.execute(
+                        "SELECT data FROM lexicon WHERE lemma = ? AND pos = ? AND prompt_version = ?",
+                        (lemma, pos, prompt_version)
+                    ).fetchone()
+                    if row:
+                        found[(lemma, pos)] = json.loads(row[0])
+                        self._conn.execute(
+                            "UPDATE lexicon SET last_used_at = ? WHERE lemma = ? AND pos = ? AND prompt_version = ?",
+                            (now, lemma, pos, prompt_version)
+                        )
+                        break
+            self._conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, entries: Iterable[Tuple[str, str, str, Dict[str, Any]]]) -> int:
+        """
+        상세화 결과를 저장하고 용량을 넘으면 LRU 항목을 제거합니다.
+        
+        Args:
+            entries: (lemma, pos, prompt_version, data) 목록
+            
+        Returns:
+            저장한 항목 수
+        """
+        now = time.time()
+        rows = [
+            (lemma, pos, prompt_version, json.dumps(data, ensure_ascii=False), now, now)
+            for lemma, pos, prompt_version, data in entries
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO lexicon (lemma, pos, prompt_version, data, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.stored += len(rows)
+            self._evict()
+            self._conn.commit()
+        return len(rows)
+
+    def _evict(self) -> None:
+        """항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다 (잠금 안에서 호출)."""
+        count = self._conn.execute("SELECT COUNT(*) FROM lexicon").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM lexicon WHERE rowid IN "
+                "(SELECT rowid FROM lexicon ORDER BY last_used_at ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.evicted += overflow
+            ACCESS_LOGGER.info(f"Lexicon Cache Evicted {overflow} Entries - Max Entries: {self.max_entries}")
+
+    def export_entries(self, prompt_version: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        저장된 항목을 노드 간 공유용 리스트로 내보냅니다.
+        
+        Args:
+            prompt_version: 특정 프롬프트 버전만 내보낼 때 지정
+            
+        Returns:
+            [{"lemma": ..., "pos": ..., "prompt_version": ..., "data": {...}}, ...]
+        """
+        query = "SELECT lemma, pos, prompt_version, data FROM lexicon"
+        params = ()
+        if prompt_version:
+            query += " WHERE prompt_version = ?"
+            params = (prompt_version,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY lemma", params).fetchall()
+        return [
+            {"lemma": lemma, "pos": pos, "prompt_version": version, "data": json.loads(data)}
+            for lemma, pos, version, data in rows
+        ]
+
+    def import_entries(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        export_entries 형식의 항목을 가져옵니다 (같은 키는 덮어씀).
+        
+        Args:
+            entries: [{"lemma": ..., "pos": ..., "prompt_version": ..., "data": {...}}, ...]
+            
+        Returns:
+            가져온 항목 수
+        """
+        return self.put_many(
+            (entry["lemma"], entry.get("pos", ""), entry["prompt_version"], entry["data"])
+            for entry in entries
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 크기, 조회 적중률, 저장/제거 수를 반환합니다."""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM lexicon").fetchone()[0]
+        return {
+            "path": self.path,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "stored": self.stored,
+            "evicted": self.evicted
+        }
+
+
+_LEXICON: Optional[LexiconCache] = None
+
+
+def get_lexicon() -> LexiconCache:
+    """프로세스 전역 lexicon 캐시를 반환합니다."""
+    global _LEXICON
+    if _LEXICON is None:
+        _LEXICON = LexiconCache(settings.LLM_LEXICON_PATH, settings.LLM_LEXICON_MAX_ENTRIES)
+    return _LEXICON
@@ -48,9 +48,10 @@ def merge_results(
                         "예문": "Example sentence in English."
                     },
                     ...
-                }
+                },
+                "lexiconHits": {...}  # lexicon 캐시 적중 항목 (result와 같은 형식, 선택적)
             }
-        phrase_enrichment_result: 2단계 숙어 예문 결과
+        phrase_enrichment_result: 2단계 숙어 예문 결과 (lexiconHits 포함 가능)
             예: {
                 "videoId": video_id,
                 "result": {
@@ -96,6 +97,10 @@ def merge_results(
     word_enrichment_dict = word_enrichment_result.get("result", {})
     phrase_enrichment_dict = phrase_enrichment_result.get("result", {})
     
+    # lexicon 캐시 적중 항목 (LLM 결과에 없는 항목만 사용)
+    word_lexicon_hits = word_enrichment_result.get("lexiconHits", {})
+    phrase_lexicon_hits = phrase_enrichment_result.get("lexiconHits", {})
+    
     # 단어 병합
     words_list = []
     for word_key, word_data in words_dict.items():
@@ -111,7 +116,7 @@ def merge_results(
             meanings = [meanings] if meanings else []
         
         # 2단계 데이터 추출 (소문자 키로 조회)
-        enrichment_data = word_enrichment_dict.get(word_key, {})
+        enrichment_data = word_enrichment_dict.get(word_key) or word_lexicon_hits.get(word_key, {})
         synonyms = enrichment_data.get("동의어", [])
         example = enrichment_data.get("예문", "")
         
@@ -143,7 +148,7 @@ def merge_results(
             meaning_value = str(meaning) if meaning else ""
         
         # 2단계 데이터 추출 (소문자 키로 조회)
-        enrichment_data = phrase_enrichment_dict.get(phrase_key, {})
+        enrichment_data = phrase_enrichment_dict.get(phrase_key) or phrase_lexicon_hits.get(phrase_key, {})
         example = enrichment_data.get("예문", "")
         
         # 숙어 엔트리 생성
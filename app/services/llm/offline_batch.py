@@ -0,0 +1,329 @@
+"""
+오프라인 JSONL 배치 모듈 (대량 단어장 생성용)
+
+수천 개 영상의 야간 백필처럼 지연 시간보다 처리량이 중요한 작업은 HTTP 요청 경로 대신
+다음 세 단계로 처리하여 GPU 사용률을 최대화합니다.
+
+1. 모든 영상의 1단계(단어/숙어 추출) 프롬프트를 OpenAI batch 형식의 JSONL 요청 파일로 작성
+2. vLLM 오프라인 배치 실행기(vllm.entrypoints.openai.run_batch) 또는 로컬 대체 실행기로 처리
+3. 결과 파일을 읽어 영상별 1단계 결과를 만들고 2단계(상세화) + 3단계(병합) 수행
+
+사용 예시:
+    python -m app.services.llm.offline_batch --videos video_ids.txt --output vocabularies.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Any
+from app.core.config import settings
+from app.core.logging import get_access_logger, get_error_logger
+from app.core.error_utils import log_error_with_location
+from app.services.llm.client import VLLMClient
+from app.services.llm.budget import estimate_extraction_max_tokens
+from app.services.llm.stages import get_stage_config, STAGE_EXTRACTION
+from app.services.llm.prompts import get_word_extraction_prompt, get_phrase_extraction_prompt
+from app.services.llm.extract_words import _merge_word_results
+from app.services.llm.extract_phrases import _merge_phrase_results
+from app.services.llm.processor import select_chunks, enrich_and_merge
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+BATCH_RUNNER_VLLM = "vllm"
+BATCH_RUNNER_LOCAL = "local"
+
+# 추출 종류별 (프롬프트 함수, 출력 토큰 비율 설정 이름, 병합 함수)
+EXTRACTION_KINDS = {
+    "word": (get_word_extraction_prompt, "LLM_WORD_EXTRACTION_OUTPUT_RATIO", _merge_word_results),
+    "phrase": (get_phrase_extraction_prompt, "LLM_PHRASE_EXTRACTION_OUTPUT_RATIO", _merge_phrase_results),
+}
+
+# custom_id 구분자 ("{video_id}::{kind}::{chunk_idx}")
+CUSTOM_ID_SEPARATOR = "::"
+
+
+def build_stage1_requests(videos: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """
+    영상별 청크로 1단계 요청 리스트를 OpenAI batch 형식으로 만듭니다.
+    
+    Args:
+        videos: {video_id: [chunk_text, ...]} 딕셔너리
+        
+    Returns:
+        batch 요청 리스트:
+        [
+            {
+                "custom_id": "abc123::word::1",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": "...", "messages": [...], "max_tokens": 512, ...}
+            },
+            ...
+        ]
+    """
+    stage_config = get_stage_config(STAGE_EXTRACTION)
+    requests = []
+    for video_id, chunk_texts in videos.items():
+        for chunk_idx, chunk_text in enumerate(select_chunks(chunk_texts, video_id), start=1):
+            for kind, (get_prompt_func, ratio_setting, _) in EXTRACTION_KINDS.items():
+                requests.append({
+                    "custom_id": CUSTOM_ID_SEPARATOR.join([video_id, kind, str(chunk_idx)]),
+                    "method": "POST",
+                    "url": settings.VLLM_SERVER_ENDPOINT,
+                    "body": {
+                        "model": stage_config["model"],
+                        "messages": [{"role": "user", "content": get_prompt_func(chunk_text, video_id)}],
+                        "temperature": stage_config["temperature"],
+                        "max_tokens": estimate_extraction_max_tokens(
+                            chunk_text, getattr(settings, ratio_setting), stage_config["max_output_tokens"]
+                        )
+                    }
+                })
+    return requests
+
+
+def write_batch_file(requests: List[Dict[str, Any]], path: str) -> str:
+    """batch 요청 리스트를 JSONL 파일로 저장하고 경로를 반환합니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for request in requests:
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+    ACCESS_LOGGER.info(f"Batch Request File Written - Path: '{path}' - Requests: {len(requests)}")
+    return path
+
+
+async def _run_batch_with_vllm(input_path: str, output_path: str) -> None:
+    """vLLM 오프라인 배치 실행기(run_batch)로 요청 파일을 처리합니다 (GPU가 있는 머신에서 실행)."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "vllm.entrypoints.openai.run_batch",
+        "-i", input_path,
+        "-o", output_path,
+        "--model", get_stage_config(STAGE_EXTRACTION)["model"]
+    )
+    return_code = await process.wait()
+    if return_code != 0:
+        raise RuntimeError(f"vLLM run_batch 실행에 실패했습니다. (exit code: {return_code})")
+
+
+async def _run_batch_locally(input_path: str, output_path: str, concurrency: int) -> None:
+    """
+    run_batch 대체 실행기: 요청 파일을 vLLM 서버로 전송하고 같은 형식의 결과 파일을 작성합니다.
+    
+    오프라인 실행기를 쓸 수 없는 환경(GPU 서버에 직접 접근 불가 등)에서 사용합니다.
+    """
+    with open(input_path, encoding="utf-8") as f:
+        requests = [json.loads(line) for line in f if line.strip()]
+    
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def _send(request_idx: int, request: Dict[str, Any], client: VLLMClient) -> Dict[str, Any]:
+        body = request["body"]
+        output = {"id": f"batch_req_{request_idx}", "custom_id": request["custom_id"], "response": None, "error": None}
+        async with semaphore:
+            try:
+                response = await client.chat_completion(
+                    body["messages"],
+                    temperature=body.get("temperature", 0.7),
+                    max_tokens=body.get("max_tokens", settings.LLM_MAX_OUTPUT_TOKENS),
+                    route_key=request["custom_id"].split(CUSTOM_ID_SEPARATOR)[1],
+                    stop=body.get("stop")
+                )
+                output["response"] = {"status_code": 200, "body": response}
+            except Exception as e:
+                output["error"] = {"message": str(e)}
+        return output
+    
+    async with VLLMClient(stage=STAGE_EXTRACTION) as client:
+        outputs = await asyncio.gather(*[
+            _send(request_idx, request, client) for request_idx, request in enumerate(requests)
+        ])
+    
+    with open(output_path, "w", encoding="utf-8") as f:
+        for output in outputs:
+            f.write(json.dumps(output, ensure_ascii=False) + "\n")
+
+
+async def run_batch_file(input_path: str, output_path: str, runner: Optional[str] = None) -> str:
+    """
+    요청 파일을 배치 실행기로 처리하고 결과 파일 경로를 반환합니다.
+    
+    Args:
+        input_path: OpenAI batch 형식 요청 파일 (JSONL)
+        output_path: 결과 파일을 저장할 경로 (JSONL)
+        runner: BATCH_RUNNER_VLLM 또는 BATCH_RUNNER_LOCAL (없으면 settings.LLM_OFFLINE_BATCH_RUNNER)
+        
+    Returns:
+        결과 파일 경로
+        
+    Raises:
+        ValueError: 알 수 없는 실행기 이름
+        RuntimeError: vLLM 배치 실행 실패 시
+    """
+    runner = runner or settings.LLM_OFFLINE_BATCH_RUNNER
+    ACCESS_LOGGER.info(f"Start Batch Run - Runner: {runner} - Input: '{input_path}'")
+    
+    if runner == BATCH_RUNNER_VLLM:
+        await _run_batch_with_vllm(input_path, output_path)
+    elif runner == BATCH_RUNNER_LOCAL:
+        await _run_batch_locally(input_path, output_path, settings.LLM_OFFLINE_LOCAL_CONCURRENCY)
+    else:
+        raise ValueError(f"알 수 없는 배치 실행기입니다: '{runner}'")
+    
+    ACCESS_LOGGER.info(f"End Batch Run - Output: '{output_path}'")
+    return output_path
+
+
+async def ingest_stage1_results(output_path: str) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    배치 결과 파일을 읽어 영상별 1단계 결과를 만듭니다 (실패하거나 파싱할 수 없는 청크는 건너뜀).
+    
+    Args:
+        output_path: 배치 결과 파일 경로 (JSONL)
+        
+    Returns:
+        {
+            "abc123": {
+                "word": {"videoId": "abc123", "result": {...}},
+                "phrase": {"videoId": "abc123", "result": {...}}
+            },
+            ...
+        }
+    """
+    # 응답 본문에서 콘텐츠를 꺼내는 로직은 HTTP 경로와 동일하게 사용 (서버 연결 없음)
+    parser = VLLMClient()
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    skipped = 0
+    
+    with open(output_path, encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    
+    for line in lines:
+        output = json.loads(line)
+        custom_id = output.get("custom_id", "")
+        video_id, kind, chunk_idx = custom_id.split(CUSTOM_ID_SEPARATOR)
+        video_results = results.setdefault(video_id, {
+            extraction_kind: {"videoId": video_id, "result": {}} for extraction_kind in EXTRACTION_KINDS
+        })
+        
+        response = output.get("response") or {}
+        if output.get("error") or response.get("status_code") != 200:
+            ERROR_LOGGER.error(f"Skipping Batch Result '{custom_id}' - Error: {output.get('error')}")
+            skipped += 1
+            continue
+        
+        try:
+            content = await parser.extract_content_from_response(response.get("body", {}))
+            chunk_result = json.loads(content).get("result")
+            if not chunk_result or not isinstance(chunk_result, dict):
+                raise ValueError("응답에 result 딕셔너리가 없습니다.")
+        except (ValueError, AttributeError) as e:
+            log_error_with_location(
+                f"Batch Result Parse Failed for '{custom_id}'",
+                f"Video ID: '{video_id}' - Chunk: {chunk_idx} - Error: {str(e)}",
+                error=e
+            )
+            skipped += 1
+            continue
+        
+        merge_results_func = EXTRACTION_KINDS[kind][2]
+        merge_results_func(video_results[kind]["result"], chunk_result)
+    
+    ACCESS_LOGGER.info(
+        f"Batch Results Ingested - Videos: {len(results)} - Lines: {len(lines)} - Skipped: {skipped}"
+    )
+    return results
+
+
+async def process_vocabulary_offline(
+    videos: Dict[str, List[str]],
+    work_dir: Optional[str] = None,
+    runner: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    여러 영상의 단어장을 오프라인 배치로 생성합니다 (process_vocabulary의 대량 처리 버전).
+    
+    Args:
+        videos: {video_id: [chunk_text, ...]} 딕셔너리
+        work_dir: 요청/결과 JSONL 파일을 저장할 디렉토리 (없으면 settings.LLM_OFFLINE_BATCH_DIR)
+        runner: 배치 실행기 (없으면 settings.LLM_OFFLINE_BATCH_RUNNER)
+        
+    Returns:
+        {
+            "vocabularies": {video_id: 최종 단어장, ...},
+            "failed": {video_id: "에러 메시지", ...},
+            "request_file": ".../stage1_requests.jsonl",
+            "result_file": ".../stage1_results.jsonl"
+        }
+    """
+    work_dir = work_dir or settings.LLM_OFFLINE_BATCH_DIR
+    request_file = os.path.join(work_dir, "stage1_requests.jsonl")
+    result_file = os.path.join(work_dir, "stage1_results.jsonl")
+    
+    # 1. 요청 파일 작성 → 2. 배치 실행
+    write_batch_file(build_stage1_requests(videos), request_file)
+    await run_batch_file(request_file, result_file, runner)
+    
+    # 3. 결과 수집 후 영상별 2단계 + 병합 (동시 요청 수는 KV cache 토큰 예산이 제한)
+    stage1_results = await ingest_stage1_results(result_file)
+    video_ids = list(videos.keys())
+    
+    async def _complete(video_id: str) -> Dict[str, Any]:
+        video_results = stage1_results.get(video_id, {})
+        empty_result = {"videoId": video_id, "result": {}}
+        return await enrich_and_merge(
+            video_results.get("word", empty_result),
+            video_results.get("phrase", empty_result),
+            video_id
+        )
+    
+    final_results = await asyncio.gather(
+        *[_complete(video_id) for video_id in video_ids], return_exceptions=True
+    )
+    
+    vocabularies, failed = {}, {}
+    for video_id, final_result in zip(video_ids, final_results):
+        if isinstance(final_result, Exception):
+            ERROR_LOGGER.error(f"Offline Vocabulary Failed for Video ID: '{video_id}' - Error: {str(final_result)}")
+            failed[video_id] = str(final_result)
+        else:
+            vocabularies[video_id] = final_result
+    
+    ACCESS_LOGGER.info(f"Offline Vocabulary Processing Complete - Success: {len(vocabularies)}, Failed: {len(failed)}")
+    return {
+        "vocabularies": vocabularies,
+        "failed": failed,
+        "request_file": request_file,
+        "result_file": result_file
+    }
+
+
+async def _main(video_ids_path: str, output_path: str, work_dir: Optional[str], runner: Optional[str]) -> None:
+    """영상 ID 목록 파일을 읽어 자막을 추출하고 오프라인 배치로 단어장을 만들어 JSONL로 저장합니다."""
+    from app.services.transcript import get_transcript
+    
+    with open(video_ids_path, encoding="utf-8") as f:
+        video_ids = [line.strip() for line in f if line.strip()]
+    
+    videos = {}
+    for video_id in video_ids:
+        try:
+            videos[video_id] = [chunk.get("text", "") for chunk in get_transcript(video_id)]
+        except ValueError as e:
+            ERROR_LOGGER.error(f"Skipping Video ID: '{video_id}' - {str(e)}")
+    
+    outcome = await process_vocabulary_offline(videos, work_dir, runner)
+    with open(output_path, "w", encoding="utf-8") as f:
+        for vocabulary in outcome["vocabularies"].values():
+            f.write(json.dumps(vocabulary, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오프라인 배치 단어장 생성")
+    parser.add_argument("--videos", required=True, help="영상 ID 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--output", required=True, help="단어장 결과 JSONL 파일")
+    parser.add_argument("--work-dir", default=None, help="요청/결과 JSONL 저장 디렉토리")
+    parser.add_argument("--runner", choices=[BATCH_RUNNER_VLLM, BATCH_RUNNER_LOCAL], default=None)
+    args = parser.parse_args()
+    asyncio.run(_main(args.videos, args.output, args.work_dir, args.runner))
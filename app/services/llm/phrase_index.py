@@ -0,0 +1,119 @@
+"""
+숙어 사전 인덱스 모듈
+
+1단계 숙어 추출은 청크마다 LLM을 호출하지만, 결과의 상당수는 유한한 목록의 구동사/관용구입니다.
+번들된 숙어 목록(resources/phrase_list.txt)으로 단어 단위 Aho-Corasick 오토마톤을 한 번 만들어 두고,
+청크를 선형 시간에 훑어 등장한 숙어와 뜻을 로컬에서 찾습니다.
+
+- 원형 허용 매칭: 숙어와 텍스트를 모두 lexical.lemmatize로 원형화한 토큰열로 비교
+  ("gave up", "looking forward to"도 "give up", "look forward to"로 매칭)
+- 겹치는 매칭은 더 긴 숙어만 남김 ("as well as" 안의 "as well"은 제외)
+- 문장부호(. ! ?)도 토큰으로 두어 문장 경계를 넘는 매칭을 막음
+"""
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.services.llm.lexical import lemmatize, tokenize
+
+PHRASE_LIST_PATH = Path(__file__).parent / "resources" / "phrase_list.txt"
+
+
+def _to_lemma_tokens(text: str) -> List[str]:
+    """텍스트를 소문자 원형 토큰열로 변환합니다."""
+    return [lemmatize(token.lower()) for token in tokenize(text)]
+
+
+class PhraseIndex:
+    """원형 토큰 단위 Aho-Corasick 오토마톤"""
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._patterns: List[Tuple[str, str, int]] = []  # (숙어, 뜻, 토큰 수)
+        
+        for phrase, meaning in entries:
+            lemma_tokens = _to_lemma_tokens(phrase)
+            if len(lemma_tokens) < 2:
+                continue
+            state = 0
+            for token in lemma_tokens:
+                if token not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][token] = len(self._goto) - 1
+                state = self._goto[state][token]
+            self._output[state].append(len(self._patterns))
+            self._patterns.append((phrase.lower(), meaning, len(lemma_tokens)))
+        
+        # 실패 링크 (BFS, 실패 상태의 출력도 이어받음)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(token, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    @classmethod
+    def load(cls, path: Path = PHRASE_LIST_PATH) -> "PhraseIndex":
+        """숙어 목록 파일(1줄에 "숙어<TAB>뜻", '#'으로 시작하는 줄은 주석)로 인덱스를 만듭니다."""
+        with open(path, encoding="utf-8") as f:
+            return cls(
+                tuple(line.rstrip("\n").split("\t", 1))
+                for line in f
+                if line.strip() and not line.startswith("#")
+            )
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _find_spans(self, lemma_tokens: List[str]) -> List[Tuple[int, int, int]]:
+        """토큰열에서 모든 매칭의 (시작, 끝, 숙어 번호)를 찾습니다."""
+        spans = []
+        state = 0
+        for position, token in enumerate(lemma_tokens):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for pattern_id in self._output[state]:
+                length = self._patterns[pattern_id][2]
+                spans.append((position - length + 1, position + 1, pattern_id))
+        return spans
+
+    def find(self, text: str) -> Dict[str, str]:
+        """
+        텍스트에 등장한 숙어와 뜻을 찾습니다.
+        
+        Args:
+            text: 자막 청크 텍스트
+            
+        Returns:
+            {숙어: 뜻} 딕셔너리 (등장 순서, 다른 매칭 안에 포함된 짧은 매칭은 제외)
+        """
+        spans = self._find_spans(_to_lemma_tokens(text))
+        kept = []
+        for start, end, pattern_id in sorted(spans, key=lambda span: (span[0] - span[1], span[0])):
+            if not any(kept_start <= start and end <= kept_end for kept_start, kept_end, _ in kept):
+                kept.append((start, end, pattern_id))
+        
+        found = {}
+        for _, _, pattern_id in sorted(kept):
+            phrase, meaning, _ = self._patterns[pattern_id]
+            found.setdefault(phrase, meaning)
+        return found
+
+
+_PHRASE_INDEX: Optional[PhraseIndex] = None
+
+
+def get_phrase_index() -> PhraseIndex:
+    """프로세스 전역 숙어 인덱스를 반환합니다 (처음 사용할 때 1회 생성)."""
+    global _PHRASE_INDEX
+    if _PHRASE_INDEX is None:
+        _PHRASE_INDEX = PhraseIndex.load()
+    return _PHRASE_INDEX
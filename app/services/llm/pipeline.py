@@ -0,0 +1,128 @@
+"""
+1단계 → 2단계 청크 단위 파이프라인 모듈
+
+파이프라인 모드(settings.LLM_PIPELINE_MODE)에서는 1단계 전체가 끝나기를 기다리지 않고,
+청크 추출 결과가 도착할 때마다 처음 본 단어/숙어를 모아 배치 크기가 차면 바로 2단계 상세화 요청을 보냅니다.
+나머지 청크를 추출하는 동안 상세화가 함께 진행되므로 전체 지연 시간은
+(1단계 + 2단계)의 합이 아니라 대략 max(1단계) + 마지막 상세화 배치 1건이 됩니다.
+max_items를 주면 그 개수만큼의 항목만 상세화하고, 이후 처음 보는 항목은 넣지 않습니다.
+"""
+import asyncio
+from typing import Dict, List, Any, Callable, Awaitable
+from app.core.logging import get_access_logger, get_error_logger
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+
+class EnrichmentPipeline:
+    """
+    청크 추출 결과를 받아 상세화 배치를 흘려보내는 파이프라인 (단어/숙어별로 하나씩 사용)
+    
+    사용 예시:
+        pipeline = EnrichmentPipeline("Word", enrich_words, _merge_word_results, video_id, batch_size=20)
+        await extract_words_from_chunks(chunk_texts, video_id, on_chunk_result=pipeline.add)
+        word_enrichment_result = await pipeline.finish()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        enrich_func: Callable[[Dict[str, Any], str], Awaitable[Dict[str, Any]]],
+        merge_func: Callable[[Dict[str, Any], Dict[str, Any]], None],
+        video_id: str,
+        batch_size: int,
+        max_items: int = 0
+    ):
+        self.name = name
+        self.enrich_func = enrich_func
+        self.merge_func = merge_func
+        self.video_id = video_id
+        self.batch_size = max(1, batch_size)
+        self.max_items = max(0, max_items)
+        self._seen = set()
+        self._skipped = set()
+        self._pending: Dict[str, Any] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add(self, chunk_result: Dict[str, Any]) -> None:
+        """
+        청크 1건의 추출 결과에서 처음 본 항목을 대기열에 넣고, 배치 크기가 차면 상세화를 시작합니다.
+        max_items개를 넣은 뒤에는 새 항목을 건너뜁니다 (먼저 도착한 항목 우선).
+        
+        Args:
+            chunk_result: 청크 추출 결과 딕셔너리 (1단계 병합 함수로 정규화)
+        """
+        normalized = {}
+        self.merge_func(normalized, chunk_result)
+        for item, item_data in normalized.items():
+            if item in self._seen:
+                continue
+            if self.max_items and len(self._seen) >= self.max_items:
+                self._skipped.add(item)
+                continue
+            self._seen.add(item)
+            self._pending[item] = item_data
+        
+        while len(self._pending) >= self.batch_size:
+            items = list(self._pending.items())
+            self._pending = dict(items[self.batch_size:])
+            self._start_batch(dict(items[:self.batch_size]))
+
+    @property
+    def admitted_items(self) -> set:
+        """상세화 대기열에 넣은(넣을) 항목 집합 (max_items로 건너뛴 항목 제외)"""
+        return set(self._seen)
+
+    def _start_batch(self, batch: Dict[str, Any]) -> None:
+        """상세화 배치 1건을 백그라운드 작업으로 시작합니다."""
+        ACCESS_LOGGER.info(
+            f"{self.name} Enrichment Batch {len(self._tasks) + 1} Started for Video ID: '{self.video_id}' - "
+            f"Items: {len(batch)}"
+        )
+        self._tasks.append(asyncio.create_task(
+            self.enrich_func({"videoId": self.video_id, "result": batch}, self.video_id)
+        ))
+
+    async def finish(self) -> Dict[str, Any]:
+        """
+        남은 항목을 마지막 배치로 보내고 모든 상세화 배치 결과를 합쳐 반환합니다.
+        
+        실패한 배치는 로그만 남기고 건너뜁니다 (부분 실패 허용).
+        
+        Returns:
+            {"videoId": video_id, "result": {...}, "lexiconHits": {...}} 형식의 상세화 결과
+        """
+        if self._pending:
+            self._start_batch(self._pending)
+            self._pending = {}
+        
+        batch_results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        combined_result = {}
+        lexicon_hits = {}
+        for idx, batch_result in enumerate(batch_results, start=1):
+            if isinstance(batch_result, Exception):
+                ERROR_LOGGER.error(
+                    f"{self.name} Enrichment Batch {idx}/{len(batch_results)} Failed for Video ID: "
+                    f"'{self.video_id}' - Error: {str(batch_result)}"
+                )
+                continue
+            combined_result.update(batch_result.get("result", {}))
+            lexicon_hits.update(batch_result.get("lexiconHits", {}))
+        
+        ACCESS_LOGGER.info(
+            f"{self.name} Enrichment Pipeline Complete for Video ID: '{self.video_id}' - "
+            f"Batches: {len(batch_results)}, Items: {len(combined_result) + len(lexicon_hits)}/{len(self._seen)}, "
+            f"Skipped Over Limit: {len(self._skipped)}"
+        )
+        return {
+            "videoId": self.video_id,
+            "result": combined_result,
+            "lexiconHits": lexicon_hits
+        }
+
+    def cancel(self) -> None:
+        """진행 중인 상세화 배치를 취소합니다 (1단계 처리 중 예외 발생 시)."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,87 @@
+"""
+prefix cache 사전 적재(priming) 모듈
+
+서버 시작 시 템플릿별 정적 prefix로 요청을 보내 vLLM의 KV prefix cache를 미리 채웁니다.
+같은 prefix로 두 번 요청하여(max_tokens=1이므로 지연 시간 ≈ prefill 시간)
+첫 요청(cache miss)과 두 번째 요청(cache hit)의 지연 시간 차이를
+"요청당 절약되는 prefill 시간"으로 기록합니다.
+
+주의: vLLM 서버가 이미 같은 prefix를 캐시하고 있었다면 첫 요청도 cache hit이므로 절약 시간이 0에 가깝게 측정됩니다.
+"""
+import time
+from typing import Dict, List, Any
+from app.services.llm.client import VLLMClient
+from app.services.llm.prompts import STATIC_PROMPT_PREFIXES
+from app.services.llm.stages import STAGE_EXTRACTION, STAGE_ENRICHMENT
+from app.core.logging import get_access_logger, get_error_logger
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+# 라우팅 키별 priming 측정 결과
+PRIMING_STATS: Dict[str, Dict[str, Any]] = {}
+
+
+async def _timed_prefill(client: VLLMClient, prefix: str, route_key: str) -> tuple:
+    """prefix만 담은 요청을 max_tokens=1로 보내고 (지연 시간(ms), 프롬프트 토큰 수)를 반환합니다."""
+    messages = [{"role": "user", "content": prefix}]
+    started_at = time.perf_counter()
+    response = await client.chat_completion(
+        messages, temperature=0.0, max_tokens=1, route_key=route_key
+    )
+    latency_ms = (time.perf_counter() - started_at) * 1000
+    prompt_tokens = (response.get("usage") or {}).get("prompt_tokens")
+    return latency_ms, prompt_tokens
+
+
+async def prime_prefix_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    모든 템플릿의 정적 prefix를 vLLM prefix cache에 적재하고 절약되는 prefill 시간을 측정합니다.
+    
+    라우팅 키와 단계별 서버 설정을 실제 요청과 동일하게 사용하므로, prefix_affinity 모드에서는
+    해당 템플릿을 처리할 레플리카의 캐시가 채워집니다.
+    템플릿별 실패는 로그만 남기고 건너뜁니다 (서버 시작을 막지 않음).
+    
+    Returns:
+        라우팅 키별 측정 결과:
+        {
+            "Word Extraction:v11": {
+                "prompt_tokens": 512,
+                "cold_ms": 180.2,
+                "warm_ms": 35.4,
+                "saved_prefill_ms": 144.8
+            },
+            ...
+        }
+    """
+    ACCESS_LOGGER.info(f"Start Prefix Cache Priming - Templates: {len(STATIC_PROMPT_PREFIXES)}")
+    
+    for route_key, prefix in STATIC_PROMPT_PREFIXES.items():
+        stage = STAGE_EXTRACTION if "Extraction" in route_key else STAGE_ENRICHMENT
+        async with VLLMClient(stage=stage) as client:
+            try:
+                cold_ms, prompt_tokens = await _timed_prefill(client, prefix, route_key)
+                warm_ms, _ = await _timed_prefill(client, prefix, route_key)
+                PRIMING_STATS[route_key] = {
+                    "prompt_tokens": prompt_tokens,
+                    "cold_ms": round(cold_ms, 2),
+                    "warm_ms": round(warm_ms, 2),
+                    "saved_prefill_ms": round(max(0.0, cold_ms - warm_ms), 2)
+                }
+                ACCESS_LOGGER.info(
+                    f"Prefix Cache Primed - Key: '{route_key}' - Prompt Tokens: {prompt_tokens} - "
+                    f"Cold: {cold_ms:.1f}ms, Warm: {warm_ms:.1f}ms"
+                )
+            except Exception as e:
+                ERROR_LOGGER.error(f"Prefix Cache Priming Failed - Key: '{route_key}' - Error: {str(e)}")
+    
+    ACCESS_LOGGER.info(f"End Prefix Cache Priming - Primed: {len(PRIMING_STATS)}/{len(STATIC_PROMPT_PREFIXES)}")
+    return PRIMING_STATS
+
+
+def get_priming_stats() -> List[Dict[str, Any]]:
+    """템플릿별 priming 측정 결과(요청당 절약되는 prefill 시간 포함)를 반환합니다."""
+    return [
+        {"route_key": route_key, **stats}
+        for route_key, stats in PRIMING_STATS.items()
+    ]
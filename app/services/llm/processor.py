@@ -4,35 +4,240 @@ LLM 처리 통합 모듈
 전체 워크플로우를 통합하여 자막 청크에서 단어장을 생성합니다.
 """
 import asyncio
-import random
-from typing import Dict, Any, List
-from app.services.llm.extract_words import extract_words_from_chunks
-from app.services.llm.extract_phrases import extract_phrases_from_chunks
+import time
+from typing import Dict, Any, List, Tuple, Callable, Optional
+from app.services.llm.extract_words import (
+    extract_words_from_chunks,
+    fold_inflected_words,
+    fold_word_inflections,
+    _merge_word_results
+)
+from app.services.llm.extract_phrases import extract_phrases_from_chunks, _merge_phrase_results
+from app.services.llm.extract_vocabulary import extract_vocabulary_from_chunks
 from app.services.llm.enrich_words import enrich_words
 from app.services.llm.enrich_phrases import enrich_phrases
 from app.services.llm.merge_results import merge_results
+from app.services.llm.pipeline import EnrichmentPipeline
+from app.services.llm.chunk_selection import select_chunks_by_coverage
+from app.services.llm.saturation import SaturationMonitor, get_saturation_tracker
+from app.services.llm.word_ranking import get_word_ranker, rank_extracted_words
+from app.services.llm.budget import estimate_token_count
+from app.services.llm.stages import STAGE_EXTRACTION, STAGE_ENRICHMENT
+from app.core.config import settings
 from app.core.logging import get_access_logger, get_error_logger
 
 ACCESS_LOGGER = get_access_logger()
 ERROR_LOGGER = get_error_logger()
 
+# 진행 단계 콜백(on_stage)에 전달하는 3단계 이름 (1, 2단계는 STAGE_EXTRACTION, STAGE_ENRICHMENT)
+STAGE_MERGE = "merge"
+
+
+def select_chunks(chunk_texts: List[str], video_id: str) -> List[str]:
+    """
+    1단계에 사용할 청크를 선택합니다.
+    
+    청크 수나 토큰 합이 설정된 예산을 넘으면 어휘 커버리지가 최대가 되는 청크를 선택합니다
+    (비디오 ID seed로 같은 영상은 항상 같은 청크 선택).
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        
+    Returns:
+        선택된 청크 텍스트 리스트 (원래 순서 유지)
+    """
+    max_chunks = settings.LLM_CHUNK_SELECTION_MAX_CHUNKS
+    max_tokens = settings.LLM_CHUNK_SELECTION_MAX_TOKENS
+    total_tokens = sum(estimate_token_count(chunk_text) for chunk_text in chunk_texts)
+    if len(chunk_texts) <= max_chunks and (not max_tokens or total_tokens <= max_tokens):
+        return chunk_texts
+    
+    selection = select_chunks_by_coverage(chunk_texts, video_id, max_chunks, max_tokens)
+    ACCESS_LOGGER.info(
+        f"Subsampling chunks for Video ID: '{video_id}' - "
+        f"Total: {len(chunk_texts)} -> {len(selection['chunks'])} (Coverage Selection) - "
+        f"Selected: {selection['indices']} - Vocabulary Coverage: {selection['coverage']:.1%}"
+    )
+    return selection["chunks"]
+
+
+async def _extract_stage1(
+    chunk_texts: List[str],
+    video_id: str,
+    on_word_result: Callable[[Dict[str, Any]], None] = None,
+    on_phrase_result: Callable[[Dict[str, Any]], None] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    1단계: 청크에서 단어 및 숙어를 추출합니다 (실패한 쪽은 빈 결과로 대체, 부분 실패 허용).
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        on_word_result: 청크의 단어 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        on_phrase_result: 청크의 숙어 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        
+    Returns:
+        (단어 추출 결과, 숙어 추출 결과) 튜플
+    """
+    stage1_started_at = time.perf_counter()
+    ACCESS_LOGGER.info(f"Stage 1: Word and Phrase Extraction for Video ID: '{video_id}'")
+    
+    if settings.LLM_STAGE1_FUSED_MODE:
+        # 통합 모드: 청크마다 요청 1건으로 단어와 숙어를 함께 추출
+        try:
+            word_extraction_result, phrase_extraction_result = await extract_vocabulary_from_chunks(
+                chunk_texts, video_id, on_word_result, on_phrase_result
+            )
+        except Exception as e:
+            word_extraction_result = phrase_extraction_result = e
+    else:
+        # 단어 추출과 숙어 추출을 병렬로 실행
+        word_extraction_task = extract_words_from_chunks(chunk_texts, video_id, on_word_result)
+        phrase_extraction_task = extract_phrases_from_chunks(chunk_texts, video_id, on_phrase_result)
+        
+        word_extraction_result, phrase_extraction_result = await asyncio.gather(
+            word_extraction_task,
+            phrase_extraction_task,
+            return_exceptions=True
+        )
+    
+    # 1단계 결과 검증 및 예외 처리
+    if isinstance(word_extraction_result, Exception):
+        ERROR_LOGGER.error(
+            f"Word Extraction Failed for Video ID: '{video_id}' - "
+            f"Error: {str(word_extraction_result)}"
+        )
+        # 단어 추출 실패 시 빈 결과로 처리 (부분 실패 허용)
+        word_extraction_result = {
+            "videoId": video_id,
+            "result": {}
+        }
+        ACCESS_LOGGER.warning(
+            f"Word Extraction Failed - Using Empty Result for Video ID: '{video_id}'"
+        )
+    
+    if isinstance(phrase_extraction_result, Exception):
+        ERROR_LOGGER.error(
+            f"Phrase Extraction Failed for Video ID: '{video_id}' - "
+            f"Error: {str(phrase_extraction_result)}"
+        )
+        # 숙어 추출 실패 시 빈 결과로 처리 (부분 실패 허용)
+        phrase_extraction_result = {
+            "videoId": video_id,
+            "result": {}
+        }
+        ACCESS_LOGGER.warning(
+            f"Phrase Extraction Failed - Using Empty Result for Video ID: '{video_id}'"
+        )
+    
+    # 1단계 결과 집계 (모두 비어있으면 enrich_and_merge에서 예외 발생)
+    words_dict = word_extraction_result.get("result", {})
+    phrases_dict = phrase_extraction_result.get("result", {})
+    
+    ACCESS_LOGGER.info(
+        f"Stage 1 Complete for Video ID: '{video_id}' - "
+        f"Words: {len(words_dict)}, Phrases: {len(phrases_dict)} - "
+        f"Elapsed: {time.perf_counter() - stage1_started_at:.2f}s"
+    )
+    
+    return word_extraction_result, phrase_extraction_result
+
+
+async def _extract_stage1_until_saturated(
+    chunk_texts: List[str],
+    video_id: str,
+    on_word_result: Callable[[Dict[str, Any]], None] = None,
+    on_phrase_result: Callable[[Dict[str, Any]], None] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    1단계를 wave 단위로 실행하고 새 항목 발견 비율이 기준 미만이면 남은 청크를 건너뜁니다.
+    
+    Args:
+        chunk_texts: 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        on_word_result: 청크의 단어 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        on_phrase_result: 청크의 숙어 결과가 도착할 때마다 호출할 콜백 (파이프라인 모드)
+        
+    Returns:
+        (단어 추출 결과, 숙어 추출 결과) 튜플 (처리한 wave의 결과를 병합)
+    """
+    wave_size = max(1, settings.LLM_SATURATION_WAVE_SIZE)
+    monitor = SaturationMonitor(settings.LLM_SATURATION_MIN_DISCOVERY_RATE)
+    combined_words = {}
+    combined_phrases = {}
+    processed_chunks = 0
+    
+    for wave_start in range(0, len(chunk_texts), wave_size):
+        wave_chunks = chunk_texts[wave_start:wave_start + wave_size]
+        word_wave_result, phrase_wave_result = await _extract_stage1(
+            wave_chunks, video_id, on_word_result, on_phrase_result
+        )
+        processed_chunks += len(wave_chunks)
+        
+        wave_words = word_wave_result.get("result", {})
+        wave_phrases = phrase_wave_result.get("result", {})
+        _merge_word_results(combined_words, wave_words)
+        _merge_phrase_results(combined_phrases, wave_phrases)
+        
+        discovery_rate = monitor.observe(
+            [f"word:{word.lower().strip()}" for word in wave_words]
+            + [f"phrase:{phrase.lower().strip()}" for phrase in wave_phrases]
+        )
+        ACCESS_LOGGER.info(
+            f"Stage 1 Wave {monitor.waves} for Video ID: '{video_id}' - "
+            f"Chunks: {processed_chunks}/{len(chunk_texts)} - Discovery Rate: {discovery_rate:.1%}"
+        )
+        if monitor.is_saturated():
+            break
+    
+    skipped_chunks = len(chunk_texts) - processed_chunks
+    get_saturation_tracker().record(processed_chunks, skipped_chunks, monitor.estimated_coverage)
+    ACCESS_LOGGER.info(
+        f"Stage 1 Saturation for Video ID: '{video_id}' - "
+        f"Processed Chunks: {processed_chunks}, Skipped Chunks: {skipped_chunks} - "
+        f"Estimated Coverage: {monitor.estimated_coverage:.1%}"
+    )
+    
+    return (
+        {"videoId": video_id, "result": combined_words},
+        {"videoId": video_id, "result": combined_phrases}
+    )
+
+
+async def _run_stage1(
+    chunk_texts: List[str],
+    video_id: str,
+    on_word_result: Callable[[Dict[str, Any]], None] = None,
+    on_phrase_result: Callable[[Dict[str, Any]], None] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """1단계를 실행합니다 (조기 종료 모드에서는 wave 단위, 아니면 모든 청크를 한 번에)."""
+    if settings.LLM_SATURATION_EARLY_EXIT and len(chunk_texts) > settings.LLM_SATURATION_WAVE_SIZE:
+        return await _extract_stage1_until_saturated(chunk_texts, video_id, on_word_result, on_phrase_result)
+    return await _extract_stage1(chunk_texts, video_id, on_word_result, on_phrase_result)
+
 
 async def process_vocabulary(
     chunk_texts: List[str],
-    video_id: str
+    video_id: str,
+    on_stage: Callable[[str], None] = None
 ) -> Dict[str, Any]:
     """
     전체 워크플로우를 통합하여 자막 청크에서 단어장을 생성합니다.
     
     워크플로우:
-    1. 1단계: 청크에서 단어 및 숙어 추출 (병렬 처리)
+    1. 1단계: 청크에서 단어 및 숙어 추출 (병렬 처리, 통합 모드에서는 청크당 요청 1건)
+       (조기 종료 모드에서는 wave 단위로 추출하고 새 항목이 거의 나오지 않으면 남은 청크를 건너뜀)
     2. 2단계: 추출된 단어 및 숙어에 대해 상세 정보 생성 (재시도 로직 포함)
+       (파이프라인 모드에서는 1단계 청크 결과가 도착하는 대로 새 항목을 배치로 상세화)
     3. 3단계: 모든 결과를 병합하여 최종 단어장 형식으로 변환
     
     Args:
         chunk_texts: 자막 청크 텍스트 리스트
             예: ["chunk1 text...", "chunk2 text...", ...]
         video_id: 비디오 ID
+        on_stage: 각 단계를 시작할 때 단계 이름("extraction", "enrichment", "merge")으로 호출할 콜백
+            (비동기 작업 API의 단계별 진행 상황 기록)
         
     Returns:
         최종 단어장 형식의 딕셔너리:
@@ -73,13 +278,7 @@ async def process_vocabulary(
     
     video_id = video_id.strip()
     
-    # 청크가 10개를 초과하면 랜덤으로 10개만 선택
-    if len(chunk_texts) > 10:
-        ACCESS_LOGGER.info(
-            f"Subsampling chunks for Video ID: '{video_id}' - "
-            f"Total: {len(chunk_texts)} -> 10 (Random Selection)"
-        )
-        chunk_texts = random.sample(chunk_texts, 10)
+    chunk_texts = select_chunks(chunk_texts, video_id)
     
     ACCESS_LOGGER.info(
         f"Start Vocabulary Processing for Video ID: '{video_id}' - "
@@ -87,127 +286,17 @@ async def process_vocabulary(
     )
     
     try:
-        # 1단계: 단어 및 숙어 추출 (병렬 처리)
-        ACCESS_LOGGER.info(f"Stage 1: Word and Phrase Extraction for Video ID: '{video_id}'")
-        
-        # 단어 추출과 숙어 추출을 병렬로 실행
-        word_extraction_task = extract_words_from_chunks(chunk_texts, video_id)
-        phrase_extraction_task = extract_phrases_from_chunks(chunk_texts, video_id)
-        
-        word_extraction_result, phrase_extraction_result = await asyncio.gather(
-            word_extraction_task,
-            phrase_extraction_task,
-            return_exceptions=True
-        )
-        
-        # 1단계 결과 검증 및 예외 처리
-        if isinstance(word_extraction_result, Exception):
-            ERROR_LOGGER.error(
-                f"Word Extraction Failed for Video ID: '{video_id}' - "
-                f"Error: {str(word_extraction_result)}"
-            )
-            # 단어 추출 실패 시 빈 결과로 처리 (부분 실패 허용)
-            word_extraction_result = {
-                "videoId": video_id,
-                "result": {}
-            }
-            ACCESS_LOGGER.warning(
-                f"Word Extraction Failed - Using Empty Result for Video ID: '{video_id}'"
-            )
-        
-        if isinstance(phrase_extraction_result, Exception):
-            ERROR_LOGGER.error(
-                f"Phrase Extraction Failed for Video ID: '{video_id}' - "
-                f"Error: {str(phrase_extraction_result)}"
-            )
-            # 숙어 추출 실패 시 빈 결과로 처리 (부분 실패 허용)
-            phrase_extraction_result = {
-                "videoId": video_id,
-                "result": {}
-            }
-            ACCESS_LOGGER.warning(
-                f"Phrase Extraction Failed - Using Empty Result for Video ID: '{video_id}'"
-            )
-        
-        # 1단계 결과가 모두 비어있는 경우 예외 발생
-        words_dict = word_extraction_result.get("result", {})
-        phrases_dict = phrase_extraction_result.get("result", {})
-        
-        if not words_dict and not phrases_dict:
-            ERROR_LOGGER.error(
-                f"Both Word and Phrase Extraction Failed for Video ID: '{video_id}'"
-            )
-            raise ValueError(
-                f"단어 및 숙어 추출이 모두 실패했습니다. Video ID: '{video_id}'"
-            )
-        
-        ACCESS_LOGGER.info(
-            f"Stage 1 Complete for Video ID: '{video_id}' - "
-            f"Words: {len(words_dict)}, Phrases: {len(phrases_dict)}"
-        )
-        
-        # 2단계: 단어 및 숙어 상세 정보 생성 (재시도 로직 포함)
-        ACCESS_LOGGER.info(f"Stage 2: Word and Phrase Enrichment for Video ID: '{video_id}'")
-        
-        # 단어 상세 정보 생성과 숙어 예문 생성을 병렬로 실행
-        word_enrichment_task = enrich_words(word_extraction_result, video_id)
-        phrase_enrichment_task = enrich_phrases(phrase_extraction_result, video_id)
-        
-        word_enrichment_result, phrase_enrichment_result = await asyncio.gather(
-            word_enrichment_task,
-            phrase_enrichment_task,
-            return_exceptions=True
-        )
+        if settings.LLM_PIPELINE_MODE:
+            # 파이프라인 모드: 청크 추출 결과가 도착하는 대로 2단계 상세화 시작
+            return await _process_vocabulary_pipelined(chunk_texts, video_id, on_stage)
         
-        # 2단계 결과 검증 및 예외 처리
-        if isinstance(word_enrichment_result, Exception):
-            ERROR_LOGGER.error(
-                f"Word Enrichment Failed for Video ID: '{video_id}' - "
-                f"Error: {str(word_enrichment_result)}"
-            )
-            # 단어 상세 정보 생성 실패 시 빈 결과로 처리
-            word_enrichment_result = {
-                "videoId": video_id,
-                "result": {}
-            }
-            ACCESS_LOGGER.warning(
-                f"Word Enrichment Failed - Using Empty Result for Video ID: '{video_id}'"
-            )
-        
-        if isinstance(phrase_enrichment_result, Exception):
-            ERROR_LOGGER.error(
-                f"Phrase Enrichment Failed for Video ID: '{video_id}' - "
-                f"Error: {str(phrase_enrichment_result)}"
-            )
-            # 숙어 예문 생성 실패 시 빈 결과로 처리
-            phrase_enrichment_result = {
-                "videoId": video_id,
-                "result": {}
-            }
-            ACCESS_LOGGER.warning(
-                f"Phrase Enrichment Failed - Using Empty Result for Video ID: '{video_id}'"
-            )
-        
-        ACCESS_LOGGER.info(f"Stage 2 Complete for Video ID: '{video_id}'")
-        
-        # 3단계: 결과 병합
-        ACCESS_LOGGER.info(f"Stage 3: Merging Results for Video ID: '{video_id}'")
-        
-        final_result = merge_results(
-            word_extraction_result,
-            phrase_extraction_result,
-            word_enrichment_result,
-            phrase_enrichment_result,
-            video_id
-        )
-        
-        ACCESS_LOGGER.info(
-            f"End Vocabulary Processing for Video ID: '{video_id}' - "
-            f"Words: {len(final_result.get('words', []))}, "
-            f"Phrases: {len(final_result.get('phrases', []))}"
-        )
+        # 1단계: 단어 및 숙어 추출 (병렬 처리)
+        if on_stage:
+            on_stage(STAGE_EXTRACTION)
+        word_extraction_result, phrase_extraction_result = await _run_stage1(chunk_texts, video_id)
         
-        return final_result
+        # 2단계 + 3단계: 상세 정보 생성 및 결과 병합
+        return await enrich_and_merge(word_extraction_result, phrase_extraction_result, video_id, on_stage)
         
     except ValueError as e:
         # 입력 검증 실패는 재발생
@@ -226,4 +315,254 @@ async def process_vocabulary(
         )
         raise Exception(
             f"단어장 생성 중 오류가 발생했습니다. Video ID: '{video_id}' - Error: {str(e)}"
-        ) from e
\ No newline at end of file
+        ) from e
+
+
+def _prepare_words_for_enrichment(
+    word_extraction_result: Dict[str, Any], video_id: str, top_k: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    상세화 전에 변화형 단어를 원형으로 합치고, 흔한 단어를 걸러 상위 단어만 남깁니다 (단어장에서도 제외).
+    
+    Args:
+        word_extraction_result: 1단계 단어 추출 결과
+        video_id: 비디오 ID
+        top_k: 남길 최대 단어 수 (None이면 settings.LLM_WORD_RANKING_TOP_K, 0이면 개수 제한 없음)
+        
+    Returns:
+        설정에 따라 합치고 거른 단어 추출 결과 (같은 형식)
+    """
+    if settings.LLM_LEMMA_MERGE_ENABLED:
+        word_extraction_result = fold_inflected_words(word_extraction_result, video_id)
+    if settings.LLM_WORD_RANKING_ENABLED:
+        word_extraction_result = rank_extracted_words(word_extraction_result, video_id, top_k)
+    return word_extraction_result
+
+
+async def enrich_and_merge(
+    word_extraction_result: Dict[str, Any],
+    phrase_extraction_result: Dict[str, Any],
+    video_id: str,
+    on_stage: Callable[[str], None] = None
+) -> Dict[str, Any]:
+    """
+    1단계 추출 결과로 2단계(상세 정보 생성)와 3단계(결과 병합)를 수행합니다.
+    
+    HTTP 요청 경로(process_vocabulary)와 오프라인 배치 경로(offline_batch.py)가 함께 사용합니다.
+    
+    Args:
+        word_extraction_result: 1단계 단어 추출 결과 ({"videoId": ..., "result": {...}})
+        phrase_extraction_result: 1단계 숙어 추출 결과 ({"videoId": ..., "result": {...}})
+        video_id: 비디오 ID
+        on_stage: 각 단계를 시작할 때 단계 이름으로 호출할 콜백 (process_vocabulary 참고)
+        
+    Returns:
+        최종 단어장 형식의 딕셔너리 (process_vocabulary의 반환 형식과 동일)
+        
+    Raises:
+        ValueError: 단어 및 숙어 추출 결과가 모두 비어있는 경우
+    """
+    # 1단계 결과가 모두 비어있는 경우 예외 발생
+    _check_stage1_result(word_extraction_result, phrase_extraction_result, video_id)
+    
+    word_extraction_result = _prepare_words_for_enrichment(word_extraction_result, video_id)
+    
+    # 2단계: 단어 및 숙어 상세 정보 생성 (재시도 로직 포함)
+    if on_stage:
+        on_stage(STAGE_ENRICHMENT)
+    stage2_started_at = time.perf_counter()
+    ACCESS_LOGGER.info(f"Stage 2: Word and Phrase Enrichment for Video ID: '{video_id}'")
+    
+    # 단어 상세 정보 생성과 숙어 예문 생성을 병렬로 실행
+    word_enrichment_task = enrich_words(word_extraction_result, video_id)
+    phrase_enrichment_task = enrich_phrases(phrase_extraction_result, video_id)
+    
+    word_enrichment_result, phrase_enrichment_result = await asyncio.gather(
+        word_enrichment_task,
+        phrase_enrichment_task,
+        return_exceptions=True
+    )
+    
+    # 2단계 결과 검증 및 예외 처리
+    if isinstance(word_enrichment_result, Exception):
+        ERROR_LOGGER.error(
+            f"Word Enrichment Failed for Video ID: '{video_id}' - "
+            f"Error: {str(word_enrichment_result)}"
+        )
+        # 단어 상세 정보 생성 실패 시 빈 결과로 처리
+        word_enrichment_result = {
+            "videoId": video_id,
+            "result": {}
+        }
+        ACCESS_LOGGER.warning(
+            f"Word Enrichment Failed - Using Empty Result for Video ID: '{video_id}'"
+        )
+    
+    if isinstance(phrase_enrichment_result, Exception):
+        ERROR_LOGGER.error(
+            f"Phrase Enrichment Failed for Video ID: '{video_id}' - "
+            f"Error: {str(phrase_enrichment_result)}"
+        )
+        # 숙어 예문 생성 실패 시 빈 결과로 처리
+        phrase_enrichment_result = {
+            "videoId": video_id,
+            "result": {}
+        }
+        ACCESS_LOGGER.warning(
+            f"Phrase Enrichment Failed - Using Empty Result for Video ID: '{video_id}'"
+        )
+    
+    ACCESS_LOGGER.info(
+        f"Stage 2 Complete for Video ID: '{video_id}' - "
+        f"Elapsed: {time.perf_counter() - stage2_started_at:.2f}s"
+    )
+    
+    # 3단계: 결과 병합
+    if on_stage:
+        on_stage(STAGE_MERGE)
+    return _merge_stage_results(
+        word_extraction_result,
+        phrase_extraction_result,
+        word_enrichment_result,
+        phrase_enrichment_result,
+        video_id
+    )
+
+
+def _check_stage1_result(
+    word_extraction_result: Dict[str, Any],
+    phrase_extraction_result: Dict[str, Any],
+    video_id: str
+) -> None:
+    """
+    1단계 단어/숙어 추출 결과가 모두 비어있으면 예외를 발생시킵니다.
+    
+    Raises:
+        ValueError: 단어 및 숙어 추출 결과가 모두 비어있는 경우
+    """
+    words_dict = word_extraction_result.get("result", {})
+    phrases_dict = phrase_extraction_result.get("result", {})
+    
+    if not words_dict and not phrases_dict:
+        ERROR_LOGGER.error(
+            f"Both Word and Phrase Extraction Failed for Video ID: '{video_id}'"
+        )
+        raise ValueError(
+            f"단어 및 숙어 추출이 모두 실패했습니다. Video ID: '{video_id}'"
+        )
+
+
+def _merge_stage_results(
+    word_extraction_result: Dict[str, Any],
+    phrase_extraction_result: Dict[str, Any],
+    word_enrichment_result: Dict[str, Any],
+    phrase_enrichment_result: Dict[str, Any],
+    video_id: str
+) -> Dict[str, Any]:
+    """3단계: 1단계/2단계 결과를 최종 단어장 형식으로 병합합니다."""
+    ACCESS_LOGGER.info(f"Stage 3: Merging Results for Video ID: '{video_id}'")
+    
+    final_result = merge_results(
+        word_extraction_result,
+        phrase_extraction_result,
+        word_enrichment_result,
+        phrase_enrichment_result,
+        video_id
+    )
+    
+    ACCESS_LOGGER.info(
+        f"End Vocabulary Processing for Video ID: '{video_id}' - "
+        f"Words: {len(final_result.get('words', []))}, "
+        f"Phrases: {len(final_result.get('phrases', []))}"
+    )
+    
+    return final_result
+
+
+async def _process_vocabulary_pipelined(
+    chunk_texts: List[str],
+    video_id: str,
+    on_stage: Callable[[str], None] = None
+) -> Dict[str, Any]:
+    """
+    파이프라인 모드로 단어장을 생성합니다 (1단계와 2단계 사이의 대기 없음).
+    
+    청크 추출 결과가 도착할 때마다 처음 본 단어/숙어를 EnrichmentPipeline에 넣어,
+    배치 크기가 차면 나머지 청크를 추출하는 동안 상세화를 시작합니다.
+    단어 순위 필터를 사용하면 전체 단어를 모으기 전이므로 상위 K개 대신 기준 점수를 넘은 단어를
+    도착 순서대로 LLM_WORD_RANKING_TOP_K개까지만 상세화하고, 단어장에도 상세화한 단어만 남깁니다.
+    
+    Args:
+        chunk_texts: 선택된 자막 청크 텍스트 리스트
+        video_id: 비디오 ID
+        on_stage: 각 단계를 시작할 때 단계 이름으로 호출할 콜백 (2단계는 1단계가 끝난 뒤 남은 상세화 대기)
+        
+    Returns:
+        최종 단어장 형식의 딕셔너리 (process_vocabulary의 반환 형식과 동일)
+        
+    Raises:
+        ValueError: 단어 및 숙어 추출 결과가 모두 비어있는 경우
+    """
+    batch_size = settings.LLM_PIPELINE_ENRICHMENT_BATCH_SIZE
+    max_words = settings.LLM_WORD_RANKING_TOP_K if settings.LLM_WORD_RANKING_ENABLED else 0
+    word_pipeline = EnrichmentPipeline(
+        "Word", enrich_words, _merge_word_results, video_id, batch_size, max_items=max_words
+    )
+    phrase_pipeline = EnrichmentPipeline("Phrase", enrich_phrases, _merge_phrase_results, video_id, batch_size)
+    
+    def on_word_result(chunk_result: Dict[str, Any]) -> None:
+        """청크 단어 결과를 원형으로 합치고 기준 점수로 거른 뒤 상세화 파이프라인에 넣음 (최대 개수는 파이프라인이 제한)"""
+        if settings.LLM_LEMMA_MERGE_ENABLED:
+            chunk_result, _ = fold_word_inflections(chunk_result)
+        if settings.LLM_WORD_RANKING_ENABLED:
+            chunk_result = get_word_ranker().filter_words(chunk_result, settings.LLM_WORD_RANKING_MIN_SCORE)
+        word_pipeline.add(chunk_result)
+    
+    try:
+        if on_stage:
+            on_stage(STAGE_EXTRACTION)
+        word_extraction_result, phrase_extraction_result = await _run_stage1(
+            chunk_texts, video_id, on_word_result, phrase_pipeline.add
+        )
+        _check_stage1_result(word_extraction_result, phrase_extraction_result, video_id)
+        # 상위 K개 제한은 파이프라인에 넣은 단어 수로 이미 적용했으므로 기준 점수만 다시 적용
+        word_extraction_result = _prepare_words_for_enrichment(word_extraction_result, video_id, top_k=0)
+        if max_words:
+            # 개수 제한으로 상세화하지 않은 단어는 단어장에서도 제외
+            admitted_words = word_pipeline.admitted_items
+            word_extraction_result = {
+                **word_extraction_result,
+                "result": {
+                    word: word_data for word, word_data in word_extraction_result.get("result", {}).items()
+                    if word in admitted_words
+                }
+            }
+        
+        # 2단계: 마지막 상세화 배치까지 대기 (앞선 배치는 1단계와 함께 진행됨)
+        if on_stage:
+            on_stage(STAGE_ENRICHMENT)
+        stage2_started_at = time.perf_counter()
+        word_enrichment_result, phrase_enrichment_result = await asyncio.gather(
+            word_pipeline.finish(),
+            phrase_pipeline.finish()
+        )
+    except BaseException:
+        word_pipeline.cancel()
+        phrase_pipeline.cancel()
+        raise
+    
+    ACCESS_LOGGER.info(
+        f"Stage 2 Complete for Video ID: '{video_id}' (Pipelined) - "
+        f"Waited After Stage 1: {time.perf_counter() - stage2_started_at:.2f}s"
+    )
+    
+    # 3단계: 결과 병합
+    if on_stage:
+        on_stage(STAGE_MERGE)
+    return _merge_stage_results(
+        word_extraction_result,
+        phrase_extraction_result,
+        word_enrichment_result,
+        phrase_enrichment_result,
+        video_id
+    )
@@ -2,26 +2,32 @@
 LLM 프롬프트 템플릿 모듈
 
 단어 추출, 숙어 추출, 상세 정보 생성 등의 프롬프트 템플릿을 관리합니다.
+
+모든 템플릿은 "정적 prefix + 요청별 데이터" 순서로 구성합니다.
+지시문과 출력 형식 예시는 요청마다 바이트 단위로 동일한 prefix(*_PROMPT_PREFIX)에 두고,
+비디오 ID·자막 텍스트·단어 목록은 항상 마지막에 붙여 vLLM prefix caching이 prefix 전체를 재사용하도록 합니다.
 """
 from typing import Dict, List, Any
 
+# 운영 중인 프롬프트 템플릿 버전 (레플리카 라우팅 키, A/B 통계, lexicon 캐시 키에 사용)
+# 템플릿 문구를 바꾸면 이전 결과와 섞이지 않도록 반드시 버전을 올립니다.
+# v11/v12는 A/B 테스트 템플릿(v1~v10) 중 채택된 버전을 정적 prefix 구조로 재작성한 버전입니다.
+WORD_EXTRACTION_PROMPT_VERSION = "v11"  # v10 재작성
+PHRASE_EXTRACTION_PROMPT_VERSION = "v11"  # v1 재작성
+FUSED_EXTRACTION_PROMPT_VERSION = "v1"
+WORD_MEANING_PROMPT_VERSION = "v1"
+WORD_ENRICHMENT_PROMPT_VERSION = "v11"  # v1 재작성 (출력 형식 앞에 배치, 강한 강조)
+WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION = "v12"  # v7 재작성 (출력 형식 뒤에 배치, 간결한 강조)
+PHRASE_ENRICHMENT_PROMPT_VERSION = "v11"  # v1 재작성
+PHRASE_ENRICHMENT_FALLBACK_PROMPT_VERSION = "v12"  # v7 재작성
 
-def get_word_extraction_prompt(chunk_text: str, video_id: str) -> str:
-    """
-    1단계: 단어 추출 프롬프트 (v10 기반)
-    
-    Args:
-        chunk_text: 자막 청크 텍스트
-        video_id: 비디오 ID
-        
-    Returns:
-        프롬프트 문자열
-    """
-    return f"""
-다음은 유튜브 영상의 자막 텍스트입니다. 이 텍스트에서 등장하는 모든 영어 단어를 추출하고, 각 단어에 대해 문맥상 사용되는 한국어 뜻을 최대 2개까지 제공해주세요.
 
-텍스트:
-{chunk_text}
+# ============================================================================
+# 정적 prefix (요청별 데이터를 포함하지 않음)
+# ============================================================================
+
+WORD_EXTRACTION_PROMPT_PREFIX = """
+다음은 유튜브 영상의 자막 텍스트에서 영어 단어를 추출하는 작업입니다. 맨 아래에 주어진 텍스트에서 등장하는 모든 영어 단어를 추출하고, 각 단어에 대해 문맥상 사용되는 한국어 뜻을 최대 2개까지 제공해주세요.
 
 요구사항:
 1. 각 단어에 대해 문맥상 자연스러운 뜻을 "한국어"로 1~2개 반드시 제공합니다.
@@ -38,15 +44,15 @@ def get_word_extraction_prompt(chunk_text: str, video_id: str) -> str:
 - 단어는 반드시 소문자로 정규화해서 사용하세요.
 - 같은 의미가 반복되거나 동일 의미를 표현하는 문장을 두 번 작성하지 마세요.
 
-결과는 반드시 다음 JSON 형식으로만 출력합니다:
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
 
-{{
-  "videoId": "{video_id}",
-  "result": {{
-    "단어1": {{"품사": "n", "뜻": ["뜻1", "뜻2"]}},
-    "단어2": {{"품사": "v", "뜻": ["뜻1"]}}
-  }}
-}}
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "단어1": {"품사": "n", "뜻": ["뜻1", "뜻2"]},
+    "단어2": {"품사": "v", "뜻": ["뜻1"]}
+  }
+}
 
 중요:
 - 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
@@ -54,37 +60,22 @@ def get_word_extraction_prompt(chunk_text: str, video_id: str) -> str:
 - JSON 형식이 유효하지 않으면 파싱이 실패하므로, 반드시 유효한 JSON만 출력하세요.
 """
 
+PHRASE_EXTRACTION_PROMPT_PREFIX = """
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
 
-def get_phrase_extraction_prompt(chunk_text: str, video_id: str) -> str:
-    """
-    1단계: 숙어 추출 프롬프트 (v1 기반)
-    
-    Args:
-        chunk_text: 자막 청크 텍스트
-        video_id: 비디오 ID
-        
-    Returns:
-        프롬프트 문자열
-    """
-    return f"""
-결과는 반드시 다음 JSON 형식으로만 출력합니다:
-
-{{
-  "videoId": "{video_id}",
-  "result": {{
+{
+  "videoId": "비디오 ID",
+  "result": {
     "숙어1": "뜻1",
     "숙어2": "뜻2",
     "숙어3": "뜻3"
-  }}
-}}
+  }
+}
 
 ⚠️ 중요: 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
 ⚠️ 중요: JSON 외의 텍스트는 절대 포함하지 마세요.
 
-다음은 유튜브 영상의 자막 텍스트입니다. 이 텍스트에서 등장하는 영어 숙어(idiom, phrasal verb, collocation)를 추출하고, 각 숙어에 대해 문맥상 사용되는 한국어 뜻을 제공해주세요.
-
-텍스트:
-{chunk_text}
+맨 아래에 주어진 유튜브 영상의 자막 텍스트에서 등장하는 영어 숙어(idiom, phrasal verb, collocation)를 추출하고, 각 숙어에 대해 문맥상 사용되는 한국어 뜻을 제공해주세요.
 
 요구사항:
 1. 텍스트에 등장하는 숙어를 추출합니다. 숙어는 다음을 포함합니다:
@@ -101,53 +92,100 @@ def get_phrase_extraction_prompt(chunk_text: str, video_id: str) -> str:
 ⚠️ 중요: 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
 """
 
+# 통합 추출 모드: 청크 1건으로 단어(WORD_EXTRACTION v11 기준)와 숙어(PHRASE_EXTRACTION v11 기준)를 함께 추출
+FUSED_EXTRACTION_PROMPT_PREFIX = """
+다음은 유튜브 영상의 자막 텍스트에서 영어 단어와 영어 숙어를 함께 추출하는 작업입니다. 맨 아래에 주어진 텍스트에서 등장하는 영어 단어와 숙어를 추출하고, 각각 문맥상 사용되는 한국어 뜻을 제공해주세요.
 
-def get_word_enrichment_prompt_v1(
-    words: Dict[str, Dict[str, Any]], 
-    video_id: str
-) -> str:
-    """
-    2단계: 단어 상세 정보 생성 프롬프트 v1 (출력 형식 앞에 배치, 강한 강조)
-    
-    Args:
-        words: 1단계 단어 추출 결과 딕셔너리 (예: {"word": {"품사": "n", "뜻": ["뜻1", "뜻2"]}})
-        video_id: 비디오 ID
-        
-    Returns:
-        프롬프트 문자열
-    """
-    # 1단계 결과 포맷에서 단어와 뜻만 추출하여 표시
-    words_str = "\n".join([
-        f"- {word}: {', '.join(word_data.get('뜻', []))} (품사: {word_data.get('품사', 'N/A')})"
-        for word, word_data in words.items()
-        if isinstance(word_data, dict)
-    ])
-    
-    return f"""
-결과는 반드시 다음 JSON 형식으로만 출력합니다:
+단어(words) 요구사항:
+1. 각 단어에 대해 문맥상 자연스러운 뜻을 "한국어"로 1~2개 반드시 제공합니다.
+2. 텍스트에 등장하는 단어는 "영어사전에 등록된 단어"의 "원형"과 "품사"를 추출하는 것을 원칙으로 합니다.
+3. 단어의 추출 기준: 명사, 동사, 형용사, 부사만 포함. 관사, 전치사, 접속사, 대명사, 조동사, 감탄사는 제외.
+4. 품사 표시: "n"(명사), "v"(동사), "adj"(형용사), "adv"(부사)만 사용.
+5. 각 단어에 대해: 원형 기준으로만 표기, 뜻은 최대 2개, 의미가 겹치면 하나만 유지.
+6. 단어는 반드시 소문자로 정규화해서 사용하세요.
+
+숙어(phrases) 요구사항:
+1. 숙어는 Idiom(관용구, 예: "break the ice"), Phrasal verb(구동사, 예: "give up"), Collocation(연어, 예: "make a decision")을 포함합니다.
+2. 두 단어 이상으로 이루어진 표현만 숙어로 인정합니다. 단일 단어나 공백이 없는 표현은 절대로 포함하지 마세요.
+3. 문맥상 특별한 의미 또는 관용적 의미가 드러나는 표현만 선택합니다. 단순히 빈출하는 일반 조합은 제외합니다.
+4. 각 숙어에 대한 뜻은 문맥상 자연스러운 "한국어" 1개로 제공합니다.
+
+중요:
+- 뜻에 "..." 및 "중국어", "한자"의 사용을 금지합니다.
+- 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
+- 뜻에 "masc.:", "female:", "남성:", "여성:" 등 성별 구분 표기를 절대 사용하지 마세요.
+- 같은 의미가 반복되거나 동일 의미를 표현하는 문장을 두 번 작성하지 마세요.
+
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
+
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "words": {
+      "단어1": {"품사": "n", "뜻": ["뜻1", "뜻2"]},
+      "단어2": {"품사": "v", "뜻": ["뜻1"]}
+    },
+    "phrases": {
+      "숙어1": "뜻1",
+      "숙어2": "뜻2"
+    }
+  }
+}
+
+중요:
+- 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
+- JSON 외의 텍스트는 절대 포함하지 마세요.
+- JSON 형식이 유효하지 않으면 파싱이 실패하므로, 반드시 유효한 JSON만 출력하세요.
+"""
+
+# 로컬 후보 추출 모드: 후보 단어(원형)는 로컬에서 만들고, LLM은 문맥상 뜻만 간결한 형식으로 출력
+WORD_MEANING_PROMPT_PREFIX = """
+다음은 유튜브 영상의 자막 텍스트에 등장한 영어 단어의 뜻을 제공하는 작업입니다. 맨 아래의 단어 목록에 있는 각 단어에 대해, 텍스트의 문맥상 사용되는 한국어 뜻을 최대 2개까지 제공해주세요.
+
+요구사항:
+1. 단어 목록의 단어만 사용하고, 목록에 없는 단어를 추가하거나 단어의 형태를 바꾸지 마세요.
+2. 각 단어에 대해 문맥상 자연스러운 뜻을 "한국어"로 1~2개 제공합니다. 의미가 겹치면 하나만 유지합니다.
+3. 영어 단어가 아니거나 뜻을 알 수 없는 단어는 결과에서 제외합니다.
+4. 뜻에 "..." 및 "중국어", "한자"의 사용을 금지합니다.
+5. 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
+
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
+
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "단어1": ["뜻1", "뜻2"],
+    "단어2": ["뜻1"]
+  }
+}
+
+중요:
+- 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
+- JSON 외의 텍스트는 절대 포함하지 마세요.
+"""
+
+WORD_ENRICHMENT_PROMPT_PREFIX_V1 = """
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
 
-{{
-  "videoId": "{video_id}",
-  "result": {{
-    "단어1": {{
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "단어1": {
       "동의어": ["synonym1", "synonym2"],
       "예문": "Example sentence in English."
-    }},
-    "단어2": {{
+    },
+    "단어2": {
       "동의어": ["synonym1"],
       "예문": "Example sentence in English."
-  }}
-}}
-}}
+    }
+  }
+}
 
 ⚠️ 중요: 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
 ⚠️ 중요: JSON 외의 텍스트는 절대 포함하지 마세요.
 ⚠️ 중요: 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
 
-다음 단어들에 대해 영어 동의어(최대 2개)와 예문을 생성해주세요.
-
-단어 목록:
-{words_str}
+맨 아래의 단어 목록에 있는 단어들에 대해 영어 동의어(최대 2개)와 예문을 생성해주세요.
 
 요구사항:
 1. 각 단어에 대해 영어 동의어(synonym)를 "최대 2개까지" 제공합니다.
@@ -155,54 +193,29 @@ def get_word_enrichment_prompt_v1(
 3. 동의어와 예문은 반드시 영어로 작성해야 합니다.
 """
 
-
-def get_word_enrichment_prompt_v7(
-    words: Dict[str, Dict[str, Any]], 
-    video_id: str
-) -> str:
-    """
-    2단계: 단어 상세 정보 생성 프롬프트 v7 (출력 형식 뒤에 배치, 간결한 강조)
-    
-    Args:
-        words: 1단계 단어 추출 결과 딕셔너리 (예: {"word": {"품사": "n", "뜻": ["뜻1", "뜻2"]}})
-        video_id: 비디오 ID
-        
-    Returns:
-        프롬프트 문자열
-    """
-    # 1단계 결과 포맷에서 단어와 뜻만 추출하여 표시
-    words_str = "\n".join([
-        f"- {word}: {', '.join(word_data.get('뜻', []))} (품사: {word_data.get('품사', 'N/A')})"
-        for word, word_data in words.items()
-        if isinstance(word_data, dict)
-    ])
-    
-    return f"""
-다음 단어들에 대해 영어 동의어(최대 2개)와 예문을 생성해주세요.
-
-단어 목록:
-{words_str}
+WORD_ENRICHMENT_PROMPT_PREFIX_V7 = """
+맨 아래의 단어 목록에 있는 단어들에 대해 영어 동의어(최대 2개)와 예문을 생성해주세요.
 
 요구사항:
 1. 각 단어에 대해 영어 동의어(synonym)를 "최대 2개까지" 제공합니다.
 2. 각 단어에 대해 해당 단어를 사용한 간단한 영어 예문을 "반드시 1개" 제공합니다.
 3. 동의어와 예문은 반드시 영어로 작성해야 합니다.
 
-결과는 반드시 다음 JSON 형식으로만 출력합니다:
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
 
-{{
-  "videoId": "{video_id}",
-  "result": {{
-    "단어1": {{
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "단어1": {
       "동의어": ["synonym1", "synonym2"],
       "예문": "Example sentence in English."
-    }},
-    "단어2": {{
+    },
+    "단어2": {
       "동의어": ["synonym1"],
       "예문": "Example sentence in English."
-    }}
-  }}
-}}
+    }
+  }
+}
 
 중요:
 - 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
@@ -212,24 +225,232 @@ def get_word_enrichment_prompt_v7(
 - JSON 형식이 유효하지 않으면 파싱이 실패하므로, 반드시 유효한 JSON만 출력하세요.
 """
 
+PHRASE_ENRICHMENT_PROMPT_PREFIX_V1 = """
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
+
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "숙어1": {
+      "예문": "Example sentence in English using the phrase."
+    },
+    "숙어2": {
+      "예문": "Example sentence in English using the phrase."
+    }
+  }
+}
+
+⚠️ 중요: 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
+⚠️ 중요: JSON 외의 텍스트는 절대 포함하지 마세요.
+⚠️ 중요: 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
+
+맨 아래의 숙어 목록에 있는 숙어들에 대해 해당 숙어를 사용한 간단한 영어 예문을 생성해주세요.
+
+요구사항:
+1. 각 숙어에 대해 해당 숙어를 사용한 간단한 영어 예문을 "반드시 1개" 제공합니다.
+2. 예문은 반드시 영어로 작성해야 합니다.
+"""
+
+PHRASE_ENRICHMENT_PROMPT_PREFIX_V7 = """
+맨 아래의 숙어 목록에 있는 숙어들에 대해 해당 숙어를 사용한 간단한 영어 예문을 생성해주세요.
+
+요구사항:
+1. 각 숙어에 대해 해당 숙어를 사용한 간단한 영어 예문을 "반드시 1개" 제공합니다.
+2. 예문은 반드시 영어로 작성해야 합니다.
+
+결과는 반드시 다음 JSON 형식으로만 출력합니다 (videoId에는 맨 아래의 비디오 ID를 그대로 사용):
+
+{
+  "videoId": "비디오 ID",
+  "result": {
+    "숙어1": {
+      "예문": "Example sentence in English using the phrase."
+    },
+    "숙어2": {
+      "예문": "Example sentence in English using the phrase."
+    }
+  }
+}
+
+중요:
+- 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
+- JSON 외의 텍스트는 절대 포함하지 마세요.
+- 예문은 반드시 영어로 작성해야 합니다.
+- 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
+- JSON 형식이 유효하지 않으면 파싱이 실패하므로, 반드시 유효한 JSON만 출력하세요.
+"""
+
+# 라우팅 키("{프로세스 이름}:{버전}")별 정적 prefix (prefix cache 사전 적재에 사용)
+STATIC_PROMPT_PREFIXES: Dict[str, str] = {
+    f"Word Extraction:{WORD_EXTRACTION_PROMPT_VERSION}": WORD_EXTRACTION_PROMPT_PREFIX,
+    f"Phrase Extraction:{PHRASE_EXTRACTION_PROMPT_VERSION}": PHRASE_EXTRACTION_PROMPT_PREFIX,
+    f"Fused Extraction:{FUSED_EXTRACTION_PROMPT_VERSION}": FUSED_EXTRACTION_PROMPT_PREFIX,
+    f"Word Meaning:{WORD_MEANING_PROMPT_VERSION}": WORD_MEANING_PROMPT_PREFIX,
+    f"Word Enrichment:{WORD_ENRICHMENT_PROMPT_VERSION}": WORD_ENRICHMENT_PROMPT_PREFIX_V1,
+    f"Word Enrichment:{WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION}": WORD_ENRICHMENT_PROMPT_PREFIX_V7,
+    f"Phrase Enrichment:{PHRASE_ENRICHMENT_PROMPT_VERSION}": PHRASE_ENRICHMENT_PROMPT_PREFIX_V1,
+    f"Phrase Enrichment:{PHRASE_ENRICHMENT_FALLBACK_PROMPT_VERSION}": PHRASE_ENRICHMENT_PROMPT_PREFIX_V7,
+}
+
+
+# ============================================================================
+# 요청별 데이터 (항상 prefix 뒤에 배치)
+# ============================================================================
+
+def _format_chunk_data(chunk_text: str, video_id: str) -> str:
+    """1단계 프롬프트의 요청별 데이터 부분 (비디오 ID + 자막 텍스트)"""
+    return f"""
+비디오 ID: {video_id}
+
+텍스트:
+{chunk_text}
+"""
+
+
+def _format_candidates_data(chunk_text: str, candidates: Dict[str, str], video_id: str) -> str:
+    """단어 뜻 프롬프트의 요청별 데이터 부분 (비디오 ID + 자막 텍스트 + 후보 단어 목록)"""
+    candidates_str = "\n".join([f"- {word} ({pos})" for word, pos in candidates.items()])
+    return _format_chunk_data(chunk_text, video_id) + f"""
+단어 목록:
+{candidates_str}
+"""
+
+
+def _format_words_data(words: Dict[str, Dict[str, Any]], video_id: str) -> str:
+    """단어 상세화 프롬프트의 요청별 데이터 부분 (비디오 ID + 단어 목록)"""
+    # 1단계 결과 포맷에서 단어와 뜻만 추출하여 표시
+    words_str = "\n".join([
+        f"- {word}: {', '.join(word_data.get('뜻', []))} (품사: {word_data.get('품사', 'N/A')})"
+        for word, word_data in words.items()
+        if isinstance(word_data, dict)
+    ])
+    return f"""
+비디오 ID: {video_id}
+
+단어 목록:
+{words_str}
+"""
+
+
+def _format_phrases_data(phrases: Dict[str, str], video_id: str) -> str:
+    """숙어 예문 프롬프트의 요청별 데이터 부분 (비디오 ID + 숙어 목록)"""
+    phrases_str = "\n".join([f"- {phrase}: {meaning}" for phrase, meaning in phrases.items()])
+    return f"""
+비디오 ID: {video_id}
+
+숙어 목록:
+{phrases_str}
+"""
+
+
+def get_word_extraction_prompt(chunk_text: str, video_id: str) -> str:
+    """
+    1단계: 단어 추출 프롬프트 (WORD_EXTRACTION_PROMPT_VERSION, v10 재작성)
+    
+    Args:
+        chunk_text: 자막 청크 텍스트
+        video_id: 비디오 ID
+    
+    Returns:
+        프롬프트 문자열
+    """
+    return WORD_EXTRACTION_PROMPT_PREFIX + _format_chunk_data(chunk_text, video_id)
+
+
+def get_phrase_extraction_prompt(chunk_text: str, video_id: str) -> str:
+    """
+    1단계: 숙어 추출 프롬프트 (v1 기반)
+    
+    Args:
+        chunk_text: 자막 청크 텍스트
+        video_id: 비디오 ID
+    
+    Returns:
+        프롬프트 문자열
+    """
+    return PHRASE_EXTRACTION_PROMPT_PREFIX + _format_chunk_data(chunk_text, video_id)
+
+
+def get_fused_extraction_prompt(chunk_text: str, video_id: str) -> str:
+    """
+    1단계: 단어 + 숙어 통합 추출 프롬프트 (통합 추출 모드)
+    
+    Args:
+        chunk_text: 자막 청크 텍스트
+        video_id: 비디오 ID
+    
+    Returns:
+        프롬프트 문자열
+    """
+    return FUSED_EXTRACTION_PROMPT_PREFIX + _format_chunk_data(chunk_text, video_id)
+
+
+def get_word_meaning_prompt(chunk_text: str, candidates: Dict[str, str], video_id: str) -> str:
+    """
+    1단계: 로컬 후보 단어의 문맥상 뜻 프롬프트 (로컬 후보 추출 모드)
+    
+    Args:
+        chunk_text: 자막 청크 텍스트
+        candidates: {원형: 품사} 후보 단어 딕셔너리 (lexical.extract_candidates)
+        video_id: 비디오 ID
+    
+    Returns:
+        프롬프트 문자열
+    """
+    return WORD_MEANING_PROMPT_PREFIX + _format_candidates_data(chunk_text, candidates, video_id)
+
+
+def get_word_enrichment_prompt_v1(
+    words: Dict[str, Dict[str, Any]],
+    video_id: str
+) -> str:
+    """
+    2단계: 단어 상세 정보 생성 프롬프트 v1 (출력 형식 앞에 배치, 강한 강조)
+    
+    Args:
+        words: 1단계 단어 추출 결과 딕셔너리 (예: {"word": {"품사": "n", "뜻": ["뜻1", "뜻2"]}})
+        video_id: 비디오 ID
+    
+    Returns:
+        프롬프트 문자열
+    """
+    return WORD_ENRICHMENT_PROMPT_PREFIX_V1 + _format_words_data(words, video_id)
+
+
+def get_word_enrichment_prompt_v7(
+    words: Dict[str, Dict[str, Any]],
+    video_id: str
+) -> str:
+    """
+    2단계: 단어 상세 정보 생성 프롬프트 v7 (출력 형식 뒤에 배치, 간결한 강조)
+    
+    Args:
+        words: 1단계 단어 추출 결과 딕셔너리 (예: {"word": {"품사": "n", "뜻": ["뜻1", "뜻2"]}})
+        video_id: 비디오 ID
+    
+    Returns:
+        프롬프트 문자열
+    """
+    return WORD_ENRICHMENT_PROMPT_PREFIX_V7 + _format_words_data(words, video_id)
+
 
 def get_word_enrichment_prompt(
-    words: Dict[str, Dict[str, Any]], 
+    words: Dict[str, Dict[str, Any]],
     video_id: str,
-    version: str = "v1"
+    version: str = WORD_ENRICHMENT_PROMPT_VERSION
 ) -> str:
     """
-    2단계: 단어 상세 정보 생성 프롬프트 (기본값: v1)
+    2단계: 단어 상세 정보 생성 프롬프트 (기본값: WORD_ENRICHMENT_PROMPT_VERSION)
     
     Args:
         words: 1단계 단어 추출 결과 딕셔너리 (예: {"word": {"품사": "n", "뜻": ["뜻1", "뜻2"]}})
         video_id: 비디오 ID
-        version: 프롬프트 버전 ("v1" 또는 "v7")
-        
+        version: 프롬프트 버전 (WORD_ENRICHMENT_PROMPT_VERSION 또는 WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION)
+    
     Returns:
         프롬프트 문자열
     """
-    if version == "v7":
+    if version == WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION:
         return get_word_enrichment_prompt_v7(words, video_id)
     else:
         return get_word_enrichment_prompt_v1(words, video_id)
@@ -245,40 +466,11 @@ def get_phrase_enrichment_prompt_v1(
     Args:
         phrases: 숙어와 뜻 딕셔너리 (예: {"phrase": "뜻"})
         video_id: 비디오 ID
-        
+    
     Returns:
         프롬프트 문자열
     """
-    phrases_str = "\n".join([f"- {phrase}: {meaning}" for phrase, meaning in phrases.items()])
-    
-    return f"""
-결과는 반드시 다음 JSON 형식으로만 출력합니다:
-
-{{
-  "videoId": "{video_id}",
-  "result": {{
-    "숙어1": {{
-      "예문": "Example sentence in English using the phrase."
-    }},
-    "숙어2": {{
-      "예문": "Example sentence in English using the phrase."
-    }}
-  }}
-}}
-
-⚠️ 중요: 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
-⚠️ 중요: JSON 외의 텍스트는 절대 포함하지 마세요.
-⚠️ 중요: 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
-
-다음 숙어들에 대해 해당 숙어를 사용한 간단한 영어 예문을 생성해주세요.
-
-숙어 목록:
-{phrases_str}
-
-요구사항:
-1. 각 숙어에 대해 해당 숙어를 사용한 간단한 영어 예문을 "반드시 1개" 제공합니다.
-2. 예문은 반드시 영어로 작성해야 합니다.
-"""
+    return PHRASE_ENRICHMENT_PROMPT_PREFIX_V1 + _format_phrases_data(phrases, video_id)
 
 
 def get_phrase_enrichment_prompt_v7(
@@ -291,63 +483,30 @@ def get_phrase_enrichment_prompt_v7(
     Args:
         phrases: 숙어와 뜻 딕셔너리 (예: {"phrase": "뜻"})
         video_id: 비디오 ID
-        
+    
     Returns:
         프롬프트 문자열
     """
-    phrases_str = "\n".join([f"- {phrase}: {meaning}" for phrase, meaning in phrases.items()])
-    
-    return f"""
-다음 숙어들에 대해 해당 숙어를 사용한 간단한 영어 예문을 생성해주세요.
-
-숙어 목록:
-{phrases_str}
-
-요구사항:
-1. 각 숙어에 대해 해당 숙어를 사용한 간단한 영어 예문을 "반드시 1개" 제공합니다.
-2. 예문은 반드시 영어로 작성해야 합니다.
-
-결과는 반드시 다음 JSON 형식으로만 출력합니다:
-
-{{
-  "videoId": "{video_id}",
-  "result": {{
-    "숙어1": {{
-      "예문": "Example sentence in English using the phrase."
-    }},
-    "숙어2": {{
-      "예문": "Example sentence in English using the phrase."
-    }}
-  }}
-}}
-
-중요:
-- 마크다운 코드 블록(```json 또는 ```)을 절대 사용하지 마세요. 순수 JSON만 출력하세요.
-- JSON 외의 텍스트는 절대 포함하지 마세요.
-- 예문은 반드시 영어로 작성해야 합니다.
-- 결과에 중국어(Chinese characters)와 이모티콘(Emojis)은 절대 포함하지 마십시오.
-- JSON 형식이 유효하지 않으면 파싱이 실패하므로, 반드시 유효한 JSON만 출력하세요.
-"""
+    return PHRASE_ENRICHMENT_PROMPT_PREFIX_V7 + _format_phrases_data(phrases, video_id)
 
 
 def get_phrase_enrichment_prompt(
     phrases: Dict[str, str],
     video_id: str,
-    version: str = "v1"
+    version: str = PHRASE_ENRICHMENT_PROMPT_VERSION
 ) -> str:
     """
-    2단계: 숙어 예문 생성 프롬프트 (기본값: v1)
+    2단계: 숙어 예문 생성 프롬프트 (기본값: PHRASE_ENRICHMENT_PROMPT_VERSION)
     
     Args:
         phrases: 숙어와 뜻 딕셔너리 (예: {"phrase": "뜻"})
         video_id: 비디오 ID
-        version: 프롬프트 버전 ("v1" 또는 "v7")
-        
+        version: 프롬프트 버전 (PHRASE_ENRICHMENT_PROMPT_VERSION 또는 PHRASE_ENRICHMENT_FALLBACK_PROMPT_VERSION)
+    
     Returns:
         프롬프트 문자열
     """
-    if version == "v7":
+    if version == PHRASE_ENRICHMENT_FALLBACK_PROMPT_VERSION:
         return get_phrase_enrichment_prompt_v7(phrases, video_id)
     else:
         return get_phrase_enrichment_prompt_v1(phrases, video_id)
-
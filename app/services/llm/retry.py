@@ -0,0 +1,205 @@
+"""
+vLLM 호출 재시도 정책 모듈
+
+- 에러 분류: 일시적 오류(타임아웃, 연결 오류, 408/429/5xx)만 재시도하고 나머지 4xx는 즉시 실패
+- 백오프: 지수 백오프 + full jitter (여러 청크의 재시도가 같은 시점에 몰리지 않도록 분산)
+- Retry-After: 서버가 알려준 대기 시간을 우선 사용
+- 재시도 예산: 요청별(시도 횟수, 누적 대기 시간) 예산과 전역(전체 트래픽 대비 비율) 예산
+"""
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Any
+import httpx
+from app.core.config import settings
+from app.core.logging import get_access_logger, get_error_logger
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+# 재시도해도 되는 HTTP 상태 코드 (나머지 4xx는 요청 자체의 문제이므로 재시도하지 않음)
+TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class RetryBudget:
+    """
+    전역 재시도 예산 (token bucket)
+
+    최초 요청마다 ratio만큼 토큰을 적립하고 재시도 1회마다 토큰 1개를 소비합니다.
+    따라서 장기적으로 재시도는 전체 요청의 ratio 비율을 넘을 수 없습니다.
+    트래픽이 적을 때도 최소한의 재시도는 가능하도록 min_reserve만큼 미리 적립해 둡니다.
+    """
+
+    def __init__(self, ratio: float, min_reserve: int):
+        self.ratio = max(0.0, ratio)
+        self.min_reserve = max(0, min_reserve)
+        self.balance = float(self.min_reserve)
+        # 예산이 무한히 쌓이지 않도록 상한 설정
+        self.max_balance = float(self.min_reserve) + 100 * self.ratio
+        self.requests = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def record_request(self) -> None:
+        """최초 요청 1건을 기록하고 예산을 적립합니다."""
+        self.requests += 1
+        self.balance = min(self.max_balance, self.balance + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """재시도 1회를 위한 예산을 소비합니다. 예산이 없으면 False를 반환합니다."""
+        # 부동소수점 누적 오차(0.1 x 10 = 0.999...) 보정
+        if self.balance >= 1.0 - 1e-9:
+            self.balance = max(0.0, self.balance - 1.0)
+            self.retries += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전역 재시도 예산 통계를 반환합니다."""
+        return {
+            "ratio": self.ratio,
+            "balance": round(self.balance, 2),
+            "requests": self.requests,
+            "retries": self.retries,
+            "rejected_retries": self.rejected,
+            "retry_rate": round(self.retries / self.requests, 4) if self.requests else None
+        }
+
+
+class RetryPolicy:
+    """
+    vLLM 호출 재시도 정책
+
+    사용 예시:
+        state = policy.start()
+        while True:
+            try:
+                return await send()
+            except httpx.HTTPError as e:
+                delay = policy.next_delay(e, state)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        max_total_delay: float,
+        budget: Optional[RetryBudget] = None
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_delay = max_total_delay
+        self.budget = budget
+
+    @staticmethod
+    def is_transient(error: Exception) -> bool:
+        """재시도하면 성공할 가능성이 있는 일시적 오류인지 판단합니다."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in TRANSIENT_STATUS_CODES
+        return isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
+
+    @staticmethod
+    def get_retry_after(error: Exception) -> Optional[float]:
+        """응답의 Retry-After 헤더(초 또는 HTTP-date)를 대기 시간(초)으로 변환합니다."""
+        if not isinstance(error, httpx.HTTPStatusError):
+            return None
+        value = error.response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def backoff(self, attempt: int) -> float:
+        """지수 백오프 + full jitter: [0, min(max_delay, base x 2^(attempt-1))] 구간의 임의 값"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def start(self) -> Dict[str, Any]:
+        """요청 1건의 재시도 상태를 생성하고 전역 예산에 최초 요청을 기록합니다."""
+        if self.budget:
+            self.budget.record_request()
+        return {"attempt": 1, "total_delay": 0.0}
+
+    def next_delay(self, error: Exception, state: Dict[str, Any]) -> Optional[float]:
+        """
+        실패한 시도 이후 다음 재시도까지의 대기 시간을 계산합니다.
+
+        Args:
+            error: 실패한 시도에서 발생한 예외
+            state: start()로 생성한 요청별 재시도 상태 (in-place 갱신)
+
+        Returns:
+            대기 시간(초). 재시도하지 않아야 하면 None
+        """
+        attempt = state["attempt"]
+
+        if not self.is_transient(error):
+            ERROR_LOGGER.error(f"vLLM API Call Failed with Permanent Error - No Retry - {str(error)}")
+            return None
+
+        if attempt >= self.max_attempts:
+            return None
+
+        retry_after = self.get_retry_after(error)
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+
+        # 요청별 예산: 누적 대기 시간 상한 (Retry-After가 상한보다 길면 재시도 포기)
+        if delay > self.max_delay or state["total_delay"] + delay > self.max_total_delay:
+            ERROR_LOGGER.error(
+                f"vLLM API Retry Skipped - Per-Request Retry Budget Exceeded "
+                f"(delay: {delay:.2f}s, total delay: {state['total_delay']:.2f}s)"
+            )
+            return None
+
+        # 전역 예산: 전체 트래픽 대비 재시도 비율 상한
+        if self.budget and not self.budget.try_acquire():
+            ERROR_LOGGER.error("vLLM API Retry Skipped - Global Retry Budget Exhausted")
+            return None
+
+        state["attempt"] = attempt + 1
+        state["total_delay"] += delay
+        ACCESS_LOGGER.info(
+            f"vLLM API Retry Scheduled - Next Attempt: {state['attempt']}/{self.max_attempts} - "
+            f"Delay: {delay:.2f}s{' (Retry-After)' if retry_after is not None else ''}"
+        )
+        return delay
+
+
+_RETRY_BUDGET: Optional[RetryBudget] = None
+
+
+def get_retry_budget() -> RetryBudget:
+    """프로세스 전역 재시도 예산을 반환합니다 (모든 VLLMClient가 공유)."""
+    global _RETRY_BUDGET
+    if _RETRY_BUDGET is None:
+        _RETRY_BUDGET = RetryBudget(
+            ratio=settings.VLLM_RETRY_BUDGET_RATIO,
+            min_reserve=settings.VLLM_RETRY_BUDGET_MIN_RESERVE
+        )
+    return _RETRY_BUDGET
+
+
+def get_retry_policy() -> RetryPolicy:
+    """설정 기반의 재시도 정책을 반환합니다."""
+    return RetryPolicy(
+        max_attempts=settings.VLLM_SERVER_MAX_RETRIES,
+        base_delay=settings.VLLM_SERVER_RETRY_DELAY,
+        max_delay=settings.VLLM_RETRY_MAX_DELAY,
+        max_total_delay=settings.VLLM_RETRY_MAX_TOTAL_DELAY,
+        budget=get_retry_budget()
+    )
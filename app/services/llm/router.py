@@ -0,0 +1,185 @@
+"""
+vLLM 레플리카 라우팅 모듈
+
+vLLM의 automatic prefix caching은 같은 prefix를 가진 요청이 같은 레플리카에 도착해야 효과가 있습니다.
+"prefix_affinity" 모드에서는 (단계, 프롬프트 템플릿 버전) 라우팅 키를 consistent hashing하여
+레플리카를 고정하고, 한 레플리카에 부하가 몰리면 bounded-load 규칙에 따라 링의 다음 레플리카로 넘깁니다.
+"""
+import bisect
+import hashlib
+import math
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Iterator
+from app.core.config import settings
+from app.core.logging import get_access_logger
+
+ACCESS_LOGGER = get_access_logger()
+
+ROUTING_MODE_SINGLE = "single"
+ROUTING_MODE_PREFIX_AFFINITY = "prefix_affinity"
+
+
+def _hash_key(key: str) -> int:
+    """라우팅 키를 해시 링 위의 정수 위치로 변환합니다."""
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class ReplicaRouter:
+    """consistent hashing + bounded-load 기반 레플리카 선택기
+
+    같은 라우팅 키는 항상 같은 레플리카를 우선 선택합니다. 단, 진행 중인 요청 수가
+    ceil(load_factor x 평균 부하)에 도달한 레플리카는 건너뛰고 링의 다음 레플리카를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        mode: str = ROUTING_MODE_SINGLE,
+        load_factor: float = 1.25,
+        virtual_nodes: int = 100
+    ):
+        if not urls:
+            raise ValueError("라우팅할 vLLM 서버 URL이 없습니다.")
+
+        # 중복 URL 제거 (순서 유지)
+        self.urls = list(dict.fromkeys(url.rstrip("/") for url in urls))
+        self.mode = mode
+        self.load_factor = max(1.0, load_factor)
+
+        # 해시 링 구성: 레플리카당 virtual_nodes개의 위치
+        ring = [
+            (_hash_key(f"{url}#{node}"), url)
+            for url in self.urls
+            for node in range(max(1, virtual_nodes))
+        ]
+        ring.sort()
+        self._ring_hashes = [point for point, _ in ring]
+        self._ring_urls = [url for _, url in ring]
+
+        self.in_flight: Dict[str, int] = {url: 0 for url in self.urls}
+        self.stats: Dict[str, Dict[str, int]] = {
+            url: {"requests": 0, "spillovers": 0, "prompt_tokens": 0, "cached_tokens": 0}
+            for url in self.urls
+        }
+
+    def _iter_ring(self, route_key: str) -> Iterator[str]:
+        """라우팅 키 위치부터 시계 방향으로 레플리카를 중복 없이 순회합니다."""
+        start = bisect.bisect(self._ring_hashes, _hash_key(route_key)) % len(self._ring_hashes)
+        seen = set()
+        for offset in range(len(self._ring_urls)):
+            url = self._ring_urls[(start + offset) % len(self._ring_urls)]
+            if url not in seen:
+                seen.add(url)
+                yield url
+                if len(seen) == len(self.urls):
+                    return
+
+    def choose(self, route_key: Optional[str] = None) -> str:
+        """
+        요청을 보낼 레플리카 URL을 선택합니다.
+
+        Args:
+            route_key: 라우팅 키 (예: "Word Extraction:v11"). 없으면 가장 한가한 레플리카를 선택
+
+        Returns:
+            선택된 레플리카의 base URL
+        """
+        if self.mode != ROUTING_MODE_PREFIX_AFFINITY or len(self.urls) == 1:
+            return self.urls[0]
+
+        if not route_key:
+            return min(self.urls, key=lambda url: self.in_flight[url])
+
+        # bounded-load 상한: 이번 요청을 포함한 평균 부하 x load_factor
+        total_load = sum(self.in_flight.values()) + 1
+        capacity = math.ceil(self.load_factor * total_load / len(self.urls))
+
+        preferred = None
+        for url in self._iter_ring(route_key):
+            if preferred is None:
+                preferred = url
+            if self.in_flight[url] < capacity:
+                if url != preferred:
+                    self.stats[url]["spillovers"] += 1
+                    ACCESS_LOGGER.info(
+                        f"Replica Spillover - Key: '{route_key}' - {preferred} -> {url} "
+                        f"(in-flight: {self.in_flight[preferred]}, capacity: {capacity})"
+                    )
+                return url
+
+        # 이론상 도달하지 않지만, 안전하게 우선 레플리카 반환
+        return preferred
+
+    @contextmanager
+    def route(self, route_key: Optional[str] = None) -> Iterator[str]:
+        """
+        레플리카를 선택하고 요청이 끝날 때까지 진행 중인 요청 수에 반영합니다.
+
+        사용 예시:
+            with router.route("Word Extraction:v11") as base_url:
+                response = await client.post(f"{base_url}/v1/chat/completions", ...)
+        """
+        url = self.choose(route_key)
+        self.in_flight[url] += 1
+        self.stats[url]["requests"] += 1
+        try:
+            yield url
+        finally:
+            self.in_flight[url] -= 1
+
+    def record_usage(self, url: str, usage: Optional[Dict[str, Any]]) -> None:
+        """
+        응답의 usage 정보로 레플리카별 prefix cache 적중 토큰 수를 누적합니다.
+
+        vLLM은 `--enable-prompt-tokens-details` 옵션이 켜져 있으면
+        usage.prompt_tokens_details.cached_tokens에 prefix cache로 재사용한 토큰 수를 반환합니다.
+        """
+        if not usage or url not in self.stats:
+            return
+        details = usage.get("prompt_tokens_details") or {}
+        self.stats[url]["prompt_tokens"] += usage.get("prompt_tokens", 0) or 0
+        self.stats[url]["cached_tokens"] += details.get("cached_tokens", 0) or 0
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """레플리카별 라우팅 통계와 prefix cache 적중률을 반환합니다."""
+        replica_stats = []
+        for url in self.urls:
+            stats = self.stats[url]
+            prompt_tokens = stats["prompt_tokens"]
+            replica_stats.append({
+                "url": url,
+                "in_flight": self.in_flight[url],
+                **stats,
+                "prefix_cache_hit_rate": round(stats["cached_tokens"] / prompt_tokens, 4) if prompt_tokens else None
+            })
+        return replica_stats
+
+
+_ROUTERS: Dict[tuple, ReplicaRouter] = {}
+
+
+def get_replica_router(urls: Optional[List[str]] = None) -> ReplicaRouter:
+    """
+    서버 URL 목록별 전역 레플리카 라우터를 반환합니다 (프로세스 내 요청 간 부하 정보 공유).
+    
+    Args:
+        urls: 라우팅할 서버 URL 목록 (없으면 VLLM_SERVER_URLS 또는 VLLM_SERVER_URL)
+            단계별로 다른 서버를 쓰는 경우(settings.LLM_EXTRACTION_SERVER_URLS 등) 단계마다 별도 라우터를 사용합니다.
+    """
+    urls = urls or settings.VLLM_SERVER_URLS or [settings.VLLM_SERVER_URL]
+    key = tuple(urls)
+    if key not in _ROUTERS:
+        _ROUTERS[key] = ReplicaRouter(
+            urls=list(urls),
+            mode=settings.VLLM_ROUTING_MODE,
+            load_factor=settings.VLLM_ROUTING_LOAD_FACTOR,
+            virtual_nodes=settings.VLLM_ROUTING_VIRTUAL_NODES
+        )
+    return _ROUTERS[key]
+
+
+def get_all_replica_stats() -> List[Dict[str, Any]]:
+    """지금까지 생성된 모든 라우터의 레플리카별 통계를 반환합니다."""
+    if not _ROUTERS:
+        get_replica_router()
+    return [stats for router in _ROUTERS.values() for stats in router.get_stats()]
@@ -0,0 +1,98 @@
+"""
+1단계 어휘 포화(saturation) 조기 종료 모듈
+
+긴 영상은 청크 몇 개만 처리해도 새로 추출되는 단어 대부분이 이미 병합 결과에 있습니다.
+조기 종료 모드(settings.LLM_SATURATION_EARLY_EXIT)에서는 청크를 wave 단위로 보내고,
+wave마다 새 항목 발견 비율(이번 wave에서 추출한 항목 중 처음 본 항목의 비율)을 측정해
+기준 아래로 떨어지면 남은 청크를 건너뜁니다.
+
+추정 커버리지는 마지막 wave의 발견 비율로 계산합니다: 청크를 더 처리했을 때 추출될 항목 중
+이미 가진 항목의 비율 ≈ 1 - 마지막 발견 비율.
+"""
+from typing import Dict, Iterable, Optional, Any
+
+
+class SaturationMonitor:
+    """영상 1건의 wave별 새 항목 발견 비율 측정기"""
+
+    def __init__(self, min_discovery_rate: float, min_waves: int = 2):
+        self.min_discovery_rate = min_discovery_rate
+        self.min_waves = max(1, min_waves)
+        self.waves = 0
+        self.last_discovery_rate: Optional[float] = None
+        self._seen = set()
+
+    def observe(self, items: Iterable[str]) -> float:
+        """
+        wave 1회의 추출 항목을 기록하고 새 항목 발견 비율을 반환합니다.
+        
+        Args:
+            items: 이번 wave에서 추출한 항목 (단어/숙어, 정규화된 키)
+            
+        Returns:
+            새 항목 발견 비율 (0 ~ 1, 추출 항목이 없으면 0)
+        """
+        items = set(items)
+        new_items = items - self._seen
+        self._seen |= items
+        self.waves += 1
+        self.last_discovery_rate = len(new_items) / len(items) if items else 0.0
+        return self.last_discovery_rate
+
+    def is_saturated(self) -> bool:
+        """최소 wave 수를 처리했고 마지막 발견 비율이 기준 미만이면 True"""
+        return (
+            self.waves >= self.min_waves
+            and self.last_discovery_rate is not None
+            and self.last_discovery_rate < self.min_discovery_rate
+        )
+
+    @property
+    def estimated_coverage(self) -> float:
+        """추정 어휘 커버리지 (1 - 마지막 발견 비율)"""
+        if self.last_discovery_rate is None:
+            return 0.0
+        return round(1.0 - self.last_discovery_rate, 4)
+
+
+class SaturationTracker:
+    """조기 종료 모드 실행 결과 누적 기록기"""
+
+    def __init__(self):
+        self.runs = 0
+        self.early_exits = 0
+        self.chunks_processed = 0
+        self.chunks_skipped = 0
+        self._coverage_sum = 0.0
+
+    def record(self, processed_chunks: int, skipped_chunks: int, estimated_coverage: float) -> None:
+        """영상 1건의 처리/건너뛴 청크 수와 추정 커버리지를 기록합니다."""
+        self.runs += 1
+        self.chunks_processed += processed_chunks
+        self.chunks_skipped += skipped_chunks
+        self._coverage_sum += estimated_coverage
+        if skipped_chunks:
+            self.early_exits += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """조기 종료 비율, 건너뛴 청크 수, 평균 추정 커버리지를 반환합니다."""
+        total_chunks = self.chunks_processed + self.chunks_skipped
+        return {
+            "runs": self.runs,
+            "early_exits": self.early_exits,
+            "chunks_processed": self.chunks_processed,
+            "chunks_skipped": self.chunks_skipped,
+            "skip_rate": round(self.chunks_skipped / total_chunks, 4) if total_chunks else None,
+            "avg_estimated_coverage": round(self._coverage_sum / self.runs, 4) if self.runs else None
+        }
+
+
+_SATURATION_TRACKER: Optional[SaturationTracker] = None
+
+
+def get_saturation_tracker() -> SaturationTracker:
+    """프로세스 전역 조기 종료 기록기를 반환합니다."""
+    global _SATURATION_TRACKER
+    if _SATURATION_TRACKER is None:
+        _SATURATION_TRACKER = SaturationTracker()
+    return _SATURATION_TRACKER
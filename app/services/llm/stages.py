@@ -0,0 +1,123 @@
+"""
+단계별 모델/서버 설정 모듈
+
+1단계(추출)는 요청 수가 많고 비교적 쉬운 작업, 2단계(상세화)는 요청 수는 적지만 출력이 긴 작업입니다.
+단계마다 모델, 서버, temperature, 출력 토큰 상한을 따로 지정할 수 있도록 설정을 모으고,
+단계별 호출 지연 시간을 기록하여 분리 효과를 확인할 수 있게 합니다.
+"""
+from collections import deque
+from typing import Dict, List, Optional, Any
+from app.core.config import settings
+
+STAGE_EXTRACTION = "extraction"
+STAGE_ENRICHMENT = "enrichment"
+STAGE_DEFAULT = "default"
+
+# 모델 등급 (cascade 모드에서 먼저 시도하는 작은 모델 / 기본 모델)
+MODEL_TIER_LARGE = "large"
+MODEL_TIER_SMALL = "small"
+
+# 단계별로 보관할 최근 지연 시간 샘플 수 (백분위 계산용)
+LATENCY_WINDOW_SIZE = 1000
+
+
+def get_stage_config(stage: Optional[str] = None, tier: str = MODEL_TIER_LARGE) -> Dict[str, Any]:
+    """
+    단계별 vLLM 호출 설정을 반환합니다. 단계별 값이 비어 있으면 공통 설정을 사용합니다.
+    
+    Args:
+        stage: STAGE_EXTRACTION, STAGE_ENRICHMENT 또는 None(공통 설정)
+        tier: MODEL_TIER_LARGE(단계 모델) 또는 MODEL_TIER_SMALL(cascade 1차 모델, LLM_CASCADE_SMALL_*)
+        
+    Returns:
+        {
+            "stage": "extraction",
+            "tier": "large",
+            "model": "Qwen/Qwen2.5-7B-Instruct-AWQ",
+            "server_urls": ["http://gpu-small:8000"],
+            "temperature": 0.7,
+            "max_output_tokens": 4096,
+            "client_templating": False  # 클라이언트 측 chat template/토큰화 가능 여부
+        }
+    """
+    if stage == STAGE_EXTRACTION:
+        model = settings.LLM_EXTRACTION_MODEL
+        server_urls = settings.LLM_EXTRACTION_SERVER_URLS
+        temperature = settings.LLM_EXTRACTION_TEMPERATURE
+        max_output_tokens = settings.LLM_EXTRACTION_MAX_OUTPUT_TOKENS
+    elif stage == STAGE_ENRICHMENT:
+        model = settings.LLM_ENRICHMENT_MODEL
+        server_urls = settings.LLM_ENRICHMENT_SERVER_URLS
+        temperature = settings.LLM_ENRICHMENT_TEMPERATURE
+        max_output_tokens = settings.LLM_ENRICHMENT_MAX_OUTPUT_TOKENS
+    else:
+        model, server_urls, temperature, max_output_tokens = "", [], 0.7, settings.LLM_MAX_OUTPUT_TOKENS
+    
+    if tier == MODEL_TIER_SMALL:
+        # 작은 모델은 단계의 temperature/토큰 상한을 그대로 쓰고 모델과 서버만 교체
+        model = settings.LLM_CASCADE_SMALL_MODEL
+        server_urls = settings.LLM_CASCADE_SMALL_SERVER_URLS or server_urls
+    
+    model = model or settings.VLLM_SERVER_MODEL
+    return {
+        "stage": stage or STAGE_DEFAULT,
+        "tier": tier,
+        "model": model,
+        "server_urls": list(server_urls or settings.VLLM_SERVER_URLS or [settings.VLLM_SERVER_URL]),
+        "temperature": temperature,
+        "max_output_tokens": max_output_tokens,
+        # 클라이언트의 토크나이저(TOKENIZER_MODEL)와 같은 모델일 때만 chat template 적용/토큰 ID 전송 가능
+        "client_templating": model == settings.TOKENIZER_MODEL
+    }
+
+
+class StageLatencyTracker:
+    """단계별 vLLM 호출 지연 시간 기록기 (최근 LATENCY_WINDOW_SIZE건 기준 백분위)"""
+
+    def __init__(self, window_size: int = LATENCY_WINDOW_SIZE):
+        self.window_size = window_size
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, int] = {}
+        self._models: Dict[str, str] = {}
+
+    def record(self, stage: str, latency_seconds: float, model: str = "") -> None:
+        """성공한 호출 1건의 지연 시간을 기록합니다."""
+        if stage not in self._samples:
+            self._samples[stage] = deque(maxlen=self.window_size)
+            self._counts[stage] = 0
+        self._samples[stage].append(latency_seconds * 1000)
+        self._counts[stage] += 1
+        if model:
+            self._models[stage] = model
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percentile: float) -> float:
+        """정렬된 값에서 nearest-rank 방식으로 백분위 값을 구합니다."""
+        index = max(0, min(len(sorted_values) - 1, round(percentile / 100 * len(sorted_values)) - 1))
+        return round(sorted_values[index], 2)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 호출 수, 모델, 평균/p50/p95/최대 지연 시간(ms)을 반환합니다."""
+        stats = {}
+        for stage, samples in self._samples.items():
+            values = sorted(samples)
+            stats[stage] = {
+                "model": self._models.get(stage),
+                "calls": self._counts[stage],
+                "avg_ms": round(sum(values) / len(values), 2),
+                "p50_ms": self._percentile(values, 50),
+                "p95_ms": self._percentile(values, 95),
+                "max_ms": round(values[-1], 2)
+            }
+        return stats
+
+
+_LATENCY_TRACKER: Optional[StageLatencyTracker] = None
+
+
+def get_stage_latency_tracker() -> StageLatencyTracker:
+    """프로세스 전역 단계별 지연 시간 기록기를 반환합니다."""
+    global _LATENCY_TRACKER
+    if _LATENCY_TRACKER is None:
+        _LATENCY_TRACKER = StageLatencyTracker()
+    return _LATENCY_TRACKER
@@ -0,0 +1,255 @@
+"""
+vLLM 서버 텔레메트리 기반 요청 수락 모듈
+
+백그라운드에서 vLLM 서버의 Prometheus /metrics 엔드포인트를 주기적으로 수집하여
+실행/대기 중인 요청 수, KV cache 사용률, 평균 TTFT(time-to-first-token)를 기록합니다.
+요청을 보낼 단계의 서버가 모두 대기열이나 KV cache 사용률 임계값을 넘으면 새 청크 요청 전송을 잠시 보류합니다.
+(단계별로 서버가 다르면 단계마다 따로 판단하므로, 다른 단계의 서버 상태는 보류 여부에 영향을 주지 않습니다.)
+
+같은 GPU 서버를 다른 서비스와 공유하는 경우 고정된 동시성 제한(admission.py)만으로는
+너무 보수적이거나 공격적일 수 있으므로, 서버의 실제 부하를 보고 전송 시점을 조절합니다.
+텔레메트리를 수집할 수 없거나 오래된 경우에는 요청을 막지 않습니다 (fail-open).
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional, Any
+import httpx
+from app.core.config import settings
+from app.core.logging import get_access_logger, get_error_logger
+from app.services.llm.stages import (
+    get_stage_config, STAGE_EXTRACTION, STAGE_ENRICHMENT, MODEL_TIER_LARGE, MODEL_TIER_SMALL
+)
+
+ACCESS_LOGGER = get_access_logger()
+ERROR_LOGGER = get_error_logger()
+
+# vLLM Prometheus 메트릭 이름 (버전에 따라 KV cache 사용률 메트릭 이름이 다름)
+METRIC_RUNNING = "vllm:num_requests_running"
+METRIC_WAITING = "vllm:num_requests_waiting"
+METRIC_KV_USAGE = ("vllm:kv_cache_usage_perc", "vllm:gpu_cache_usage_perc")
+METRIC_TTFT_SUM = "vllm:time_to_first_token_seconds_sum"
+METRIC_TTFT_COUNT = "vllm:time_to_first_token_seconds_count"
+
+
+def parse_prometheus_metrics(text: str) -> Dict[str, float]:
+    """
+    Prometheus 텍스트 형식을 메트릭 이름별 값으로 변환합니다.
+    
+    같은 이름의 샘플이 레이블(예: model_name)별로 여러 개 있으면 합산합니다.
+    
+    Args:
+        text: /metrics 응답 본문
+        
+    Returns:
+        {메트릭 이름: 값} 딕셔너리
+    """
+    metrics: Dict[str, float] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        
+        # "name{label="value"} 1.0" 또는 "name 1.0" (타임스탬프가 붙을 수 있음)
+        if "{" in line:
+            name = line[:line.index("{")]
+            value_part = line[line.rindex("}") + 1:].split()
+        else:
+            name, *value_part = line.split()
+        if not value_part:
+            continue
+        try:
+            value = float(value_part[0])
+        except ValueError:
+            continue
+        metrics[name] = metrics.get(name, 0.0) + value
+    return metrics
+
+
+class BackendTelemetry:
+    """
+    vLLM 서버 부하 수집기 및 요청 보류 게이트
+
+    - poll_once(): 등록된 모든 서버의 /metrics를 한 번 수집
+    - run(): poll_interval마다 poll_once()를 반복 (백그라운드 태스크)
+    - wait_for_capacity(server_urls): 요청을 보낼 서버가 모두 과부하이면 여유가 생기거나 max_hold가 지날 때까지 대기
+      (처음 보는 서버는 수집 대상에 추가)
+    """
+
+    def __init__(
+        self,
+        base_urls: List[str],
+        metrics_endpoint: str = "/metrics",
+        poll_interval: float = 1.0,
+        max_waiting_requests: int = 8,
+        max_kv_usage: float = 0.9,
+        stale_after: float = 10.0,
+        max_hold: float = 30.0
+    ):
+        self.base_urls = list(base_urls)
+        self.metrics_endpoint = metrics_endpoint
+        self.poll_interval = poll_interval
+        self.max_waiting_requests = max_waiting_requests
+        self.max_kv_usage = max_kv_usage
+        self.stale_after = stale_after
+        self.max_hold = max_hold
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        # TTFT 평균을 수집 구간별로 계산하기 위한 직전 누적값 (sum, count)
+        self._ttft_totals: Dict[str, tuple] = {}
+        self.held_requests = 0
+        self.total_hold_seconds = 0.0
+        self.hold_timeouts = 0
+
+    def _to_snapshot(self, base_url: str, metrics: Dict[str, float]) -> Dict[str, Any]:
+        """수집한 메트릭을 서버 부하 스냅샷으로 변환합니다."""
+        kv_usage = next((metrics[name] for name in METRIC_KV_USAGE if name in metrics), None)
+        
+        ttft_ms = None
+        if METRIC_TTFT_SUM in metrics and METRIC_TTFT_COUNT in metrics:
+            total, count = metrics[METRIC_TTFT_SUM], metrics[METRIC_TTFT_COUNT]
+            previous_total, previous_count = self._ttft_totals.get(base_url, (0.0, 0.0))
+            if count > previous_count:
+                ttft_ms = round((total - previous_total) / (count - previous_count) * 1000, 2)
+            elif base_url in self._snapshots:
+                # 수집 구간 동안 새 요청이 없으면 직전 값 유지
+                ttft_ms = self._snapshots[base_url].get("ttft_ms")
+            self._ttft_totals[base_url] = (total, count)
+        
+        return {
+            "running": metrics.get(METRIC_RUNNING),
+            "waiting": metrics.get(METRIC_WAITING),
+            "kv_cache_usage": kv_usage,
+            "ttft_ms": ttft_ms,
+            "collected_at": time.time()
+        }
+
+    async def poll_once(self, client: httpx.AsyncClient) -> None:
+        """모든 서버의 /metrics를 수집하여 스냅샷을 갱신합니다 (실패한 서버는 기존 스냅샷 유지)."""
+        for base_url in self.base_urls:
+            try:
+                response = await client.get(f"{base_url}{self.metrics_endpoint}")
+                response.raise_for_status()
+                metrics = parse_prometheus_metrics(response.text)
+                self._snapshots[base_url] = self._to_snapshot(base_url, metrics)
+            except httpx.HTTPError as e:
+                ERROR_LOGGER.error(f"vLLM Metrics Poll Failed - Server: {base_url} - Error: {str(e)}")
+
+    async def run(self) -> None:
+        """poll_interval마다 메트릭을 수집합니다 (취소될 때까지 실행)."""
+        ACCESS_LOGGER.info(
+            f"Start vLLM Metrics Poller - Servers: {len(self.base_urls)} - Interval: {self.poll_interval}s"
+        )
+        async with httpx.AsyncClient(timeout=self.poll_interval * 2) as client:
+            while True:
+                await self.poll_once(client)
+                await asyncio.sleep(self.poll_interval)
+
+    def _is_overloaded(self, snapshot: Dict[str, Any]) -> bool:
+        """서버 스냅샷이 임계값을 넘었는지 판단합니다 (오래된 스냅샷은 과부하로 보지 않음)."""
+        if time.time() - snapshot["collected_at"] > self.stale_after:
+            return False
+        waiting = snapshot.get("waiting")
+        kv_usage = snapshot.get("kv_cache_usage")
+        return (
+            (waiting is not None and waiting > self.max_waiting_requests)
+            or (kv_usage is not None and kv_usage > self.max_kv_usage)
+        )
+
+    def watch(self, server_urls: List[str]) -> None:
+        """수집 대상에 없는 서버를 추가합니다 (다음 수집 주기부터 반영)."""
+        for url in server_urls:
+            if url not in self.base_urls:
+                self.base_urls.append(url)
+
+    def is_server_overloaded(self, server_url: str) -> bool:
+        """서버 1대가 과부하 상태이면 True (스냅샷이 없거나 오래되었으면 False)."""
+        snapshot = self._snapshots.get(server_url)
+        return snapshot is not None and self._is_overloaded(snapshot)
+
+    def is_overloaded(self, server_urls: Optional[List[str]] = None) -> bool:
+        """
+        요청을 보낼 서버가 모두 과부하 상태이면 True
+        (하나라도 여유가 있거나 스냅샷이 없으면 False).
+        
+        Args:
+            server_urls: 요청을 보낼 단계의 서버 URL 목록 (없으면 수집 중인 모든 서버)
+        """
+        urls = server_urls or self.base_urls
+        if not urls:
+            return False
+        return all(self.is_server_overloaded(url) for url in urls)
+
+    async def wait_for_capacity(self, server_urls: Optional[List[str]] = None) -> float:
+        """
+        요청을 보낼 서버에 여유가 생길 때까지 새 요청 전송을 보류합니다.
+        
+        max_hold가 지나면 과부하여도 전송합니다 (메트릭이 갱신되지 않는 상황에서 요청이 멈추지 않도록).
+        
+        Args:
+            server_urls: 요청을 보낼 단계의 서버 URL 목록 (없으면 수집 중인 모든 서버)
+            
+        Returns:
+            보류한 시간(초)
+        """
+        if server_urls:
+            self.watch(server_urls)
+        if not self.is_overloaded(server_urls):
+            return 0.0
+        
+        self.held_requests += 1
+        started_at = time.perf_counter()
+        while self.is_overloaded(server_urls):
+            waited = time.perf_counter() - started_at
+            if waited >= self.max_hold:
+                self.hold_timeouts += 1
+                ERROR_LOGGER.warning(f"vLLM Server Still Overloaded after {waited:.1f}s - Sending Request Anyway")
+                break
+            await asyncio.sleep(min(self.poll_interval, self.max_hold - waited))
+        
+        held = time.perf_counter() - started_at
+        self.total_hold_seconds += held
+        return held
+
+    def get_stats(self) -> Dict[str, Any]:
+        """서버별 최신 부하 스냅샷과 요청 보류 통계를 반환합니다."""
+        return {
+            "thresholds": {
+                "max_waiting_requests": self.max_waiting_requests,
+                "max_kv_usage": self.max_kv_usage
+            },
+            "servers": [
+                {"url": url, "overloaded": self.is_server_overloaded(url), **self._snapshots.get(url, {})}
+                for url in self.base_urls
+            ],
+            "held_requests": self.held_requests,
+            "hold_timeouts": self.hold_timeouts,
+            "avg_hold_ms": (
+                round(self.total_hold_seconds / self.held_requests * 1000, 2)
+                if self.held_requests else None
+            )
+        }
+
+
+_BACKEND_TELEMETRY: Optional[BackendTelemetry] = None
+
+
+def get_backend_telemetry() -> BackendTelemetry:
+    """프로세스 전역 텔레메트리 수집기를 반환합니다."""
+    global _BACKEND_TELEMETRY
+    if _BACKEND_TELEMETRY is None:
+        _BACKEND_TELEMETRY = BackendTelemetry(
+            # 단계별(작은 모델 포함) 실제 요청 대상 서버를 수집 (중복 제거, 순서 유지)
+            # 설정에 없는 서버도 wait_for_capacity()에 처음 전달될 때 수집 대상에 추가됨
+            base_urls=list(dict.fromkeys(
+                url
+                for stage in (STAGE_EXTRACTION, STAGE_ENRICHMENT)
+                for tier in (MODEL_TIER_LARGE, MODEL_TIER_SMALL)
+                for url in get_stage_config(stage, tier)["server_urls"]
+            )),
+            metrics_endpoint=settings.VLLM_METRICS_ENDPOINT,
+            poll_interval=settings.VLLM_METRICS_POLL_INTERVAL,
+            max_waiting_requests=settings.VLLM_METRICS_MAX_WAITING,
+            max_kv_usage=settings.VLLM_METRICS_MAX_KV_USAGE,
+            stale_after=settings.VLLM_METRICS_STALE_AFTER,
+            max_hold=settings.VLLM_METRICS_MAX_HOLD
+        )
+    return _BACKEND_TELEMETRY
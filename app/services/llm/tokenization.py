@@ -0,0 +1,131 @@
+"""
+프롬프트 토큰화 모듈
+
+vLLM 서버의 chat template 적용/토큰화를 클라이언트에서 대신 수행할 때 사용합니다.
+토크나이저는 자막 청크 생성에 쓰는 것(app/services/transcript.py)과 같은 모델을 공유하며,
+모듈 import 시점이 아니라 처음 사용할 때 로드합니다.
+
+토큰 ID 전송 모드(settings.LLM_SEND_TOKEN_IDS)에서는 프롬프트를
+[chat template 앞부분 + 정적 prefix] + [요청별 데이터] + [chat template 뒷부분]으로 나누어
+정적 prefix의 토큰 ID는 한 번만 계산해 캐시하고, 자막 청크는 청크 생성 시 계산한 토큰 ID를 재사용합니다.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Any
+from app.services.llm.prompts import STATIC_PROMPT_PREFIXES
+
+# chat template을 앞/뒤로 나누기 위해 content 자리에 넣는 표식
+_CONTENT_PLACEHOLDER = "\x00CONTENT\x00"
+
+# 청크 토큰 ID 캐시 최대 크기 (최근 청크 기준 LRU)
+CHUNK_TOKEN_CACHE_SIZE = 512
+
+_CHAT_TEMPLATE_PARTS: Optional[Tuple[str, str]] = None
+_PREFIX_TOKEN_CACHE: Dict[str, List[int]] = {}
+_CHUNK_TOKEN_CACHE: "OrderedDict[str, List[int]]" = OrderedDict()
+
+
+def _get_tokenizer():
+    """자막 청크 생성에 사용하는 토크나이저를 반환합니다 (지연 로드)."""
+    from app.services.transcript import TOKENIZER
+    return TOKENIZER
+
+
+def _encode(text: str) -> List[int]:
+    """텍스트를 토큰 ID로 변환합니다 (BOS 등 특수 토큰 자동 추가 없음)."""
+    if not text:
+        return []
+    return _get_tokenizer().encode(text, add_special_tokens=False)
+
+
+def render_chat_prompt(messages: List[Dict[str, Any]]) -> str:
+    """
+    chat 메시지 리스트에 모델의 chat template을 적용하여 completion용 프롬프트 문자열로 변환합니다.
+    
+    Args:
+        messages: 대화 메시지 리스트 (예: [{"role": "user", "content": "..."}])
+        
+    Returns:
+        assistant 응답 시작 토큰까지 포함된 프롬프트 문자열
+    """
+    return _get_tokenizer().apply_chat_template(
+        messages, tokenize=False, add_generation_prompt=True
+    )
+
+
+def _get_chat_template_parts() -> Tuple[str, str]:
+    """user 메시지 1개짜리 chat template을 content 앞부분과 뒷부분으로 나누어 반환합니다."""
+    global _CHAT_TEMPLATE_PARTS
+    if _CHAT_TEMPLATE_PARTS is None:
+        rendered = render_chat_prompt([{"role": "user", "content": _CONTENT_PLACEHOLDER}])
+        head, _, tail = rendered.partition(_CONTENT_PLACEHOLDER)
+        _CHAT_TEMPLATE_PARTS = (head, tail)
+    return _CHAT_TEMPLATE_PARTS
+
+
+def _get_prefix_token_ids(head: str, prefix: str) -> List[int]:
+    """chat template 앞부분 + 정적 prefix의 토큰 ID를 반환합니다 (최초 1회만 토큰화)."""
+    if prefix not in _PREFIX_TOKEN_CACHE:
+        _PREFIX_TOKEN_CACHE[prefix] = _encode(head + prefix)
+    return _PREFIX_TOKEN_CACHE[prefix]
+
+
+def remember_chunk_tokens(chunk_text: str, token_ids: List[int]) -> None:
+    """
+    청크 생성 시 계산한 자막 청크의 토큰 ID를 저장합니다.
+    
+    같은 청크로 만드는 단어/숙어 추출 프롬프트가 청크를 다시 토큰화하지 않도록 재사용합니다.
+    
+    Args:
+        chunk_text: 자막 청크 텍스트
+        token_ids: 청크 텍스트의 토큰 ID (특수 토큰 제외)
+    """
+    _CHUNK_TOKEN_CACHE[chunk_text] = list(token_ids)
+    _CHUNK_TOKEN_CACHE.move_to_end(chunk_text)
+    while len(_CHUNK_TOKEN_CACHE) > CHUNK_TOKEN_CACHE_SIZE:
+        _CHUNK_TOKEN_CACHE.popitem(last=False)
+
+
+def _encode_data(data: str, chunk_text: Optional[str]) -> List[int]:
+    """요청별 데이터 부분을 토큰화합니다. 청크 토큰 ID가 저장되어 있으면 재사용합니다."""
+    chunk_token_ids = _CHUNK_TOKEN_CACHE.get(chunk_text) if chunk_text else None
+    if chunk_token_ids is None:
+        return _encode(data)
+    
+    position = data.rfind(chunk_text)
+    if position < 0:
+        return _encode(data)
+    
+    _CHUNK_TOKEN_CACHE.move_to_end(chunk_text)
+    before = data[:position]
+    after = data[position + len(chunk_text):]
+    return _encode(before) + chunk_token_ids + _encode(after)
+
+
+def tokenize_chat_prompt(content: str, chunk_text: Optional[str] = None) -> List[int]:
+    """
+    user 메시지 1개짜리 프롬프트를 chat template을 적용한 토큰 ID 리스트로 변환합니다.
+    
+    프롬프트가 STATIC_PROMPT_PREFIXES의 prefix로 시작하면 prefix 토큰 ID는 캐시에서 가져오고,
+    chunk_text의 토큰 ID가 remember_chunk_tokens()로 저장되어 있으면 그대로 이어 붙입니다.
+    조각별로 토큰화하므로 경계의 줄바꿈 병합 등 토큰 분할이 전체를 한 번에 토큰화한 결과와
+    조금 다를 수 있지만, 디코딩한 텍스트는 render_chat_prompt()의 결과와 같습니다.
+    
+    Args:
+        content: user 메시지 내용 (프롬프트 함수의 반환값)
+        chunk_text: 프롬프트에 포함된 자막 청크 텍스트 (1단계 추출에서만 사용)
+        
+    Returns:
+        /v1/completions의 prompt로 보낼 토큰 ID 리스트
+    """
+    head, tail = _get_chat_template_parts()
+    
+    for prefix in STATIC_PROMPT_PREFIXES.values():
+        if content.startswith(prefix):
+            return (
+                _get_prefix_token_ids(head, prefix)
+                + _encode_data(content[len(prefix):], chunk_text)
+                + _encode(tail)
+            )
+    
+    # 정적 prefix가 없는 프롬프트는 전체를 토큰화
+    return _encode(head) + _encode_data(content, chunk_text) + _encode(tail)
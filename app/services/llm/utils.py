@@ -4,9 +4,38 @@ LLM 서비스 공통 유틸리티 모듈
 재시도 로직, 청크 처리 로직 등 공통 기능을 제공합니다.
 """
 import json
+import time
 import asyncio
-from typing import Dict, List, Any, Callable
+from typing import Dict, List, Optional, Any, Callable
 from app.services.llm.client import VLLMClient
+from app.services.llm.budget import (
+    estimate_extraction_max_tokens,
+    estimate_enrichment_max_tokens
+)
+from app.services.llm.tokenization import tokenize_chat_prompt
+from app.services.llm.telemetry import get_backend_telemetry
+from app.services.llm.stages import (
+    get_stage_config,
+    STAGE_EXTRACTION,
+    STAGE_ENRICHMENT,
+    MODEL_TIER_LARGE,
+    MODEL_TIER_SMALL
+)
+from app.services.llm.cascade import (
+    get_cascade_tracker,
+    meets_extraction_coverage,
+    meets_enrichment_coverage,
+    ESCALATION_INVALID_OUTPUT,
+    ESCALATION_LOW_COVERAGE,
+    ESCALATION_ERROR
+)
+from app.services.llm.continuation import (
+    get_finish_reason,
+    recover_complete_entries,
+    FINISH_REASON_LENGTH
+)
+from app.services.llm.lexicon import get_lexicon
+from app.core.config import settings
 from app.core.logging import get_access_logger, get_error_logger
 from app.core.error_utils import log_error_with_location
 
@@ -14,28 +43,212 @@ ACCESS_LOGGER = get_access_logger()
 ERROR_LOGGER = get_error_logger()
 
 
+def _get_prompt_token_ids(
+    prompt: str, stage_config: Dict[str, Any], chunk_text: str = None
+) -> Optional[List[int]]:
+    """
+    토큰 ID 전송 모드에서 프롬프트를 토큰 ID로 변환합니다.
+    
+    Args:
+        prompt: user 메시지 내용
+        stage_config: 단계별 설정 (get_stage_config)
+        chunk_text: 프롬프트에 포함된 자막 청크 텍스트 (청크 토큰 ID 재사용)
+        
+    Returns:
+        토큰 ID 리스트. 모드가 꺼져 있거나 단계 모델이 클라이언트 토크나이저와 다르면 None
+    """
+    if not settings.LLM_SEND_TOKEN_IDS or not stage_config["client_templating"]:
+        return None
+    prompt_token_ids = tokenize_chat_prompt(prompt, chunk_text)
+    ACCESS_LOGGER.debug(f"Prompt Tokenized on Client - Prompt Tokens: {len(prompt_token_ids)}")
+    return prompt_token_ids
+
+
+async def _wait_for_backend_capacity(request_config: Dict[str, Any]) -> None:
+    """
+    텔레메트리 수집이 켜져 있으면 요청을 보낼 단계의 vLLM 서버가 모두 과부하인 동안 새 요청 전송을 보류합니다.
+    
+    Args:
+        request_config: 요청을 보낼 단계별 설정 (get_stage_config, 작은 모델이면 작은 모델 설정)
+    """
+    if not settings.VLLM_METRICS_ENABLED:
+        return
+    held_seconds = await get_backend_telemetry().wait_for_capacity(request_config["server_urls"])
+    if held_seconds > 0:
+        ACCESS_LOGGER.info(
+            f"Chunk Request Held for {held_seconds:.2f}s - vLLM Server Overloaded - "
+            f"Stage: {request_config['stage']}:{request_config['tier']}"
+        )
+
+
+async def _continue_truncated_enrichment(
+    client: VLLMClient,
+    request_config: Dict[str, Any],
+    partial_result: Dict[str, Any],
+    input_items: Dict[str, Any],
+    video_id: str,
+    process_name: str,
+    version: str,
+    prompt_func: Callable[[Dict[str, Any], str], str],
+    tokens_per_item: int = None
+) -> Dict[str, Any]:
+    """
+    max_tokens에 걸려 잘린 상세화 응답을 이어받습니다.
+    
+    잘린 응답에서 복구한 항목은 그대로 두고, 아직 결과에 없는 입력 항목만으로 같은 프롬프트 버전의
+    후속 요청을 보냅니다 (최대 LLM_CONTINUATION_MAX_ROUNDS회). 후속 요청이 실패하거나 새 항목을
+    돌려주지 못하면 그때까지 모은 결과를 반환합니다.
+    
+    Args:
+        client: 잘린 응답을 받은 클라이언트 (같은 모델로 이어받음)
+        request_config: 단계별 설정 (get_stage_config)
+        partial_result: 잘린 응답에서 복구한 항목
+        input_items: 상세화를 요청한 전체 입력 항목
+        video_id: 비디오 ID
+        process_name: 프로세스 이름
+        version: 프롬프트 버전
+        prompt_func: 프롬프트 생성 함수 (items, video_id) -> str
+        tokens_per_item: 항목 1개당 예상 출력 토큰 수 (없으면 max_tokens 상한 사용)
+        
+    Returns:
+        복구 항목과 후속 요청 결과를 합친 딕셔너리
+    """
+    result = dict(partial_result)
+    for continuation_round in range(1, settings.LLM_CONTINUATION_MAX_ROUNDS + 1):
+        missing_items = {item: value for item, value in input_items.items() if item not in result}
+        if not missing_items:
+            break
+        
+        if tokens_per_item:
+            max_tokens = estimate_enrichment_max_tokens(
+                len(missing_items), tokens_per_item, request_config["max_output_tokens"]
+            )
+        else:
+            max_tokens = request_config["max_output_tokens"]
+        
+        ACCESS_LOGGER.info(
+            f"{process_name} Continuation {continuation_round}/{settings.LLM_CONTINUATION_MAX_ROUNDS} "
+            f"for Video ID: '{video_id}' - Recovered: {len(result)} - Missing: {len(missing_items)} - "
+            f"Max Tokens: {max_tokens}"
+        )
+        
+        try:
+            prompt = prompt_func(missing_items, video_id)
+            response = await client.chat_completion(
+                [{"role": "user", "content": prompt}],
+                temperature=request_config["temperature"],
+                max_tokens=max_tokens,
+                route_key=f"{process_name}:{version}",
+                prompt_token_ids=_get_prompt_token_ids(prompt, request_config)
+            )
+            content = await client.extract_content_from_response(response)
+        except Exception as e:
+            log_error_with_location(
+                f"{process_name} Continuation Failed (round {continuation_round}, version {version})",
+                f"Video ID: '{video_id}' - Error: {str(e)}",
+                error=e
+            )
+            break
+        
+        # 완전한 응답이든 다시 잘린 응답이든 완성된 항목만 사용
+        new_entries = {
+            item: value for item, value in recover_complete_entries(content).items() if item not in result
+        }
+        if not new_entries:
+            ERROR_LOGGER.warning(
+                f"{process_name} Continuation Returned No New Items - Video ID: '{video_id}' - "
+                f"Finish Reason: {get_finish_reason(response)}"
+            )
+            break
+        result.update(new_entries)
+    
+    return result
+
+
+def _get_lexicon_key(item: str, item_data: Any) -> tuple:
+    """lexicon 캐시 키의 (원형, 품사) 부분 (숙어처럼 품사가 없으면 빈 문자열)"""
+    pos = item_data.get("품사", "") if isinstance(item_data, dict) else ""
+    return item, pos or ""
+
+
+def _split_lexicon_hits(
+    result_dict: Dict[str, Any], process_name: str, prompt_versions: List[tuple], video_id: str
+) -> tuple:
+    """
+    상세화할 항목 중 lexicon 캐시에 있는 항목을 분리합니다.
+    
+    Args:
+        result_dict: 상세화할 항목 딕셔너리 (정규화 완료)
+        process_name: 프로세스 이름 (캐시 키의 프롬프트 버전 접두사)
+        prompt_versions: 프롬프트 버전 리스트 [(version, prompt_func), ...]
+        video_id: 비디오 ID
+        
+    Returns:
+        (LLM에 요청할 항목 딕셔너리, 캐시 적중 항목 -> 상세화 데이터 딕셔너리)
+    """
+    keys = {item: _get_lexicon_key(item, item_data) for item, item_data in result_dict.items()}
+    found = get_lexicon().get_many(
+        keys.values(), [f"{process_name}:{version}" for version, _ in prompt_versions]
+    )
+    lexicon_hits = {item: found[key] for item, key in keys.items() if key in found}
+    misses = {item: item_data for item, item_data in result_dict.items() if item not in lexicon_hits}
+    ACCESS_LOGGER.info(
+        f"{process_name} Lexicon Lookup for Video ID: '{video_id}' - "
+        f"Hits: {len(lexicon_hits)}, Misses: {len(misses)}"
+    )
+    return misses, lexicon_hits
+
+
+def _get_enrichment_shard_size(tokens_per_item: int, max_output_tokens: int) -> int:
+    """
+    출력 토큰 예산으로 상세화 shard 1개에 담을 항목 수를 계산합니다.
+    
+    shard 1개의 출력(항목 수 x tokens_per_item + 오버헤드)이 LLM_ENRICHMENT_SHARD_OUTPUT_TOKENS와
+    단계 max_tokens 상한 중 작은 값을 넘지 않도록 합니다.
+    
+    Args:
+        tokens_per_item: 항목 1개당 예상 출력 토큰 수
+        max_output_tokens: 2단계 max_tokens 상한
+        
+    Returns:
+        shard당 항목 수 (샤딩을 사용하지 않으면 0)
+    """
+    if not settings.LLM_ENRICHMENT_SHARDING or not tokens_per_item:
+        return 0
+    shard_output_tokens = min(settings.LLM_ENRICHMENT_SHARD_OUTPUT_TOKENS, max_output_tokens)
+    return max(1, (shard_output_tokens - settings.LLM_OUTPUT_OVERHEAD_TOKENS) // tokens_per_item)
+
+
 async def enrich_with_retry(
     extraction_result: Dict[str, Any],
     video_id: str,
     process_name: str,
     prompt_versions: List[tuple],
-    normalize_input: Callable[[Dict[str, Any]], Dict[str, Any]] = None
+    normalize_input: Callable[[Dict[str, Any]], Dict[str, Any]] = None,
+    tokens_per_item: int = None
 ) -> Dict[str, Any]:
     """
     상세화(enrichment) 작업을 재시도 로직과 함께 수행하는 고차 함수.
     
+    lexicon 캐시가 켜져 있으면 먼저 캐시를 조회해 적중한 항목은 LLM에 보내지 않고 "lexiconHits"로 반환합니다
+    (merge_results에서 병합). 항목 수가 출력 토큰 예산으로 정한 shard 크기를 넘으면 항목을 shard로 나누어 병렬로 상세화하고 병합합니다
+    (요청 1건의 생성 길이가 전체 단어 수가 아니라 shard 크기에 비례). 실패한 shard는 건너뛰고,
+    모든 shard가 실패한 경우에만 예외를 발생시킵니다.
+    
     Args:
         extraction_result: 1단계 추출 결과 (이미 모든 청크 병합된 결과)
         video_id: 비디오 ID
         process_name: 프로세스 이름 (예: "Word Enrichment", "Phrase Enrichment")
         prompt_versions: 프롬프트 버전 리스트 [(version, prompt_func), ...]
         normalize_input: 입력 데이터 정규화 함수 (선택적)
+        tokens_per_item: 항목 1개당 예상 출력 토큰 수 (없으면 max_tokens 상한 사용, 샤딩 안 함)
         
     Returns:
         딕셔너리 형태의 결과:
         {
             "videoId": video_id,
-            "result": {...}
+            "result": {...},  # LLM 상세화 결과
+            "lexiconHits": {...}  # lexicon 캐시 적중 항목
         }
         
     Raises:
@@ -55,28 +268,170 @@ async def enrich_with_retry(
     if normalize_input:
         result_dict = normalize_input(result_dict)
     
-    ACCESS_LOGGER.info(f"Start {process_name} for Video ID: '{video_id}' - Total Items: {len(result_dict)}")
+    # lexicon 캐시 조회: 적중 항목은 LLM 요청에서 제외
+    lexicon_hits = {}
+    if settings.LLM_LEXICON_ENABLED:
+        result_dict, lexicon_hits = _split_lexicon_hits(result_dict, process_name, prompt_versions, video_id)
+        if not result_dict:
+            return {
+                "videoId": video_id,
+                "result": {},
+                "lexiconHits": lexicon_hits
+            }
+    
+    shard_size = _get_enrichment_shard_size(
+        tokens_per_item, get_stage_config(STAGE_ENRICHMENT)["max_output_tokens"]
+    )
+    if not shard_size or len(result_dict) <= shard_size:
+        result = await _enrich_items(result_dict, video_id, process_name, prompt_versions, tokens_per_item)
+        return {
+            "videoId": video_id,
+            "result": result,
+            "lexiconHits": lexicon_hits
+        }
+    
+    # 샤딩: 출력 토큰 예산 기준 shard로 나누어 병렬 상세화
+    items = list(result_dict.items())
+    shards = [dict(items[i:i + shard_size]) for i in range(0, len(items), shard_size)]
+    ACCESS_LOGGER.info(
+        f"{process_name} Sharded for Video ID: '{video_id}' - Total Items: {len(result_dict)} - "
+        f"Shards: {len(shards)} x {shard_size} Items"
+    )
+    shard_results = await asyncio.gather(*[
+        _enrich_items(
+            shard, video_id, process_name, prompt_versions, tokens_per_item, shard_label=f"{idx}/{len(shards)}"
+        )
+        for idx, shard in enumerate(shards, start=1)
+    ], return_exceptions=True)
+    
+    combined_result = {}
+    errors = []
+    for idx, shard_result in enumerate(shard_results, start=1):
+        if isinstance(shard_result, Exception):
+            ERROR_LOGGER.error(
+                f"{process_name} Shard {idx}/{len(shards)} Failed - Video ID: '{video_id}' - "
+                f"Error: {str(shard_result)}"
+            )
+            errors.append(shard_result)
+            continue
+        combined_result.update(shard_result)
+    
+    if not combined_result and errors:
+        raise errors[0]
+    
+    ACCESS_LOGGER.info(
+        f"End {process_name} for Video ID: '{video_id}' - Total Items: {len(combined_result)} "
+        f"(Shards Succeeded: {len(shards) - len(errors)}/{len(shards)})"
+    )
+    return {
+        "videoId": video_id,
+        "result": combined_result,
+        "lexiconHits": lexicon_hits
+    }
+
+
+async def _enrich_items(
+    result_dict: Dict[str, Any],
+    video_id: str,
+    process_name: str,
+    prompt_versions: List[tuple],
+    tokens_per_item: int = None,
+    shard_label: str = None
+) -> Dict[str, Any]:
+    """
+    항목 딕셔너리 1건(전체 또는 shard)을 프롬프트 버전별 재시도와 함께 상세화합니다.
+    
+    cascade 모드에서는 첫 번째 프롬프트 버전을 작은 모델로 먼저 시도하고,
+    JSON/형식 검증이나 입력 항목 커버리지 기준을 통과하지 못하면 단계 모델로 버전별 재시도를 진행합니다.
+    응답이 max_tokens에 걸려 잘리면 완성된 항목을 복구하고 누락 항목만 후속 요청으로 이어받습니다.
+    
+    Args:
+        result_dict: 상세화할 항목 딕셔너리 (정규화 완료)
+        video_id: 비디오 ID
+        process_name: 프로세스 이름
+        prompt_versions: 프롬프트 버전 리스트 [(version, prompt_func), ...]
+        tokens_per_item: 항목 1개당 예상 출력 토큰 수 (없으면 max_tokens 상한 사용)
+        shard_label: 로그에 표시할 shard 번호 (예: "2/5", 샤딩하지 않으면 None)
+        
+    Returns:
+        상세화 결과 딕셔너리 (항목 -> 상세 정보)
+        
+    Raises:
+        ValueError: JSON 파싱 실패 또는 응답 형식 오류 시
+        Exception: LLM API 호출 실패 시
+    """
+    # 항목 수 기반 출력 토큰 예산 (상한은 2단계 설정)
+    stage_config = get_stage_config(STAGE_ENRICHMENT)
+    if tokens_per_item:
+        max_tokens = estimate_enrichment_max_tokens(
+            len(result_dict), tokens_per_item, stage_config["max_output_tokens"]
+        )
+    else:
+        max_tokens = stage_config["max_output_tokens"]
+    
+    shard_info = f" (Shard {shard_label})" if shard_label else ""
+    ACCESS_LOGGER.info(f"Start {process_name}{shard_info} for Video ID: '{video_id}' - Total Items: {len(result_dict)} - Max Tokens: {max_tokens}")
     
     last_error = None
     
-    for attempt, (version, prompt_func) in enumerate(prompt_versions, 1):
-        async with VLLMClient() as client:
+    # 시도 계획: [(모델 등급, 버전, 프롬프트 함수), ...]
+    # cascade 모드에서는 첫 번째 버전을 작은 모델로 먼저 시도
+    attempts = [(MODEL_TIER_LARGE, version, prompt_func) for version, prompt_func in prompt_versions]
+    if settings.LLM_CASCADE_ENABLED:
+        first_version, first_prompt_func = prompt_versions[0]
+        attempts.insert(0, (MODEL_TIER_SMALL, first_version, first_prompt_func))
+    small_stage_config = get_stage_config(STAGE_ENRICHMENT, MODEL_TIER_SMALL)
+    cascade_tracker = get_cascade_tracker()
+    escalation_reason = None
+    small_seconds = 0.0
+    large_started_at = None
+    
+    for attempt, (tier, version, prompt_func) in enumerate(attempts, 1):
+        request_config = small_stage_config if tier == MODEL_TIER_SMALL else stage_config
+        started_at = time.perf_counter()
+        if tier == MODEL_TIER_LARGE and large_started_at is None:
+            large_started_at = started_at
+        
+        async with VLLMClient(stage=STAGE_ENRICHMENT, tier=tier) as client:
             try:
-                ACCESS_LOGGER.info(f"{process_name} Attempt {attempt}/{len(prompt_versions)} (version: {version}) for Video ID: '{video_id}'")
+                ACCESS_LOGGER.info(f"{process_name} Attempt {attempt}/{len(attempts)} (version: {version}, model: {client.model}) for Video ID: '{video_id}'")
                 
                 # 프롬프트 생성
                 prompt = prompt_func(result_dict, video_id)
                 
-                # LLM API 호출
+                # LLM API 호출 (같은 프롬프트 버전은 같은 레플리카로 라우팅)
                 messages = [{"role": "user", "content": prompt}]
-                response = await client.chat_completion(messages, temperature=0.7)
+                response = await client.chat_completion(
+                    messages,
+                    temperature=request_config["temperature"],
+                    max_tokens=max_tokens,
+                    route_key=f"{process_name}:{version}",
+                    prompt_token_ids=_get_prompt_token_ids(prompt, request_config)
+                )
                 
                 # 응답에서 콘텐츠 추출
                 content = await client.extract_content_from_response(response)
                 
+                # max_tokens 도달로 잘린 응답: 완성된 항목을 살리고 누락 항목만 이어받기
+                parsed_result = None
+                if settings.LLM_CONTINUATION_ENABLED and get_finish_reason(response) == FINISH_REASON_LENGTH:
+                    partial_result = recover_complete_entries(content)
+                    if partial_result:
+                        ACCESS_LOGGER.info(
+                            f"{process_name} Response Truncated (max_tokens: {max_tokens}) - "
+                            f"Video ID: '{video_id}' - Recovered Items: {len(partial_result)}/{len(result_dict)}"
+                        )
+                        parsed_result = {
+                            "result": await _continue_truncated_enrichment(
+                                client, request_config, partial_result, result_dict, video_id,
+                                process_name, version, prompt_func, tokens_per_item
+                            )
+                        }
+                
                 # JSON 파싱
                 try:
-                    parsed_result = json.loads(content)
+                    if parsed_result is None:
+                        parsed_result = json.loads(content)
                 except json.JSONDecodeError as e:
                     log_error_with_location(
                         f"JSON Parse Failed ({process_name}, attempt {attempt}, version {version})",
@@ -89,6 +444,8 @@ async def enrich_with_retry(
                         }
                     )
                     last_error = ValueError(f"JSON Parse Failed - Video ID: '{video_id}' - Error: {str(e)}")
+                    if tier == MODEL_TIER_SMALL:
+                        escalation_reason = ESCALATION_INVALID_OUTPUT
                     continue  # 다음 버전으로 재시도
                 
                 # 결과 검증
@@ -103,16 +460,41 @@ async def enrich_with_retry(
                         }
                     )
                     last_error = ValueError(f"Invalid Response Format - Video ID: '{video_id}'")
+                    if tier == MODEL_TIER_SMALL:
+                        escalation_reason = ESCALATION_INVALID_OUTPUT
                     continue  # 다음 버전으로 재시도
                 
-                # 성공: 최종 결과 구성
-                final_result = {
-                    "videoId": video_id,
-                    "result": result
-                }
+                # 작은 모델 결과는 입력 항목 커버리지까지 확인
+                if tier == MODEL_TIER_SMALL and not meets_enrichment_coverage(
+                    result, result_dict, settings.LLM_CASCADE_MIN_ENRICHMENT_COVERAGE
+                ):
+                    ACCESS_LOGGER.info(
+                        f"{process_name} Escalated to Large Model - Video ID: '{video_id}' - "
+                        f"Reason: {ESCALATION_LOW_COVERAGE} ({len(result)}/{len(result_dict)} items)"
+                    )
+                    escalation_reason = ESCALATION_LOW_COVERAGE
+                    continue
+                
+                # cascade 결과 기록
+                if settings.LLM_CASCADE_ENABLED:
+                    if tier == MODEL_TIER_SMALL:
+                        cascade_tracker.record(process_name, None, time.perf_counter() - started_at)
+                    else:
+                        cascade_tracker.record(
+                            process_name, escalation_reason, small_seconds,
+                            time.perf_counter() - large_started_at
+                        )
                 
-                ACCESS_LOGGER.info(f"End {process_name} for Video ID: '{video_id}' - Total Items: {len(result)} (Success on attempt {attempt}, version {version})")
-                return final_result
+                # 성공: lexicon 캐시에 요청한 항목의 결과 저장
+                if settings.LLM_LEXICON_ENABLED:
+                    get_lexicon().put_many(
+                        (*_get_lexicon_key(item, item_data), f"{process_name}:{version}", result[item])
+                        for item, item_data in result_dict.items()
+                        if isinstance(result.get(item), dict)
+                    )
+                
+                ACCESS_LOGGER.info(f"End {process_name}{shard_info} for Video ID: '{video_id}' - Total Items: {len(result)} (Success on attempt {attempt}, version {version})")
+                return result
                 
             except Exception as e:
                 log_error_with_location(
@@ -121,11 +503,22 @@ async def enrich_with_retry(
                     error=e
                 )
                 last_error = e
+                if tier == MODEL_TIER_SMALL:
+                    escalation_reason = ESCALATION_INVALID_OUTPUT if isinstance(e, ValueError) else ESCALATION_ERROR
                 continue  # 다음 버전으로 재시도
+            finally:
+                if tier == MODEL_TIER_SMALL:
+                    small_seconds = time.perf_counter() - started_at
+    
+    # 에스컬레이션 후 큰 모델도 모두 실패한 경우
+    if settings.LLM_CASCADE_ENABLED and large_started_at is not None:
+        cascade_tracker.record(
+            process_name, escalation_reason, small_seconds, time.perf_counter() - large_started_at
+        )
     
     # 모든 시도 실패
-    ERROR_LOGGER.error(f"{process_name} failed after {len(prompt_versions)} attempts for Video ID: '{video_id}'")
-    raise last_error if last_error else Exception(f"{process_name} failed after {len(prompt_versions)} attempts - Video ID: '{video_id}'")
+    ERROR_LOGGER.error(f"{process_name} failed after {len(attempts)} attempts for Video ID: '{video_id}'")
+    raise last_error if last_error else Exception(f"{process_name} failed after {len(attempts)} attempts - Video ID: '{video_id}'")
 
 
 async def extract_from_chunks(
@@ -133,17 +526,35 @@ async def extract_from_chunks(
     video_id: str,
     process_name: str,
     get_prompt_func: Callable[[str, str], str],
-    merge_results_func: Callable[[Dict[str, Any], Dict[str, Any]], None]
+    merge_results_func: Callable[[Dict[str, Any], Dict[str, Any]], None],
+    prompt_version: str = "",
+    output_token_ratio: float = None,
+    min_items_per_1k_tokens: float = 0.0,
+    count_items_func: Callable[[Dict[str, Any]], int] = len,
+    on_chunk_result: Callable[[Dict[str, Any]], None] = None,
+    normalize_result_func: Callable[[Dict[str, Any]], Dict[str, Any]] = None,
+    max_tokens_func: Callable[[str], int] = None
 ) -> Dict[str, Any]:
     """
     청크 리스트에서 추출 작업을 병렬로 수행하는 제네릭 함수.
     
+    cascade 모드에서는 청크마다 작은 모델로 먼저 요청하고, 결과가 검증/커버리지 기준에 못 미치면
+    단계 모델로 다시 요청합니다 (배치 모드는 단계 모델만 사용).
+    
     Args:
         chunk_texts: 자막 청크 텍스트 리스트
         video_id: 비디오 ID
         process_name: 프로세스 이름 (예: "Word Extraction", "Phrase Extraction")
         get_prompt_func: 프롬프트 생성 함수 (chunk_text, video_id) -> str
         merge_results_func: 결과 병합 함수 (combined_result, chunk_result) -> None
+        prompt_version: 프롬프트 템플릿 버전 (레플리카 라우팅 키에 사용)
+        output_token_ratio: 청크 입력 토큰 1개당 예상 출력 토큰 수 (없으면 max_tokens 상한 사용)
+        min_items_per_1k_tokens: cascade 커버리지 기준 (청크 1,000토큰당 최소 항목 수)
+        count_items_func: 결과 딕셔너리의 항목 수 계산 함수 (기본 len, 통합 추출은 단어 + 숙어 수)
+        on_chunk_result: 청크 결과가 검증되는 즉시 호출할 콜백 (파이프라인 모드에서 2단계로 전달)
+        normalize_result_func: 검증된 청크 결과를 병합 형식으로 변환하는 함수
+            (로컬 후보 추출 모드에서 간결한 뜻 목록을 {"품사", "뜻"} 형식으로 변환)
+        max_tokens_func: 청크별 max_tokens 계산 함수 (없으면 output_token_ratio 기준)
         
     Returns:
         딕셔너리 형태의 결과:
@@ -156,6 +567,134 @@ async def extract_from_chunks(
         ValueError: JSON 파싱 실패 또는 응답 형식 오류 시
         Exception: LLM API 호출 실패 시
     """
+    def _get_max_tokens(chunk_text: str) -> int:
+        """청크 크기 기반 출력 토큰 예산 (상한은 1단계 설정)"""
+        if max_tokens_func:
+            return max_tokens_func(chunk_text)
+        if output_token_ratio:
+            return estimate_extraction_max_tokens(
+                chunk_text, output_token_ratio, stage_config["max_output_tokens"]
+            )
+        return stage_config["max_output_tokens"]
+    
+    async def _parse_chunk_response(
+        response: Dict[str, Any],
+        chunk_idx: int,
+        total_chunks: int,
+        client: VLLMClient
+    ) -> Dict[str, Any]:
+        """단일 청크의 LLM 응답에서 결과 딕셔너리를 추출하고 검증"""
+        # 응답에서 콘텐츠 추출
+        content = await client.extract_content_from_response(response)
+        
+        # 디버깅: 응답 내용 로깅 (JSON 파싱 전)
+        if not content or len(content.strip()) == 0:
+            log_error_with_location(
+                f"Empty Response for Chunk {chunk_idx}/{total_chunks}",
+                f"Video ID: '{video_id}'",
+                additional_info={
+                    "Raw Response": str(response)[:500]
+                }
+            )
+            raise ValueError(f"Empty Response for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}'")
+        
+        # JSON 파싱
+        try:
+            parsed_result = json.loads(content)
+        except json.JSONDecodeError as e:
+            log_error_with_location(
+                f"JSON Parse Failed for Chunk {chunk_idx}/{total_chunks}",
+                f"Video ID: '{video_id}' - Error: {str(e)}",
+                error=e,
+                additional_info={
+                    "Response Content (first 500 chars)": content[:500],
+                    "Response Content (last 200 chars)": content[-200:] if len(content) > 500 else '',
+                    "Response Length": len(content)
+                }
+            )
+            raise ValueError(f"JSON Parse Failed for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}' - Error: {str(e)}") from e
+        
+        # 결과 검증
+        result = parsed_result.get("result")
+        if not result or not isinstance(result, dict):
+            log_error_with_location(
+                f"Invalid Response Format for Chunk {chunk_idx}/{total_chunks}",
+                f"Video ID: '{video_id}'",
+                additional_info={
+                    "Response": content[:500],
+                    "Parsed Result": str(parsed_result)[:500]
+                }
+            )
+            raise ValueError(f"Invalid Response Format for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}'")
+        
+        if normalize_result_func:
+            result = normalize_result_func(result)
+        
+        ACCESS_LOGGER.debug(f"{process_name} Success for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}' - Items: {count_items_func(result)}")
+        return result
+    
+    async def _request_chunk(
+        prompt: str,
+        chunk_text: str,
+        chunk_idx: int,
+        total_chunks: int,
+        client: VLLMClient,
+        request_config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """청크 프롬프트 1건을 전송하고 검증된 결과 딕셔너리를 반환"""
+        # LLM API 호출 (같은 프롬프트 버전은 같은 레플리카로 라우팅)
+        messages = [{"role": "user", "content": prompt}]
+        response = await client.chat_completion(
+            messages,
+            temperature=request_config["temperature"],
+            max_tokens=_get_max_tokens(chunk_text),
+            route_key=route_key,
+            prompt_token_ids=_get_prompt_token_ids(prompt, request_config, chunk_text)
+        )
+        return await _parse_chunk_response(response, chunk_idx, total_chunks, client)
+    
+    async def _request_chunk_with_cascade(
+        prompt: str,
+        chunk_text: str,
+        chunk_idx: int,
+        total_chunks: int,
+        client: VLLMClient
+    ) -> Dict[str, Any]:
+        """작은 모델로 먼저 추출하고, 검증/커버리지 기준 미달이면 단계 모델로 다시 요청"""
+        escalation_reason = None
+        started_at = time.perf_counter()
+        try:
+            async with VLLMClient(stage=STAGE_EXTRACTION, tier=MODEL_TIER_SMALL) as small_client:
+                result = await _request_chunk(
+                    prompt, chunk_text, chunk_idx, total_chunks, small_client, small_stage_config
+                )
+            if not meets_extraction_coverage(
+                result, chunk_text, min_items_per_1k_tokens, count_items_func(result)
+            ):
+                escalation_reason = ESCALATION_LOW_COVERAGE
+        except ValueError:
+            escalation_reason = ESCALATION_INVALID_OUTPUT
+        except Exception:
+            escalation_reason = ESCALATION_ERROR
+        small_seconds = time.perf_counter() - started_at
+        
+        if escalation_reason is None:
+            cascade_tracker.record(process_name, None, small_seconds)
+            return result
+        
+        ACCESS_LOGGER.info(
+            f"{process_name} Escalated to Large Model for Chunk {chunk_idx}/{total_chunks} - "
+            f"Video ID: '{video_id}' - Reason: {escalation_reason}"
+        )
+        await _wait_for_backend_capacity(stage_config)
+        started_at = time.perf_counter()
+        try:
+            return await _request_chunk(prompt, chunk_text, chunk_idx, total_chunks, client, stage_config)
+        finally:
+            cascade_tracker.record(
+                process_name, escalation_reason, small_seconds, time.perf_counter() - started_at
+            )
+    
     async def _extract_from_single_chunk(
         chunk_text: str,
         chunk_idx: int,
@@ -165,57 +704,22 @@ async def extract_from_chunks(
     ) -> Dict[str, Any]:
         """단일 청크에서 추출 작업 수행"""
         try:
+            # 요청을 보낼 서버(cascade 모드는 작은 모델 서버)의 대기열/KV cache가 임계값을 넘었으면
+            # 여유가 생길 때까지 전송 보류
+            await _wait_for_backend_capacity(
+                small_stage_config if settings.LLM_CASCADE_ENABLED else stage_config
+            )
+            
             # 프롬프트 생성
             prompt = get_prompt_func(chunk_text, video_id)
             
-            # LLM API 호출
-            messages = [{"role": "user", "content": prompt}]
-            response = await client.chat_completion(messages, temperature=0.7)
-            
-            # 응답에서 콘텐츠 추출
-            content = await client.extract_content_from_response(response)
-            
-            # 디버깅: 응답 내용 로깅 (JSON 파싱 전)
-            if not content or len(content.strip()) == 0:
-                log_error_with_location(
-                    f"Empty Response for Chunk {chunk_idx}/{total_chunks}",
-                    f"Video ID: '{video_id}'",
-                    additional_info={
-                        "Raw Response": str(response)[:500]
-                    }
-                )
-                raise ValueError(f"Empty Response for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}'")
-            
-            # JSON 파싱
-            try:
-                parsed_result = json.loads(content)
-            except json.JSONDecodeError as e:
-                log_error_with_location(
-                    f"JSON Parse Failed for Chunk {chunk_idx}/{total_chunks}",
-                    f"Video ID: '{video_id}' - Error: {str(e)}",
-                    error=e,
-                    additional_info={
-                        "Response Content (first 500 chars)": content[:500],
-                        "Response Content (last 200 chars)": content[-200:] if len(content) > 500 else '',
-                        "Response Length": len(content)
-                    }
-                )
-                raise ValueError(f"JSON Parse Failed for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}' - Error: {str(e)}") from e
+            if settings.LLM_CASCADE_ENABLED:
+                result = await _request_chunk_with_cascade(prompt, chunk_text, chunk_idx, total_chunks, client)
+            else:
+                result = await _request_chunk(prompt, chunk_text, chunk_idx, total_chunks, client, stage_config)
             
-            # 결과 검증
-            result = parsed_result.get("result")
-            if not result or not isinstance(result, dict):
-                log_error_with_location(
-                    f"Invalid Response Format for Chunk {chunk_idx}/{total_chunks}",
-                    f"Video ID: '{video_id}'",
-                    additional_info={
-                        "Response": content[:500],
-                        "Parsed Result": str(parsed_result)[:500]
-                    }
-                )
-                raise ValueError(f"Invalid Response Format for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}'")
-            
-            ACCESS_LOGGER.debug(f"{process_name} Success for Chunk {chunk_idx}/{total_chunks} - Video ID: '{video_id}' - Items: {len(result)}")
+            if on_chunk_result:
+                on_chunk_result(result)
             return result
             
         except ValueError:
@@ -231,23 +735,89 @@ async def extract_from_chunks(
             )
             raise
     
+    async def _extract_from_chunk_batch(
+        batch: List[tuple],
+        total_chunks: int,
+        video_id: str,
+        client: VLLMClient
+    ) -> List[Any]:
+        """여러 청크를 /v1/completions 요청 1건으로 처리하고 청크별 결과(또는 예외)를 반환"""
+        try:
+            await _wait_for_backend_capacity(stage_config)
+            
+            prompts = [get_prompt_func(chunk_text, video_id) for _, chunk_text in batch]
+            messages_list = [[{"role": "user", "content": prompt}] for prompt in prompts]
+            prompt_token_ids_list = None
+            if settings.LLM_SEND_TOKEN_IDS:
+                prompt_token_ids_list = [
+                    _get_prompt_token_ids(prompt, stage_config, chunk_text)
+                    for prompt, (_, chunk_text) in zip(prompts, batch)
+                ]
+            
+            # 배치 내 max_tokens는 공통이므로 가장 큰 청크 기준
+            responses = await client.completion_batch(
+                messages_list,
+                temperature=stage_config["temperature"],
+                max_tokens=max(_get_max_tokens(chunk_text) for _, chunk_text in batch),
+                route_key=route_key,
+                prompt_token_ids_list=prompt_token_ids_list
+            )
+        except Exception as e:
+            log_error_with_location(
+                f"{process_name} Failed for Chunk Batch {batch[0][0]}-{batch[-1][0]}/{total_chunks}",
+                f"Video ID: '{video_id}' - Error: {str(e)}",
+                error=e
+            )
+            return [e] * len(batch)
+        
+        batch_results = []
+        for (chunk_idx, _), response in zip(batch, responses):
+            try:
+                result = await _parse_chunk_response(response, chunk_idx, total_chunks, client)
+            except Exception as e:
+                batch_results.append(e)
+                continue
+            if on_chunk_result:
+                on_chunk_result(result)
+            batch_results.append(result)
+        return batch_results
+    
+    stage_config = get_stage_config(STAGE_EXTRACTION)
+    small_stage_config = get_stage_config(STAGE_EXTRACTION, MODEL_TIER_SMALL)
+    cascade_tracker = get_cascade_tracker()
+    route_key = f"{process_name}:{prompt_version}"
     combined_result = {}
     
     # 하나의 클라이언트 인스턴스 사용
-    async with VLLMClient() as client:
+    async with VLLMClient(stage=STAGE_EXTRACTION) as client:
         try:
             ACCESS_LOGGER.info(f"Start {process_name} for Video ID: '{video_id}' - Total Chunks: {len(chunk_texts)}")
             
-            # 모든 청크에 대해 병렬로 작업 생성 (같은 클라이언트 공유)
-            tasks = [
-                _extract_from_single_chunk(
-                    chunk_text, idx, len(chunk_texts), video_id, client
-                )
-                for idx, chunk_text in enumerate(chunk_texts, start=1)
-            ]
-            
-            # 모든 작업을 병렬로 실행 (부분 실패 허용)
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # 배치 모드는 클라이언트에서 chat template을 적용하므로 단계 모델이 클라이언트 토크나이저와 같아야 함
+            if settings.LLM_STAGE1_BATCH_MODE and stage_config["client_templating"]:
+                # 배치 모드: 청크 여러 개를 /v1/completions 요청 1건에 담아 전송
+                indexed_chunks = list(enumerate(chunk_texts, start=1))
+                batch_size = max(1, settings.LLM_STAGE1_BATCH_SIZE)
+                batches = [
+                    indexed_chunks[i:i + batch_size]
+                    for i in range(0, len(indexed_chunks), batch_size)
+                ]
+                batch_results = await asyncio.gather(*[
+                    _extract_from_chunk_batch(batch, len(chunk_texts), video_id, client)
+                    for batch in batches
+                ])
+                results = [result for batch_result in batch_results for result in batch_result]
+            else:
+                # 모든 청크에 대해 병렬로 작업 생성 (같은 클라이언트 공유)
+                tasks = [
+                    _extract_from_single_chunk(
+                        chunk_text, idx, len(chunk_texts), video_id, client
+                    )
+                    for idx, chunk_text in enumerate(chunk_texts, start=1)
+                ]
+                
+                # 모든 작업을 병렬로 실행 (부분 실패 허용)
+                results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # 결과 병합
             for idx, result in enumerate(results, start=1):
@@ -268,10 +838,9 @@ async def extract_from_chunks(
                 "result": combined_result
             }
             
-            ACCESS_LOGGER.info(f"End {process_name} for Video ID: '{video_id}' - Total Items: {len(combined_result)}")
+            ACCESS_LOGGER.info(f"End {process_name} for Video ID: '{video_id}' - Total Items: {count_items_func(combined_result)}")
             return final_result
             
         except Exception as e:
             ERROR_LOGGER.error(f"{process_name} Process Failed - Video ID: '{video_id}' - Error: {str(e)}")
             raise
-
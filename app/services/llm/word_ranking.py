@@ -0,0 +1,187 @@
+"""
+로컬 단어 순위 모듈
+
+1단계는 자막의 "모든 영어 단어"를 추출하므로 "go", "thing", "good"처럼 학습 가치가 낮은 단어도
+2단계 상세화로 넘어갑니다. 번들된 빈도 순위표(resources/word_frequency.txt)로 단어마다
+희소도 점수를 매기고, 상위 K개 또는 기준 점수 이상인 단어만 enrich_words로 보냅니다.
+
+- 빈도 순위표: 정렬된 단어 튜플 + 같은 순서의 순위 array (bisect 이진 탐색, 단어당 dict 항목 없이 보관)
+- 희소도: 순위 / 순위표 크기 (순위표에 없는 단어는 1.0)
+- 코퍼스 IDF (선택): 지난 영상들에 자주 나온 단어일수록 점수를 낮춤 (settings.LLM_WORD_RANKING_CORPUS_IDF)
+"""
+import json
+import math
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Any
+from app.core.config import settings
+from app.core.logging import get_access_logger
+
+ACCESS_LOGGER = get_access_logger()
+
+FREQUENCY_TABLE_PATH = Path(__file__).parent / "resources" / "word_frequency.txt"
+
+
+class FrequencyTable:
+    """빈도 순위표 (정렬된 단어 튜플과 순위 array로 보관)"""
+
+    def __init__(self, ranked_words: Iterable[str]):
+        ranks = {}
+        for word in ranked_words:
+            ranks.setdefault(word.lower().strip(), len(ranks) + 1)
+        self._words = tuple(sorted(ranks))
+        self._ranks = array("I", (ranks[word] for word in self._words))
+
+    @classmethod
+    def load(cls, path: Path = FREQUENCY_TABLE_PATH) -> "FrequencyTable":
+        """순위표 파일(1줄 1단어, '#'으로 시작하는 줄은 주석)을 읽습니다."""
+        with open(path, encoding="utf-8") as f:
+            return cls(line for line in f if line.strip() and not line.startswith("#"))
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def rank(self, word: str) -> Optional[int]:
+        """단어의 빈도 순위를 반환합니다 (1이 가장 흔함, 순위표에 없으면 None)."""
+        word = word.lower().strip()
+        index = bisect_left(self._words, word)
+        if index < len(self._words) and self._words[index] == word:
+            return self._ranks[index]
+        return None
+
+
+class CorpusDocumentFrequency:
+    """지난 영상들의 단어별 문서 빈도 (path가 있으면 JSON 파일에 저장)"""
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.documents = 0
+        self._document_frequency: Dict[str, int] = {}
+        if path and Path(path).exists():
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            self.documents = saved.get("documents", 0)
+            self._document_frequency = saved.get("documentFrequency", {})
+
+    def observe(self, words: Iterable[str]) -> None:
+        """영상 1건의 단어 집합을 문서 1개로 기록합니다."""
+        self.documents += 1
+        for word in set(words):
+            self._document_frequency[word] = self._document_frequency.get(word, 0) + 1
+        if self.path:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"documents": self.documents, "documentFrequency": self._document_frequency}, f)
+
+    def idf_weight(self, word: str) -> float:
+        """
+        정규화된 IDF 가중치를 반환합니다.
+        
+        Args:
+            word: 소문자로 정규화된 단어
+            
+        Returns:
+            (0, 1] 범위의 가중치 (모든 영상에 나온 단어일수록 작음, 기록된 영상이 없으면 1.0)
+        """
+        if not self.documents:
+            return 1.0
+        idf = math.log((1 + self.documents) / (1 + self._document_frequency.get(word, 0)))
+        return (1.0 + idf) / (1.0 + math.log(1 + self.documents))
+
+
+class WordRanker:
+    """빈도 순위표(와 선택적 코퍼스 IDF)로 단어의 학습 가치 점수를 계산합니다."""
+
+    def __init__(self, frequency_table: FrequencyTable, corpus: Optional[CorpusDocumentFrequency] = None):
+        self.frequency_table = frequency_table
+        self.corpus = corpus
+
+    def score(self, word: str) -> float:
+        """
+        단어의 점수를 계산합니다.
+        
+        Args:
+            word: 단어 (대소문자 무관)
+            
+        Returns:
+            0 ~ 1 점수 (클수록 드문 단어, 순위표에 없는 단어는 희소도 1.0)
+        """
+        word = word.lower().strip()
+        rank = self.frequency_table.rank(word)
+        if rank is None:
+            rarity = 1.0
+        else:
+            rarity = rank / len(self.frequency_table)
+        if self.corpus is not None:
+            rarity *= self.corpus.idf_weight(word)
+        return round(rarity, 4)
+
+    def filter_words(self, words_dict: Dict[str, Any], min_score: float) -> Dict[str, Any]:
+        """점수가 min_score 이상인 단어만 남깁니다 (파이프라인 모드의 청크 단위 필터)."""
+        return {word: word_data for word, word_data in words_dict.items() if self.score(word) >= min_score}
+
+    def select_top_words(self, words_dict: Dict[str, Any], top_k: int, min_score: float) -> Dict[str, Any]:
+        """
+        점수가 min_score 이상인 단어 중 상위 top_k개를 선택합니다.
+        
+        Args:
+            words_dict: 1단계 단어 추출 결과의 result 딕셔너리
+            top_k: 최대 단어 수 (0이면 개수 제한 없음)
+            min_score: 최소 점수
+            
+        Returns:
+            선택된 단어만 남긴 딕셔너리 (원래 순서 유지)
+        """
+        scores = {word: self.score(word) for word in words_dict}
+        selected = [word for word in words_dict if scores[word] >= min_score]
+        if top_k and len(selected) > top_k:
+            selected = set(sorted(selected, key=lambda word: (-scores[word], word))[:top_k])
+        return {word: word_data for word, word_data in words_dict.items() if word in selected}
+
+
+def rank_extracted_words(
+    word_extraction_result: Dict[str, Any], video_id: str, top_k: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    1단계 단어 추출 결과를 점수로 걸러 상세화 대상만 남깁니다.
+    
+    코퍼스 IDF를 사용하면 순위를 매긴 뒤 이 영상의 단어를 코퍼스에 기록합니다.
+    
+    Args:
+        word_extraction_result: 1단계 단어 추출 결과 ({"videoId": ..., "result": {...}})
+        video_id: 비디오 ID
+        top_k: 최대 단어 수 (None이면 settings.LLM_WORD_RANKING_TOP_K, 0이면 개수 제한 없음)
+        
+    Returns:
+        선택된 단어만 남긴 단어 추출 결과 (같은 형식)
+    """
+    words_dict = word_extraction_result.get("result", {})
+    ranker = get_word_ranker()
+    selected = ranker.select_top_words(
+        words_dict,
+        settings.LLM_WORD_RANKING_TOP_K if top_k is None else top_k,
+        settings.LLM_WORD_RANKING_MIN_SCORE
+    )
+    if ranker.corpus is not None:
+        ranker.corpus.observe(words_dict)
+    
+    ACCESS_LOGGER.info(
+        f"Word Ranking for Video ID: '{video_id}' - "
+        f"Extracted: {len(words_dict)}, Selected for Enrichment: {len(selected)}"
+    )
+    return {**word_extraction_result, "result": selected}
+
+
+_WORD_RANKER: Optional[WordRanker] = None
+
+
+def get_word_ranker() -> WordRanker:
+    """프로세스 전역 단어 순위기를 반환합니다 (순위표는 처음 사용할 때 1회 로드)."""
+    global _WORD_RANKER
+    if _WORD_RANKER is None:
+        corpus = None
+        if settings.LLM_WORD_RANKING_CORPUS_IDF:
+            corpus = CorpusDocumentFrequency(settings.LLM_WORD_RANKING_CORPUS_PATH)
+        _WORD_RANKER = WordRanker(FrequencyTable.load(), corpus)
+    return _WORD_RANKER
@@ -4,53 +4,94 @@ from typing import List
 from transformers import AutoTokenizer
 from app.core.config import settings
 from app.core.logging import get_access_logger, get_error_logger
+from app.services.llm.tokenization import remember_chunk_tokens
 
 TOKENIZER = AutoTokenizer.from_pretrained(settings.TOKENIZER_MODEL)
 MAX_TOKEN_COUNT = settings.MAX_TOKEN_COUNT
 ACCESS_LOGGER = get_access_logger()
 ERROR_LOGGER = get_error_logger()
 
+# 청크 안에서 세그먼트를 이어 붙이는 구분자와 그 토큰 ID (토큰 ID 전송 모드에서 청크 토큰 ID 조립에 사용)
+SEGMENT_SEPARATOR = ' '
+_SEPARATOR_TOKEN_IDS = None
+
 def count_tokens(text: str) -> int:
     return len(TOKENIZER.encode(text))
 
+def encode_segment(text: str) -> List[int]:
+    return TOKENIZER.encode(text, add_special_tokens=False)
+
+def _join_segment_token_ids(segment_token_ids: List[List[int]]) -> List[int]:
+    """
+    청크 생성 중 토큰화한 세그먼트 토큰 ID를 구분자 토큰 ID로 이어 붙여 청크 토큰 ID를 만듭니다.
+    
+    청크 텍스트를 다시 토큰화하지 않으며, 디코딩한 텍스트는 청크 텍스트와 같습니다
+    (세그먼트 경계의 토큰 분할은 청크 전체를 한 번에 토큰화한 결과와 조금 다를 수 있음).
+    
+    Args:
+        segment_token_ids: 청크를 이루는 세그먼트별 토큰 ID (특수 토큰 제외)
+        
+    Returns:
+        청크 토큰 ID 리스트
+    """
+    global _SEPARATOR_TOKEN_IDS
+    if _SEPARATOR_TOKEN_IDS is None:
+        _SEPARATOR_TOKEN_IDS = encode_segment(SEGMENT_SEPARATOR)
+    token_ids = []
+    for position, ids in enumerate(segment_token_ids):
+        if position:
+            token_ids.extend(_SEPARATOR_TOKEN_IDS)
+        token_ids.extend(ids)
+    return token_ids
+
 def create_chunks(video_id: str, raw_segments: List[dict]) -> List[dict]:
     chunks = []  # 최종 청크 리스트
     current_chunk_texts = []  # 현재 청크의 텍스트들
     current_chunk_tokens = 0  # 현재 청크의 토큰 수
+    current_chunk_token_ids = []  # 현재 청크의 세그먼트별 토큰 ID (토큰 ID 전송 모드에서만 보관)
+    keep_token_ids = settings.LLM_SEND_TOKEN_IDS
     chunk_start_idx = 1
     
     ACCESS_LOGGER.info(f"Start Creating Chunk for Video ID: '{video_id}'")
     for idx, segment in enumerate(raw_segments, start=1):
         segment_text = segment["text"]
-        segment_tokens = count_tokens(segment_text)
+        # 토큰 ID 전송 모드: 세그먼트 토큰 ID를 보관하여 청크 토큰 ID 조립에 재사용
+        segment_token_ids = encode_segment(segment_text) if keep_token_ids else None
+        segment_tokens = len(segment_token_ids) if keep_token_ids else count_tokens(segment_text)
         
         # 현재 청크에 추가하면 2000을 넘는지 확인
         if current_chunk_tokens + segment_tokens > MAX_TOKEN_COUNT and current_chunk_texts:
             # 현재 청크를 완성하고 저장
-            chunk_text = ' '.join(current_chunk_texts)
+            chunk_text = SEGMENT_SEPARATOR.join(current_chunk_texts)
             chunks.append({
                 'text': chunk_text,
                 'token_count': current_chunk_tokens,
                 'segment_range': f"{chunk_start_idx}-{idx - 1}"
             })
+            if keep_token_ids:
+                remember_chunk_tokens(chunk_text, _join_segment_token_ids(current_chunk_token_ids))
             ACCESS_LOGGER.debug(f"Chunk Created: {len(chunks)} for Video ID: '{video_id}'")
             # 새 청크 시작
             current_chunk_texts = [segment_text]
             current_chunk_tokens = segment_tokens
+            current_chunk_token_ids = [segment_token_ids]
             chunk_start_idx = idx
         else:
             # 현재 청크에 추가
             current_chunk_texts.append(segment_text)
             current_chunk_tokens += segment_tokens
+            current_chunk_token_ids.append(segment_token_ids)
 
     # 마지막 청크 추가 (남은 것이 있으면)
     if current_chunk_texts:
-        chunk_text = ' '.join(current_chunk_texts)
+        chunk_text = SEGMENT_SEPARATOR.join(current_chunk_texts)
         chunks.append({
             'text': chunk_text,
             'token_count': current_chunk_tokens,
             'segment_range': f"{chunk_start_idx}-{len(raw_segments)}"
         })
+        if keep_token_ids:
+            remember_chunk_tokens(chunk_text, _join_segment_token_ids(current_chunk_token_ids))
         ACCESS_LOGGER.debug(f"Chunk Created: {len(chunks)} for Video ID: '{video_id}'")
     
     ACCESS_LOGGER.info(f"End Creating Chunks for Video ID: '{video_id}'")
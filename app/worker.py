@@ -0,0 +1,51 @@
+"""
+독립 워커 프로세스 (단어장 생성 작업 전용)
+
+API 노드는 작업을 큐에 넣고 결과만 조회하며(JOB_IN_PROCESS_WORKERS=False),
+이 프로세스가 같은 큐 백엔드(JOB_QUEUE_BACKEND)에서 작업을 꺼내 처리합니다.
+API 처리 용량과 LLM 처리 용량을 따로 늘릴 수 있고, 워커를 재시작해도 진행 중이던 작업은
+다시 큐에 들어가 다른 워커가 이어서 처리합니다.
+
+사용 예시:
+    python -m app.worker --concurrency 4
+"""
+import argparse
+import asyncio
+import signal
+from typing import Optional
+from app.core.config import settings
+from app.core.logging import setup_logging, get_access_logger
+from app.services.jobs.backends import get_job_queue
+from app.services.jobs.runner import JobWorkerPool
+from app.services.llm.background import llm_background_tasks
+
+
+async def _main(concurrency: int, poll_interval: float, worker_id: Optional[str]) -> None:
+    """
+    워커 풀을 시작하고 SIGINT/SIGTERM을 받으면 진행 중인 작업을 큐에 되돌린 뒤 종료합니다.
+    
+    API 서버와 같은 LLM 백그라운드 작업(prefix cache 적재, vLLM 부하 수집)을 함께 실행합니다.
+    """
+    access_logger = get_access_logger()
+    pool = JobWorkerPool(get_job_queue(), concurrency, poll_interval, worker_id)
+    
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+    
+    async with llm_background_tasks():
+        pool.start()
+        await stop_event.wait()
+        access_logger.info(f"Stopping Job Worker - Worker: '{pool.worker_id}'")
+        await pool.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="단어장 생성 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY, help="동시에 처리할 최대 작업 수")
+    parser.add_argument("--poll-interval", type=float, default=settings.JOB_WORKER_POLL_INTERVAL, help="큐가 비어 있을 때 확인 주기 (초)")
+    parser.add_argument("--worker-id", default=None, help="lease 소유자 ID (기본값: 호스트:PID:임의값)")
+    args = parser.parse_args()
+    setup_logging()
+    asyncio.run(_main(args.concurrency, args.poll_interval, args.worker_id))
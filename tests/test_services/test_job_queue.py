@@ -0,0 +1,113 @@
+"""
+단어장 생성 작업 큐 모듈 테스트
+
+app/services/jobs/의 SQLite/파일시스템 작업 큐 백엔드를 테스트합니다.
+임시 디렉터리를 사용하여 상태 전이, lease 만료 시 재등록, 워커 종료 시 작업 반환, 백엔드 인터페이스 구현 강제를 검증합니다.
+"""
+import pytest
+from app.services.jobs.queue import (
+    JobQueue,
+    JOB_STATUS_QUEUED,
+    JOB_STATUS_RUNNING,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    JOB_ERROR_ABANDONED,
+)
+from app.services.jobs.sqlite_queue import SqliteJobQueue
+from app.services.jobs.filesystem_queue import FileSystemJobQueue
+from app.services.llm.stages import STAGE_ENRICHMENT
+
+
+def test_job_queue_tracks_stage_progress_until_completed(tmp_path):
+    """작업이 queued → running → completed로 바뀌고 단계별 진행 상황과 결과가 기록되는지 확인"""
+    # Arrange (준비)
+    queue = SqliteJobQueue(str(tmp_path / "jobs.sqlite3"))
+    job = queue.enqueue("video123", webhook_url="https://example.com/hook")
+
+    # Act (실행)
+    claimed = queue.claim_next("worker-1")
+    queue.update_stage(job["jobId"], STAGE_ENRICHMENT, "worker-1")
+    in_progress = queue.get(job["jobId"])
+    queue.complete(job["jobId"], {"videoId": "video123", "words": [], "phrases": []}, "worker-1")
+    completed = queue.get(job["jobId"])
+
+    # Assert (검증)
+    assert job["status"] == JOB_STATUS_QUEUED
+    assert claimed["jobId"] == job["jobId"]
+    assert claimed["status"] == JOB_STATUS_RUNNING
+    assert claimed["leaseOwner"] == "worker-1"
+    assert queue.claim_next("worker-2") is None
+    assert in_progress["progress"] == {
+        "transcript": "completed",
+        "extraction": "completed",
+        "enrichment": "running",
+        "merge": "pending",
+    }
+    assert completed["status"] == JOB_STATUS_COMPLETED
+    assert set(completed["progress"].values()) == {"completed"}
+    assert completed["result"]["videoId"] == "video123"
+    assert completed["webhookUrl"] == "https://example.com/hook"
+    assert completed["leaseOwner"] is None
+
+
+def test_sqlite_job_queue_requeues_jobs_from_dead_workers(tmp_path):
+    """lease가 만료된 작업을 다른 워커가 가져가고, 이전 워커의 기록은 무시되며, 최대 시도 후 실패 처리되는지 확인"""
+    # Arrange (준비): 꺼내자마자 lease가 만료되도록 음수 lease 사용
+    queue = SqliteJobQueue(str(tmp_path / "jobs.sqlite3"), lease_seconds=-1.0, max_attempts=2)
+    job = queue.enqueue("video1")
+    queue.claim_next("dead-worker")
+
+    # Act (실행)
+    reclaimed = queue.claim_next("worker-2")
+    stale_heartbeat = queue.heartbeat(job["jobId"], "dead-worker")
+    stale_complete = queue.complete(job["jobId"], {"videoId": "video1"}, "dead-worker")
+    abandoned = queue.requeue_expired()
+
+    # Assert (검증)
+    assert reclaimed["leaseOwner"] == "worker-2"
+    assert reclaimed["attempts"] == 2
+    assert stale_heartbeat is False
+    assert stale_complete is False
+    assert abandoned == 1
+    assert queue.get(job["jobId"])["status"] == JOB_STATUS_FAILED
+    assert queue.get(job["jobId"])["error"] == JOB_ERROR_ABANDONED
+
+
+def test_filesystem_job_queue_claims_in_order_and_releases(tmp_path):
+    """파일시스템 큐가 먼저 들어온 작업부터 꺼내고, 반환한 작업과 lease 만료 작업을 다시 꺼낼 수 있는지 확인"""
+    # Arrange (준비)
+    queue = FileSystemJobQueue(str(tmp_path / "jobs"), lease_seconds=60.0)
+    first = queue.enqueue("video1")
+    second = queue.enqueue("video2")
+
+    # Act (실행)
+    claimed_first = queue.claim_next("worker-1")
+    claimed_second = queue.claim_next("worker-1")
+    released = queue.release(first["jobId"], "worker-1")
+    reclaimed = queue.claim_next("worker-2")
+    other_process_view = FileSystemJobQueue(str(tmp_path / "jobs"), lease_seconds=-1.0)
+    other_process_view.heartbeat(second["jobId"], "worker-1")
+    requeued = other_process_view.requeue_expired()
+
+    # Assert (검증)
+    assert claimed_first["jobId"] == first["jobId"]
+    assert claimed_second["jobId"] == second["jobId"]
+    assert released is True
+    assert reclaimed["jobId"] == first["jobId"]
+    assert reclaimed["attempts"] == 1
+    assert requeued == 1
+    assert queue.get(second["jobId"])["status"] == JOB_STATUS_QUEUED
+    assert queue.get("../jobs") is None
+    assert queue.get_stats() == {"queued": 1, "running": 1, "completed": 0, "failed": 0}
+
+
+def test_job_queue_backend_must_implement_every_method():
+    """JobQueue 메서드를 빠뜨린 백엔드는 생성 시 TypeError가 나는지 확인"""
+    # Arrange (준비)
+    class IncompleteJobQueue(JobQueue):
+        def enqueue(self, video_id, webhook_url=None):
+            return {}
+
+    # Act & Assert: 메서드가 빠진 백엔드를 생성하면 TypeError 발생해야 함
+    with pytest.raises(TypeError, match="claim_next"):
+        IncompleteJobQueue()
@@ -0,0 +1,73 @@
+"""
+작업 완료 webhook 모듈 테스트
+
+app/services/jobs/webhook.py의 webhook 대상 검사와 전송을 테스트합니다.
+IP 리터럴과 localhost만 사용하므로 외부 DNS/네트워크 없이 실행되며, 전송은 httpx MockTransport로 대체합니다.
+"""
+import httpx
+import pytest
+from app.core.config import settings
+from app.services.jobs import webhook
+from app.services.jobs.webhook import send_job_webhook, validate_webhook_url
+
+
+def test_validate_webhook_url_rejects_internal_addresses(monkeypatch):
+    """루프백/사설/링크 로컬 주소로 연결되는 webhook URL을 거부하는지 확인"""
+    # Arrange (준비): 허용 목록 없음 (DNS 조회 결과로 판단)
+    monkeypatch.setattr(settings, "JOB_WEBHOOK_ALLOWED_HOSTS", [])
+    internal_urls = [
+        "http://localhost:8000/hook",
+        "http://127.0.0.1/hook",
+        "http://10.0.0.5/hook",
+        "http://192.168.1.10/hook",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://[::1]/hook",
+        "http://[::ffff:127.0.0.1]/hook",
+    ]
+
+    # Act & Assert: 모든 내부 주소 거부, 공인 IP는 허용
+    for url in internal_urls:
+        with pytest.raises(ValueError):
+            validate_webhook_url(url)
+    validate_webhook_url("https://93.184.216.34/hook")
+
+
+def test_validate_webhook_url_uses_allowed_hosts(monkeypatch):
+    """허용 호스트 목록이 있으면 목록에 있는 호스트만 허용하는지 확인"""
+    # Arrange (준비)
+    monkeypatch.setattr(settings, "JOB_WEBHOOK_ALLOWED_HOSTS", ["hooks.example.com"])
+
+    # Act & Assert
+    validate_webhook_url("https://Hooks.Example.com/job-done")
+    with pytest.raises(ValueError):
+        validate_webhook_url("https://93.184.216.34/hook")
+
+
+@pytest.mark.asyncio
+async def test_send_job_webhook_blocks_internal_target_and_redirects(monkeypatch):
+    """내부 주소로는 전송하지 않고, 허용된 호스트의 리다이렉트는 따라가지 않는지 확인"""
+    # Arrange (준비): 모든 요청에 내부 주소로 리다이렉트 응답
+    requests = []
+
+    def handler(request):
+        requests.append(str(request.url))
+        return httpx.Response(302, headers={"Location": "http://127.0.0.1/admin"})
+
+    original_client = httpx.AsyncClient
+
+    def fake_client(**kwargs):
+        return original_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(webhook.httpx, "AsyncClient", fake_client)
+    job = {"jobId": "job-1", "status": "completed", "webhookUrl": "http://127.0.0.1/hook"}
+
+    # Act (실행)
+    monkeypatch.setattr(settings, "JOB_WEBHOOK_ALLOWED_HOSTS", [])
+    internal_sent = await send_job_webhook(job)
+    monkeypatch.setattr(settings, "JOB_WEBHOOK_ALLOWED_HOSTS", ["hooks.example.com"])
+    redirected_sent = await send_job_webhook({**job, "webhookUrl": "https://hooks.example.com/hook"})
+
+    # Assert (검증): 내부 주소는 요청 없음, 리다이렉트는 1회 요청 후 실패 처리
+    assert internal_sent is False
+    assert redirected_sent is False
+    assert requests == ["https://hooks.example.com/hook"]
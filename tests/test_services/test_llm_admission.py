@@ -0,0 +1,117 @@
+"""
+KV cache 토큰 예산 모듈 테스트
+
+app/services/llm/admission.py의 가중치 세마포어(예산 초과 시 대기, FIFO, 큰 요청 처리)와
+서버별 예산 분리를 테스트합니다.
+"""
+import asyncio
+import pytest
+from app.services.llm import admission
+from app.services.llm.admission import TokenBudgetSemaphore, get_kv_budget
+from app.core.config import settings
+from app.services.llm.client import VLLMClient
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_until_budget_is_released():
+    """예산을 넘는 요청은 앞선 요청이 예산을 반환할 때까지 대기하는지 확인"""
+    # Arrange (준비)
+    semaphore = TokenBudgetSemaphore(capacity=1000)
+    first = await semaphore.acquire(700)
+
+    # Act (실행)
+    waiting_task = asyncio.create_task(semaphore.acquire(500))
+    await asyncio.sleep(0)
+    blocked = not waiting_task.done()
+    semaphore.release(first)
+    second = await asyncio.wait_for(waiting_task, timeout=1)
+
+    # Assert (검증)
+    assert blocked
+    assert second == 500
+    assert semaphore.get_stats()["in_use"] == 500
+    assert semaphore.get_stats()["queued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_in_fifo_order():
+    """큰 요청이 먼저 기다리고 있으면 뒤에 온 작은 요청이 앞질러 가지 않는지 확인"""
+    # Arrange (준비)
+    semaphore = TokenBudgetSemaphore(capacity=1000)
+    held = await semaphore.acquire(600)
+    admitted_order = []
+
+    async def request(name, weight):
+        acquired = await semaphore.acquire(weight)
+        admitted_order.append(name)
+        return acquired
+
+    # Act (실행): 900 토큰 요청이 먼저 대기, 이후 300 토큰 요청 (예산상 바로 들어갈 수 있음)
+    large_task = asyncio.create_task(request("large", 900))
+    await asyncio.sleep(0)
+    small_task = asyncio.create_task(request("small", 300))
+    await asyncio.sleep(0)
+    order_before_release = list(admitted_order)
+    semaphore.release(held)
+    large_weight = await asyncio.wait_for(large_task, timeout=1)
+    semaphore.release(large_weight)
+    await asyncio.wait_for(small_task, timeout=1)
+
+    # Assert (검증)
+    assert order_before_release == []
+    assert admitted_order == ["large", "small"]
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_is_clamped_to_capacity():
+    """예산보다 큰 요청도 단독으로는 수락되는지 확인"""
+    # Arrange (준비)
+    semaphore = TokenBudgetSemaphore(capacity=1000)
+
+    # Act (실행)
+    async with semaphore.reserve(5000) as acquired:
+        in_use = semaphore.get_stats()["in_use"]
+
+    # Assert (검증)
+    assert acquired == 1000
+    assert in_use == 1000
+    assert semaphore.get_stats()["in_use"] == 0
+
+
+def test_prompt_tokens_are_estimated_per_prompt():
+    """요청 가중치(프롬프트 토큰 + max_tokens x 프롬프트 수)의 기준인 프롬프트 토큰 수와 개수를 추정하는지 확인"""
+    # Arrange (준비)
+    token_id_batch = {"prompt": [[1, 2, 3], [4, 5]], "max_tokens": 100}
+    token_id_single = {"prompt": [1, 2, 3, 4], "max_tokens": 100}
+    chat_payload = {"messages": [{"role": "user", "content": "a" * 40}], "max_tokens": 100}
+
+    # Act & Assert (실행 및 검증)
+    assert VLLMClient._estimate_prompt_tokens(token_id_batch) == (5, 2)
+    assert VLLMClient._estimate_prompt_tokens(token_id_single) == (4, 1)
+    assert VLLMClient._estimate_prompt_tokens(chat_payload) == (10, 1)
+
+
+@pytest.mark.asyncio
+async def test_kv_budget_is_kept_per_server(monkeypatch):
+    """추출 서버의 예산이 가득 차도 다른 상세화 서버로 가는 요청은 기다리지 않는지 확인"""
+    # Arrange (준비): 서버별 예산 (추출 서버는 KV cache가 작음)
+    monkeypatch.setattr(admission, "_KV_BUDGETS", {})
+    monkeypatch.setattr(settings, "LLM_KV_TOKEN_BUDGET", 4000)
+    monkeypatch.setattr(settings, "LLM_KV_TOKEN_BUDGETS", {"http://gpu-extract:8000": 1000})
+    extraction_budget = get_kv_budget("http://gpu-extract:8000")
+    enrichment_budget = get_kv_budget("http://gpu-enrich:8000")
+    await extraction_budget.acquire(1000)
+
+    # Act (실행)
+    extraction_waiter = asyncio.create_task(extraction_budget.acquire(500))
+    enrichment_weight = await asyncio.wait_for(enrichment_budget.acquire(3000), timeout=1)
+    await asyncio.sleep(0)
+
+    # Assert (검증)
+    assert enrichment_weight == 3000
+    assert not extraction_waiter.done()
+    assert extraction_budget.capacity == 1000
+    assert enrichment_budget.capacity == 4000
+    assert get_kv_budget("http://gpu-extract:8000") is extraction_budget
+    extraction_waiter.cancel()
+
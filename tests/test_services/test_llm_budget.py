@@ -0,0 +1,79 @@
+"""
+출력 토큰 예산 모듈 테스트
+
+app/services/llm/budget.py의 요청별 max_tokens 추정 로직과 상세화 요청의 stop sequence 미사용을 테스트합니다.
+"""
+import json
+import pytest
+from app.core.config import settings
+from app.services.llm.client import VLLMClient
+from app.services.llm.utils import enrich_with_retry
+from app.services.llm.budget import (
+    estimate_token_count,
+    estimate_extraction_max_tokens,
+    estimate_enrichment_max_tokens
+)
+
+
+def test_extraction_budget_scales_with_chunk_size():
+    """청크가 클수록 단어 추출 max_tokens가 커지고 상한을 넘지 않는지 확인"""
+    # Arrange (준비)
+    small_chunk = "We need to break the ice." * 4
+    large_chunk = "We need to break the ice." * 1000
+    ratio = settings.LLM_WORD_EXTRACTION_OUTPUT_RATIO
+
+    # Act (실행)
+    small_budget = estimate_extraction_max_tokens(small_chunk, ratio)
+    large_budget = estimate_extraction_max_tokens(large_chunk, ratio)
+
+    # Assert (검증)
+    assert settings.LLM_MIN_OUTPUT_TOKENS <= small_budget < large_budget
+    assert large_budget == settings.LLM_MAX_OUTPUT_TOKENS
+
+
+def test_enrichment_budget_scales_with_item_count():
+    """상세화할 항목 수에 비례하여 max_tokens가 정해지는지 확인"""
+    # Arrange (준비)
+    tokens_per_item = settings.LLM_WORD_ENRICHMENT_TOKENS_PER_ITEM
+
+    # Act (실행)
+    budget = estimate_enrichment_max_tokens(20, tokens_per_item)
+
+    # Assert (검증)
+    assert budget == 20 * tokens_per_item + settings.LLM_OUTPUT_OVERHEAD_TOKENS
+    assert estimate_enrichment_max_tokens(0, tokens_per_item) == settings.LLM_MIN_OUTPUT_TOKENS
+
+
+def test_estimate_token_count_empty_text():
+    """빈 텍스트의 토큰 수는 0인지 확인"""
+    assert estimate_token_count("") == 0
+
+
+@pytest.mark.asyncio
+async def test_enrichment_request_sends_no_stop_sequence(monkeypatch):
+    """들여쓰기 없는 JSON 응답도 끝까지 받도록 상세화 요청에 stop sequence를 보내지 않는지 확인"""
+    # Arrange (준비): 모델이 들여쓰기 없이 줄바꿈한 JSON을 반환
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SHARDING", False)
+    request_kwargs = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        request_kwargs.append(kwargs)
+        content = '{\n"result": {\n"decision": {\n"예문": "A decision."\n}\n}\n}'
+        return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    extraction_result = {"videoId": "vid", "result": {"decision": {"품사": "n"}}}
+
+    # Act (실행)
+    result = await enrich_with_retry(
+        extraction_result,
+        video_id="vid",
+        process_name="Word Enrichment",
+        prompt_versions=[("v1", lambda items, video_id: json.dumps(items))],
+        tokens_per_item=settings.LLM_WORD_ENRICHMENT_TOKENS_PER_ITEM
+    )
+
+    # Assert (검증)
+    assert request_kwargs[0].get("stop") is None
+    assert result["result"]["decision"]["예문"] == "A decision."
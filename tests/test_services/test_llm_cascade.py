@@ -0,0 +1,101 @@
+"""
+작은 모델 → 큰 모델 cascade 모듈 테스트
+
+app/services/llm/cascade.py의 커버리지 휴리스틱과 에스컬레이션 통계,
+1단계 추출의 cascade 동작(실제 서버 대신 chat_completion 대체)을 테스트합니다.
+"""
+import json
+import pytest
+from app.core.config import settings
+from app.services.llm import utils
+from app.services.llm.client import VLLMClient
+from app.services.llm.cascade import (
+    CascadeTracker,
+    meets_extraction_coverage,
+    meets_enrichment_coverage,
+    ESCALATION_LOW_COVERAGE,
+    ESCALATION_INVALID_OUTPUT
+)
+
+
+def test_extraction_coverage_scales_with_chunk_size():
+    """청크 토큰 수 대비 추출 항목 수가 기준 이상인지로 판단하는지 확인"""
+    # Arrange (준비): 약 1,000토큰 청크 (문자 4개 ≈ 1토큰)
+    chunk_text = "word " * 800
+    few_words = {f"word{i}": {} for i in range(5)}
+    enough_words = {f"word{i}": {} for i in range(25)}
+
+    # Act & Assert (실행 및 검증)
+    assert not meets_extraction_coverage(few_words, chunk_text, min_items_per_1k_tokens=20)
+    assert meets_extraction_coverage(enough_words, chunk_text, min_items_per_1k_tokens=20)
+    assert meets_extraction_coverage({}, chunk_text, min_items_per_1k_tokens=0)
+
+
+def test_enrichment_coverage_counts_input_items():
+    """상세화 결과에 포함된 입력 항목 비율로 판단하는지 확인"""
+    # Arrange (준비)
+    input_items = {"alpha": {}, "beta": {}, "gamma": {}, "delta": {}}
+    partial = {"alpha": {}, "beta": {}, "gamma": {}, "unrelated": {}}
+
+    # Act & Assert (실행 및 검증): 4개 중 3개 포함 = 0.75
+    assert meets_enrichment_coverage(partial, input_items, min_coverage=0.75)
+    assert not meets_enrichment_coverage(partial, input_items, min_coverage=0.9)
+
+
+def test_tracker_reports_escalation_rate_and_savings():
+    """단계별 에스컬레이션 비율, 사유별 횟수, 추정 절약 시간을 계산하는지 확인"""
+    # Arrange (준비)
+    tracker = CascadeTracker()
+
+    # Act (실행): 4건 중 1건만 큰 모델로 에스컬레이션 (작은 모델 0.1초, 큰 모델 1초)
+    for _ in range(3):
+        tracker.record("Word Extraction", None, small_seconds=0.1)
+    tracker.record("Word Extraction", ESCALATION_LOW_COVERAGE, small_seconds=0.1, large_seconds=1.0)
+    tracker.record("Word Enrichment", ESCALATION_INVALID_OUTPUT, small_seconds=0.5, large_seconds=2.0)
+    stats = tracker.get_stats()
+
+    # Assert (검증): 큰 모델만 썼다면 4초, 실제 1.4초 → 2.6초 절약
+    word_stats = stats["Word Extraction"]
+    assert word_stats["escalation_rate"] == 0.25
+    assert word_stats["reasons"] == {ESCALATION_LOW_COVERAGE: 1}
+    assert word_stats["estimated_saved_ms"] == 2600.0
+    assert stats["Word Enrichment"]["escalation_rate"] == 1.0
+    assert stats["Word Enrichment"]["estimated_saved_ms"] == -500.0
+
+
+@pytest.mark.asyncio
+async def test_extraction_escalates_only_low_coverage_chunks(monkeypatch):
+    """작은 모델 결과가 커버리지 기준에 못 미치는 청크만 큰 모델로 다시 요청하는지 확인"""
+    # Arrange (준비): 작은 모델은 "short" 청크만 충분히 추출, 큰 모델은 항상 충분히 추출
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_STAGE1_BATCH_MODE", False)
+    tracker = CascadeTracker()
+    monkeypatch.setattr(utils, "get_cascade_tracker", lambda: tracker)
+    called_models = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        called_models.append(self.model)
+        is_long_chunk = "long chunk" in messages[0]["content"]
+        word_count = 1 if self.model == settings.LLM_CASCADE_SMALL_MODEL and is_long_chunk else 30
+        result = {f"word{i}": {"품사": "n", "뜻": ["뜻"]} for i in range(word_count)}
+        return {"choices": [{"message": {"content": json.dumps({"result": result})}}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+
+    # Act (실행)
+    result = await utils.extract_from_chunks(
+        chunk_texts=["short chunk " * 10, "long chunk " * 400],
+        video_id="vid1",
+        process_name="Word Extraction",
+        get_prompt_func=lambda chunk_text, video_id: chunk_text,
+        merge_results_func=lambda combined, chunk_result: combined.update(chunk_result),
+        min_items_per_1k_tokens=20
+    )
+
+    # Assert (검증): 작은 모델 2회 + 에스컬레이션 1회
+    stats = tracker.get_stats()["Word Extraction"]
+    assert called_models.count(settings.LLM_CASCADE_SMALL_MODEL) == 2
+    assert len(called_models) == 3
+    assert stats["escalations"] == 1
+    assert stats["reasons"] == {ESCALATION_LOW_COVERAGE: 1}
+    assert len(result["result"]) == 30
@@ -0,0 +1,59 @@
+"""
+1단계 청크 선택 모듈 테스트
+
+app/services/llm/chunk_selection.py의 어휘 커버리지 기반 탐욕 선택, 결정성, 토큰 예산을 테스트합니다.
+"""
+from app.services.llm.chunk_selection import select_chunks_by_coverage
+
+
+def _chunks() -> list:
+    repeated = "the team said that the plan is good and the team is happy " * 3
+    return [
+        repeated,
+        "the committee deliberated over the controversial amendment before reaching consensus",
+        repeated,
+        "the team is happy and the plan is good",
+        "engineers benchmarked throughput latency and scalability of the distributed prototype",
+        repeated,
+    ]
+
+
+def test_selection_prefers_novel_vocabulary():
+    """반복되는 청크보다 새로운 어휘가 많은 청크를 먼저 선택하는지 확인"""
+    # Arrange (준비)
+    chunk_texts = _chunks()
+
+    # Act (실행)
+    selection = select_chunks_by_coverage(chunk_texts, "video123", max_chunks=3)
+
+    # Assert (검증): 어휘가 풍부한 1, 4번 청크 포함, 선택 결과는 원래 순서 유지
+    assert {1, 4} <= set(selection["indices"])
+    assert selection["indices"] == sorted(selection["indices"])
+    assert selection["chunks"] == [chunk_texts[idx] for idx in selection["indices"]]
+    assert 0 < selection["coverage"] <= 1
+
+
+def test_selection_is_deterministic_per_video_id():
+    """같은 비디오 ID는 항상 같은 청크를 선택하는지 확인 (동점 청크 포함)"""
+    # Arrange (준비): 모든 청크가 같은 어휘 → 선택은 seed 우선순위로만 결정
+    chunk_texts = [f"same words in every chunk number {'x' * (idx + 2)}" for idx in range(12)]
+
+    # Act (실행)
+    first = select_chunks_by_coverage(chunk_texts, "video-a", max_chunks=4)
+    second = select_chunks_by_coverage(chunk_texts, "video-a", max_chunks=4)
+
+    # Assert (검증)
+    assert first == second
+    assert len(first["indices"]) == 4
+
+
+def test_selection_respects_token_budget():
+    """선택한 청크의 토큰 합이 예산을 넘지 않는지 확인"""
+    # Arrange (준비): 청크당 약 25토큰 (100자)
+    chunk_texts = [f"{'word' + str(idx)} " * 17 for idx in range(8)]
+
+    # Act (실행)
+    selection = select_chunks_by_coverage(chunk_texts, "video", max_chunks=8, max_tokens=60)
+
+    # Assert (검증)
+    assert len(selection["indices"]) == 2
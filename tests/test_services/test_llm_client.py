@@ -0,0 +1,97 @@
+"""
+vLLM 클라이언트 모듈 테스트
+
+app/services/llm/client.py의 배치 요청(/v1/completions) 역다중화와 배치 호출의 지연 시간 모델 제외를 테스트합니다.
+실제 서버 대신 요청 전송 메서드를 대체하여 응답 구조만 검증합니다.
+"""
+import pytest
+from app.services.llm import client as client_module
+from app.services.llm.client import VLLMClient
+from app.services.llm.latency import LatencyModel
+
+
+@pytest.mark.asyncio
+async def test_completion_batch_demultiplexes_choices(monkeypatch):
+    """순서가 섞인 choices를 프롬프트 index 순서로 되돌려 chat 응답 형식으로 반환하는지 확인"""
+    # Arrange (준비): chat template 렌더링과 HTTP 전송을 대체
+    sent_payloads = []
+
+    async def fake_post_with_retry(self, endpoint, payload, route_key=None):
+        sent_payloads.append((endpoint, payload))
+        return {
+            "choices": [
+                {"index": 1, "text": '{"result": {"b": 1}}', "finish_reason": "stop"},
+                {"index": 0, "text": '{"result": {"a": 1}}', "finish_reason": "length"},
+            ]
+        }
+
+    monkeypatch.setattr(client_module, "render_chat_prompt", lambda messages: f"<user>{messages[0]['content']}")
+    monkeypatch.setattr(VLLMClient, "_post_with_retry", fake_post_with_retry)
+    messages_list = [
+        [{"role": "user", "content": "chunk 1"}],
+        [{"role": "user", "content": "chunk 2"}],
+        [{"role": "user", "content": "chunk 3"}],
+    ]
+
+    # Act (실행)
+    async with VLLMClient() as client:
+        responses = await client.completion_batch(messages_list, max_tokens=512)
+        first_content = await client.extract_content_from_response(responses[0])
+
+    # Assert (검증)
+    endpoint, payload = sent_payloads[0]
+    assert endpoint == client.completions_endpoint
+    assert payload["prompt"] == ["<user>chunk 1", "<user>chunk 2", "<user>chunk 3"]
+    assert first_content == '{"result": {"a": 1}}'
+    assert responses[0]["choices"][0]["finish_reason"] == "length"
+    assert responses[1]["choices"][0]["message"]["content"] == '{"result": {"b": 1}}'
+    assert responses[2]["choices"] == []
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_sends_prompt_token_ids(monkeypatch):
+    """토큰 ID가 주어지면 /v1/completions로 전송하고 chat 응답 형식으로 변환하는지 확인"""
+    # Arrange (준비)
+    sent_payloads = []
+
+    async def fake_post_with_retry(self, endpoint, payload, route_key=None):
+        sent_payloads.append((endpoint, payload))
+        return {
+            "choices": [{"index": 0, "text": '{"result": {}}', "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 5}
+        }
+
+    monkeypatch.setattr(VLLMClient, "_post_with_retry", fake_post_with_retry)
+
+    # Act (실행)
+    async with VLLMClient() as client:
+        response = await client.chat_completion(
+            [{"role": "user", "content": "chunk"}], max_tokens=64, prompt_token_ids=[101, 102, 103]
+        )
+        content = await client.extract_content_from_response(response)
+
+    # Assert (검증)
+    endpoint, payload = sent_payloads[0]
+    assert endpoint == client.completions_endpoint
+    assert payload["prompt"] == [101, 102, 103]
+    assert "messages" not in payload
+    assert content == '{"result": {}}'
+    assert response["usage"]["prompt_tokens"] == 3
+
+
+def test_batched_calls_do_not_update_latency_model():
+    """배치 호출은 소요 시간이 합산 토큰 수에 비례하지 않으므로 지연 시간 모델에 반영하지 않는지 확인"""
+    # Arrange (준비)
+    client = VLLMClient()
+    client.latency_model = LatencyModel()
+    usage = {"prompt_tokens": 400, "completion_tokens": 800}
+
+    # Act (실행)
+    client._observe_latency(usage, 400, 4, 3.0)
+    batched_observations = client.latency_model.observations
+    client._observe_latency(usage, 400, 1, 3.0)
+
+    # Assert (검증)
+    assert batched_observations == 0
+    assert client.latency_model.observations == 1
+    assert client._get_timeout(400, 800, prompt_count=4) == client.timeout
@@ -0,0 +1,62 @@
+"""
+잘린 응답 이어받기 모듈 테스트
+
+app/services/llm/continuation.py의 항목 복구와 enrich_with_retry의 후속 요청을 테스트합니다.
+실제 서버 대신 chat_completion을 대체하여 요청 내용과 결과 병합만 검증합니다.
+"""
+import json
+import pytest
+from app.services.llm.client import VLLMClient
+from app.services.llm.continuation import recover_complete_entries
+from app.services.llm.utils import enrich_with_retry
+
+
+def _chat_response(content: str, finish_reason: str) -> dict:
+    return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": finish_reason}]}
+
+
+def test_recover_complete_entries_drops_cut_off_entry():
+    """잘린 JSON에서 값이 닫힌 항목만 복구하는지 확인"""
+    # Arrange (준비)
+    truncated = '{\n  "result": {\n    "apple": {"동의어": ["fruit"], "예문": "An apple."},\n    "run": {"동의어": ["spr'
+
+    # Act (실행)
+    recovered = recover_complete_entries(truncated)
+    complete = recover_complete_entries('{"result": {"a": 1, "b": {"c": [1, 2]}}}')
+    missing = recover_complete_entries('{"resu')
+
+    # Assert (검증)
+    assert recovered == {"apple": {"동의어": ["fruit"], "예문": "An apple."}}
+    assert complete == {"a": 1, "b": {"c": [1, 2]}}
+    assert missing == {}
+
+
+@pytest.mark.asyncio
+async def test_truncated_enrichment_requests_only_missing_items(monkeypatch):
+    """잘린 응답이면 전체 재시도 대신 누락 항목만 후속 요청하고 결과를 합치는지 확인"""
+    # Arrange (준비)
+    requested_items = []
+    responses = [
+        _chat_response('{"result": {"apple": {"예문": "An apple."}, "run": {"예', "length"),
+        _chat_response('{"result": {"run": {"예문": "Run."}, "jump": {"예문": "Jump."}}}', "stop"),
+    ]
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        requested_items.append(json.loads(messages[0]["content"]))
+        return responses.pop(0)
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    extraction_result = {"videoId": "vid", "result": {"apple": "사과", "run": "달리다", "jump": "뛰다"}}
+
+    # Act (실행)
+    result = await enrich_with_retry(
+        extraction_result,
+        video_id="vid",
+        process_name="Word Enrichment",
+        prompt_versions=[("v1", lambda items, video_id: json.dumps(items, ensure_ascii=False))]
+    )
+
+    # Assert (검증)
+    assert len(requested_items) == 2
+    assert requested_items[1] == {"run": "달리다", "jump": "뛰다"}
+    assert set(result["result"]) == {"apple", "run", "jump"}
@@ -0,0 +1,54 @@
+"""
+단어 + 숙어 통합 추출 모듈 테스트
+
+app/services/llm/extract_vocabulary.py의 통합 추출 결과 분리와 병합을 테스트합니다.
+실제 서버 대신 chat_completion을 대체하여 요청 수와 결과 형식만 검증합니다.
+"""
+import json
+import pytest
+from app.services.llm.client import VLLMClient
+from app.services.llm.extract_vocabulary import extract_vocabulary_from_chunks, _count_fused_items
+
+
+@pytest.mark.asyncio
+async def test_fused_extraction_splits_words_and_phrases(monkeypatch):
+    """청크당 요청 1건의 결과를 분리 모드와 같은 단어/숙어 결과 형식으로 병합하는지 확인"""
+    # Arrange (준비)
+    chunk_responses = {
+        "chunk 1": {"words": {"Run": {"품사": "v", "뜻": ["달리다"]}}, "phrases": {"Give up": "포기하다"}},
+        "chunk 2": {"words": {"run": {"품사": "v", "뜻": ["운영하다"]}, "apple": {"품사": "n", "뜻": ["사과"]}}},
+    }
+    requests = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        prompt = messages[0]["content"]
+        requests.append(kwargs["route_key"])
+        chunk_text = prompt.rsplit("텍스트:\n", 1)[1].strip()
+        content = json.dumps({"videoId": "vid", "result": chunk_responses[chunk_text]}, ensure_ascii=False)
+        return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+
+    # Act (실행)
+    word_result, phrase_result = await extract_vocabulary_from_chunks(["chunk 1", "chunk 2"], "vid")
+
+    # Assert (검증): 청크당 요청 1건, 기존 병합 함수의 소문자 정규화와 뜻 병합 유지
+    assert requests == ["Fused Extraction:v1", "Fused Extraction:v1"]
+    assert word_result == {
+        "videoId": "vid",
+        "result": {
+            "run": {"품사": "v", "뜻": ["달리다", "운영하다"]},
+            "apple": {"품사": "n", "뜻": ["사과"]}
+        }
+    }
+    assert phrase_result == {"videoId": "vid", "result": {"give up": "포기하다"}}
+
+
+def test_count_fused_items_sums_both_sections():
+    """cascade 커버리지 판단에 단어 수와 숙어 수를 합산하는지 확인"""
+    # Arrange (준비)
+    result = {"words": {"a": {}, "b": {}}, "phrases": {"c d": "뜻"}}
+
+    # Act & Assert (실행 및 검증)
+    assert _count_fused_items(result) == 3
+    assert _count_fused_items({"words": None}) == 0
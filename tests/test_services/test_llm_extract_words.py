@@ -4,7 +4,7 @@
 app/services/llm/extract_words.py의 단어 추출 기능을 테스트합니다.
 """
 import pytest
-from app.services.llm.extract_words import extract_words_from_chunks
+from app.services.llm.extract_words import extract_words_from_chunks, fold_word_inflections
 
 
 # ============================================================================
@@ -227,3 +227,66 @@ async def test_extract_words_result_structure(
         print(f"  전체 데이터: {last_word_data}")
     print("="*80 + "\n")
 
+
+# ============================================================================
+# 원형 기준 병합 테스트
+# ============================================================================
+
+def test_fold_word_inflections_merges_into_lemma():
+    """변화형 항목을 원형 항목으로 합치고 뜻을 중복 없이 모으며, 합친 항목 수를 반환하는지 확인
+    
+    테스트 대상:
+        - app/services/llm/extract_words.py의 fold_word_inflections 함수
+        
+    검증 내용:
+        - "running", "ran", "runs"(동사)가 "run"으로 합쳐짐
+        - 품사가 맞지 않는 변화(형용사 "left", 명사 "building")는 합치지 않음
+    """
+    # Arrange (준비)
+    words_dict = {
+        "running": {"품사": "v", "뜻": ["달리다"]},
+        "ran": {"품사": "v", "뜻": ["운영하다"]},
+        "runs": {"품사": "v", "뜻": ["달리다"]},
+        "left": {"품사": "adj", "뜻": ["왼쪽의"]},
+        "building": {"품사": "n", "뜻": ["건물"]},
+    }
+
+    # Act (실행)
+    folded, folded_count = fold_word_inflections(words_dict)
+
+    # Assert (검증)
+    assert folded == {
+        "run": {"품사": "v", "뜻": ["달리다", "운영하다"]},
+        "left": {"품사": "adj", "뜻": ["왼쪽의"]},
+        "building": {"품사": "n", "뜻": ["건물"]},
+    }
+    assert folded_count == 3
+
+
+def test_fold_word_inflections_keeps_correct_lemmas():
+    """이미 원형인 단어를 접미사 규칙으로 잘못 줄이지 않고, 같은 결과의 원형 항목으로만 합치는지 확인
+    
+    테스트 대상:
+        - app/services/llm/extract_words.py의 fold_word_inflections 함수
+        
+    검증 내용:
+        - "physics", "species", "embed", "shed" 등은 "physic", "specy", "emb", "she"로 바뀌지 않음
+        - 빈도 순위표에 없는 원형("box")도 같은 결과에 있으면 변화형("boxes")을 합침
+    """
+    # Arrange (준비)
+    lemmas = [
+        "physics", "species", "bias", "chaos", "lens",
+        "economics", "embed", "proceed", "succeed", "shed"
+    ]
+    verbs = ("embed", "proceed", "succeed", "shed")
+    words_dict = {word: {"품사": "v" if word in verbs else "n", "뜻": ["뜻"]} for word in lemmas}
+    words_dict["boxes"] = {"품사": "n", "뜻": ["상자들"]}
+    words_dict["box"] = {"품사": "n", "뜻": ["상자"]}
+
+    # Act (실행)
+    folded, folded_count = fold_word_inflections(words_dict)
+
+    # Assert (검증)
+    assert list(folded) == lemmas + ["box"]
+    assert folded["box"] == {"품사": "n", "뜻": ["상자들", "상자"]}
+    assert folded_count == 1
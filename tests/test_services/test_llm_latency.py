@@ -0,0 +1,74 @@
+"""
+지연 시간 모델 모듈 테스트
+
+app/services/llm/latency.py의 선형 모델 적합, 적응형 타임아웃 계산을 테스트합니다.
+"""
+from app.services.llm.latency import LatencyModel
+
+
+def _timeout(model: LatencyModel, input_tokens: int, output_tokens: int) -> float:
+    return model.timeout_for(
+        input_tokens, output_tokens, default_timeout=60.0,
+        percentile=99, safety_factor=1.5, min_timeout=5.0, max_timeout=180.0
+    )
+
+
+def _fitted_model() -> LatencyModel:
+    """소요 시간 = 0.2 + 0.0005 x 입력 토큰 + 0.02 x 출력 토큰 관측치로 적합한 모델"""
+    model = LatencyModel(min_samples=10)
+    for i in range(40):
+        input_tokens = 500 + 50 * (i % 8)
+        output_tokens = 100 + 60 * (i % 5)
+        model.observe(input_tokens, output_tokens, 0.2 + 0.0005 * input_tokens + 0.02 * output_tokens)
+    return model
+
+
+def test_fit_recovers_linear_coefficients():
+    """관측치로부터 절편과 입력/출력 토큰당 소요 시간을 추정하는지 확인"""
+    # Arrange (준비)
+    model = _fitted_model()
+
+    # Act (실행)
+    params = model.get_params()
+
+    # Assert (검증)
+    assert params["fitted"] is True
+    assert abs(params["intercept_seconds"] - 0.2) < 1e-3
+    assert abs(params["seconds_per_input_token"] - 0.0005) < 1e-6
+    assert abs(params["seconds_per_output_token"] - 0.02) < 1e-4
+    assert params["p99_residual_ratio"] == 1.0
+
+
+def test_timeout_scales_with_expected_output_size():
+    """예상 출력 크기가 클수록 타임아웃이 길어지고 하한/상한으로 제한되는지 확인"""
+    # Arrange (준비)
+    model = _fitted_model()
+
+    # Act (실행)
+    small = _timeout(model, 600, 100)
+    medium = _timeout(model, 600, 1000)
+    huge = _timeout(model, 600, 20000)
+
+    # Assert (검증): 출력 100토큰 예측 ≈ 2.5초 → 하한 5초, 출력 1000토큰 ≈ 20.5초 x 1.5
+    assert small == 5.0
+    assert abs(medium - (0.2 + 0.3 + 20.0) * 1.5) < 0.1
+    assert huge == 180.0
+
+
+def test_default_timeout_until_enough_samples():
+    """관측치가 min_samples보다 적으면 고정 타임아웃을 사용하는지 확인"""
+    # Arrange (준비)
+    model = LatencyModel(min_samples=20)
+    for _ in range(5):
+        model.observe(500, 200, 4.0)
+    model.record_timeout()
+
+    # Act (실행)
+    timeout = _timeout(model, 500, 200)
+    params = model.get_params()
+
+    # Assert (검증)
+    assert timeout == 60.0
+    assert params["fitted"] is False
+    assert params["samples"] == 5
+    assert params["timeouts"] == 1
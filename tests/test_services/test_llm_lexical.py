@@ -0,0 +1,118 @@
+"""
+로컬 어휘 분석 모듈 테스트
+
+app/services/llm/lexical.py의 원형 복원, 품사 추정, 후보 단어 추출과
+로컬 후보 추출 모드의 단어 뜻 요청(extract_words_from_chunks)을 테스트합니다.
+실제 서버 대신 chat_completion을 대체하여 요청 내용과 결과 형식만 검증합니다.
+"""
+import json
+import pytest
+from app.core.config import settings
+from app.services.llm.client import VLLMClient
+from app.services.llm.extract_words import extract_words_from_chunks
+from app.services.llm import lexical
+from app.services.llm.lexical import extract_candidates, guess_pos, lemmatize
+
+
+def _use_dictionary(monkeypatch, tmp_path, words):
+    """추가 원형 사전 파일을 만들고 다음 조회 때 다시 로드되도록 설정합니다."""
+    path = tmp_path / "dictionary.txt"
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    monkeypatch.setattr(settings, "LLM_LEXICAL_DICTIONARY_PATH", str(path))
+    monkeypatch.setattr(lexical, "_DICTIONARY_WORDS", None)
+
+
+def test_lemmatize_inflected_forms(monkeypatch, tmp_path):
+    """불규칙 변화형과 규칙 변화형을 원형으로 복원하는지 확인"""
+    # Arrange (준비): 빈도 순위표에 없는 "box"는 추가 원형 사전으로 알려줌
+    _use_dictionary(monkeypatch, tmp_path, ["box"])
+    forms = ["ran", "running", "studies", "making", "using", "boxes", "stopped", "evening"]
+
+    # Act (실행)
+    lemmas = [lemmatize(form) for form in forms]
+
+    # Assert (검증): "evening"처럼 원형 자체가 -ing로 끝나는 단어는 유지
+    assert lemmas == ["run", "run", "study", "make", "use", "box", "stop", "evening"]
+
+
+def test_lemmatize_keeps_surface_form_when_rule_lemma_is_unknown(monkeypatch, tmp_path):
+    """접미사 규칙으로 만든 원형이 알려진 단어가 아니면 텍스트의 형태를 그대로 두는지 확인"""
+    # Arrange (준비): 추가 원형 사전 없음
+    monkeypatch.setattr(settings, "LLM_LEXICAL_DICTIONARY_PATH", "")
+    monkeypatch.setattr(lexical, "_DICTIONARY_WORDS", None)
+    forms = ["goes", "focuses", "buses", "physics", "shed", "seed"]
+
+    # Act (실행)
+    lemmas = [lemmatize(form) for form in forms]
+    candidates = extract_candidates("The buses were running late. She studies physics")
+
+    # Assert (검증): "buse", "physic", "goe", "focuse", 기능어 "she", "see" 같은 원형을 만들지 않음
+    assert lemmas == ["go", "focus", "buses", "physics", "shed", "seed"]
+    assert set(candidates) == {"buses", "run", "late", "study", "physics"}
+
+
+def test_lemmatize_uses_dictionary_for_rule_lemmas(monkeypatch, tmp_path):
+    """추가 원형 사전에 있는 단어는 접미사 규칙의 원형으로 받아들이는지 확인"""
+    # Arrange (준비)
+    _use_dictionary(monkeypatch, tmp_path, ["bus"])
+
+    # Act (실행)
+    lemma = lemmatize("buses")
+
+    # Assert (검증)
+    assert lemma == "bus"
+
+
+def test_extract_candidates_skips_function_words_and_names(monkeypatch, tmp_path):
+    """기능어와 고유명사를 제외하고 원형과 추정 품사를 처음 등장 순서로 반환하는지 확인"""
+    # Arrange (준비)
+    _use_dictionary(monkeypatch, tmp_path, ["box"])
+    chunk_text = "Then Sarah opened the boxes. We decided to celebrate, and it was really beautiful!"
+
+    # Act (실행)
+    candidates = extract_candidates(chunk_text)
+
+    # Assert (검증)
+    assert candidates == {
+        "open": "v",
+        "box": "n",
+        "decide": "v",
+        "celebrate": "v",
+        "really": "adv",
+        "beautiful": "adj"
+    }
+    assert guess_pos("happiness", "happiness") == "n"
+
+
+@pytest.mark.asyncio
+async def test_local_candidates_mode_requests_meanings_only(monkeypatch, tmp_path):
+    """후보 목록을 프롬프트에 담고, 간결한 뜻 응답을 후보 단어만 남긴 1단계 결과 형식으로 변환하는지 확인"""
+    # Arrange (준비): 모델이 후보에 없는 단어("sarah")를 섞어 응답
+    prompts = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        prompts.append((messages[0]["content"], kwargs["route_key"]))
+        content = json.dumps(
+            {"videoId": "vid", "result": {"open": ["열다"], "Box": "상자", "sarah": ["사라"]}},
+            ensure_ascii=False
+        )
+        return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    monkeypatch.setattr(settings, "LLM_STAGE1_LOCAL_CANDIDATES", True)
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_STAGE1_BATCH_MODE", False)
+    _use_dictionary(monkeypatch, tmp_path, ["box"])
+
+    # Act (실행)
+    result = await extract_words_from_chunks(["Then Sarah opened the boxes.", "the of and"], "vid")
+
+    # Assert (검증): 후보가 없는 두 번째 청크는 요청하지 않음
+    assert len(prompts) == 1
+    prompt, route_key = prompts[0]
+    assert route_key == "Word Meaning:v1"
+    assert prompt.endswith("단어 목록:\n- open (v)\n- box (n)\n")
+    assert result == {
+        "videoId": "vid",
+        "result": {"open": {"품사": "v", "뜻": ["열다"]}, "box": {"품사": "n", "뜻": ["상자"]}}
+    }
@@ -0,0 +1,145 @@
+"""
+영상 간 공유 lexicon 캐시 모듈 테스트
+
+app/services/llm/lexicon.py의 조회/저장, LRU 제거, 내보내기/가져오기, 스레드 간 동시 사용과
+enrich_with_retry의 캐시 적중 항목 제외 및 merge_results 병합, 비활성화 시 라우트 동작을 테스트합니다.
+"""
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from app.core.config import settings
+from app.services.llm import lexicon as lexicon_module
+from app.services.llm.client import VLLMClient
+from app.services.llm.lexicon import LexiconCache
+from app.services.llm.merge_results import merge_results
+from app.services.llm.utils import enrich_with_retry
+from app.models.schemas import LexiconEntry
+from app.routes.llm import get_list_lexicon_entries, post_import_lexicon_entries
+
+
+def test_lookup_tracks_hit_rate_and_evicts_lru():
+    """(원형, 품사, 프롬프트 버전) 키로 조회하고, 용량 초과 시 가장 오래 사용되지 않은 항목을 제거하는지 확인"""
+    # Arrange (준비)
+    cache = LexiconCache(":memory:", max_entries=2)
+    cache.put_many([
+        ("decision", "n", "Word Enrichment:v1", {"예문": "A decision."}),
+        ("run", "v", "Word Enrichment:v1", {"예문": "Run."}),
+    ])
+
+    # Act (실행): decision만 조회해 최근 사용으로 갱신한 뒤 새 항목 저장
+    found = cache.get_many([("decision", "n"), ("decision", "v")], ["Word Enrichment:v1"])
+    cache.put_many([("jump", "v", "Word Enrichment:v1", {"예문": "Jump."})])
+    remaining = {entry["lemma"] for entry in cache.export_entries()}
+    stats = cache.get_stats()
+
+    # Assert (검증): 품사가 다르면 다른 키, run이 LRU로 제거됨
+    assert found == {("decision", "n"): {"예문": "A decision."}}
+    assert stats["hit_rate"] == 0.5
+    assert remaining == {"decision", "jump"}
+    assert stats["evicted"] == 1
+
+
+def test_export_and_import_between_nodes():
+    """내보낸 항목을 다른 캐시로 가져와 같은 결과를 조회할 수 있는지 확인"""
+    # Arrange (준비)
+    source = LexiconCache(":memory:", max_entries=100)
+    source.put_many([
+        ("decision", "n", "Word Enrichment:v1", {"동의어": ["choice"], "예문": "A decision."}),
+        ("give up", "", "Phrase Enrichment:v1", {"예문": "Never give up."}),
+    ])
+    target = LexiconCache(":memory:", max_entries=100)
+
+    # Act (실행)
+    imported = target.import_entries(json.loads(json.dumps(source.export_entries())))
+    word_entries = target.export_entries("Word Enrichment:v1")
+
+    # Assert (검증)
+    assert imported == 2
+    assert word_entries == [{
+        "lemma": "decision", "pos": "n", "prompt_version": "Word Enrichment:v1",
+        "data": {"동의어": ["choice"], "예문": "A decision."}
+    }]
+
+
+@pytest.mark.asyncio
+async def test_enrichment_sends_only_misses_and_merges_hits(monkeypatch):
+    """캐시 적중 항목은 LLM에 보내지 않고, merge_results에서 적중 항목과 LLM 결과를 함께 병합하는지 확인"""
+    # Arrange (준비)
+    cache = LexiconCache(":memory:", max_entries=100)
+    cache.put_many([("decision", "n", "Word Enrichment:v7", {"동의어": ["choice"], "예문": "A decision."})])
+    monkeypatch.setattr(lexicon_module, "_LEXICON", cache)
+    monkeypatch.setattr(settings, "LLM_LEXICON_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", False)
+    requested_items = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        items = json.loads(messages[0]["content"])
+        requested_items.append(sorted(items))
+        content = json.dumps({"result": {item: {"동의어": [], "예문": item} for item in items}})
+        return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    word_extraction_result = {
+        "videoId": "vid",
+        "result": {"decision": {"품사": "n", "뜻": ["결정"]}, "technology": {"품사": "n", "뜻": ["기술"]}}
+    }
+    prompt_func = lambda items, video_id: json.dumps(items, ensure_ascii=False)
+
+    # Act (실행)
+    word_enrichment_result = await enrich_with_retry(
+        word_extraction_result, "vid", "Word Enrichment", [("v1", prompt_func), ("v7", prompt_func)]
+    )
+    final_result = merge_results(
+        word_extraction_result, {"result": {}}, word_enrichment_result, {"result": {}}, "vid"
+    )
+
+    # Assert (검증): technology만 요청, 결과는 캐시에 저장
+    assert requested_items == [["technology"]]
+    assert [entry["example"] for entry in final_result["words"]] == ["A decision.", "technology"]
+    assert cache.get_many([("technology", "n")], ["Word Enrichment:v1"]) == {
+        ("technology", "n"): {"동의어": [], "예문": "technology"}
+    }
+
+
+def test_concurrent_lookups_and_imports_from_threads():
+    """이벤트 루프와 스레드풀에서 같은 연결을 동시에 써도 저장/조회가 섞이지 않는지 확인"""
+    # Arrange (준비)
+    cache = LexiconCache(":memory:", max_entries=10000)
+    version = "Word Enrichment:v1"
+
+    def import_and_lookup(worker: int) -> int:
+        cache.import_entries(
+            {"lemma": f"word{worker}_{i}", "pos": "n", "prompt_version": version, "data": {"예문": "x"}}
+            for i in range(50)
+        )
+        return len(cache.get_many([(f"word{worker}_{i}", "n") for i in range(50)], [version]))
+
+    # Act (실행)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        found_counts = list(executor.map(import_and_lookup, range(8)))
+
+    # Assert (검증)
+    assert found_counts == [50] * 8
+    assert cache.get_stats()["entries"] == 400
+
+
+def test_lexicon_routes_do_not_create_cache_when_disabled(monkeypatch, tmp_path):
+    """lexicon 캐시가 꺼져 있으면 내보내기/가져오기 라우트가 404를 반환하고 캐시 파일을 만들지 않는지 확인"""
+    # Arrange (준비)
+    cache_path = tmp_path / "lexicon.sqlite3"
+    monkeypatch.setattr(settings, "LLM_LEXICON_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_LEXICON_PATH", str(cache_path))
+    monkeypatch.setattr(lexicon_module, "_LEXICON", None)
+    entry = LexiconEntry(lemma="decision", pos="n", prompt_version="Word Enrichment:v1", data={"예문": "x"})
+
+    # Act (실행)
+    with pytest.raises(HTTPException) as export_error:
+        get_list_lexicon_entries()
+    with pytest.raises(HTTPException) as import_error:
+        post_import_lexicon_entries([entry])
+
+    # Assert (검증)
+    assert export_error.value.status_code == 404
+    assert import_error.value.status_code == 404
+    assert not cache_path.exists()
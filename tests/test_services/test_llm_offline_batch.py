@@ -0,0 +1,65 @@
+"""
+오프라인 JSONL 배치 모듈 테스트
+
+app/services/llm/offline_batch.py의 요청 파일 작성(OpenAI batch 형식), 로컬 대체 실행기,
+결과 파일 수집을 테스트합니다. 실제 서버 대신 chat_completion을 대체합니다.
+"""
+import json
+import pytest
+from app.services.llm import offline_batch
+from app.services.llm.client import VLLMClient
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_stage1_requests_follow_openai_batch_format(tmp_path):
+    """영상 x 청크 x (단어, 숙어)마다 OpenAI batch 형식 요청 1줄을 작성하는지 확인"""
+    # Arrange (준비)
+    videos = {"vid1": ["First chunk.", "Second chunk."], "vid2": ["Only chunk."]}
+
+    # Act (실행)
+    path = offline_batch.write_batch_file(
+        offline_batch.build_stage1_requests(videos), str(tmp_path / "requests.jsonl")
+    )
+    requests = _read_jsonl(path)
+
+    # Assert (검증)
+    assert len(requests) == 6
+    assert {request["custom_id"] for request in requests} >= {"vid1::word::1", "vid1::phrase::2", "vid2::word::1"}
+    first = requests[0]
+    assert first["method"] == "POST"
+    assert first["url"] == "/v1/chat/completions"
+    assert first["body"]["messages"][0]["role"] == "user"
+    assert "stop" not in first["body"]
+
+
+@pytest.mark.asyncio
+async def test_local_runner_results_are_ingested_per_video(tmp_path, monkeypatch):
+    """로컬 대체 실행기 결과를 영상/종류별로 병합하고 실패한 요청은 건너뛰는지 확인"""
+    # Arrange (준비): 숙어 요청은 실패, 단어 요청은 청크마다 다른 단어 반환
+    async def fake_chat_completion(self, messages, **kwargs):
+        content = messages[0]["content"]
+        if kwargs.get("route_key") == "phrase":
+            raise ValueError("phrase server down")
+        word = "innovate" if "First" in content else "collaborate"
+        result = {"videoId": "vid1", "result": {word: {"품사": "v", "뜻": ["뜻"]}}}
+        return {"choices": [{"index": 0, "message": {"content": json.dumps(result)}}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    requests = offline_batch.build_stage1_requests({"vid1": ["First chunk.", "Second chunk."]})
+    request_file = offline_batch.write_batch_file(requests, str(tmp_path / "requests.jsonl"))
+    result_file = str(tmp_path / "results.jsonl")
+
+    # Act (실행)
+    await offline_batch.run_batch_file(request_file, result_file, runner=offline_batch.BATCH_RUNNER_LOCAL)
+    results = await offline_batch.ingest_stage1_results(result_file)
+
+    # Assert (검증)
+    outputs = _read_jsonl(result_file)
+    assert len(outputs) == 4
+    assert sum(1 for output in outputs if output["error"]) == 2
+    assert set(results["vid1"]["word"]["result"]) == {"innovate", "collaborate"}
+    assert results["vid1"]["phrase"]["result"] == {}
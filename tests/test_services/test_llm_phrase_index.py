@@ -0,0 +1,68 @@
+"""
+숙어 사전 인덱스 모듈 테스트
+
+app/services/llm/phrase_index.py의 Aho-Corasick 매칭과
+숙어 사전 인덱스 모드의 숙어 추출(extract_phrases_from_chunks)을 테스트합니다.
+실제 서버 대신 chat_completion을 대체하여 요청 수와 결과 병합만 검증합니다.
+"""
+import json
+import pytest
+from app.core.config import settings
+from app.services.llm.client import VLLMClient
+from app.services.llm.extract_phrases import extract_phrases_from_chunks
+from app.services.llm.phrase_index import PhraseIndex
+
+
+def test_phrase_index_matches_inflected_forms_and_prefers_longest():
+    """변화형으로 쓰인 숙어를 원형으로 찾고, 겹치는 매칭은 더 긴 숙어만 남기는지 확인"""
+    # Arrange (준비)
+    phrase_index = PhraseIndex([
+        ("give up", "포기하다"),
+        ("look forward to", "고대하다"),
+        ("catch up", "따라잡다"),
+        ("catch up with", "~을 따라잡다"),
+    ])
+    text = "She gave up. We are looking forward to it, so let's catch up with them. Give. Up."
+
+    # Act (실행)
+    found = phrase_index.find(text)
+
+    # Assert (검증): 문장부호로 끊긴 "Give. Up."은 매칭하지 않음
+    assert found == {
+        "give up": "포기하다",
+        "look forward to": "고대하다",
+        "catch up with": "~을 따라잡다",
+    }
+
+
+@pytest.mark.asyncio
+async def test_fast_mode_skips_llm_for_covered_chunks(monkeypatch):
+    """매칭이 충분한 청크는 LLM 호출을 생략하고, 같은 숙어는 LLM의 문맥상 뜻을 우선하는지 확인"""
+    # Arrange (준비)
+    requested_chunks = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        chunk_text = messages[0]["content"].rsplit("텍스트:\n", 1)[1].strip()
+        requested_chunks.append(chunk_text)
+        content = json.dumps({"videoId": "vid", "result": {"Give up": "그만두다"}}, ensure_ascii=False)
+        return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    monkeypatch.setattr(settings, "LLM_PHRASE_INDEX_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_PHRASE_INDEX_FAST_MODE", True)
+    monkeypatch.setattr(settings, "LLM_PHRASE_INDEX_MIN_HITS", 2)
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_STAGE1_BATCH_MODE", False)
+    covered_chunk = "They figured out the plan and ran out of time."
+    uncovered_chunk = "I will never give up."
+
+    # Act (실행)
+    result = await extract_phrases_from_chunks([covered_chunk, uncovered_chunk], "vid")
+
+    # Assert (검증)
+    assert requested_chunks == [uncovered_chunk]
+    assert result["result"] == {
+        "give up": "그만두다",
+        "figure out": "알아내다",
+        "run out of": "~이 바닥나다",
+    }
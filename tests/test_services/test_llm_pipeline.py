@@ -0,0 +1,55 @@
+"""
+1단계 → 2단계 파이프라인 모듈 테스트
+
+app/services/llm/pipeline.py의 청크 단위 상세화 배치 생성과 결과 병합을 테스트합니다.
+실제 상세화 대신 입력 항목을 그대로 돌려주는 함수를 사용합니다.
+"""
+import asyncio
+import pytest
+from app.services.llm.extract_words import _merge_word_results
+from app.services.llm.pipeline import EnrichmentPipeline
+
+
+@pytest.mark.asyncio
+async def test_pipeline_starts_batches_before_extraction_ends():
+    """배치 크기가 차면 즉시 상세화를 시작하고, 이미 본 항목은 다시 보내지 않는지 확인"""
+    # Arrange (준비)
+    enriched_batches = []
+
+    async def fake_enrich(extraction_result, video_id):
+        enriched_batches.append(sorted(extraction_result["result"]))
+        return {"videoId": video_id, "result": {word: {"예문": word} for word in extraction_result["result"]}}
+
+    pipeline = EnrichmentPipeline("Word", fake_enrich, _merge_word_results, "vid", batch_size=2)
+
+    # Act (실행): 첫 청크에서 2개가 모이면 바로 배치 시작, 두 번째 청크의 "Run"은 중복
+    pipeline.add({"run": {"품사": "v", "뜻": ["달리다"]}, "apple": {"품사": "n", "뜻": ["사과"]}})
+    await asyncio.sleep(0)
+    batches_before_finish = list(enriched_batches)
+    pipeline.add({"Run": {"품사": "v", "뜻": ["운영하다"]}, "jump": {"품사": "v", "뜻": ["뛰다"]}})
+    result = await pipeline.finish()
+
+    # Assert (검증)
+    assert batches_before_finish == [["apple", "run"]]
+    assert enriched_batches == [["apple", "run"], ["jump"]]
+    assert set(result["result"]) == {"run", "apple", "jump"}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_failed_batches():
+    """실패한 상세화 배치는 건너뛰고 나머지 배치 결과만 반환하는지 확인"""
+    # Arrange (준비)
+    async def flaky_enrich(extraction_result, video_id):
+        if "bad" in extraction_result["result"]:
+            raise ValueError("JSON Parse Failed")
+        return {"videoId": video_id, "result": {word: {} for word in extraction_result["result"]}}
+
+    pipeline = EnrichmentPipeline("Word", flaky_enrich, _merge_word_results, "vid", batch_size=1)
+
+    # Act (실행)
+    pipeline.add({"good": {"품사": "adj", "뜻": ["좋은"]}})
+    pipeline.add({"bad": {"품사": "adj", "뜻": ["나쁜"]}})
+    result = await pipeline.finish()
+
+    # Assert (검증)
+    assert result == {"videoId": "vid", "result": {"good": {}}, "lexiconHits": {}}
@@ -11,6 +11,11 @@ from typing import Dict, List, Any
 from datetime import datetime
 
 from app.services.llm.client import VLLMClient
+from app.services.llm.prompts import (
+    get_word_extraction_prompt,
+    get_phrase_extraction_prompt,
+    get_fused_extraction_prompt,
+)
 
 # 프롬프트 함수들을 tests/test_services/test_llm_prompt_ab_test_prompts.py에서 import
 from tests.test_services.test_llm_prompt_ab_test_prompts import (
@@ -61,6 +66,18 @@ from tests.test_services.test_llm_prompt_ab_test_prompts import (
 # 헬퍼 함수
 # ============================================================================
 
+def _count_result_items(result: Any) -> Dict[str, int]:
+    """응답 result의 항목 수 (통합 추출 결과는 단어/숙어별로 집계)"""
+    if not isinstance(result, dict):
+        return {"items": 0}
+    if isinstance(result.get("words"), dict) or isinstance(result.get("phrases"), dict):
+        return {
+            "words": len(result.get("words") or {}),
+            "phrases": len(result.get("phrases") or {})
+        }
+    return {"items": len(result)}
+
+
 async def test_single_run(
     prompt: str,
     run_num: int,
@@ -84,6 +101,7 @@ async def test_single_run(
                 return {
                     "run": run_num,
                     "success": True,
+                    "item_counts": _count_result_items(parsed["result"]),
                     "content_preview": content[:200] + "..." if len(content) > 200 else content
                 }
             else:
@@ -173,6 +191,13 @@ async def test_prompt_version(
             })
     
     results["success_rate"] = (results["success_count"] / num_runs) * 100
+    
+    # 성공한 실행의 평균 항목 수 (분리/통합 추출 모드의 추출량 비교용)
+    item_counts = [r["item_counts"] for r in run_results if r["success"]]
+    results["avg_item_counts"] = {
+        key: round(sum(counts.get(key, 0) for counts in item_counts) / len(item_counts), 1)
+        for key in (item_counts[0] if item_counts else {})
+    }
     return results
 
 
@@ -264,6 +289,39 @@ async def _test_stage1_phrase_extraction(
             print(f"  -> 실패 원인: {result['errors'][0]['error'] if result['errors'] else 'Unknown'}")
 
 
+async def _test_stage1_fused_vs_split(
+    output_file: Path,
+    all_results: List[Dict[str, Any]],
+    chunk_text: str,
+    video_id: str
+):
+    """1단계: 운영 프롬프트 기준 분리 모드(단어 + 숙어 2건)와 통합 모드(1건) 비교"""
+    mode_prompt_funcs = [
+        ("split_word_extraction", get_word_extraction_prompt),
+        ("split_phrase_extraction", get_phrase_extraction_prompt),
+        ("fused_extraction", get_fused_extraction_prompt),
+    ]
+    
+    print(f"\n[분리/통합 추출 모드 비교 테스트 시작]")
+    print(f"테스트 청크 길이: {len(chunk_text)} 문자\n")
+    
+    for i, (test_type, prompt_func) in enumerate(mode_prompt_funcs, 1):
+        print(f"{test_type} 테스트 중...", end=" ", flush=True)
+        result = await test_prompt_version(
+            prompt_func, i, test_type,
+            chunk_text, video_id, num_runs=10
+        )
+        all_results.append(result)
+        print(f"완료 (성공률: {result['success_rate']:.1f}%)")
+        
+        # 즉시 파일에 저장
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(all_results, f, ensure_ascii=False, indent=2)
+        
+        # 즉시 출력
+        print(f"  -> 성공 {result['success_count']}/10, 평균 항목 수: {result['avg_item_counts']}")
+
+
 # ============================================================================
 # 2단계 통합 테스트 함수
 # ============================================================================
@@ -424,6 +482,49 @@ async def test_stage1_prompt_ab_test(
     print(f"{'='*80}\n")
 
 
+@pytest.mark.asyncio
+async def test_stage1_fused_vs_split_ab_test(
+    skip_if_vllm_unavailable,
+    ab_test_chunk_text,
+    ab_test_video_id
+):
+    """1단계 분리 모드와 통합 모드 비교 A/B 테스트
+    
+    테스트 대상:
+        - 분리 모드: 운영 단어 추출 + 숙어 추출 프롬프트 (각 10번 실행)
+        - 통합 모드: 단어 + 숙어 통합 추출 프롬프트 (10번 실행)
+    
+    출력:
+        - 테스트 결과 JSON 파일 생성 (tests/test_services/ab_test_results/ab_test_results_stage1_fused_YYYYMMDD_HHMMSS.json)
+        - 모드별 성공률과 평균 단어/숙어 수
+    """
+    print(f"\n{'='*80}")
+    print(f"1단계 분리/통합 추출 모드 비교 테스트 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*80}\n")
+    
+    # 결과 파일 디렉토리 생성
+    results_dir = Path(__file__).parent / "ab_test_results"
+    results_dir.mkdir(exist_ok=True)
+    
+    # 결과 파일 경로 (타임스탬프 포함)
+    output_file = results_dir / f"ab_test_results_stage1_fused_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    
+    all_results = []
+    
+    await _test_stage1_fused_vs_split(output_file, all_results, ab_test_chunk_text, ab_test_video_id)
+    
+    # 최종 결과 출력
+    print(f"\n{'='*80}")
+    print("분리/통합 추출 모드 비교 결과 요약")
+    print(f"{'='*80}\n")
+    
+    for r in all_results:
+        print(f"{r['test_type']:24s}: 성공 {r['success_count']:2d}/10 ({r['success_rate']:5.1f}%) | 평균 항목 수 {r['avg_item_counts']}")
+    
+    print(f"\n결과가 저장되었습니다: {output_file}")
+    print(f"{'='*80}\n")
+
+
 @pytest.mark.asyncio
 async def test_stage2_prompt_ab_test(
     skip_if_vllm_unavailable,
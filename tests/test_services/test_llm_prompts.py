@@ -1,9 +1,13 @@
 """
 LLM 프롬프트 모듈 테스트
 
-단어/숙어 추출 프롬프트에 새로 추가된 규칙이 포함되어 있는지 검증합니다.
+단어/숙어 추출 프롬프트에 새로 추가된 규칙이 포함되어 있는지와 상세화 요청의 프롬프트 버전을 검증합니다.
 """
+import pytest
+from app.core.config import settings
 from app.services.llm import prompts
+from app.services.llm.client import VLLMClient
+from app.services.llm.enrich_words import enrich_words
 
 
 def test_word_prompt_enforces_unique_meanings():
@@ -27,3 +31,57 @@ def test_phrase_prompt_enforces_multi_token_rule():
     assert "단일 단어" in prompt_text
     assert "최소 두 개" in prompt_text
 
+
+
+def test_prompts_share_static_prefix_across_videos():
+    """비디오/청크가 달라도 프롬프트가 동일한 정적 prefix로 시작하는지 확인 (prefix cache 재사용)"""
+    # Arrange (준비)
+    words = {"innovation": {"pos": "noun", "meaning": "혁신"}}
+    phrases = {"come up with": "생각해내다"}
+    prompt_pairs = [
+        (prompts.WORD_EXTRACTION_PROMPT_PREFIX,
+         [prompts.get_word_extraction_prompt("First chunk.", "vid1"),
+          prompts.get_word_extraction_prompt("Second chunk.", "vid2")]),
+        (prompts.PHRASE_EXTRACTION_PROMPT_PREFIX,
+         [prompts.get_phrase_extraction_prompt("First chunk.", "vid1"),
+          prompts.get_phrase_extraction_prompt("Second chunk.", "vid2")]),
+        (prompts.WORD_ENRICHMENT_PROMPT_PREFIX_V7,
+         [prompts.get_word_enrichment_prompt(words, "vid1", version=prompts.WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION)]),
+        (prompts.PHRASE_ENRICHMENT_PROMPT_PREFIX_V7,
+         [prompts.get_phrase_enrichment_prompt(phrases, "vid1", version=prompts.PHRASE_ENRICHMENT_FALLBACK_PROMPT_VERSION)]),
+    ]
+
+    # Act & Assert (실행 및 검증): 가변 데이터(비디오 ID, 청크)는 prefix 뒤에만 등장
+    for prefix, prompt_texts in prompt_pairs:
+        assert "vid1" not in prefix
+        assert prefix in prompts.STATIC_PROMPT_PREFIXES.values()
+        for prompt_text in prompt_texts:
+            assert prompt_text.startswith(prefix)
+
+
+@pytest.mark.asyncio
+async def test_enrichment_requests_use_current_prompt_versions(monkeypatch):
+    """상세화 요청의 라우팅 키가 재작성된 템플릿 버전이고 prefix 사전 적재 대상과 같은지 확인"""
+    # Arrange (준비): 모든 응답을 파싱 실패로 만들어 두 버전을 모두 요청
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SHARDING", False)
+    route_keys = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        route_keys.append(kwargs["route_key"])
+        return {"choices": [{"index": 0, "message": {"content": "not json"}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    extraction_result = {"videoId": "vid", "result": {"decision": {"품사": "n", "뜻": ["결정"]}}}
+
+    # Act (실행)
+    with pytest.raises(ValueError):
+        await enrich_words(extraction_result, "vid")
+
+    # Assert (검증)
+    assert route_keys == [
+        f"Word Enrichment:{prompts.WORD_ENRICHMENT_PROMPT_VERSION}",
+        f"Word Enrichment:{prompts.WORD_ENRICHMENT_FALLBACK_PROMPT_VERSION}",
+    ]
+    assert "Word Enrichment:v1" not in route_keys
+    assert set(route_keys) <= set(prompts.STATIC_PROMPT_PREFIXES)
@@ -0,0 +1,78 @@
+"""
+재시도 정책 모듈 테스트
+
+app/services/llm/retry.py의 에러 분류, 백오프, Retry-After, 재시도 예산을 테스트합니다.
+"""
+import httpx
+from app.services.llm.retry import RetryPolicy, RetryBudget
+
+
+def _status_error(status_code: int, headers: dict = None) -> httpx.HTTPStatusError:
+    """테스트용 HTTPStatusError 생성"""
+    request = httpx.Request("POST", "http://vllm:8000/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def _policy(max_attempts: int = 3, budget: RetryBudget = None) -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=max_attempts, base_delay=1.0, max_delay=10.0, max_total_delay=15.0, budget=budget
+    )
+
+
+def test_permanent_errors_are_not_retried():
+    """400, 404 같은 4xx 응답은 재시도하지 않는지 확인"""
+    # Arrange (준비)
+    policy = _policy()
+
+    # Act & Assert (실행 및 검증)
+    for status_code in (400, 401, 404, 422):
+        state = policy.start()
+        assert policy.next_delay(_status_error(status_code), state) is None
+
+
+def test_transient_errors_are_retried_with_jitter():
+    """429, 503, 타임아웃은 지수 백오프 범위 안의 대기 시간으로 재시도하는지 확인"""
+    # Arrange (준비)
+    policy = _policy()
+    timeout_error = httpx.ReadTimeout("timeout")
+
+    # Act (실행)
+    state = policy.start()
+    first_delay = policy.next_delay(_status_error(503), state)
+    second_delay = policy.next_delay(timeout_error, state)
+    third_delay = policy.next_delay(_status_error(429), state)
+
+    # Assert (검증): 1회차 [0, 1], 2회차 [0, 2], 최대 시도 횟수 도달 후 None
+    assert 0 <= first_delay <= 1.0
+    assert 0 <= second_delay <= 2.0
+    assert third_delay is None
+
+
+def test_retry_after_header_is_honored():
+    """Retry-After 헤더가 있으면 그 값을 대기 시간으로 사용하는지 확인"""
+    # Arrange (준비)
+    policy = _policy()
+
+    # Act (실행)
+    delay = policy.next_delay(_status_error(429, {"Retry-After": "3"}), policy.start())
+    too_long = policy.next_delay(_status_error(503, {"Retry-After": "120"}), policy.start())
+
+    # Assert (검증): 최대 대기 시간보다 긴 Retry-After는 재시도 포기
+    assert delay == 3.0
+    assert too_long is None
+
+
+def test_global_budget_limits_retry_ratio():
+    """전역 재시도 예산이 소진되면 일시적 오류라도 재시도하지 않는지 확인"""
+    # Arrange (준비): 요청 10건당 재시도 1회, 예비 예산 없음
+    budget = RetryBudget(ratio=0.1, min_reserve=0)
+    policy = _policy(budget=budget)
+
+    # Act (실행): 요청 20건이 모두 실패
+    delays = [policy.next_delay(_status_error(503), policy.start()) for _ in range(20)]
+
+    # Assert (검증)
+    retried = [delay for delay in delays if delay is not None]
+    assert len(retried) == 2
+    assert budget.get_stats()["rejected_retries"] == 18
@@ -0,0 +1,79 @@
+"""
+레플리카 라우팅 모듈 테스트
+
+app/services/llm/router.py의 consistent hashing 및 bounded-load 레플리카 선택을 테스트합니다.
+"""
+from app.services.llm.router import ReplicaRouter, ROUTING_MODE_PREFIX_AFFINITY
+
+
+REPLICA_URLS = ["http://gpu-1:8000", "http://gpu-2:8000", "http://gpu-3:8000"]
+
+
+def test_same_route_key_goes_to_same_replica():
+    """같은 라우팅 키는 항상 같은 레플리카로 라우팅되는지 확인"""
+    # Arrange (준비)
+    router = ReplicaRouter(REPLICA_URLS, mode=ROUTING_MODE_PREFIX_AFFINITY)
+
+    # Act (실행)
+    chosen = {router.choose("Word Extraction:v10") for _ in range(20)}
+
+    # Assert (검증)
+    assert len(chosen) == 1
+
+
+def test_route_keys_spread_across_replicas():
+    """서로 다른 라우팅 키가 여러 레플리카에 분산되는지 확인"""
+    # Arrange (준비)
+    router = ReplicaRouter(REPLICA_URLS, mode=ROUTING_MODE_PREFIX_AFFINITY)
+
+    # Act (실행)
+    chosen = {router.choose(f"Stage:v{version}") for version in range(50)}
+
+    # Assert (검증)
+    assert len(chosen) > 1
+
+
+def test_bounded_load_spills_over_to_next_replica():
+    """우선 레플리카가 부하 상한에 도달하면 다른 레플리카로 넘기는지 확인"""
+    # Arrange (준비): load_factor 1.0 → 레플리카당 평균 부하까지만 허용
+    router = ReplicaRouter(REPLICA_URLS, mode=ROUTING_MODE_PREFIX_AFFINITY, load_factor=1.0)
+    route_key = "Word Enrichment:v1"
+    preferred = router.choose(route_key)
+
+    # Act (실행): 같은 키로 동시에 요청 3개를 진행
+    with router.route(route_key) as first, router.route(route_key) as second, router.route(route_key) as third:
+        in_flight = dict(router.in_flight)
+
+    # Assert (검증)
+    assert first == preferred
+    assert len({first, second, third}) == 3
+    assert all(count == 1 for count in in_flight.values())
+    assert sum(stats["spillovers"] for stats in router.stats.values()) == 2
+    assert all(count == 0 for count in router.in_flight.values())
+
+
+def test_single_mode_uses_first_replica():
+    """single 모드에서는 라우팅 키와 상관없이 첫 번째 서버를 사용하는지 확인"""
+    # Arrange (준비)
+    router = ReplicaRouter(REPLICA_URLS)
+
+    # Act & Assert (실행 및 검증)
+    assert router.choose("Word Extraction:v10") == REPLICA_URLS[0]
+    assert router.choose("Phrase Extraction:v1") == REPLICA_URLS[0]
+
+
+def test_prefix_cache_hit_rate_from_usage():
+    """usage.prompt_tokens_details.cached_tokens로 prefix cache 적중률을 계산하는지 확인"""
+    # Arrange (준비)
+    router = ReplicaRouter(REPLICA_URLS[:1])
+    url = REPLICA_URLS[0]
+
+    # Act (실행)
+    router.record_usage(url, {"prompt_tokens": 1000, "prompt_tokens_details": {"cached_tokens": 600}})
+    router.record_usage(url, {"prompt_tokens": 1000, "prompt_tokens_details": None})
+    stats = router.get_stats()[0]
+
+    # Assert (검증)
+    assert stats["prompt_tokens"] == 2000
+    assert stats["cached_tokens"] == 600
+    assert stats["prefix_cache_hit_rate"] == 0.3
@@ -0,0 +1,58 @@
+"""
+1단계 어휘 포화 조기 종료 테스트
+
+app/services/llm/saturation.py의 새 항목 발견 비율 측정과
+app/services/llm/processor.py의 wave 단위 1단계 실행을 테스트합니다.
+실제 LLM 호출 대신 wave마다 정해진 결과를 돌려주는 함수를 사용합니다.
+"""
+import pytest
+from app.core.config import settings
+from app.services.llm import processor
+from app.services.llm.saturation import SaturationMonitor
+
+
+def test_monitor_detects_saturation():
+    """새 항목 비율이 기준 아래로 떨어지면 포화로 판단하고 추정 커버리지를 계산하는지 확인"""
+    # Arrange (준비)
+    monitor = SaturationMonitor(min_discovery_rate=0.3)
+
+    # Act (실행)
+    first_rate = monitor.observe(["a", "b", "c", "d"])
+    saturated_after_first = monitor.is_saturated()
+    second_rate = monitor.observe(["a", "b", "c", "d", "e"])
+
+    # Assert (검증): 첫 wave는 모두 새 항목이어도 최소 wave 수 전에는 중단하지 않음
+    assert first_rate == 1.0
+    assert not saturated_after_first
+    assert second_rate == 0.2
+    assert monitor.is_saturated()
+    assert monitor.estimated_coverage == 0.8
+
+
+@pytest.mark.asyncio
+async def test_stage1_stops_when_discovery_saturates(monkeypatch):
+    """새 단어가 거의 나오지 않는 wave 이후 남은 청크를 건너뛰고 wave 결과를 병합하는지 확인"""
+    # Arrange (준비): wave마다 청크 이름을 단어로 돌려주고, 두 번째 wave부터는 같은 단어만 반환
+    dispatched_waves = []
+
+    async def fake_extract_stage1(chunk_texts, video_id, on_word_result=None, on_phrase_result=None):
+        dispatched_waves.append(list(chunk_texts))
+        if len(dispatched_waves) == 1:
+            words = {chunk: {"품사": "n", "뜻": ["뜻"]} for chunk in chunk_texts}
+        else:
+            words = {"chunk0": {"품사": "n", "뜻": ["뜻"]}, "chunk1": {"품사": "n", "뜻": ["뜻"]}}
+        return {"videoId": video_id, "result": words}, {"videoId": video_id, "result": {}}
+
+    monkeypatch.setattr(processor, "_extract_stage1", fake_extract_stage1)
+    monkeypatch.setattr(settings, "LLM_SATURATION_EARLY_EXIT", True)
+    monkeypatch.setattr(settings, "LLM_SATURATION_WAVE_SIZE", 2)
+    monkeypatch.setattr(settings, "LLM_SATURATION_MIN_DISCOVERY_RATE", 0.1)
+    chunk_texts = [f"chunk{index}" for index in range(6)]
+
+    # Act (실행)
+    word_result, phrase_result = await processor._run_stage1(chunk_texts, "vid")
+
+    # Assert (검증): 두 번째 wave에서 새 단어가 없어 세 번째 wave(chunk4, chunk5)는 건너뜀
+    assert dispatched_waves == [["chunk0", "chunk1"], ["chunk2", "chunk3"]]
+    assert set(word_result["result"]) == {"chunk0", "chunk1"}
+    assert phrase_result == {"videoId": "vid", "result": {}}
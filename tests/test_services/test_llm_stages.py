@@ -0,0 +1,54 @@
+"""
+단계별 모델/서버 설정 모듈 테스트
+
+app/services/llm/stages.py의 단계별 설정 기본값 처리와 지연 시간 통계를 테스트합니다.
+"""
+from app.core.config import settings
+from app.services.llm.stages import (
+    get_stage_config,
+    StageLatencyTracker,
+    STAGE_EXTRACTION,
+    STAGE_ENRICHMENT
+)
+
+
+def test_stage_config_overrides_and_falls_back(monkeypatch):
+    """단계별 값이 있으면 사용하고, 비어 있으면 공통 모델/서버를 사용하는지 확인"""
+    # Arrange (준비): 1단계만 작은 모델과 별도 서버로 분리
+    monkeypatch.setattr(settings, "LLM_EXTRACTION_MODEL", "Qwen/Qwen2.5-3B-Instruct")
+    monkeypatch.setattr(settings, "LLM_EXTRACTION_SERVER_URLS", ["http://gpu-small:8000"])
+    monkeypatch.setattr(settings, "LLM_EXTRACTION_TEMPERATURE", 0.2)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_MODEL", "")
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SERVER_URLS", [])
+    monkeypatch.setattr(settings, "VLLM_SERVER_URLS", [])
+
+    # Act (실행)
+    extraction = get_stage_config(STAGE_EXTRACTION)
+    enrichment = get_stage_config(STAGE_ENRICHMENT)
+
+    # Assert (검증)
+    assert extraction["model"] == "Qwen/Qwen2.5-3B-Instruct"
+    assert extraction["server_urls"] == ["http://gpu-small:8000"]
+    assert extraction["temperature"] == 0.2
+    assert extraction["client_templating"] is False
+    assert enrichment["model"] == settings.VLLM_SERVER_MODEL
+    assert enrichment["server_urls"] == [settings.VLLM_SERVER_URL]
+
+
+def test_latency_tracker_reports_percentiles_per_stage():
+    """단계별 호출 수와 평균/p50/p95 지연 시간을 계산하는지 확인"""
+    # Arrange (준비)
+    tracker = StageLatencyTracker()
+
+    # Act (실행): 1단계 1~100ms, 2단계 1000ms
+    for millis in range(1, 101):
+        tracker.record(STAGE_EXTRACTION, millis / 1000, model="small")
+    tracker.record(STAGE_ENRICHMENT, 1.0, model="large")
+    stats = tracker.get_stats()
+
+    # Assert (검증)
+    assert stats[STAGE_EXTRACTION]["calls"] == 100
+    assert stats[STAGE_EXTRACTION]["p50_ms"] == 50.0
+    assert stats[STAGE_EXTRACTION]["p95_ms"] == 95.0
+    assert stats[STAGE_EXTRACTION]["model"] == "small"
+    assert stats[STAGE_ENRICHMENT]["avg_ms"] == 1000.0
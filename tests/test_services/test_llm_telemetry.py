@@ -0,0 +1,153 @@
+"""
+vLLM 서버 텔레메트리 모듈 테스트
+
+app/services/llm/telemetry.py의 Prometheus 메트릭 파싱과 과부하 시 요청 보류를 테스트합니다.
+실제 vLLM 서버 대신 httpx.MockTransport로 만든 가짜 /metrics 엔드포인트를 사용합니다.
+"""
+import asyncio
+import httpx
+import pytest
+from app.services.llm.telemetry import BackendTelemetry, parse_prometheus_metrics
+
+SERVER_URL = "http://vllm:8000"
+
+
+def _metrics_text(running: int, waiting: int, kv_usage: float, ttft_sum: float, ttft_count: int) -> str:
+    """vLLM /metrics 형식의 응답 본문 생성"""
+    return f"""# HELP vllm:num_requests_running Number of requests currently running on GPU.
+# TYPE vllm:num_requests_running gauge
+vllm:num_requests_running{{model_name="qwen"}} {running}.0
+vllm:num_requests_waiting{{model_name="qwen"}} {waiting}.0
+vllm:gpu_cache_usage_perc{{model_name="qwen"}} {kv_usage}
+vllm:time_to_first_token_seconds_sum{{model_name="qwen"}} {ttft_sum}
+vllm:time_to_first_token_seconds_count{{model_name="qwen"}} {ttft_count}.0
+"""
+
+
+def _fake_metrics_client(state: dict) -> httpx.AsyncClient:
+    """state["text"]를 /metrics 응답으로 돌려주는 가짜 서버 클라이언트"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/metrics"
+        return httpx.Response(200, text=state["text"])
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_parse_prometheus_metrics_sums_labels():
+    """레이블이 다른 같은 이름의 샘플을 합산하고 주석은 무시하는지 확인"""
+    # Arrange (준비)
+    text = """# TYPE vllm:num_requests_waiting gauge
+vllm:num_requests_waiting{model_name="a"} 2.0
+vllm:num_requests_waiting{model_name="b"} 3.0 1700000000000
+process_cpu_seconds_total 12.5
+"""
+
+    # Act (실행)
+    metrics = parse_prometheus_metrics(text)
+
+    # Assert (검증)
+    assert metrics["vllm:num_requests_waiting"] == 5.0
+    assert metrics["process_cpu_seconds_total"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_poll_once_builds_snapshot_with_interval_ttft():
+    """수집 구간별 평균 TTFT와 KV cache 사용률을 스냅샷으로 기록하는지 확인"""
+    # Arrange (준비)
+    telemetry = BackendTelemetry([SERVER_URL])
+    state = {"text": _metrics_text(2, 0, 0.25, ttft_sum=1.0, ttft_count=10)}
+
+    # Act (실행): 두 번째 수집 구간에 요청 10건, TTFT 합계 3초 증가
+    async with _fake_metrics_client(state) as client:
+        await telemetry.poll_once(client)
+        state["text"] = _metrics_text(4, 1, 0.5, ttft_sum=4.0, ttft_count=20)
+        await telemetry.poll_once(client)
+
+    # Assert (검증)
+    server = telemetry.get_stats()["servers"][0]
+    assert server["running"] == 4
+    assert server["waiting"] == 1
+    assert server["kv_cache_usage"] == 0.5
+    assert server["ttft_ms"] == 300.0
+
+
+@pytest.mark.asyncio
+async def test_requests_are_held_while_server_is_overloaded():
+    """대기열이 임계값을 넘으면 보류하고, 메트릭이 회복되면 전송을 재개하는지 확인"""
+    # Arrange (준비)
+    telemetry = BackendTelemetry(
+        [SERVER_URL], poll_interval=0.01, max_waiting_requests=4, max_kv_usage=0.9, max_hold=5.0
+    )
+    state = {"text": _metrics_text(8, 10, 0.5, ttft_sum=0.0, ttft_count=0)}
+
+    async with _fake_metrics_client(state) as client:
+        await telemetry.poll_once(client)
+        overloaded_before = telemetry.is_overloaded()
+
+        # Act (실행): 보류 중에 서버 대기열이 줄어듦
+        wait_task = asyncio.create_task(telemetry.wait_for_capacity())
+        await asyncio.sleep(0.05)
+        still_waiting = not wait_task.done()
+        state["text"] = _metrics_text(8, 2, 0.5, ttft_sum=0.0, ttft_count=0)
+        await telemetry.poll_once(client)
+        held_seconds = await asyncio.wait_for(wait_task, timeout=1)
+
+    # Assert (검증)
+    assert overloaded_before
+    assert still_waiting
+    assert held_seconds > 0
+    assert telemetry.get_stats()["held_requests"] == 1
+    assert not telemetry.is_overloaded()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_metrics_endpoint_fails_open():
+    """메트릭을 수집할 수 없으면 요청을 보류하지 않는지 확인"""
+    # Arrange (준비)
+    telemetry = BackendTelemetry([SERVER_URL])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    # Act (실행)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await telemetry.poll_once(client)
+    held_seconds = await telemetry.wait_for_capacity()
+
+    # Assert (검증)
+    assert held_seconds == 0.0
+    assert not telemetry.is_overloaded()
+
+
+@pytest.mark.asyncio
+async def test_overloaded_extraction_server_is_held_while_enrichment_server_is_idle():
+    """추출 서버만 과부하이면 추출 요청만 보류하고, 상세화 요청과 응답 없는 공통 서버는 영향을 주지 않는지 확인"""
+    # Arrange (준비): 추출 서버 과부하, 상세화 서버 여유, 공통 서버는 연결 불가
+    extraction_url, enrichment_url, shared_url = "http://gpu-extract:8000", "http://gpu-enrich:8000", "http://shared:8000"
+    telemetry = BackendTelemetry(
+        [shared_url, extraction_url, enrichment_url], poll_interval=0.01, max_waiting_requests=4, max_hold=0.05
+    )
+    metrics_by_host = {
+        "gpu-extract": _metrics_text(8, 12, 0.95, ttft_sum=0.0, ttft_count=0),
+        "gpu-enrich": _metrics_text(1, 0, 0.2, ttft_sum=0.0, ttft_count=0),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host not in metrics_by_host:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, text=metrics_by_host[request.url.host])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await telemetry.poll_once(client)
+
+    # Act (실행)
+    enrichment_held = await telemetry.wait_for_capacity([enrichment_url])
+    extraction_held = await telemetry.wait_for_capacity([extraction_url])
+    await telemetry.wait_for_capacity(["http://gpu-small:8000"])
+
+    # Assert (검증)
+    assert telemetry.is_overloaded([extraction_url])
+    assert not telemetry.is_overloaded([enrichment_url])
+    assert enrichment_held == 0.0
+    assert extraction_held >= 0.05
+    assert telemetry.get_stats()["hold_timeouts"] == 1
+    assert "http://gpu-small:8000" in telemetry.base_urls
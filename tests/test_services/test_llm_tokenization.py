@@ -0,0 +1,72 @@
+"""
+프롬프트 토큰화 모듈 테스트
+
+app/services/llm/tokenization.py의 정적 prefix 토큰 캐시와 청크 토큰 재사용을 테스트합니다.
+실제 토크나이저 대신 문자 단위로 토큰화하는 가짜 토크나이저를 사용합니다.
+"""
+import pytest
+from app.services.llm import tokenization
+from app.services.llm.prompts import get_word_extraction_prompt, WORD_EXTRACTION_PROMPT_PREFIX
+
+
+class FakeTokenizer:
+    """문자 하나를 토큰 하나(유니코드 코드 포인트)로 변환하는 테스트용 토크나이저"""
+
+    def __init__(self):
+        self.encoded_texts = []
+
+    def encode(self, text, add_special_tokens=True):
+        self.encoded_texts.append(text)
+        return [ord(char) for char in text]
+
+    def decode(self, token_ids):
+        return "".join(chr(token_id) for token_id in token_ids)
+
+    def apply_chat_template(self, messages, tokenize=False, add_generation_prompt=True):
+        return f"<|im_start|>user\n{messages[0]['content']}<|im_end|>\n<|im_start|>assistant\n"
+
+
+@pytest.fixture
+def fake_tokenizer(monkeypatch):
+    """토크나이저와 모듈 캐시를 테스트마다 초기화"""
+    tokenizer = FakeTokenizer()
+    monkeypatch.setattr(tokenization, "_get_tokenizer", lambda: tokenizer)
+    monkeypatch.setattr(tokenization, "_CHAT_TEMPLATE_PARTS", None)
+    monkeypatch.setattr(tokenization, "_PREFIX_TOKEN_CACHE", {})
+    monkeypatch.setattr(tokenization, "_CHUNK_TOKEN_CACHE", tokenization.OrderedDict())
+    return tokenizer
+
+
+def test_token_ids_decode_to_rendered_prompt(fake_tokenizer):
+    """토큰 ID를 디코딩하면 chat template을 적용한 프롬프트 문자열과 같은지 확인"""
+    # Arrange (준비)
+    prompt = get_word_extraction_prompt("We need to innovate.", "vid1")
+
+    # Act (실행)
+    token_ids = tokenization.tokenize_chat_prompt(prompt, "We need to innovate.")
+
+    # Assert (검증)
+    expected = tokenization.render_chat_prompt([{"role": "user", "content": prompt}])
+    assert fake_tokenizer.decode(token_ids) == expected
+
+
+def test_static_prefix_and_chunk_tokens_are_reused(fake_tokenizer):
+    """정적 prefix는 한 번만 토큰화하고, 저장된 청크 토큰 ID는 다시 토큰화하지 않는지 확인"""
+    # Arrange (준비): 청크 생성 시 계산한 토큰 ID 저장
+    chunk_texts = ["First chunk text.", "Second chunk text."]
+    for chunk_text in chunk_texts:
+        tokenization.remember_chunk_tokens(chunk_text, [ord(char) for char in chunk_text])
+    fake_tokenizer.encoded_texts.clear()
+
+    # Act (실행)
+    for chunk_text in chunk_texts:
+        tokenization.tokenize_chat_prompt(get_word_extraction_prompt(chunk_text, "vid1"), chunk_text)
+
+    # Assert (검증)
+    prefix_encodings = [text for text in fake_tokenizer.encoded_texts if WORD_EXTRACTION_PROMPT_PREFIX in text]
+    chunk_encodings = [
+        text for text in fake_tokenizer.encoded_texts
+        if any(chunk_text in text for chunk_text in chunk_texts)
+    ]
+    assert len(prefix_encodings) == 1
+    assert chunk_encodings == []
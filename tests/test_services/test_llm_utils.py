@@ -0,0 +1,60 @@
+"""
+LLM 서비스 공통 유틸리티 모듈 테스트
+
+app/services/llm/utils.py의 상세화 샤딩(shard 크기 계산, 병렬 요청, 부분 실패 병합)을 테스트합니다.
+실제 서버 대신 chat_completion을 대체하여 요청 단위와 결과 병합만 검증합니다.
+"""
+import json
+import pytest
+from app.core.config import settings
+from app.services.llm.client import VLLMClient
+from app.services.llm.utils import enrich_with_retry, _get_enrichment_shard_size
+
+
+def test_shard_size_follows_output_token_budget(monkeypatch):
+    """shard 출력 토큰 예산(오버헤드 제외)을 항목당 토큰으로 나눈 값이 shard 크기인지 확인"""
+    # Arrange (준비)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SHARDING", True)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SHARD_OUTPUT_TOKENS", 1064)
+    monkeypatch.setattr(settings, "LLM_OUTPUT_OVERHEAD_TOKENS", 64)
+
+    # Act & Assert (실행 및 검증): (1064 - 64) / 50 = 20, 단계 상한 564면 (564 - 64) / 50 = 10
+    assert _get_enrichment_shard_size(50, max_output_tokens=4096) == 20
+    assert _get_enrichment_shard_size(50, max_output_tokens=564) == 10
+    assert _get_enrichment_shard_size(None, max_output_tokens=4096) == 0
+
+
+@pytest.mark.asyncio
+async def test_enrichment_is_sharded_and_merged(monkeypatch):
+    """항목이 shard 크기를 넘으면 shard별로 요청하고, 실패한 shard만 빼고 병합하는지 확인"""
+    # Arrange (준비): shard당 2개 (출력 예산 (164 - 64) / 50)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SHARDING", True)
+    monkeypatch.setattr(settings, "LLM_ENRICHMENT_SHARD_OUTPUT_TOKENS", 164)
+    monkeypatch.setattr(settings, "LLM_OUTPUT_OVERHEAD_TOKENS", 64)
+    monkeypatch.setattr(settings, "LLM_CASCADE_ENABLED", False)
+    requested_shards = []
+
+    async def fake_chat_completion(self, messages, **kwargs):
+        items = json.loads(messages[0]["content"])
+        requested_shards.append(sorted(items))
+        if "broken" in items:
+            content = "not json"
+        else:
+            content = json.dumps({"result": {item: {"예문": item} for item in items}})
+        return {"choices": [{"index": 0, "message": {"content": content}, "finish_reason": "stop"}]}
+
+    monkeypatch.setattr(VLLMClient, "chat_completion", fake_chat_completion)
+    extraction_result = {"videoId": "vid", "result": {"a": {}, "b": {}, "c": {}, "broken": {}, "e": {}}}
+
+    # Act (실행)
+    result = await enrich_with_retry(
+        extraction_result,
+        video_id="vid",
+        process_name="Word Enrichment",
+        prompt_versions=[("v1", lambda items, video_id: json.dumps(items))],
+        tokens_per_item=50
+    )
+
+    # Assert (검증): shard 3개 (a,b / c,broken / e), 두 번째 shard만 실패
+    assert sorted(requested_shards) == [["a", "b"], ["broken", "c"], ["e"]]
+    assert set(result["result"]) == {"a", "b", "e"}
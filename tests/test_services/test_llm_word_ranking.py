@@ -0,0 +1,94 @@
+"""
+로컬 단어 순위 모듈 테스트
+
+app/services/llm/word_ranking.py의 빈도 순위표 조회, 희소도 점수, 상위 단어 선택과
+파이프라인 모드의 상세화 단어 수 제한을 테스트합니다.
+"""
+import pytest
+from app.core.config import settings
+from app.services.llm import processor
+from app.services.llm.word_ranking import CorpusDocumentFrequency, FrequencyTable, WordRanker
+
+
+def test_bundled_table_scores_common_words_low():
+    """번들 순위표에서 흔한 단어는 낮은 점수, 순위표에 없는 단어는 1.0을 받는지 확인"""
+    # Arrange (준비)
+    ranker = WordRanker(FrequencyTable.load())
+
+    # Act (실행)
+    scores = {word: ranker.score(word) for word in ["the", "Go", "thing", "decision", "serendipity"]}
+
+    # Assert (검증)
+    assert scores["the"] < scores["Go"]
+    assert max(scores["Go"], scores["thing"]) < 0.3 < scores["decision"]
+    assert scores["serendipity"] == 1.0
+
+
+def test_select_top_words_applies_threshold_and_top_k():
+    """기준 점수 미만 단어를 제외하고 점수 상위 K개만 원래 순서대로 남기는지 확인"""
+    # Arrange (준비): 순위표 크기 10, "a"~"j" 순서로 흔함
+    ranker = WordRanker(FrequencyTable(list("abcdefghij")))
+    words_dict = {"b": {}, "rare": {}, "i": {}, "g": {}, "j": {}}
+
+    # Act (실행)
+    selected = ranker.select_top_words(words_dict, top_k=3, min_score=0.5)
+
+    # Assert (검증): "b"(0.2)는 기준 미만, 나머지 중 점수 상위 3개("rare", "j", "i")
+    assert list(selected) == ["rare", "i", "j"]
+
+
+def test_corpus_idf_lowers_words_seen_in_every_video():
+    """지난 영상마다 나온 단어는 한 번도 나오지 않은 단어보다 점수가 낮아지는지 확인"""
+    # Arrange (준비)
+    corpus = CorpusDocumentFrequency()
+    for words in [["subscribe", "galaxy"], ["subscribe", "recipe"], ["subscribe"]]:
+        corpus.observe(words)
+    ranker = WordRanker(FrequencyTable(["the"]), corpus)
+
+    # Act (실행)
+    subscribe_score = ranker.score("subscribe")
+    nebula_score = ranker.score("nebula")
+
+    # Assert (검증)
+    assert subscribe_score < nebula_score == 1.0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_mode_caps_enrichment_at_top_k(monkeypatch):
+    """파이프라인 모드에서도 상세화 요청 단어 수가 상위 K개 제한을 넘지 않고 단어장에도 상세화한 단어만 남는지 확인"""
+    # Arrange (준비): 청크 2개에서 단어 4개가 도착, K = 2
+    monkeypatch.setattr(settings, "LLM_WORD_RANKING_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_WORD_RANKING_TOP_K", 2)
+    monkeypatch.setattr(settings, "LLM_WORD_RANKING_MIN_SCORE", 0.0)
+    monkeypatch.setattr(settings, "LLM_LEMMA_MERGE_ENABLED", False)
+    monkeypatch.setattr(settings, "LLM_PIPELINE_ENRICHMENT_BATCH_SIZE", 1)
+    chunk_results = [
+        {"galaxy": {"품사": "n", "뜻": ["은하"]}, "nebula": {"품사": "n", "뜻": ["성운"]}},
+        {"comet": {"품사": "n", "뜻": ["혜성"]}, "quasar": {"품사": "n", "뜻": ["퀘이사"]}},
+    ]
+    enriched_words = []
+
+    async def fake_run_stage1(chunk_texts, video_id, on_word_result=None, on_phrase_result=None):
+        all_words = {}
+        for chunk_result in chunk_results:
+            on_word_result(chunk_result)
+            all_words.update(chunk_result)
+        return {"videoId": video_id, "result": all_words}, {"videoId": video_id, "result": {}}
+
+    async def fake_enrich_words(extraction_result, video_id):
+        enriched_words.extend(extraction_result["result"])
+        return {"videoId": video_id, "result": {word: {"예문": word} for word in extraction_result["result"]}}
+
+    async def fake_enrich_phrases(extraction_result, video_id):
+        return {"videoId": video_id, "result": {}}
+
+    monkeypatch.setattr(processor, "_run_stage1", fake_run_stage1)
+    monkeypatch.setattr(processor, "enrich_words", fake_enrich_words)
+    monkeypatch.setattr(processor, "enrich_phrases", fake_enrich_phrases)
+
+    # Act (실행)
+    result = await processor._process_vocabulary_pipelined(["chunk 1", "chunk 2"], "vid")
+
+    # Assert (검증): 먼저 도착한 2개만 상세화
+    assert sorted(enriched_words) == ["galaxy", "nebula"]
+    assert sorted(word["word"] for word in result["words"]) == ["galaxy", "nebula"]